@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Benchmark dense vs. sparse kNN chunk clustering.
+
+# Chunk: docs/chunks/cluster_knn_graph - Clustering benchmark
+
+Generates synthetic projects whose chunks are drawn from planted topics,
+then runs `cluster_chunks` with method="dense" (full distance matrix plus
+scikit-learn average linkage) and method="knn" (sparse neighbour graph) on
+each. Reports wall time, peak traced memory, cluster counts and quality as
+the adjusted Rand index against the planted topics and between the two
+methods.
+
+The dense path needs an n x n matrix (about 3 GB at 20k chunks), so it is
+skipped above --dense-limit.
+
+Usage:
+    python scripts/benchmark_cluster_chunks.py [--sizes 500,5000,20000]
+        [--dense-limit 5000] [--neighbors 30] [--min-similarity 0.3]
+
+Options:
+    --sizes N,N,...      Chunk counts to benchmark (default: 500,5000,20000)
+    --dense-limit N      Largest size to run the dense path on (default: 5000)
+    --neighbors K        Neighbours per chunk in knn mode (default: 30)
+    --min-similarity S   Clustering threshold (default: 0.3)
+    --seed N             Random seed for the synthetic corpus (default: 0)
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from chunk_corpus import ChunkCorpus  # noqa: E402
+from cluster_analysis import DEFAULT_CLUSTER_NEIGHBORS, cluster_chunks  # noqa: E402
+
+# Chunks per planted topic, in the healthy cluster size range
+TOPIC_SIZE = 6
+WORDS_PER_TOPIC = 8
+# Topics are distinguished by combinations drawn from a fixed pool small
+# enough to survive the 500-feature vocabulary cap at any corpus size
+TOPIC_POOL_SIZE = 400
+FILLER_SIZE = 5000
+WORDS_PER_CHUNK = 60
+# Share of each chunk's words drawn from its topic rather than shared filler
+TOPIC_WORD_SHARE = 0.5
+
+
+def make_word(rng: random.Random) -> str:
+    consonants = "bcdfghjklmnprstvz"
+    vowels = "aeiou"
+    return "".join(
+        rng.choice(consonants) + rng.choice(vowels) for _ in range(rng.randint(2, 4))
+    )
+
+
+def write_corpus(root: Path, size: int, seed: int) -> dict[str, int]:
+    """Write size synthetic chunks and return chunk name -> planted topic."""
+    rng = random.Random(seed)
+    vocabulary = sorted({make_word(rng) for _ in range(3 * (FILLER_SIZE + TOPIC_POOL_SIZE))})
+    rng.shuffle(vocabulary)
+    topic_pool = vocabulary[:TOPIC_POOL_SIZE]
+    filler = vocabulary[TOPIC_POOL_SIZE : TOPIC_POOL_SIZE + FILLER_SIZE]
+
+    topics: dict[str, int] = {}
+    topic_count = max(1, size // TOPIC_SIZE)
+    topic_words = [rng.sample(topic_pool, WORDS_PER_TOPIC) for _ in range(topic_count)]
+    for i in range(size):
+        topic = i % topic_count
+        name = f"t{topic}_chunk{i}"
+        words = [
+            rng.choice(topic_words[topic])
+            if rng.random() < TOPIC_WORD_SHARE
+            else rng.choice(filler)
+            for _ in range(WORDS_PER_CHUNK)
+        ]
+        goal_path = root / "docs" / "chunks" / name / "GOAL.md"
+        goal_path.parent.mkdir(parents=True)
+        goal_path.write_text(
+            "---\nstatus: ACTIVE\n---\n\n# Chunk Goal\n\n" + " ".join(words) + "\n"
+        )
+        topics[name] = topic
+    return topics
+
+
+def result_labels(result, names: list[str]) -> list[int]:
+    """Flatten a ClusterResult into one label per chunk (singletons unique)."""
+    label_of: dict[str, int] = {}
+    for label, members in enumerate(result.clusters):
+        for name in members:
+            label_of[name] = label
+    next_label = len(result.clusters)
+    labels = []
+    for name in names:
+        if name not in label_of:
+            label_of[name] = next_label
+            next_label += 1
+        labels.append(label_of[name])
+    return labels
+
+
+def run_method(root: Path, names: list[str], method: str, args) -> tuple:
+    def run():
+        return cluster_chunks(
+            root,
+            chunk_ids=names,
+            min_similarity=args.min_similarity,
+            method=method,
+            neighbors=args.neighbors,
+        )
+
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc slows Python-heavy code, so memory is measured on a second run
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", default="500,5000,20000")
+    parser.add_argument("--dense-limit", type=int, default=5000)
+    parser.add_argument("--neighbors", type=int, default=DEFAULT_CLUSTER_NEIGHBORS)
+    parser.add_argument("--min-similarity", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from sklearn.metrics import adjusted_rand_score
+
+    print(
+        f"{'chunks':>7} {'method':>6} {'seconds':>8} {'peak MB':>8} "
+        f"{'clusters':>8} {'ARI/topics':>10} {'ARI/dense':>9}"
+    )
+    for size in (int(s) for s in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            topics = write_corpus(root, size, args.seed)
+            names = sorted(topics)
+            truth = [topics[name] for name in names]
+
+            # Warm the persisted corpus so both methods time clustering only
+            ChunkCorpus(root).sync(
+                (name, root / "docs" / "chunks" / name / "GOAL.md") for name in names
+            )
+
+            dense_labels = None
+            for method in ("dense", "knn"):
+                if method == "dense" and size > args.dense_limit:
+                    print(f"{size:>7} {method:>6} {'skipped (above --dense-limit)':>48}")
+                    continue
+                result, elapsed, peak = run_method(root, names, method, args)
+                labels = result_labels(result, names)
+                if method == "dense":
+                    dense_labels = labels
+                agreement = (
+                    f"{adjusted_rand_score(dense_labels, labels):.3f}"
+                    if dense_labels is not None
+                    else "-"
+                )
+                print(
+                    f"{size:>7} {method:>6} {elapsed:>8.2f} {peak / 2**20:>8.1f} "
+                    f"{len(result.clusters):>8} "
+                    f"{adjusted_rand_score(truth, labels):>10.3f} {agreement:>9}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
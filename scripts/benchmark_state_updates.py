@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Benchmark StateStore work unit updates on a dispatch-heavy workload.
+
+# Chunk: docs/chunks/orch_work_unit_dirty_fields - Update path micro-benchmark
+
+Creates a database of READY work units (each with a few blocked_by entries
+and cached conflict verdicts), then times the writes a busy dispatch loop
+issues:
+
+- backoff-clear: clear next_retry_at and bump updated_at, as _dispatch_tick
+  does once a retry backoff has elapsed;
+- status: move a unit to RUNNING and back, logging both transitions;
+- verdict: record one new conflict verdict on a unit.
+
+Each workload runs through three paths: update_work_unit() without a
+timestamp (read the row, diff, write changed columns),
+update_work_unit(expected_updated_at=...) and compare_and_swap_work_unit()
+(no read, one conditional UPDATE of the dirty columns). Reports mean
+microseconds per update.
+
+Usage:
+    python scripts/benchmark_state_updates.py [--units 500] [--rounds 5]
+
+Options:
+    --units N    Work units in the database (default: 500)
+    --rounds N   Passes over all units per workload and path (default: 5)
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from orchestrator.models import WorkUnit, WorkUnitPhase, WorkUnitStatus  # noqa: E402
+from orchestrator.state import StateStore  # noqa: E402
+
+BLOCKERS_PER_UNIT = 3
+VERDICTS_PER_UNIT = 8
+
+
+def populate(store: StateStore, count: int) -> list[str]:
+    now = datetime.now(timezone.utc)
+    chunks = [f"chunk_{i:05d}" for i in range(count)]
+    for i, chunk in enumerate(chunks):
+        store.create_work_unit(
+            WorkUnit(
+                chunk=chunk,
+                phase=WorkUnitPhase.IMPLEMENT,
+                status=WorkUnitStatus.READY,
+                blocked_by=[chunks[(i + j) % count] for j in range(1, BLOCKERS_PER_UNIT + 1)],
+                conflict_verdicts={
+                    chunks[(i + j) % count]: "INDEPENDENT"
+                    for j in range(1, VERDICTS_PER_UNIT + 1)
+                },
+                baseline_implementing=chunks[:5],
+                next_retry_at=now - timedelta(seconds=1),
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    return chunks
+
+
+def clear_backoff(unit: WorkUnit, round_no: int) -> None:
+    unit.next_retry_at = None if unit.next_retry_at else datetime.now(timezone.utc)
+
+
+def flip_status(unit: WorkUnit, round_no: int) -> None:
+    unit.status = (
+        WorkUnitStatus.RUNNING if unit.status == WorkUnitStatus.READY else WorkUnitStatus.READY
+    )
+
+
+def add_verdict(unit: WorkUnit, round_no: int) -> None:
+    unit.conflict_verdicts[f"analysed_{round_no}"] = "SERIALIZE"
+
+
+WORKLOADS = {
+    "backoff-clear": clear_backoff,
+    "status": flip_status,
+    "verdict": add_verdict,
+}
+
+
+def write_plain(store: StateStore, unit: WorkUnit, expected: datetime) -> None:
+    store.update_work_unit(unit)
+
+
+def write_expected(store: StateStore, unit: WorkUnit, expected: datetime) -> None:
+    store.update_work_unit(unit, expected_updated_at=expected)
+
+
+def write_cas(store: StateStore, unit: WorkUnit, expected: datetime) -> None:
+    store.compare_and_swap_work_unit(unit)
+
+
+PATHS = {
+    "update": write_plain,
+    "update+expected": write_expected,
+    "compare-and-swap": write_cas,
+}
+
+
+def run(store: StateStore, chunks: list[str], rounds: int, mutate, write) -> float:
+    """Return mean microseconds per update, excluding the initial reads."""
+    units = [store.get_work_unit(chunk) for chunk in chunks]
+    elapsed = 0.0
+    for round_no in range(rounds):
+        for unit in units:
+            expected = unit.updated_at
+            mutate(unit, round_no)
+            unit.updated_at = datetime.now(timezone.utc)
+            started = time.perf_counter()
+            write(store, unit, expected)
+            elapsed += time.perf_counter() - started
+    return elapsed / (rounds * len(units)) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--units", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = StateStore(Path(tmp) / "orchestrator.db")
+        store.initialize()
+        chunks = populate(store, args.units)
+
+        print(f"{args.units} units, {args.rounds} rounds; mean microseconds per update")
+        print(f"{'workload':<16}" + "".join(f"{path:>20}" for path in PATHS))
+        for workload, mutate in WORKLOADS.items():
+            row = [
+                run(store, chunks, args.rounds, mutate, write) for write in PATHS.values()
+            ]
+            print(f"{workload:<16}" + "".join(f"{value:>20.1f}" for value in row))
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
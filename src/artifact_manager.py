@@ -193,13 +193,12 @@ class ArtifactManager(ABC, Generic[FrontmatterT, StatusT]):
             - Main file doesn't exist
             - Frontmatter is malformed or fails validation
         """
-        from frontmatter import parse_frontmatter
-
         main_path = self.get_main_file_path(artifact_id)
         if not main_path.exists():
             return None
 
-        return parse_frontmatter(main_path, self.frontmatter_model_class)
+        frontmatter, _ = self._parse_file_with_errors(main_path)
+        return frontmatter
 
     # Chunk: docs/chunks/validation_error_surface - Error surfacing for frontmatter parsing
     def parse_frontmatter_with_errors(
@@ -219,13 +218,53 @@ class ArtifactManager(ABC, Generic[FrontmatterT, StatusT]):
             - frontmatter is the validated model if successful, None otherwise
             - errors is a list of error messages (empty if parsing succeeded)
         """
-        from frontmatter import parse_frontmatter_with_errors
-
         main_path = self.get_main_file_path(artifact_id)
         if not main_path.exists():
             return None, [f"{self.artifact_type_name} '{artifact_id}' not found"]
 
-        return parse_frontmatter_with_errors(main_path, self.frontmatter_model_class)
+        return self._parse_file_with_errors(main_path)
+
+    # Chunk: docs/chunks/frontmatter_parse_cache - Route all frontmatter parsing through the shared cache
+    def _parse_file_with_errors(
+        self, file_path: Path
+    ) -> tuple[FrontmatterT | None, list[str]]:
+        """Parse a main file's frontmatter through the persistent frontmatter cache.
+
+        Results are memoized in-process across all manager instances and stored
+        under .ve/cache/frontmatter/ so unchanged files are never re-parsed.
+
+        Args:
+            file_path: Path to the artifact's main markdown file.
+
+        Returns:
+            Tuple of (frontmatter, errors) as for parse_frontmatter_with_errors().
+        """
+        from frontmatter_cache import FRONTMATTER_CACHE_DIR, parse_frontmatter_cached
+
+        return parse_frontmatter_cached(
+            file_path,
+            self.frontmatter_model_class,
+            parser=lambda content: self._parse_content_with_errors(content, file_path),
+            cache_dir=self._project_dir / FRONTMATTER_CACHE_DIR,
+        )
+
+    def _parse_content_with_errors(
+        self, content: str, file_path: Path
+    ) -> tuple[FrontmatterT | None, list[str]]:
+        """Parse main file content into validated frontmatter (cache-miss path).
+
+        Subclasses override this to apply artifact-specific handling such as
+        legacy field mapping.
+
+        Args:
+            content: Full markdown content of the main file.
+            file_path: Path the content was read from (for error messages).
+        """
+        from frontmatter import parse_frontmatter_from_content_with_errors
+
+        return parse_frontmatter_from_content_with_errors(
+            content, self.frontmatter_model_class
+        )
 
     def get_status(self, artifact_id: str) -> StatusT:
         """Get the current status of an artifact.
@@ -6,20 +6,24 @@
 # Chunk: docs/chunks/external_chunk_causal - External chunk ordering in ArtifactIndex
 # Chunk: docs/chunks/ordering_active_only - Status-filtered tip detection for causal ordering
 # Chunk: docs/chunks/ordering_remove_seqno - Ancestor computation for causal ordering
+# Chunk: docs/chunks/artifact_index_incremental - Per-artifact incremental index refresh
 
 This module provides the ArtifactIndex class which maintains ordered artifact
 listings using directory enumeration for staleness detection and topological sorting.
 Works in any directory without requiring git.
 """
 
+import hashlib
 import json
+import os
+import time
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from external_refs import ARTIFACT_MAIN_FILE, ARTIFACT_DIR_NAME, is_external_artifact
+from external_refs import ARTIFACT_MAIN_FILE, ARTIFACT_DIR_NAME
 # Chunk: docs/chunks/consolidate_ext_refs - Import ArtifactType from models.py instead of defining locally
 from models import ArtifactType
 
@@ -73,57 +77,58 @@ def _topological_sort_multi_parent(deps: dict[str, list[str]]) -> list[str]:
 
 
 # Chunk: docs/chunks/artifact_index_no_git - Directory enumeration for staleness detection without git
-# Chunk: docs/chunks/consolidate_ext_ref_utils - Updated to use is_external_artifact from external_refs
-def _enumerate_artifacts(artifact_dir: Path, artifact_type: ArtifactType) -> set[str]:
-    """Enumerate artifact directory names.
+# Chunk: docs/chunks/artifact_index_incremental - Single-pass scan with one stat per artifact
+def _scan_artifact_files(
+    artifact_dir: Path, artifact_type: ArtifactType
+) -> dict[str, tuple[str, str, os.stat_result]]:
+    """Scan artifact directories, stating each artifact's defining file once.
+
+    A directory is an artifact if it holds the type's main file (e.g. GOAL.md
+    or OVERVIEW.md), or failing that an external.yaml reference. The file that
+    defines each artifact's ordering data is returned along with its stat
+    result so callers can detect changes without further syscalls. Plain
+    string paths are used because pathlib overhead dominates at thousands of
+    artifacts.
 
     Args:
         artifact_dir: Directory containing artifact subdirectories.
         artifact_type: Type of artifact to determine main file name.
 
     Returns:
-        Set of artifact directory names. Includes directories that have:
-        - The required main file (e.g., GOAL.md or OVERVIEW.md), OR
-        - external.yaml (external artifact reference)
+        Mapping of artifact name -> (kind, path, stat) where kind is "local"
+        (main file present) or "external" (external.yaml only).
     """
-    if not artifact_dir.exists():
-        return set()
-
     main_file = ARTIFACT_MAIN_FILE[artifact_type]
-    result = set()
+    result: dict[str, tuple[str, str, os.stat_result]] = {}
+
+    try:
+        entries = list(os.scandir(artifact_dir))
+    except (FileNotFoundError, NotADirectoryError):
+        return result
 
-    for item in artifact_dir.iterdir():
-        if not item.is_dir():
+    for entry in entries:
+        try:
+            if not entry.is_dir():
+                continue
+        except OSError:
             continue
 
-        main_path = item / main_file
+        main_path = os.path.join(entry.path, main_file)
+        try:
+            result[entry.name] = ("local", main_path, os.stat(main_path))
+            continue
+        except OSError:
+            pass
 
-        if main_path.exists():
-            # Local artifact
-            result.add(item.name)
-        elif is_external_artifact(item, artifact_type):
-            # External artifact reference
-            result.add(item.name)
+        external_path = os.path.join(entry.path, "external.yaml")
+        try:
+            result[entry.name] = ("external", external_path, os.stat(external_path))
+        except OSError:
+            pass
 
     return result
 
 
-# Chunk: docs/chunks/frontmatter_io - Migrated to use shared frontmatter utilities
-def _parse_frontmatter(file_path: Path) -> dict[str, Any] | None:
-    """Parse YAML frontmatter from a markdown file.
-
-    Args:
-        file_path: Path to the markdown file with YAML frontmatter.
-
-    Returns:
-        Parsed frontmatter dict, or None if file doesn't exist,
-        has no frontmatter, or invalid YAML.
-    """
-    from frontmatter import extract_frontmatter_dict
-
-    return extract_frontmatter_dict(file_path)
-
-
 # Chunk: docs/chunks/artifact_pattern_consolidation - Unified created_after normalization
 def _normalize_created_after(value: Any) -> list[str]:
     """Normalize a created_after value to a list of strings.
@@ -155,83 +160,99 @@ def _normalize_created_after(value: Any) -> list[str]:
     return []
 
 
-# Chunk: docs/chunks/artifact_ordering_index - Extracts created_after field from YAML frontmatter
-def _parse_created_after(file_path: Path) -> list[str]:
-    """Parse the created_after field from a file's frontmatter.
+# _ARTIFACT_DIR_NAME is imported from external_refs as ARTIFACT_DIR_NAME
 
-    Args:
-        file_path: Path to the markdown file with YAML frontmatter.
+# Statuses that are considered "active" for tip detection purposes.
+# None means no status filtering (all statuses are tip-eligible).
+_TIP_ELIGIBLE_STATUSES: dict[ArtifactType, set[str] | None] = {
+    ArtifactType.CHUNK: {"ACTIVE", "IMPLEMENTING", "EXTERNAL"},
+    ArtifactType.NARRATIVE: {"ACTIVE"},
+    ArtifactType.INVESTIGATION: None,  # No filtering - all statuses are tips
+    ArtifactType.SUBSYSTEM: None,  # No filtering - all statuses are tips
+}
 
-    Returns:
-        List of artifact names from created_after field.
-        Returns empty list if file doesn't exist, has no frontmatter,
-        invalid YAML, or missing created_after field.
-    """
-    frontmatter = _parse_frontmatter(file_path)
-    if frontmatter is None:
-        return []
+# Index format version for compatibility checks
+_INDEX_VERSION = 4
 
-    return _normalize_created_after(frontmatter.get("created_after", []))
+# Files modified within this window of being recorded may have been rewritten
+# without a visible mtime change (coarse filesystem timestamps). Such entries
+# are re-verified by content hash instead of trusted on their stat signature.
+_RACY_WINDOW_NS = 2_000_000_000
 
 
-def _parse_yaml_created_after(file_path: Path) -> list[str]:
-    """Parse created_after from a plain YAML file (e.g., external.yaml).
+# Chunk: docs/chunks/artifact_ordering_index - Extracts created_after field from YAML frontmatter
+# Chunk: docs/chunks/artifact_index_incremental - Ordering data extracted from already-read content
+def _parse_ordering_fields(kind: str, content: str) -> tuple[list[str], str | None]:
+    """Extract (created_after, status) from an artifact's defining file content.
 
     Args:
-        file_path: Path to a plain YAML file (not markdown frontmatter).
+        kind: "local" for markdown main files, "external" for external.yaml.
+        content: The file content.
 
     Returns:
-        List of artifact names from created_after field.
-        Returns empty list if file doesn't exist, has invalid YAML,
-        or missing created_after field.
+        Tuple of (created_after, status). External artifacts use the
+        "EXTERNAL" pseudo-status, which is always tip-eligible.
     """
-    if not file_path.exists():
-        return []
+    if kind == "external":
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError:
+            data = None
+        if not isinstance(data, dict):
+            return [], "EXTERNAL"
+        return _normalize_created_after(data.get("created_after", [])), "EXTERNAL"
 
-    try:
-        data = yaml.safe_load(file_path.read_text())
-        if not data:
-            return []
+    from frontmatter import extract_frontmatter_dict_from_content
 
-        return _normalize_created_after(data.get("created_after", []))
-    except (yaml.YAMLError, OSError):
-        return []
+    frontmatter = extract_frontmatter_dict_from_content(content)
+    if frontmatter is None:
+        return [], None
+
+    status = frontmatter.get("status")
+    return (
+        _normalize_created_after(frontmatter.get("created_after", [])),
+        status if isinstance(status, str) else None,
+    )
 
 
-def _parse_status(file_path: Path) -> str | None:
-    """Parse the status field from a file's frontmatter.
+def _compute_tips(
+    artifact_type: ArtifactType,
+    ordered: list[str],
+    deps: dict[str, list[str]],
+    statuses: dict[str, str | None],
+) -> list[str]:
+    """Find tips: tip-eligible artifacts not referenced by other eligible artifacts.
 
     Args:
-        file_path: Path to the markdown file with YAML frontmatter.
+        artifact_type: Type of artifact (selects status filtering).
+        ordered: Artifact names in causal order.
+        deps: Mapping of artifact name -> created_after parents.
+        statuses: Mapping of artifact name -> status.
 
     Returns:
-        Status string, or None if file doesn't exist, has no frontmatter,
-        invalid YAML, or missing/invalid status field.
+        Tip names in causal order.
     """
-    frontmatter = _parse_frontmatter(file_path)
-    if frontmatter is None:
-        return None
-
-    status = frontmatter.get("status")
-    if isinstance(status, str):
-        return status
-
-    return None
-
+    eligible_statuses = _TIP_ELIGIBLE_STATUSES[artifact_type]
 
-# _ARTIFACT_DIR_NAME is imported from external_refs as ARTIFACT_DIR_NAME
+    # Determine which artifacts are tip-eligible
+    if eligible_statuses is not None:
+        tip_eligible_artifacts = {
+            name for name, status in statuses.items()
+            if status is not None and status in eligible_statuses
+        }
+    else:
+        tip_eligible_artifacts = set(deps)
 
-# Statuses that are considered "active" for tip detection purposes.
-# None means no status filtering (all statuses are tip-eligible).
-_TIP_ELIGIBLE_STATUSES: dict[ArtifactType, set[str] | None] = {
-    ArtifactType.CHUNK: {"ACTIVE", "IMPLEMENTING", "EXTERNAL"},
-    ArtifactType.NARRATIVE: {"ACTIVE"},
-    ArtifactType.INVESTIGATION: None,  # No filtering - all statuses are tips
-    ArtifactType.SUBSYSTEM: None,  # No filtering - all statuses are tips
-}
+    # Collect artifacts referenced by tip-eligible artifacts
+    # Only references from tip-eligible artifacts count for excluding tips
+    referenced_by_eligible: set[str] = set()
+    for artifact_name in tip_eligible_artifacts:
+        referenced_by_eligible.update(deps.get(artifact_name, []))
 
-# Index format version for compatibility checks
-_INDEX_VERSION = 3
+    return [
+        name for name in ordered
+        if name in tip_eligible_artifacts and name not in referenced_by_eligible
+    ]
 
 
 # Chunk: docs/chunks/artifact_ordering_index - Main class providing cached ordering and tip identification
@@ -243,9 +264,12 @@ class ArtifactIndex:
     - Topological sort (Kahn's algorithm) for causal ordering
     - Fallback to sequence number order when created_after is empty
 
-    The index is stored as JSON (.artifact-order.json) and automatically
-    rebuilds when artifacts are added or removed. Since created_after is
-    immutable after artifact creation, content changes don't require rebuild.
+    The index is stored as JSON (.artifact-order.json). For every artifact it
+    records the defining file's stat signature and content hash together with
+    the parsed created_after and status, so a refresh only re-parses artifacts
+    whose files actually changed. The topological order is only recomputed
+    (from the cached graph, without parsing) when the graph itself changes;
+    status-only changes just recompute tips.
     """
 
     def __init__(self, project_root: Path | None = None):
@@ -276,139 +300,130 @@ class ArtifactIndex:
         self._index_file.write_text(json.dumps(index, indent=2))
 
     # Chunk: docs/chunks/artifact_index_no_git - Directory set comparison for staleness detection
-    def _is_index_stale(
-        self, index: dict[str, Any], artifact_type: ArtifactType
-    ) -> bool:
-        """Check if the index is stale for the given artifact type.
-
-        Staleness is determined by:
-        1. Directory set changes (artifacts added or removed)
-        2. File modification times (any artifact file newer than the index)
-        """
-        type_key = artifact_type.value
-        type_index = index.get(type_key, {})
+    # Chunk: docs/chunks/artifact_index_incremental - Per-artifact change detection and incremental patching
+    def _refresh_type_index(
+        self, type_index: dict[str, Any], artifact_type: ArtifactType
+    ) -> tuple[dict[str, Any], bool]:
+        """Bring a type's index up to date, re-parsing only changed artifacts.
 
-        if not type_index:
-            return True
+        An artifact is re-read when its defining file's stat signature differs
+        from the recorded one, or when the recorded signature is racy (taken
+        within _RACY_WINDOW_NS of the file's mtime). A re-read artifact is only
+        re-parsed if its content hash changed.
 
+        Args:
+            type_index: The currently stored index for this type (may be empty
+                or from an older index version).
+            artifact_type: Type of artifact to refresh.
+
+        Returns:
+            Tuple of (type_index, changed) where changed indicates the index
+            must be persisted.
+        """
         if type_index.get("version") != _INDEX_VERSION:
-            return True
-
-        artifact_dir = self._get_artifact_dir(artifact_type)
-        stored_directories = set(type_index.get("directories", []))
-        current_directories = _enumerate_artifacts(artifact_dir, artifact_type)
-
-        if stored_directories != current_directories:
-            return True
-
-        # Check if any artifact files are newer than the index
-        index_mtime = self._index_file.stat().st_mtime if self._index_file.exists() else 0
-        for artifact_name in current_directories:
-            artifact_path = artifact_dir / artifact_name
-            # Check GOAL.md / OVERVIEW.md
-            goal_path = artifact_path / ARTIFACT_MAIN_FILE[artifact_type]
-            if goal_path.exists() and goal_path.stat().st_mtime > index_mtime:
-                return True
-            # Check external.yaml for external artifacts
-            external_path = artifact_path / "external.yaml"
-            if external_path.exists() and external_path.stat().st_mtime > index_mtime:
-                return True
-
-        return False
+            type_index = {}
+
+        previous: dict[str, dict[str, Any]] = type_index.get("artifacts", {})
+        current = _scan_artifact_files(self._get_artifact_dir(artifact_type), artifact_type)
+        now_ns = time.time_ns()
+
+        artifacts: dict[str, dict[str, Any]] = {}
+        changed = not type_index
+        graph_changed = not type_index or set(previous) != set(current)
+        status_changed = False
+
+        for name, (kind, path, st) in current.items():
+            entry = previous.get(name)
+            if (
+                entry is not None
+                and entry.get("kind") == kind
+                and entry.get("mtime_ns") == st.st_mtime_ns
+                and entry.get("size") == st.st_size
+                and st.st_mtime_ns < entry.get("checked_ns", 0) - _RACY_WINDOW_NS
+            ):
+                artifacts[name] = entry
+                continue
 
-    # Chunk: docs/chunks/artifact_index_no_git - Index building with directories list instead of hashes
-    def _build_index_for_type(self, artifact_type: ArtifactType) -> dict[str, Any]:
-        """Build index data for a specific artifact type."""
-        artifact_dir = self._get_artifact_dir(artifact_type)
-        artifacts = _enumerate_artifacts(artifact_dir, artifact_type)
-
-        if not artifacts:
-            return {
-                "ordered": [],
-                "tips": [],
-                "directories": [],
-                "version": _INDEX_VERSION,
-            }
+            try:
+                with open(path, "rb") as f:
+                    raw = f.read()
+            except OSError:
+                raw = b""
+            digest = hashlib.sha1(raw).hexdigest()
+
+            if entry is not None and entry.get("kind") == kind and entry.get("hash") == digest:
+                # Content unchanged: refresh the stat signature. Only persist
+                # once the entry is trustworthy, so racy files don't cause a
+                # rewrite on every query.
+                refreshed = dict(
+                    entry, mtime_ns=st.st_mtime_ns, size=st.st_size, checked_ns=now_ns
+                )
+                artifacts[name] = refreshed
+                if st.st_mtime_ns < now_ns - _RACY_WINDOW_NS:
+                    changed = True
+                continue
 
-        main_file = ARTIFACT_MAIN_FILE[artifact_type]
-
-        # Build dependency graph and collect statuses
-        deps: dict[str, list[str]] = {}
-        statuses: dict[str, str | None] = {}
-        for artifact_name in artifacts:
-            main_path = artifact_dir / artifact_name / main_file
-            external_path = artifact_dir / artifact_name / "external.yaml"
-
-            if main_path.exists():
-                # Local artifact
-                created_after = _parse_created_after(main_path)
-                status = _parse_status(main_path)
-            elif external_path.exists():
-                # External chunk reference
-                created_after = _parse_yaml_created_after(external_path)
-                status = "EXTERNAL"  # Pseudo-status, always tip-eligible
-            else:
-                # Should not happen given _enumerate_artifacts logic
-                created_after = []
-                status = None
-
-            deps[artifact_name] = created_after
-            statuses[artifact_name] = status
-
-        # Topological sort
-        ordered = _topological_sort_multi_parent(deps)
-
-        # Find tips with status filtering
-        # Tips are artifacts that:
-        # 1. Have a tip-eligible status (or status filtering is disabled for this type), AND
-        # 2. Are not referenced by any other tip-eligible artifact
-        eligible_statuses = _TIP_ELIGIBLE_STATUSES[artifact_type]
-
-        # Determine which artifacts are tip-eligible
-        if eligible_statuses is not None:
-            tip_eligible_artifacts = {
-                name for name, status in statuses.items()
-                if status is not None and status in eligible_statuses
+            created_after, status = _parse_ordering_fields(
+                kind, raw.decode(errors="replace")
+            )
+            artifacts[name] = {
+                "kind": kind,
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "checked_ns": now_ns,
+                "hash": digest,
+                "created_after": created_after,
+                "status": status,
             }
-        else:
-            tip_eligible_artifacts = set(artifacts)
-
-        # Collect artifacts referenced by tip-eligible artifacts
-        # Only references from tip-eligible artifacts count for excluding tips
-        referenced_by_eligible: set[str] = set()
-        for artifact_name in tip_eligible_artifacts:
-            referenced_by_eligible.update(deps.get(artifact_name, []))
-
-        tips: list[str] = []
-        for name in ordered:
-            # Only tip-eligible artifacts can be tips
-            if name not in tip_eligible_artifacts:
-                continue
+            changed = True
+            if entry is None or entry.get("created_after") != created_after:
+                graph_changed = True
+            if entry is None or entry.get("status") != status:
+                status_changed = True
 
-            # Skip artifacts that are referenced by tip-eligible artifacts
-            if name in referenced_by_eligible:
-                continue
+        if not changed and not graph_changed:
+            return type_index, False
+
+        deps = {name: entry["created_after"] for name, entry in artifacts.items()}
+        statuses = {name: entry["status"] for name, entry in artifacts.items()}
 
-            tips.append(name)
+        if graph_changed:
+            ordered = _topological_sort_multi_parent(deps)
+        else:
+            ordered = type_index.get("ordered", [])
+
+        if graph_changed or status_changed:
+            tips = _compute_tips(artifact_type, ordered, deps, statuses)
+        else:
+            tips = type_index.get("tips", [])
 
         return {
             "ordered": ordered,
             "tips": tips,
             "directories": sorted(artifacts),
+            "artifacts": artifacts,
             "version": _INDEX_VERSION,
-        }
+        }, True
+
+    # Chunk: docs/chunks/artifact_index_no_git - Index building with directories list instead of hashes
+    def _build_index_for_type(self, artifact_type: ArtifactType) -> dict[str, Any]:
+        """Build index data for a specific artifact type from scratch."""
+        type_index, _ = self._refresh_type_index({}, artifact_type)
+        return type_index
 
     def _ensure_index_fresh(self, artifact_type: ArtifactType) -> dict[str, Any]:
         """Ensure index is fresh and return the type-specific data."""
         if self._cache is None:
             self._cache = self._load_index()
 
-        if self._is_index_stale(self._cache, artifact_type):
-            type_index = self._build_index_for_type(artifact_type)
+        type_index, changed = self._refresh_type_index(
+            self._cache.get(artifact_type.value, {}), artifact_type
+        )
+        if changed:
             self._cache[artifact_type.value] = type_index
             self._save_index(self._cache)
 
-        return self._cache.get(artifact_type.value, {})
+        return type_index
 
     # Chunk: docs/chunks/artifact_ordering_index - Returns topologically sorted artifact names in causal order
     def get_ordered(self, artifact_type: ArtifactType) -> list[str]:
@@ -474,24 +489,12 @@ class ArtifactIndex:
         Returns:
             Set of artifact directory names that are ancestors.
         """
-        artifact_dir = self._get_artifact_dir(artifact_type)
-        main_file = ARTIFACT_MAIN_FILE[artifact_type]
-
-        # Build dependency graph
-        artifacts = _enumerate_artifacts(artifact_dir, artifact_type)
-        deps: dict[str, list[str]] = {}
-        for name in artifacts:
-            main_path = artifact_dir / name / main_file
-            external_path = artifact_dir / name / "external.yaml"
-
-            if main_path.exists():
-                created_after = _parse_created_after(main_path)
-            elif external_path.exists():
-                created_after = _parse_yaml_created_after(external_path)
-            else:
-                created_after = []
-
-            deps[name] = created_after
+        # Chunk: docs/chunks/artifact_index_incremental - Dependency graph from the index instead of re-parsing
+        type_index = self._ensure_index_fresh(artifact_type)
+        deps: dict[str, list[str]] = {
+            name: entry["created_after"]
+            for name, entry in type_index.get("artifacts", {}).items()
+        }
 
         if artifact_name not in deps:
             return set()
@@ -41,6 +41,47 @@ CHUNK_BACKREF_PATTERN = re.compile(r"^#\s+Chunk:\s+docs/chunks/([a-z0-9_-]+)", r
 NARRATIVE_BACKREF_PATTERN = re.compile(r"^#\s+Narrative:\s+docs/narratives/([a-z0-9_-]+)", re.MULTILINE)
 SUBSYSTEM_BACKREF_PATTERN = re.compile(r"^#\s+Subsystem:\s+docs/subsystems/([a-z0-9_-]+)", re.MULTILINE)
 
+# Chunk: docs/chunks/integrity_parallel_scan - Single-pass chunk/subsystem backreference matching
+# Matches exactly the lines CHUNK_BACKREF_PATTERN or SUBSYSTEM_BACKREF_PATTERN
+# match, so one regex evaluation per line replaces two.
+CODE_BACKREF_LINE_PATTERN = re.compile(
+    r"#\s+(?:Chunk:\s+docs/chunks/(?P<chunk>[a-z0-9_-]+)"
+    r"|Subsystem:\s+docs/subsystems/(?P<subsystem>[a-z0-9_-]+))"
+)
+
+
+# Chunk: docs/chunks/integrity_parallel_scan - Single-pass chunk/subsystem backreference matching
+def scan_code_backreferences(content: str) -> list[tuple[int, str, str]]:
+    """Find chunk and subsystem backreference lines in file content.
+
+    Lines are numbered with the same `str.splitlines()` semantics the
+    integrity validator reports. Content without any `Chunk:` or
+    `Subsystem:` marker is rejected without splitting it into lines.
+
+    Args:
+        content: Full text of a source file.
+
+    Returns:
+        List of (line_number, kind, artifact_id) in file order, where kind
+        is "chunk" or "subsystem" and line numbers are 1-indexed.
+    """
+    if "Chunk:" not in content and "Subsystem:" not in content:
+        return []
+
+    hits: list[tuple[int, str, str]] = []
+    for line_num, line in enumerate(content.splitlines(), start=1):
+        if not line.startswith("#"):
+            continue
+        match = CODE_BACKREF_LINE_PATTERN.match(line)
+        if match is None:
+            continue
+        chunk_id = match.group("chunk")
+        if chunk_id is not None:
+            hits.append((line_num, "chunk", chunk_id))
+        else:
+            hits.append((line_num, "subsystem", match.group("subsystem")))
+    return hits
+
 
 def count_backreferences(
     project_dir: pathlib.Path,
@@ -23,6 +23,11 @@ from board.crypto import sign
 
 logger = logging.getLogger(__name__)
 
+# Chunk: docs/chunks/leader_board_stream_watch - Streaming watch credit window
+# Messages a streaming watch may have in flight per channel; credits are
+# returned once half the window has been consumed
+DEFAULT_STREAM_WINDOW = 256
+
 # Chunk: docs/chunks/board_watch_handshake_retry - Centralized retryable exception tuple
 # Chunk: docs/chunks/watch_handshake_timeout_retry - asyncio.TimeoutError for Python < 3.11 safety
 _RETRYABLE_ERRORS = (
@@ -422,12 +427,15 @@ class BoardClient:
     # Chunk: docs/chunks/watchmulti_manual_ack - Manual ack mode
     # Chunk: docs/chunks/board_watch_stale_reconnect - Stale connection detection via re-registration
     # Chunk: docs/chunks/watch_idle_reconnect_budget - Raises StaleWatchError on stale timeout enabling budget-exempt idle reconnect
+    # Chunk: docs/chunks/leader_board_stream_watch - Streaming subscription mode
     async def watch_multi(
         self,
         channels: dict[str, int],
         count: int = 1,
         auto_ack: bool = True,
         stale_timeout: float = 300,
+        stream: bool = False,
+        window: int = DEFAULT_STREAM_WINDOW,
     ) -> AsyncGenerator[dict, None]:
         """Watch multiple channels on a single connection.
 
@@ -458,24 +466,45 @@ class BoardClient:
             Seconds to wait for a message before re-registering all watch
             frames on the existing connection. Default 300 (5 minutes).
             Set to ``0`` to disable stale detection.
+        stream:
+            When ``True``, opens one streaming subscription per channel: the
+            server pushes the backlog and new messages in ``messages``
+            batches without a watch round trip per message. Requires
+            ``auto_ack``. Servers without streaming support answer with
+            single ``message`` frames, which are handled as in the default
+            mode.
+        window:
+            Streaming credit window: how many messages per channel the
+            server may send ahead of the consumer.
 
         Yields dicts with keys: channel, position, body, sent_at.
         """
+        if stream and not auto_ack:
+            raise ValueError("stream mode requires auto_ack")
+
         # Track current cursors (updated as messages are delivered)
         cursors = dict(channels)
+        # Streamed messages consumed per channel since credits were last returned
+        consumed: dict[str, int] = {}
+
+        def _watch_frame(channel: str, cursor: int) -> dict:
+            frame = {
+                "type": "watch",
+                "channel": channel,
+                "swarm": self.swarm_id,
+                "cursor": cursor,
+            }
+            if stream:
+                frame.update(stream=True, max_batch=window, credits=window)
+            return frame
 
         # Send initial watch frames for all channels
         async def _send_all_watch_frames() -> None:
+            consumed.clear()
             for channel, cursor in cursors.items():
                 if channel not in active_channels:
                     continue
-                frame = {
-                    "type": "watch",
-                    "channel": channel,
-                    "swarm": self.swarm_id,
-                    "cursor": cursor,
-                }
-                await self._ws.send(json.dumps(frame))
+                await self._ws.send(json.dumps(_watch_frame(channel, cursor)))
 
         # Track active channels (channels that haven't errored)
         active_channels = set(channels.keys())
@@ -537,6 +566,26 @@ class BoardClient:
                     raise BoardError(code, error_msg)
                 continue
 
+            if stream and response.get("type") == "messages":
+                channel = response["channel"]
+                for message in response["messages"]:
+                    yield {"channel": channel, **message}
+                    cursors[channel] = message["position"]
+                    delivered += 1
+                    if count > 0 and delivered >= count:
+                        return
+                # Return credits in bulk rather than one frame per message
+                consumed[channel] = consumed.get(channel, 0) + len(response["messages"])
+                if consumed[channel] * 2 >= window and channel in active_channels:
+                    frame = {
+                        "type": "credit",
+                        "channel": channel,
+                        "swarm": self.swarm_id,
+                        "credits": consumed.pop(channel),
+                    }
+                    await self._ws.send(json.dumps(frame))
+                continue
+
             if response.get("type") != "message":
                 raise BoardError(
                     "protocol_error",
@@ -564,13 +613,7 @@ class BoardClient:
             # Re-send watch frame for this channel with updated cursor
             # Chunk: docs/chunks/watchmulti_manual_ack - Skip re-send when auto_ack=False
             if auto_ack and channel in active_channels:
-                frame = {
-                    "type": "watch",
-                    "channel": channel,
-                    "swarm": self.swarm_id,
-                    "cursor": position,
-                }
-                await self._ws.send(json.dumps(frame))
+                await self._ws.send(json.dumps(_watch_frame(channel, position)))
 
     # Chunk: docs/chunks/multichannel_watch - Reconnect wrapper for multi-channel watch
     # Chunk: docs/chunks/watchmulti_exit_on_message - Count-limited reconnect wrapper
@@ -586,6 +629,8 @@ class BoardClient:
         count: int = 1,
         auto_ack: bool = True,
         stale_timeout: float = 300,
+        stream: bool = False,
+        window: int = DEFAULT_STREAM_WINDOW,
     ) -> AsyncGenerator[dict, None]:
         """Watch multiple channels with automatic reconnect on connection failure.
 
@@ -609,6 +654,11 @@ class BoardClient:
         stale_timeout:
             Seconds to wait for a message before re-registering watch
             frames. Passed through to ``watch_multi``. Default 300.
+        stream:
+            Use streaming subscriptions. Passed through to ``watch_multi``;
+            after a reconnect the streams restart from the latest cursors.
+        window:
+            Streaming credit window. Passed through to ``watch_multi``.
 
         Yields dicts with keys: channel, position, body, sent_at.
         """
@@ -627,7 +677,12 @@ class BoardClient:
                 # reconnect wrapper manages the overall message cap so that
                 # reconnects don't reset the count.
                 async for msg in self.watch_multi(
-                    cursors, count=0, auto_ack=auto_ack, stale_timeout=current_stale_timeout
+                    cursors,
+                    count=0,
+                    auto_ack=auto_ack,
+                    stale_timeout=current_stale_timeout,
+                    stream=stream,
+                    window=window,
                 ):
                     # Update cursor for the channel that delivered a message
                     cursors[msg["channel"]] = msg["position"]
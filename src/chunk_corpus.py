@@ -0,0 +1,360 @@
+"""Persisted TF-IDF corpus model for chunk similarity.
+
+# Subsystem: docs/subsystems/cluster_analysis - Chunk naming and clustering
+# Chunk: docs/chunks/cluster_tfidf_corpus - Persisted incremental TF-IDF corpus
+
+Prefix suggestion, singleton merge suggestions and chunk clustering all
+compare chunks by the TF-IDF cosine similarity of their GOAL.md text. Doing
+that with scikit-learn means importing it (seconds on its own), re-reading
+every GOAL.md, re-fitting a vectorizer and building a dense similarity matrix
+on every invocation.
+
+This module keeps the expensive part on disk instead. A ChunkCorpus stores,
+under `.ve/cache/tfidf/`:
+
+- per-document term counts (unigrams and bigrams), keyed by the GOAL.md path
+  and recorded with the SHA-256 of the bytes they were built from, and
+- corpus-wide document frequencies and total term counts, maintained
+  incrementally as documents are added, changed or removed.
+
+Syncing the corpus only tokenizes GOAL.md files whose content changed. A
+TfidfModel built from the stored counts reproduces
+`TfidfVectorizer(stop_words="english", max_features=500, ngram_range=(1, 2))`
+(raw term counts, smoothed idf, l2-normalized rows) and answers similarity
+queries through a sparse inverted index.
+
+The cache is best-effort: an unreadable or corrupt store is rebuilt from the
+GOAL.md files and write failures (e.g., read-only checkouts) are ignored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+# Bump when the on-disk layout or the analyzer changes
+_CORPUS_FORMAT_VERSION = 1
+
+# Directory (relative to the corpus root) holding the persisted corpus
+CORPUS_CACHE_DIR = Path(".ve") / "cache" / "tfidf"
+
+# Vocabulary size, matching the former TfidfVectorizer(max_features=500)
+MAX_FEATURES = 500
+
+# Same tokenization as scikit-learn's default token_pattern
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+# scikit-learn's English stop word list (stop_words="english")
+ENGLISH_STOP_WORDS = frozenset(
+    """
+    a about above across after afterwards again against all almost alone
+    along already also although always am among amongst amoungst amount an
+    and another any anyhow anyone anything anyway anywhere are around as at
+    back be became because become becomes becoming been before beforehand
+    behind being below beside besides between beyond bill both bottom but by
+    call can cannot cant co con could couldnt cry de describe detail do done
+    down due during each eg eight either eleven else elsewhere empty enough
+    etc even ever every everyone everything everywhere except few fifteen
+    fifty fill find fire first five for former formerly forty found four from
+    front full further get give go had has hasnt have he hence her here
+    hereafter hereby herein hereupon hers herself him himself his how however
+    hundred i ie if in inc indeed interest into is it its itself keep last
+    latter latterly least less ltd made many may me meanwhile might mill mine
+    more moreover most mostly move much must my myself name namely neither
+    never nevertheless next nine no nobody none noone nor not nothing now
+    nowhere of off often on once one only onto or other others otherwise our
+    ours ourselves out over own part per perhaps please put rather re same see
+    seem seemed seeming seems serious several she should show side since
+    sincere six sixty so some somehow someone something sometime sometimes
+    somewhere still such system take ten than that the their them themselves
+    then thence there thereafter thereby therefore therein thereupon these
+    they thick thin third this those though three through throughout thru
+    thus to together too top toward towards twelve twenty two un under until
+    up upon us very via was we well were what whatever when whence whenever
+    where whereafter whereas whereby wherein whereupon wherever whether which
+    while whither who whoever whole whom whose why will with within without
+    would yet you your yours yourself yourselves
+    """.split()
+)
+
+
+def analyze(text: str) -> Counter[str]:
+    """Count the unigram and bigram terms of a document.
+
+    Text is lowercased and tokenized into runs of two or more word
+    characters. Stop words are dropped before bigrams are formed, so a bigram
+    may join words that were separated by a stop word in the original text.
+    """
+    tokens = [
+        token
+        for token in _TOKEN_RE.findall(text.lower())
+        if token not in ENGLISH_STOP_WORDS
+    ]
+    counts = Counter(tokens)
+    counts.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    return counts
+
+
+@dataclass
+class CorpusDocument:
+    """Stored analysis of one GOAL.md."""
+
+    name: str  # Chunk name the document belongs to
+    digest: str  # SHA-256 of the GOAL.md bytes the counts were built from
+    blank: bool  # True when the goal text was empty after extraction
+    terms: dict[str, int] = field(default_factory=dict)
+
+
+class TfidfModel:
+    """TF-IDF vectors for a set of corpus documents.
+
+    Build through ChunkCorpus.model(). Vectors are sparse dicts restricted to
+    the vocabulary and l2-normalized, so cosine similarity is a dot product.
+
+    Raises:
+        ValueError: If no document contains any vocabulary term (the same
+            condition TfidfVectorizer reports as an empty vocabulary).
+    """
+
+    def __init__(
+        self,
+        documents: dict[str, CorpusDocument],
+        doc_freq: dict[str, int],
+        term_totals: dict[str, int],
+        max_features: int = MAX_FEATURES,
+    ):
+        # Highest corpus-wide counts win. Ties at the cutoff are broken
+        # alphabetically so the vocabulary is deterministic.
+        vocabulary = heapq.nsmallest(
+            max_features,
+            (term for term, total in term_totals.items() if total > 0),
+            key=lambda term: (-term_totals[term], term),
+        )
+        if not vocabulary:
+            raise ValueError("empty vocabulary; documents contain only stop words")
+
+        n_docs = len(documents)
+        self.idf = {
+            term: math.log((1 + n_docs) / (1 + doc_freq[term])) + 1.0
+            for term in vocabulary
+        }
+
+        self.vectors: dict[str, dict[str, float]] = {}
+        self._postings: dict[str, list[tuple[str, float]]] = {}
+        for key, doc in documents.items():
+            weights = {
+                term: count * self.idf[term]
+                for term, count in doc.terms.items()
+                if term in self.idf
+            }
+            norm = math.sqrt(sum(w * w for w in weights.values()))
+            if norm > 0:
+                weights = {term: w / norm for term, w in weights.items()}
+            self.vectors[key] = weights
+            for term, weight in weights.items():
+                self._postings.setdefault(term, []).append((key, weight))
+
+    def similarities(self, key: str) -> dict[str, float]:
+        """Cosine similarity between one document and every document sharing a term.
+
+        Documents with no term in common (similarity 0.0) are omitted; the
+        document itself is included.
+        """
+        scores: dict[str, float] = {}
+        for term, weight in self.vectors[key].items():
+            for other, other_weight in self._postings[term]:
+                scores[other] = scores.get(other, 0.0) + weight * other_weight
+        return scores
+
+    def top_k(
+        self, keys: list[str], index: int, k: int
+    ) -> list[tuple[int, float]]:
+        """The k documents most similar to keys[index], excluding itself.
+
+        Args:
+            keys: Candidate document keys, in corpus order.
+            index: Position of the query document in keys.
+            k: Maximum number of results.
+
+        Returns:
+            (position in keys, similarity) pairs, most similar first. Ties
+            keep corpus order, and documents with zero similarity fill the
+            result when fewer than k documents share a term with the query.
+        """
+        scores = self.similarities(keys[index])
+        ranked = heapq.nsmallest(
+            k,
+            (i for i in range(len(keys)) if i != index),
+            key=lambda i: (-scores.get(keys[i], 0.0), i),
+        )
+        return [(i, scores.get(keys[i], 0.0)) for i in ranked]
+
+
+class ChunkCorpus:
+    """Persisted, incrementally updated term statistics for GOAL.md files.
+
+    Args:
+        root: Project or task directory; the store lives under
+            root/.ve/cache/tfidf/.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.path = self.root / CORPUS_CACHE_DIR / "corpus.json"
+        self._root_prefix = os.path.join(os.fspath(self.root), "")
+        self.documents: dict[str, CorpusDocument] = {}
+        self.doc_freq: dict[str, int] = {}
+        self.term_totals: dict[str, int] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _CORPUS_FORMAT_VERSION:
+            return
+        try:
+            documents = {
+                key: CorpusDocument(
+                    name=entry["name"],
+                    digest=entry["digest"],
+                    blank=entry["blank"],
+                    terms=entry["terms"],
+                )
+                for key, entry in data["documents"].items()
+            }
+            doc_freq = data["doc_freq"]
+            term_totals = data["term_totals"]
+        except (KeyError, TypeError, AttributeError):
+            return
+        self.documents = documents
+        self.doc_freq = doc_freq
+        self.term_totals = term_totals
+
+    def save(self) -> None:
+        """Atomically write the store if it changed, ignoring filesystem failures."""
+        if not self._dirty:
+            return
+        data = {
+            "version": _CORPUS_FORMAT_VERSION,
+            "documents": {
+                key: {
+                    "name": doc.name,
+                    "digest": doc.digest,
+                    "blank": doc.blank,
+                    "terms": doc.terms,
+                }
+                for key, doc in self.documents.items()
+            },
+            "doc_freq": self.doc_freq,
+            "term_totals": self.term_totals,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            return
+        self._dirty = False
+
+    def _key(self, goal_path: Path) -> str:
+        # String prefix test; Path.relative_to is slow across thousands of chunks
+        path = os.fspath(goal_path)
+        if path.startswith(self._root_prefix):
+            return Path(path[len(self._root_prefix):]).as_posix()
+        return goal_path.resolve().as_posix()
+
+    def _apply(self, terms: dict[str, int], sign: int) -> None:
+        for term, count in terms.items():
+            df = self.doc_freq.get(term, 0) + sign
+            total = self.term_totals.get(term, 0) + sign * count
+            if df > 0:
+                self.doc_freq[term] = df
+                self.term_totals[term] = total
+            else:
+                self.doc_freq.pop(term, None)
+                self.term_totals.pop(term, None)
+
+    def _remove(self, key: str) -> None:
+        doc = self.documents.pop(key)
+        self._apply(doc.terms, -1)
+        self._dirty = True
+
+    def sync(self, documents: Iterable[tuple[str, Path]]) -> list[str]:
+        """Make the store match the given GOAL.md files and persist it.
+
+        Only files whose content hash differs from the stored entry are
+        re-extracted and re-tokenized. Stored documents not listed are
+        dropped, so the corpus-wide statistics always describe exactly the
+        synced set.
+
+        Args:
+            documents: (chunk_name, goal_path) pairs, in corpus order.
+
+        Returns:
+            Document keys in the same order, one per pair, for lookups
+            against model().
+        """
+        from chunks import extract_goal_text
+
+        keys: list[str] = []
+        for name, goal_path in documents:
+            key = self._key(Path(goal_path))
+            keys.append(key)
+            try:
+                raw = Path(goal_path).read_bytes()
+            except OSError:
+                # Unreadable files count as empty, like extract_goal_text
+                raw = b""
+            digest = hashlib.sha256(raw).hexdigest()
+            existing = self.documents.get(key)
+            if existing is not None:
+                if existing.digest == digest and existing.name == name:
+                    continue
+                self._remove(key)
+
+            text = extract_goal_text(Path(goal_path))
+            terms = dict(analyze(text))
+            self.documents[key] = CorpusDocument(
+                name=name, digest=digest, blank=not text.strip(), terms=terms
+            )
+            self._apply(terms, 1)
+            self._dirty = True
+
+        listed = set(keys)
+        for key in [key for key in self.documents if key not in listed]:
+            self._remove(key)
+
+        self.save()
+        return keys
+
+    def model(self, keys: list[str] | None = None) -> TfidfModel:
+        """Build TF-IDF vectors over all stored documents or a subset.
+
+        The full corpus reuses the persisted document frequencies; a subset
+        aggregates them from the stored per-document counts.
+
+        Raises:
+            ValueError: If the selected documents have an empty vocabulary.
+        """
+        if keys is None or set(keys) == set(self.documents):
+            return TfidfModel(self.documents, self.doc_freq, self.term_totals)
+
+        documents = {key: self.documents[key] for key in keys}
+        doc_freq: Counter[str] = Counter()
+        term_totals: Counter[str] = Counter()
+        for doc in documents.values():
+            doc_freq.update(doc.terms.keys())
+            term_totals.update(doc.terms)
+        return TfidfModel(documents, doc_freq, term_totals)
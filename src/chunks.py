@@ -510,6 +510,7 @@ class Chunks(ArtifactManager[ChunkFrontmatter, ChunkStatus]):
 
     # Chunk: docs/chunks/coderef_format_prompting - Frontmatter parsing that surfaces validation error details
     # Chunk: docs/chunks/frontmatter_io - Migrated to use shared frontmatter utilities
+    # Chunk: docs/chunks/frontmatter_parse_cache - Parses through the shared frontmatter cache
     def parse_chunk_frontmatter_with_errors(
         self, chunk_id: str
     ) -> tuple[ChunkFrontmatter | None, list[str]]:
@@ -520,13 +521,11 @@ class Chunks(ArtifactManager[ChunkFrontmatter, ChunkStatus]):
             - ChunkFrontmatter is the parsed frontmatter if valid, None otherwise
             - errors is a list of error messages (empty if parsing succeeded)
         """
-        from frontmatter import parse_frontmatter_with_errors
-
         goal_path = self.get_chunk_goal_path(chunk_id)
         if goal_path is None or not goal_path.exists():
             return None, [f"Chunk '{chunk_id}' not found"]
 
-        return parse_frontmatter_with_errors(goal_path, ChunkFrontmatter)
+        return self._parse_file_with_errors(goal_path)
 
     # Chunk: docs/chunks/task_chunk_validation - Parse frontmatter from cached content strings
     # Chunk: docs/chunks/frontmatter_io - Migrated to use shared frontmatter utilities
@@ -79,11 +79,65 @@ def board():
     default=None,
     help=f"Storage directory (default: {DEFAULT_STORAGE_DIR})",
 )
-def start_cmd(host: str, port: int, storage_dir: Path | None) -> None:
+# Chunk: docs/chunks/leader_board_tail_cache - Configurable tail cache ceiling
+@click.option(
+    "--tail-cache-mb",
+    type=click.IntRange(min=0),
+    default=64,
+    show_default=True,
+    help="Memory for caching recent channel messages (0 = disabled)",
+)
+# Chunk: docs/chunks/leader_board_fs_writer - Storage durability mode
+@click.option(
+    "--durability",
+    type=click.Choice(["none", "batched", "per-message"]),
+    default="batched",
+    show_default=True,
+    help="When appended messages are fsynced to disk",
+)
+def start_cmd(
+    host: str,
+    port: int,
+    storage_dir: Path | None,
+    tail_cache_mb: int,
+    durability: str,
+) -> None:
     """Start the local leader board WebSocket server."""
     from leader_board.server import run_server
 
-    run_server(storage_dir=storage_dir, host=host, port=port)
+    run_server(
+        storage_dir=storage_dir,
+        host=host,
+        port=port,
+        tail_cache_bytes=tail_cache_mb * 1024 * 1024,
+        durability=durability,
+    )
+
+
+# Chunk: docs/chunks/leader_board_binary_records - Convert stored channels to binary records
+@board.command("migrate-storage")
+@click.option(
+    "--storage-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help=f"Storage directory (default: {DEFAULT_STORAGE_DIR})",
+)
+def migrate_storage_cmd(storage_dir: Path | None) -> None:
+    """Convert stored channels to the binary record format.
+
+    Channels are converted on first use anyway; this converts them all now.
+    Stop the server first.
+    """
+    from leader_board.fs_storage import FileSystemStorage
+
+    storage = FileSystemStorage(storage_dir or DEFAULT_STORAGE_DIR)
+    results = [r for r in storage.migrate() if r.converted]
+    for r in results:
+        click.echo(
+            f"{r.swarm_id}/{r.channel}: {r.bytes_before} -> {r.bytes_after} bytes"
+        )
+    saved = sum(r.bytes_before - r.bytes_after for r in results)
+    click.echo(f"Converted {len(results)} channel(s), saved {saved} bytes")
 
 
 @board.group()
@@ -313,7 +367,9 @@ def watch_cmd(channel: str, swarm: str | None, server: str | None, project_root:
 @click.option("--offset", type=int, default=None, help="Start reading from this position instead of the persisted cursor")
 # Chunk: docs/chunks/board_watch_reconnect_fix - Configurable reconnect limit
 @click.option("--max-reconnects", type=int, default=10, show_default=True, help="Max reconnect attempts before giving up (0 = unlimited)")
-def watch_multi_cmd(channels: tuple[str, ...], swarm: str | None, server: str | None, project_root: Path | None, no_reconnect: bool, count: int, no_auto_ack: bool, offset: int | None, max_reconnects: int) -> None:
+# Chunk: docs/chunks/leader_board_stream_watch - Streaming subscription flag
+@click.option("--stream", is_flag=True, help="Receive backlogs in batches over a streaming subscription")
+def watch_multi_cmd(channels: tuple[str, ...], swarm: str | None, server: str | None, project_root: Path | None, no_reconnect: bool, count: int, no_auto_ack: bool, offset: int | None, max_reconnects: int, stream: bool) -> None:
     """Watch multiple channels on a single connection.
 
     Blocks and prints messages from any subscribed channel.
@@ -326,10 +382,16 @@ def watch_multi_cmd(channels: tuple[str, ...], swarm: str | None, server: str |
     includes position for manual acking via 've board ack'.
     Output format: [channel-name] position=N message text
 
+    With --stream, the server pushes each channel's backlog and new
+    messages in batches instead of one message per watch round trip.
+    Cannot be combined with --no-auto-ack.
+
     Exit codes: 0 = success, 1 = configuration error, 3 = reconnect exhaustion.
     """
     if project_root is not None and not project_root.exists():
         raise click.BadParameter(f"Path '{project_root}' does not exist.", param_hint="'--project-root'")
+    if stream and no_auto_ack:
+        raise click.BadParameter("--stream cannot be combined with --no-auto-ack.", param_hint="'--stream'")
     project_root = resolve_board_root(project_root)
 
     config = load_board_config()
@@ -380,9 +442,9 @@ def watch_multi_cmd(channels: tuple[str, ...], swarm: str | None, server: str |
         try:
             auto_ack = not no_auto_ack
             if no_reconnect:
-                gen = client.watch_multi(channel_cursors, count=count, auto_ack=auto_ack)
+                gen = client.watch_multi(channel_cursors, count=count, auto_ack=auto_ack, stream=stream)
             else:
-                gen = client.watch_multi_with_reconnect(channel_cursors, count=count, auto_ack=auto_ack, max_retries=max_retries)
+                gen = client.watch_multi_with_reconnect(channel_cursors, count=count, auto_ack=auto_ack, max_retries=max_retries, stream=stream)
 
             async for msg in gen:
                 plaintext = decrypt(msg["body"], sym_key)
@@ -1102,12 +1102,19 @@ def backrefs(project_dir, threshold, pattern):
     click.echo(f"Total: {len(above_threshold)} file(s) above threshold")
 
 
+# Chunk: docs/chunks/cluster_knn_graph - --method option for sparse clustering
 @chunk.command("cluster")
 @click.argument("chunk_ids", nargs=-1)
 @click.option("--project-dir", type=click.Path(exists=True, path_type=pathlib.Path), default=".")
 @click.option("--min-similarity", type=float, default=0.3, help="Minimum similarity to cluster (default: 0.3)")
 @click.option("--all", "cluster_all", is_flag=True, help="Cluster all ACTIVE chunks")
-def cluster(chunk_ids, project_dir, min_similarity, cluster_all):
+@click.option(
+    "--method",
+    type=click.Choice(["auto", "dense", "knn"]),
+    default="auto",
+    help="dense: full similarity matrix; knn: sparse nearest-neighbour graph for large corpora (default: auto)",
+)
+def cluster(chunk_ids, project_dir, min_similarity, cluster_all, method):
     """Cluster chunks by content similarity for narrative consolidation.
 
     Groups related chunks based on TF-IDF similarity of their GOAL.md content.
@@ -1116,6 +1123,7 @@ def cluster(chunk_ids, project_dir, min_similarity, cluster_all):
     Examples:
         ve chunk cluster --all                    # Cluster all ACTIVE chunks
         ve chunk cluster chunk1 chunk2 chunk3    # Cluster specific chunks
+        ve chunk cluster --all --method knn       # Sparse mode for thousands of chunks
     """
     from chunks import cluster_chunks
 
@@ -1129,7 +1137,9 @@ def cluster(chunk_ids, project_dir, min_similarity, cluster_all):
         click.echo("Error: Provide chunk IDs or use --all to cluster all ACTIVE chunks", err=True)
         raise SystemExit(1)
 
-    result = cluster_chunks(project_dir, chunk_ids=target_chunks, min_similarity=min_similarity)
+    result = cluster_chunks(
+        project_dir, chunk_ids=target_chunks, min_similarity=min_similarity, method=method
+    )
 
     if not result.clusters:
         click.echo("No clusters found.")
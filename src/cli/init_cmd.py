@@ -6,6 +6,8 @@ These are direct commands on the root cli group, not part of a command group.
 # Chunk: docs/chunks/project_init_command - CLI init command implementation
 # Chunk: docs/chunks/integrity_validate - Project-wide referential integrity validation
 # Chunk: docs/chunks/validate_external_chunks - External chunk skip reporting in verbose output
+# Chunk: docs/chunks/integrity_parallel_scan - --jobs option for process-pool validation
+# Chunk: docs/chunks/validate_since_ref - --since option for incremental validation
 
 import pathlib
 
@@ -49,7 +51,20 @@ def init(project_dir):
 @click.option("--project-dir", type=click.Path(exists=True, path_type=pathlib.Path), default=".")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed statistics")
 @click.option("--strict", is_flag=True, help="Treat warnings as errors")
-def validate(project_dir, verbose, strict):
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Worker processes for parsing artifacts and scanning source files (0 = one per CPU)",
+)
+@click.option(
+    "--since",
+    metavar="REF",
+    default=None,
+    help="Only check artifacts and source files affected by changes since this git ref",
+)
+def validate(project_dir, verbose, strict, jobs, since):
     """Validate referential integrity across all artifacts.
 
     Checks that all cross-artifact references are valid:
@@ -57,12 +72,21 @@ def validate(project_dir, verbose, strict):
     - Code backreferences (# Chunk: and # Subsystem: comments)
     - Proposed chunks in narratives, investigations, and friction log
 
+    With --since, only artifacts and source files affected by changes between
+    REF and the working tree are checked, including references broken by
+    deleting or renaming an artifact.
+
     Returns non-zero exit code if errors are found.
     """
     from integrity import IntegrityValidator
+    from source_files import GitRefError
 
-    validator = IntegrityValidator(project_dir)
-    result = validator.validate()
+    validator = IntegrityValidator(project_dir, jobs=jobs)
+    try:
+        result = validator.validate(since=since)
+    except GitRefError as e:
+        click.echo(f"Error: {e}", err=True)
+        raise SystemExit(1)
 
     # Show statistics if verbose
     if verbose:
@@ -26,6 +26,7 @@ from orchestrator.dependencies import (
     read_chunk_dependencies,
     validate_external_dependencies,
 )
+from orchestrator.models import WorkUnitPhase
 
 
 # Chunk: docs/chunks/orch_daemon_root_resolution - Orch CLI root resolution
@@ -500,7 +501,7 @@ def orch_prioritize(chunk, priority, json_output, project_dir):
 
 @orch.command("config")
 @click.option("--max-agents", type=int, help="Maximum concurrent agents")
-@click.option("--dispatch-interval", type=float, help="Dispatch interval in seconds")
+@click.option("--dispatch-interval", type=float, help="Fallback dispatch interval in seconds (state changes dispatch immediately)")
 # Chunk: docs/chunks/orch_worktree_retain - CLI option for worktree warning threshold
 @click.option("--worktree-threshold", type=int, help="Warning threshold for retained worktrees (default: 10)")
 # Chunk: docs/chunks/orch_max_turns_config - CLI options for per-phase turn budgets
@@ -901,33 +902,53 @@ def orch_analyze(chunk_a, chunk_b, json_output, project_dir):
 @orch.command("tail")
 @click.argument("chunk")
 @click.option("-f", "--follow", is_flag=True, help="Follow log output in real-time")
+@click.option("-n", "--last", type=click.IntRange(min=0), default=None, help="Show only the last N log entries")
+@click.option("--phase", "phases", multiple=True, type=click.Choice([p.value.lower() for p in WorkUnitPhase], case_sensitive=False), help="Only show this phase (repeatable)")
+@click.option("--since", default=None, help="Only entries at or after this time (ISO 8601 or Unix seconds)")
+@click.option("--until", default=None, help="Only entries at or before this time (ISO 8601 or Unix seconds)")
 @click.option("--project-dir", type=click.Path(exists=True, path_type=pathlib.Path), default=None)
 # Chunk: docs/chunks/cli_decompose - Refactored to use log_streaming module
-def orch_tail(chunk, follow, project_dir):
+# Chunk: docs/chunks/orch_paged_log_view - Range options backed by the log index
+def orch_tail(chunk, follow, last, phases, since, until, project_dir):
     """Stream log output for an orchestrator work unit.
 
     Displays parsed, human-readable log output for CHUNK. Shows tool calls,
     tool results, and assistant messages in a condensed format.
 
+    Use --last, --phase, --since and --until to show part of a long log;
+    only the selected entries are read.
+
     Use -f to follow the log in real-time as the agent works.
     """
     project_dir = resolve_orch_project_dir(project_dir)
-    import time
     from orchestrator.log_parser import (
-        parse_log_file,
         format_entry,
         format_phase_header,
         parse_log_line,
     )
     from orchestrator.log_streaming import (
         get_phase_log_files,
+        display_log_records,
         display_phase_log,
+        parse_log_time,
+        read_log_pages,
+        watch_log_dir,
         PHASE_ORDER,
     )
+    from orchestrator.phase_log import log_end, read_records
 
     # Normalize chunk path
     chunk = strip_artifact_path_prefix(chunk, ArtifactType.CHUNK)
 
+    try:
+        since_ts = parse_log_time(since) if since is not None else None
+    except ValueError:
+        raise click.BadParameter(f"Invalid time '{since}'.", param_hint="'--since'")
+    try:
+        until_ts = parse_log_time(until) if until is not None else None
+    except ValueError:
+        raise click.BadParameter(f"Invalid time '{until}'.", param_hint="'--until'")
+
     # Get log directory - compute directly without WorktreeManager to avoid git requirement
     log_dir = project_dir / ".ve" / "chunks" / chunk / "log"
 
@@ -951,70 +972,61 @@ def orch_tail(chunk, follow, project_dir):
         raise SystemExit(1)
 
     # Display existing phase logs
-    for phase, log_file in phase_logs:
-        display_phase_log(phase, log_file, output=click.echo)
+    if last is None and not phases and since_ts is None and until_ts is None:
+        for phase, log_file in phase_logs:
+            display_phase_log(phase, log_file, output=click.echo)
+    else:
+        pages = read_log_pages(
+            log_dir,
+            phases=[WorkUnitPhase(p.upper()) for p in phases] or None,
+            last=last,
+            since=since_ts,
+            until=until_ts,
+        )
+        for phase, page in pages:
+            display_log_records(phase, page.records, output=click.echo)
 
     if not follow:
         return
 
-    # Follow mode: stream new lines
+    # Follow mode: stream new lines as the log directory changes
+    # Chunk: docs/chunks/orch_log_bus - Notification-driven follow instead of polling
     try:
-        current_phase_idx = len(phase_logs) - 1
-        current_phase, current_log = phase_logs[current_phase_idx]
-
-        # Track file position
-        with open(current_log) as f:
-            f.seek(0, 2)  # Seek to end
-            file_pos = f.tell()
-
-        while True:
-            time.sleep(0.1)  # 100ms polling interval
-
-            # Check for new content in current log
-            try:
-                with open(current_log) as f:
-                    f.seek(file_pos)
-                    new_content = f.read()
-                    if new_content:
-                        file_pos = f.tell()
-                        # Parse and display new lines
-                        for line in new_content.strip().split("\n"):
-                            if line.strip():
-                                entry = parse_log_line(line)
-                                if entry:
-                                    lines = format_entry(entry)
-                                    for display_line in lines:
-                                        click.echo(display_line)
-            except FileNotFoundError:
-                pass
-
-            # Check for next phase log file
-            next_phase_idx = current_phase_idx + 1
-            if next_phase_idx < len(PHASE_ORDER):
+        current_phase_idx = PHASE_ORDER.index(phase_logs[-1][0])
+        current_phase = PHASE_ORDER[current_phase_idx].value.lower()
+        # Chunk: docs/chunks/orch_phase_log_writer - Logical offsets survive rotation
+        file_pos = log_end(log_dir, current_phase)
+
+        for _ in watch_log_dir(log_dir):
+            # Display complete records appended to the current log
+            records, file_pos = read_records(log_dir, current_phase, file_pos)
+            for _, line in records:
+                entry = parse_log_line(line)
+                if entry:
+                    for display_line in format_entry(entry):
+                        click.echo(display_line)
+
+            # Check for a later phase's log file
+            for next_phase_idx in range(current_phase_idx + 1, len(PHASE_ORDER)):
                 next_phase = PHASE_ORDER[next_phase_idx]
                 next_log = log_dir / f"{next_phase.value.lower()}.txt"
-                if next_log.exists():
-                    # New phase started
-                    current_phase_idx = next_phase_idx
-                    current_phase = next_phase
-                    current_log = next_log
-
-                    # Show phase header
-                    entries = parse_log_file(next_log)
-                    if entries:
-                        header = format_phase_header(next_phase.value, entries[0].timestamp)
-                        click.echo(f"\n{header}\n")
-
-                    # Display any content already in the file
-                    for entry in entries:
-                        lines = format_entry(entry)
-                        for line in lines:
-                            click.echo(line)
-
-                    # Update file position
-                    with open(current_log) as f:
-                        f.seek(0, 2)
-                        file_pos = f.tell()
+                if not next_log.exists():
+                    continue
+
+                # New phase started
+                current_phase_idx = next_phase_idx
+                current_phase = next_phase.value.lower()
+
+                # Show phase header and any content already in the file
+                records, file_pos = read_records(log_dir, current_phase, 0)
+                entries = [e for e in (parse_log_line(line) for _, line in records) if e]
+                if entries:
+                    header = format_phase_header(next_phase.value, entries[0].timestamp)
+                    click.echo(f"\n{header}\n")
+                for entry in entries:
+                    for display_line in format_entry(entry):
+                        click.echo(display_line)
+                break
 
     except KeyboardInterrupt:
         click.echo("\n")  # Clean exit on Ctrl+C
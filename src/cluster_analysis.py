@@ -16,7 +16,7 @@ from collections import Counter
 from subsystems import Subsystems
 from template_system import load_ve_config
 
-# Note: Chunks, extract_goal_text, get_chunk_prefix, and ChunkStatus are imported locally
+# Note: Chunks, get_chunk_prefix, and ChunkStatus are imported locally
 # in functions to avoid circular imports with chunks.py
 
 
@@ -164,8 +164,9 @@ def suggest_singleton_merges(
 ) -> list[MergeSuggestion]:
     """Suggest singleton chunks that could be renamed into existing clusters.
 
-    Uses TF-IDF pairwise similarity to find semantically similar chunks,
-    then suggests renging singletons into clusters where similar chunks live.
+    Uses TF-IDF similarity from the persisted chunk corpus to find
+    semantically similar chunks, then suggests renaming singletons into
+    clusters where similar chunks live.
 
     Args:
         project_dir: Path to the project directory.
@@ -175,9 +176,8 @@ def suggest_singleton_merges(
     Returns:
         List of MergeSuggestion objects for singletons with potential homes.
     """
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    from chunks import Chunks, extract_goal_text, get_chunk_prefix
+    from chunk_corpus import ChunkCorpus
+    from chunks import Chunks, get_chunk_prefix
 
     chunks_instance = Chunks(project_dir)
     suggestions: list[MergeSuggestion] = []
@@ -193,28 +193,22 @@ def suggest_singleton_merges(
         return []
 
     # Build corpus of all chunks
-    all_chunks: list[tuple[str, str]] = []  # (chunk_name, text)
+    all_chunks: list[tuple[str, Path]] = []  # (chunk_name, goal_path)
     for chunk_name in chunks_instance.enumerate_chunks():
         goal_path = chunks_instance.get_chunk_goal_path(chunk_name)
         if goal_path and goal_path.exists():
-            text = extract_goal_text(goal_path)
-            all_chunks.append((chunk_name, text if text else " "))
+            all_chunks.append((chunk_name, goal_path))
 
     if len(all_chunks) < 3:
         return []
 
-    # Build TF-IDF vectors
-    chunk_names = [name for name, _ in all_chunks]
-    texts = [text for _, text in all_chunks]
-
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        max_features=500,
-        ngram_range=(1, 2),
-    )
+    # Chunk: docs/chunks/cluster_tfidf_corpus - Reuse persisted term statistics
+    corpus = ChunkCorpus(project_dir)
+    keys = corpus.sync(all_chunks)
+    chunk_names = [corpus.documents[key].name for key in keys]
 
     try:
-        tfidf_matrix = vectorizer.fit_transform(texts)
+        model = corpus.model()
     except ValueError:
         # Can happen if all documents are empty after stop word removal
         return []
@@ -227,13 +221,13 @@ def suggest_singleton_merges(
         except ValueError:
             continue
 
-        # Compute similarities
-        singleton_vec = tfidf_matrix[singleton_idx]
-        similarities = cosine_similarity(singleton_vec, tfidf_matrix)[0]
+        # Compute similarities (only chunks sharing a term can score above 0)
+        similarities = model.similarities(keys[singleton_idx])
 
         # Find similar chunks above threshold, excluding self
         similar: list[tuple[str, float]] = []
-        for i, sim in enumerate(similarities):
+        for i, key in enumerate(keys):
+            sim = similarities.get(key, 0.0)
             if i != singleton_idx and sim >= threshold:
                 similar.append((chunk_names[i], sim))
 
@@ -506,42 +500,233 @@ class ClusterResult:
     cluster_themes: list[str]  # Inferred theme for each cluster
 
 
+# Chunks above this count are clustered through the sparse kNN graph when
+# method="auto"; the dense path needs an n x n distance matrix.
+DENSE_CLUSTER_MAX_CHUNKS = 1000
+
+# Neighbours kept per chunk in the sparse kNN graph
+DEFAULT_CLUSTER_NEIGHBORS = 30
+
+# Rows of the similarity product materialized at once while building the graph
+_KNN_BLOCK_ROWS = 256
+
+CLUSTER_METHODS = ("auto", "dense", "knn")
+
+
+# Chunk: docs/chunks/cluster_knn_graph - Corpus vectors as a sparse matrix
+def _vector_matrix(model, keys: list[str]):
+    """Stack the model's l2-normalized vectors for keys into a CSR matrix."""
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+    columns: dict[str, int] = {}
+    data: list[float] = []
+    indices: list[int] = []
+    indptr = [0]
+    for key in keys:
+        for term, weight in model.vectors[key].items():
+            indices.append(columns.setdefault(term, len(columns)))
+            data.append(weight)
+        indptr.append(len(indices))
+    return csr_matrix(
+        (np.array(data), np.array(indices, dtype=np.int64), np.array(indptr)),
+        shape=(len(keys), max(len(columns), 1)),
+    )
+
+
+# Chunk: docs/chunks/cluster_knn_graph - Dense average-linkage path
+def _dense_cluster_labels(model, keys: list[str], min_similarity: float) -> list[int]:
+    """Average-linkage clustering over the full pairwise distance matrix."""
+    from sklearn.cluster import AgglomerativeClustering
+
+    matrix = _vector_matrix(model, keys)
+    similarity_matrix = (matrix @ matrix.T).toarray()
+
+    # Convert similarity to distance (1 - similarity)
+    # Clip to avoid negative distances due to floating point errors
+    distance_matrix = 1 - similarity_matrix
+    distance_matrix = distance_matrix.clip(min=0)
+
+    # Agglomerative clustering with distance threshold
+    # threshold = 1 - min_similarity (e.g., 0.3 similarity = 0.7 distance)
+    clustering = AgglomerativeClustering(
+        n_clusters=None,
+        distance_threshold=1 - min_similarity,
+        metric="precomputed",
+        linkage="average",
+    )
+
+    return [int(label) for label in clustering.fit_predict(distance_matrix)]
+
+
+# Chunk: docs/chunks/cluster_knn_graph - Sparse top-k neighbour graph
+def _knn_graph(
+    model, keys: list[str], neighbors: int
+) -> dict[tuple[int, int], float]:
+    """Each chunk's top-k most similar chunks, as symmetric weighted edges.
+
+    The similarity product is computed a block of rows at a time, so memory
+    stays proportional to the number of chunks rather than its square.
+
+    Returns:
+        Mapping of (i, j) with i < j to cosine similarity; only pairs with
+        positive similarity appear.
+    """
+    import numpy as np
+
+    matrix = _vector_matrix(model, keys)
+    transposed = matrix.T.tocsr()
+
+    n = len(keys)
+    k = min(neighbors, n - 1)
+    edges: dict[tuple[int, int], float] = {}
+    for start in range(0, n, _KNN_BLOCK_ROWS):
+        stop = min(start + _KNN_BLOCK_ROWS, n)
+        block = (matrix[start:stop] @ transposed).toarray()
+        rows = np.arange(stop - start)
+        block[rows, rows + start] = 0.0
+        nearest = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        sims = np.take_along_axis(block, nearest, axis=1)
+        row_idx, col_idx = np.nonzero(sims > 0.0)
+        sources = (row_idx + start).tolist()
+        targets = nearest[row_idx, col_idx].tolist()
+        for i, j, sim in zip(sources, targets, sims[row_idx, col_idx].tolist()):
+            edges[(i, j) if i < j else (j, i)] = sim
+    return edges
+
+
+# Chunk: docs/chunks/cluster_knn_graph - Average linkage restricted to graph edges
+def _knn_cluster_labels(
+    model, keys: list[str], min_similarity: float, neighbors: int
+) -> list[int]:
+    """Average-linkage clustering over a sparse kNN similarity graph.
+
+    Clusters merge greedily in order of average pairwise similarity, exactly
+    as in the dense path, except that pairs outside the graph count as
+    similarity 0. With every positive-similarity pair in the graph the result
+    equals the dense clustering; with top-k edges averages are underestimated,
+    so borderline merges are skipped rather than invented.
+    """
+    import heapq
+
+    n = len(keys)
+    size = [1] * n
+    version = [0] * n
+    alive = [True] * n
+    parent = list(range(n))
+    # Sum of edge similarities between live clusters
+    links: list[dict[int, float]] = [{} for _ in range(n)]
+    for (i, j), sim in _knn_graph(model, keys, neighbors).items():
+        links[i][j] = sim
+        links[j][i] = sim
+
+    heap = [
+        (-sim, i, j, 0, 0)
+        for i in range(n)
+        for j, sim in links[i].items()
+        if i < j
+    ]
+    heapq.heapify(heap)
+
+    while heap:
+        neg_avg, a, b, version_a, version_b = heapq.heappop(heap)
+        if not (alive[a] and alive[b]) or version[a] != version_a or version[b] != version_b:
+            continue
+        # Same stopping rule as distance_threshold = 1 - min_similarity
+        if -neg_avg <= min_similarity:
+            break
+
+        # Fold the cluster with fewer links into the other
+        if len(links[a]) < len(links[b]):
+            a, b = b, a
+        alive[b] = False
+        parent[b] = a
+        folded, links[b] = links[b], {}
+        del links[a][b]
+        for c, total in folded.items():
+            if c == a:
+                continue
+            del links[c][b]
+            links[a][c] = links[a].get(c, 0.0) + total
+            links[c][a] = links[a][c]
+        size[a] += size[b]
+        version[a] += 1
+
+        for c, total in links[a].items():
+            first, second = (a, c) if a < c else (c, a)
+            heapq.heappush(
+                heap,
+                (
+                    -total / (size[a] * size[c]),
+                    first,
+                    second,
+                    version[first],
+                    version[second],
+                ),
+            )
+
+    # Label each chunk by the surviving cluster it was folded into
+    def root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    return [root(i) for i in range(n)]
+
+
 # Chunk: docs/chunks/chunks_decompose - Moved from chunks.py
+# Chunk: docs/chunks/cluster_knn_graph - Sparse kNN graph mode for large corpora
 def cluster_chunks(
     project_dir: Path,
     chunk_ids: list[str] | None = None,
     min_similarity: float = 0.3,
     min_cluster_size: int = 2,
+    method: str = "auto",
+    neighbors: int = DEFAULT_CLUSTER_NEIGHBORS,
 ) -> ClusterResult:
     """Cluster chunks by content similarity using TF-IDF.
 
     Groups related chunks for potential consolidation into narratives.
-    Uses agglomerative clustering with cosine similarity.
+    Uses average-linkage agglomerative clustering with cosine similarity,
+    either over the full distance matrix ("dense") or over a sparse graph of
+    each chunk's nearest neighbours ("knn"), which scales to many thousands
+    of chunks.
 
     Args:
         project_dir: Path to the project directory.
         chunk_ids: Specific chunk IDs to cluster (default: all ACTIVE chunks).
         min_similarity: Minimum similarity to cluster together (default: 0.3).
         min_cluster_size: Minimum chunks per cluster (default: 2).
+        method: "dense", "knn", or "auto" to pick "knn" above
+            DENSE_CLUSTER_MAX_CHUNKS chunks (default: "auto").
+        neighbors: Neighbours kept per chunk in "knn" mode.
 
     Returns:
         ClusterResult with clusters, unclustered chunks, and inferred themes.
+
+    Raises:
+        ValueError: If method is not one of CLUSTER_METHODS.
     """
-    from sklearn.cluster import AgglomerativeClustering
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    from chunks import Chunks, extract_goal_text, get_chunk_prefix
+    from chunk_corpus import ChunkCorpus
+    from chunks import Chunks, get_chunk_prefix
     from models import ChunkStatus
 
+    if method not in CLUSTER_METHODS:
+        raise ValueError(
+            f"Unknown clustering method '{method}' (expected one of {', '.join(CLUSTER_METHODS)})"
+        )
+
     chunks_manager = Chunks(project_dir)
+    # Enumerate once; per-chunk ID resolution re-lists the chunk directory
+    chunk_names = chunks_manager.enumerate_chunks()
 
     # Get chunk IDs to cluster
     if chunk_ids is None:
         # Default: all ACTIVE chunks
-        all_chunks = chunks_manager.enumerate_chunks()
         chunk_ids = []
-        for chunk_name in all_chunks:
-            fm = chunks_manager.parse_chunk_frontmatter(chunk_name)
+        for chunk_name in chunk_names:
+            fm = chunks_manager.parse_frontmatter(chunk_name)
             if fm and fm.status == ChunkStatus.ACTIVE:
                 chunk_ids.append(chunk_name)
 
@@ -552,16 +737,26 @@ def cluster_chunks(
             cluster_themes=[],
         )
 
-    # Extract text from each chunk's GOAL.md
-    texts = []
+    # Chunk: docs/chunks/cluster_tfidf_corpus - Reuse persisted term statistics
+    # The corpus store always tracks every chunk so other callers can reuse it;
+    # the model below is restricted to the requested chunks.
+    corpus_chunks: list[tuple[str, Path]] = []
+    for name in chunk_names:
+        goal_path = chunks_manager.get_main_file_path(name)
+        if goal_path.exists():
+            corpus_chunks.append((name, goal_path))
+    corpus = ChunkCorpus(project_dir)
+    keys_by_name = dict(zip((name for name, _ in corpus_chunks), corpus.sync(corpus_chunks)))
+
+    # Keep chunks whose GOAL.md has text content
+    valid_keys = []
     valid_chunk_ids = []
     for chunk_id in chunk_ids:
-        goal_path = chunks_manager.get_chunk_goal_path(chunk_id)
-        if goal_path is None:
+        key = keys_by_name.get(chunk_id)
+        if key is None:
             continue
-        text = extract_goal_text(goal_path)
-        if text.strip():
-            texts.append(text)
+        if not corpus.documents[key].blank:
+            valid_keys.append(key)
             valid_chunk_ids.append(chunk_id)
 
     if len(valid_chunk_ids) < min_cluster_size:
@@ -571,15 +766,9 @@ def cluster_chunks(
             cluster_themes=[],
         )
 
-    # Build TF-IDF vectors
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        max_features=500,
-        ngram_range=(1, 2),
-    )
-
+    # Build TF-IDF vectors over the selected chunks
     try:
-        tfidf_matrix = vectorizer.fit_transform(texts)
+        model = corpus.model(valid_keys)
     except ValueError:
         # All documents empty after stop word removal
         return ClusterResult(
@@ -588,24 +777,12 @@ def cluster_chunks(
             cluster_themes=[],
         )
 
-    # Compute similarity matrix
-    similarity_matrix = cosine_similarity(tfidf_matrix)
-
-    # Convert similarity to distance (1 - similarity)
-    # Clip to avoid negative distances due to floating point errors
-    distance_matrix = 1 - similarity_matrix
-    distance_matrix = distance_matrix.clip(min=0)
-
-    # Agglomerative clustering with distance threshold
-    # threshold = 1 - min_similarity (e.g., 0.3 similarity = 0.7 distance)
-    clustering = AgglomerativeClustering(
-        n_clusters=None,
-        distance_threshold=1 - min_similarity,
-        metric="precomputed",
-        linkage="average",
-    )
-
-    labels = clustering.fit_predict(distance_matrix)
+    if method == "auto":
+        method = "knn" if len(valid_keys) > DENSE_CLUSTER_MAX_CHUNKS else "dense"
+    if method == "knn":
+        labels = _knn_cluster_labels(model, valid_keys, min_similarity, neighbors)
+    else:
+        labels = _dense_cluster_labels(model, valid_keys, min_similarity)
 
     # Group chunks by cluster label
     cluster_groups: dict[int, list[str]] = {}
@@ -676,9 +853,8 @@ def suggest_prefix(
         - similar_chunks: list of (chunk_name, similarity_score) tuples
         - reason: str explaining why the suggestion was or wasn't made
     """
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    from chunks import Chunks, extract_goal_text, get_chunk_prefix
+    from chunk_corpus import ChunkCorpus
+    from chunks import Chunks, get_chunk_prefix
     from task import is_task_directory, load_task_config, resolve_repo_directory
 
     project_dir = Path(project_dir)
@@ -753,21 +929,12 @@ def suggest_prefix(
             reason=f"Too few chunks for meaningful similarity (need at least 3 total, have {len(corpus_chunks)})",
         )
 
-    # Extract text from all chunks
-    texts = []
-    for _, goal_path in corpus_chunks:
-        text = extract_goal_text(goal_path)
-        texts.append(text if text else " ")  # Empty text causes TF-IDF issues
-
-    # Build TF-IDF vectors
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        max_features=500,
-        ngram_range=(1, 2),
-    )
+    # Chunk: docs/chunks/cluster_tfidf_corpus - Only changed GOAL.md files are re-tokenized
+    corpus = ChunkCorpus(project_dir)
+    keys = corpus.sync(corpus_chunks)
 
     try:
-        tfidf_matrix = vectorizer.fit_transform(texts)
+        model = corpus.model()
     except ValueError:
         # Can happen if all documents are empty after stop word removal
         return SuggestPrefixResult(
@@ -776,18 +943,8 @@ def suggest_prefix(
             reason="Could not build similarity model (insufficient text content)",
         )
 
-    # Compute similarity between target and all others
-    target_vec = tfidf_matrix[target_idx]
-    similarities = cosine_similarity(target_vec, tfidf_matrix)[0]
-
-    # Find top-k similar chunks (excluding self)
-    indexed_sims = []
-    for i, sim in enumerate(similarities):
-        if i != target_idx:
-            indexed_sims.append((i, sim))
-
-    indexed_sims.sort(key=lambda x: -x[1])  # Sort by similarity descending
-    top_similar = indexed_sims[:top_k]
+    # Find top-k similar chunks (excluding self) through the sparse index
+    top_similar = model.top_k(keys, target_idx, top_k)
 
     # Filter by threshold
     above_threshold = [(i, sim) for i, sim in top_similar if sim >= threshold]
@@ -1,16 +1,26 @@
 # Chunk: docs/chunks/entity_episodic_search
+# Chunk: docs/chunks/episodic_inverted_index - Inverted index persisted in SQLite
 """Episodic search over archived entity session transcripts.
 
 Two-phase workflow:
   Phase 1: BM25 search returns ranked snippets with session/chunk IDs.
   Phase 2: Expand a specific hit to show surrounding conversation context.
+
+Scoring walks an inverted index (term -> postings of (chunk, tf)), so a
+query only touches the chunks that contain one of its terms. The on-disk
+index is a SQLite database; a search reads just the postings of its query
+terms and the rows of its top-k chunks, never the whole corpus.
 """
 
+import heapq
 import json
 import math
 import re
 import shutil
+import sqlite3
 from collections import Counter
+from collections.abc import Callable, Iterable
+from contextlib import closing
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -116,64 +126,108 @@ def build_chunks(
     return chunks
 
 
+# ---------------------------------------------------------------------------
+# BM25 scoring
+# ---------------------------------------------------------------------------
+
+# A posting: (chunk_id, term frequency in that chunk, chunk length in tokens)
+Posting = tuple[int, int, int]
+
+
+def bm25_top_k(
+    query_tokens: list[str],
+    postings_for: Callable[[str], tuple[int, list[Posting]]],
+    num_docs: int,
+    avg_doc_length: float,
+    top_k: int,
+    k1: float = K1,
+    b: float = B,
+) -> list[tuple[int, float]]:
+    """Score the chunks containing any query term and return the best top_k.
+
+    Args:
+        query_tokens: Tokenized query; repeated terms count repeatedly.
+        postings_for: Returns (document frequency, postings) for a term,
+            with (0, []) for unknown terms. Called once per distinct term.
+        num_docs: Number of chunks in the corpus.
+        avg_doc_length: Mean chunk length in tokens.
+        top_k: Number of results to return.
+
+    Returns:
+        (chunk_id, score) pairs, best first; ties keep chunk_id order.
+    """
+    if num_docs == 0 or top_k <= 0:
+        return []
+
+    cache: dict[str, tuple[int, list[Posting]]] = {}
+    scores: dict[int, float] = {}
+    for term in query_tokens:
+        if term not in cache:
+            cache[term] = postings_for(term)
+        df, postings = cache[term]
+        if df == 0:
+            continue
+        idf = math.log((num_docs - df + 0.5) / (df + 0.5) + 1)
+        for chunk_id, tf, doc_len in postings:
+            tf_norm = (tf * (k1 + 1)) / (
+                tf + k1 * (1 - b + b * doc_len / avg_doc_length)
+            )
+            scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf_norm
+
+    best = heapq.nlargest(
+        top_k, scores.items(), key=lambda item: (item[1], -item[0])
+    )
+    return [(chunk_id, score) for chunk_id, score in best if score > 0]
+
+
 # ---------------------------------------------------------------------------
 # BM25Index
 # ---------------------------------------------------------------------------
 
 @dataclass
 class BM25Index:
+    """In-memory inverted index over a list of chunks."""
+
     chunks: list[EpisodicChunk] = field(default_factory=list)
     doc_freqs: dict[str, int] = field(default_factory=dict)
     doc_lengths: list[int] = field(default_factory=list)
     avg_doc_length: float = 0.0
-    tokenized_docs: list[list[str]] = field(default_factory=list)
+    # term -> [(index into chunks, tf)]
+    postings: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
     k1: float = K1
     b: float = B
 
     @classmethod
     def build(cls, chunks: list[EpisodicChunk]) -> "BM25Index":
         idx = cls(chunks=list(chunks))
-        idx.tokenized_docs = [tokenize(c.text) for c in chunks]
-        idx.doc_lengths = [len(d) for d in idx.tokenized_docs]
+        for i, chunk in enumerate(idx.chunks):
+            tokens = tokenize(chunk.text)
+            idx.doc_lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                idx.postings.setdefault(term, []).append((i, tf))
         idx.avg_doc_length = sum(idx.doc_lengths) / max(len(idx.doc_lengths), 1)
-
-        idx.doc_freqs = {}
-        for doc in idx.tokenized_docs:
-            seen = set(doc)
-            for term in seen:
-                idx.doc_freqs[term] = idx.doc_freqs.get(term, 0) + 1
-
+        idx.doc_freqs = {term: len(p) for term, p in idx.postings.items()}
         return idx
 
     def search(
         self, query: str, top_k: int = 5
     ) -> list[tuple[EpisodicChunk, float]]:
-        query_tokens = tokenize(query)
-        n = len(self.chunks)
-        if n == 0:
-            return []
-
-        scores: list[tuple[EpisodicChunk, float]] = []
-        for i, doc_tokens in enumerate(self.tokenized_docs):
-            score = 0.0
-            tf_counts = Counter(doc_tokens)
-            doc_len = self.doc_lengths[i]
-
-            for term in query_tokens:
-                if term not in self.doc_freqs:
-                    continue
-                df = self.doc_freqs[term]
-                idf = math.log((n - df + 0.5) / (df + 0.5) + 1)
-                tf = tf_counts.get(term, 0)
-                tf_norm = (tf * (self.k1 + 1)) / (
-                    tf + self.k1 * (1 - self.b + self.b * doc_len / self.avg_doc_length)
-                )
-                score += idf * tf_norm
-
-            scores.append((self.chunks[i], score))
-
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return [(c, s) for c, s in scores[:top_k] if s > 0]
+        def postings_for(term: str) -> tuple[int, list[Posting]]:
+            postings = self.postings.get(term, [])
+            return len(postings), [
+                (i, tf, self.doc_lengths[i]) for i, tf in postings
+            ]
+
+        ranked = bm25_top_k(
+            tokenize(query),
+            postings_for,
+            num_docs=len(self.chunks),
+            avg_doc_length=self.avg_doc_length,
+            top_k=top_k,
+            k1=self.k1,
+            b=self.b,
+        )
+        return [(self.chunks[i], score) for i, score in ranked]
 
 
 # ---------------------------------------------------------------------------
@@ -254,22 +308,59 @@ class EpisodicStore:
 
     @property
     def index_path(self) -> Path:
-        return self._entity_dir / "episodic_index" / "index.json"
+        return self._entity_dir / "episodic_index" / "index.db"
 
-    def _load_raw(self) -> dict:
-        if not self.index_path.exists():
-            return {
-                "indexed_sessions": [],
-                "chunks": [],
-                "doc_freqs": {},
-                "doc_lengths": [],
-                "tokenized_docs": [],
-            }
-        return json.loads(self.index_path.read_text())
+    @property
+    def legacy_index_path(self) -> Path:
+        """JSON index written by earlier versions; imported on first update."""
+        return self._entity_dir / "episodic_index" / "index.json"
 
-    def _save_raw(self, data: dict) -> None:
+    # Chunk: docs/chunks/episodic_inverted_index - Index database schema
+    def _connect(self) -> sqlite3.Connection:
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
-        self.index_path.write_text(json.dumps(data))
+        conn = sqlite3.connect(self.index_path)
+        conn.row_factory = sqlite3.Row
+        # Let SQLite map the file instead of copying pages into its cache
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY
+            );
+            CREATE TABLE IF NOT EXISTS chunks (
+                chunk_id INTEGER PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                text TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                anchor_start INTEGER NOT NULL,
+                anchor_end INTEGER NOT NULL,
+                length INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS terms (
+                term TEXT PRIMARY KEY,
+                df INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                chunk_id INTEGER NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, chunk_id)
+            ) WITHOUT ROWID;
+        """)
+        return conn
+
+    def _chunk_from_row(self, row: sqlite3.Row) -> EpisodicChunk:
+        return EpisodicChunk(
+            session_id=row["session_id"],
+            chunk_id=row["chunk_id"],
+            text=row["text"],
+            timestamp=row["timestamp"],
+            anchor_start=row["anchor_start"],
+            anchor_end=row["anchor_end"],
+        )
 
     def _chunks_from_raw(self, raw_chunks: list[dict]) -> list[EpisodicChunk]:
         return [
@@ -284,73 +375,108 @@ class EpisodicStore:
             for c in raw_chunks
         ]
 
-    def _chunk_to_dict(self, chunk: EpisodicChunk) -> dict:
-        return {
-            "session_id": chunk.session_id,
-            "chunk_id": chunk.chunk_id,
-            "text": chunk.text,
-            "timestamp": chunk.timestamp,
-            "anchor_start": chunk.anchor_start,
-            "anchor_end": chunk.anchor_end,
-        }
+    def _add_chunks(
+        self, conn: sqlite3.Connection, chunks: Iterable[EpisodicChunk]
+    ) -> None:
+        """Insert chunks and their postings, updating df and corpus totals."""
+        added_docs = 0
+        added_length = 0
+        df_delta: Counter[str] = Counter()
+        for chunk in chunks:
+            tf_counts = Counter(tokenize(chunk.text))
+            length = sum(tf_counts.values())
+            conn.execute(
+                "INSERT INTO chunks (chunk_id, session_id, text, timestamp, "
+                "anchor_start, anchor_end, length) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    chunk.chunk_id, chunk.session_id, chunk.text, chunk.timestamp,
+                    chunk.anchor_start, chunk.anchor_end, length,
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO postings (term, chunk_id, tf) VALUES (?, ?, ?)",
+                ((term, chunk.chunk_id, tf) for term, tf in tf_counts.items()),
+            )
+            df_delta.update(tf_counts.keys())
+            added_docs += 1
+            added_length += length
+
+        conn.executemany(
+            "INSERT INTO terms (term, df) VALUES (?, ?) "
+            "ON CONFLICT(term) DO UPDATE SET df = df + excluded.df",
+            df_delta.items(),
+        )
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+            [("num_docs", added_docs), ("total_length", added_length)],
+        )
+
+    def _import_legacy_index(self, conn: sqlite3.Connection) -> None:
+        """Move an index.json from earlier versions into the database."""
+        data = json.loads(self.legacy_index_path.read_text())
+        self._add_chunks(conn, self._chunks_from_raw(data.get("chunks", [])))
+        conn.executemany(
+            "INSERT OR IGNORE INTO sessions (session_id) VALUES (?)",
+            ((sid,) for sid in data.get("indexed_sessions", [])),
+        )
+
+    def indexed_sessions(self) -> list[str]:
+        """Session IDs already in the index, in indexing order."""
+        if not self.index_path.exists():
+            return []
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT session_id FROM sessions ORDER BY rowid")
+            return [row["session_id"] for row in rows]
+
+    def list_chunks(self) -> list[EpisodicChunk]:
+        """All indexed chunks in chunk_id order."""
+        if not self.index_path.exists():
+            return []
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT * FROM chunks ORDER BY chunk_id")
+            return [self._chunk_from_row(row) for row in rows]
 
     def build_or_update(self, entity_name: str = "") -> None:
-        """Incrementally rebuild the index with any new sessions."""
+        """Incrementally index any new sessions.
+
+        Only the new sessions are tokenized; their postings are appended and
+        document frequencies adjusted in place.
+        """
         if not self.sessions_dir.exists():
             return
 
-        data = self._load_raw()
-        indexed_sessions: list[str] = data.get("indexed_sessions", [])
-        existing_chunk_dicts: list[dict] = data.get("chunks", [])
-
-        # Find JSONL files not yet indexed
         all_jsonl = list(self.sessions_dir.glob("*.jsonl"))
-        new_jsonl = [p for p in all_jsonl if p.stem not in indexed_sessions]
-
-        if not new_jsonl:
-            return  # Nothing new to index
-
-        # Parse and chunk new sessions
-        new_chunk_dicts: list[dict] = []
-        base = len(existing_chunk_dicts)
-        for jsonl_path in new_jsonl:
-            transcript = parse_session_jsonl(jsonl_path)
-            new_chunks = build_chunks(transcript, base_chunk_id=base + len(new_chunk_dicts))
-            new_chunk_dicts.extend(self._chunk_to_dict(c) for c in new_chunks)
-            indexed_sessions.append(jsonl_path.stem)
-
-        all_chunk_dicts = existing_chunk_dicts + new_chunk_dicts
-        all_chunks = self._chunks_from_raw(all_chunk_dicts)
-
-        # Recompute BM25 fields from scratch
-        tokenized_docs = [tokenize(c.text) for c in all_chunks]
-        doc_lengths = [len(d) for d in tokenized_docs]
-        doc_freqs: dict[str, int] = {}
-        for doc in tokenized_docs:
-            for term in set(doc):
-                doc_freqs[term] = doc_freqs.get(term, 0) + 1
-
-        self._save_raw({
-            "indexed_sessions": indexed_sessions,
-            "chunks": all_chunk_dicts,
-            "doc_freqs": doc_freqs,
-            "doc_lengths": doc_lengths,
-            "tokenized_docs": tokenized_docs,
-        })
-
-    def _reconstruct_index(self, data: dict) -> BM25Index:
-        """Reconstruct a BM25Index from raw stored data."""
-        chunks = self._chunks_from_raw(data.get("chunks", []))
-        idx = BM25Index(
-            chunks=chunks,
-            doc_freqs=data.get("doc_freqs", {}),
-            doc_lengths=data.get("doc_lengths", []),
-            avg_doc_length=(
-                sum(data.get("doc_lengths", [])) / max(len(data.get("doc_lengths", [])), 1)
-            ),
-            tokenized_docs=data.get("tokenized_docs", []),
-        )
-        return idx
+        if not self.index_path.exists() and not all_jsonl and not self.legacy_index_path.exists():
+            return
+
+        with closing(self._connect()) as conn, conn:
+            if self.legacy_index_path.exists():
+                if conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 0:
+                    self._import_legacy_index(conn)
+                self.legacy_index_path.unlink()
+
+            indexed = {
+                row["session_id"]
+                for row in conn.execute("SELECT session_id FROM sessions")
+            }
+            new_jsonl = [p for p in all_jsonl if p.stem not in indexed]
+            if not new_jsonl:
+                return  # Nothing new to index
+
+            base = conn.execute(
+                "SELECT COALESCE(MAX(chunk_id) + 1, 0) FROM chunks"
+            ).fetchone()[0]
+            new_chunks: list[EpisodicChunk] = []
+            for jsonl_path in new_jsonl:
+                transcript = parse_session_jsonl(jsonl_path)
+                new_chunks.extend(
+                    build_chunks(transcript, base_chunk_id=base + len(new_chunks))
+                )
+                conn.execute(
+                    "INSERT INTO sessions (session_id) VALUES (?)", (jsonl_path.stem,)
+                )
+            self._add_chunks(conn, new_chunks)
 
     def search(
         self,
@@ -358,9 +484,36 @@ class EpisodicStore:
         top_k: int = 5,
         entity_name: str = "",
     ) -> list[SearchResult]:
-        data = self._load_raw()
-        idx = self._reconstruct_index(data)
-        raw_results = idx.search(query, top_k=top_k)
+        if not self.index_path.exists():
+            return []
+
+        with closing(self._connect()) as conn:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            num_docs = meta.get("num_docs", 0)
+            avg_doc_length = meta.get("total_length", 0) / max(num_docs, 1)
+
+            def postings_for(term: str) -> tuple[int, list[Posting]]:
+                row = conn.execute(
+                    "SELECT df FROM terms WHERE term = ?", (term,)
+                ).fetchone()
+                if row is None:
+                    return 0, []
+                postings = conn.execute(
+                    "SELECT p.chunk_id, p.tf, c.length FROM postings p "
+                    "JOIN chunks c ON c.chunk_id = p.chunk_id WHERE p.term = ?",
+                    (term,),
+                ).fetchall()
+                return row["df"], [tuple(p) for p in postings]
+
+            ranked = bm25_top_k(
+                tokenize(query), postings_for, num_docs, avg_doc_length, top_k
+            )
+            raw_results: list[tuple[EpisodicChunk, float]] = []
+            for chunk_id, score in ranked:
+                row = conn.execute(
+                    "SELECT * FROM chunks WHERE chunk_id = ?", (chunk_id,)
+                ).fetchone()
+                raw_results.append((self._chunk_from_row(row), score))
 
         results: list[SearchResult] = []
         for rank, (chunk, score) in enumerate(raw_results, 1):
@@ -387,18 +540,18 @@ class EpisodicStore:
         radius: int = 10,
     ) -> str | None:
         """Expand context around a search hit. Returns None if not found."""
-        data = self._load_raw()
-        chunk_dicts = data.get("chunks", [])
+        if not self.index_path.exists():
+            return None
 
         # Find the target chunk
-        target: EpisodicChunk | None = None
-        for c_dict in chunk_dicts:
-            if c_dict["session_id"] == session_id and c_dict["chunk_id"] == chunk_id:
-                target = EpisodicChunk(**c_dict)
-                break
-
-        if target is None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM chunks WHERE chunk_id = ? AND session_id = ?",
+                (chunk_id, session_id),
+            ).fetchone()
+        if row is None:
             return None
+        target = self._chunk_from_row(row)
 
         # Load full transcript
         jsonl_path = self.sessions_dir / f"{session_id}.jsonl"
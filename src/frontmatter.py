@@ -157,6 +157,20 @@ def extract_frontmatter_dict(file_path: Path) -> dict[str, Any] | None:
     except (OSError, IOError):
         return None
 
+    return extract_frontmatter_dict_from_content(content)
+
+
+# Chunk: docs/chunks/frontmatter_parse_cache - Content-based raw extraction for cached parsing
+def extract_frontmatter_dict_from_content(content: str) -> dict[str, Any] | None:
+    """Extract raw frontmatter dict from a content string without validation.
+
+    Args:
+        content: Full markdown content including frontmatter.
+
+    Returns:
+        Parsed frontmatter dict, or None if the content has no frontmatter
+        or invalid YAML.
+    """
     match = _FRONTMATTER_PATTERN.match(content)
     if not match:
         return None
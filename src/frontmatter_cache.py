@@ -0,0 +1,223 @@
+"""Persistent cache for validated artifact frontmatter.
+
+# Chunk: docs/chunks/frontmatter_parse_cache - Persistent parsed-frontmatter cache
+# Subsystem: docs/subsystems/workflow_artifacts - Workflow artifact lifecycle
+
+Every ArtifactManager funnels frontmatter parsing through this module so that
+one `ve` invocation never parses the same file twice and repeated invocations
+skip YAML parsing entirely for unchanged files.
+
+Two layers are maintained:
+
+1. An in-process memo shared by all manager instances (IntegrityValidator,
+   cluster analysis, overlap detection and task listing each construct their
+   own managers). Entries are trusted on a stat match (mtime, size, inode) as
+   long as the file's mtime is outside the racy window; otherwise the content
+   digest is re-checked.
+2. An on-disk store under `.ve/cache/frontmatter/` keyed by file path and
+   model version. Each entry records the SHA-256 of the file content it was
+   built from, so an entry is only reused when the bytes on disk match.
+
+The cache is best-effort: unreadable or corrupt entries are treated as misses
+and write failures (e.g., read-only checkouts) are ignored.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+
+T = TypeVar("T", bound=BaseModel)
+
+# Bump when the on-disk entry layout changes
+_CACHE_FORMAT_VERSION = 1
+
+# Files modified within this window of being memoized may have been rewritten
+# without a visible mtime change (coarse filesystem timestamps), so their
+# content digest is re-verified instead of trusting the stat signature.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Directory (relative to the project root) holding on-disk cache entries
+FRONTMATTER_CACHE_DIR = Path(".ve") / "cache" / "frontmatter"
+
+ContentParser = Callable[[str], tuple[BaseModel | None, list[str]]]
+
+
+@dataclass
+class _MemoEntry:
+    """In-process memo entry for a single (file, model) pair."""
+
+    stat_key: tuple[int, int, int]
+    recorded_ns: int
+    digest: str
+    model: BaseModel | None
+    errors: list[str]
+
+
+_memo: dict[tuple[str, str], _MemoEntry] = {}
+_model_versions: dict[type, str] = {}
+
+
+def clear_memo() -> None:
+    """Drop all in-process memo entries (the on-disk store is untouched)."""
+    _memo.clear()
+
+
+def model_version(model_class: type[BaseModel]) -> str:
+    """Return a version string that changes whenever the model's schema changes.
+
+    Cached entries built against an older schema are never reused because the
+    version participates in every cache key.
+    """
+    version = _model_versions.get(model_class)
+    if version is None:
+        try:
+            schema = json.dumps(model_class.model_json_schema(), sort_keys=True)
+        except Exception:
+            # Models with non-serializable schemas still get per-class caching
+            schema = ""
+        schema_hash = hashlib.sha256(schema.encode()).hexdigest()[:16]
+        version = (
+            f"{model_class.__module__}.{model_class.__qualname__}"
+            f":{schema_hash}:{_CACHE_FORMAT_VERSION}"
+        )
+        _model_versions[model_class] = version
+    return version
+
+
+def _copy_result(
+    model: BaseModel | None, errors: list[str]
+) -> tuple[BaseModel | None, list[str]]:
+    """Hand out copies so callers can't mutate memoized state."""
+    if model is not None:
+        model = copy.deepcopy(model)
+    return model, list(errors)
+
+
+def _entry_path(cache_dir: Path, file_key: str, version: str) -> Path:
+    key = hashlib.sha256(f"{file_key}\0{version}".encode()).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _load_disk_entry(
+    entry_path: Path, digest: str, model_class: type[T]
+) -> tuple[T | None, list[str]] | None:
+    """Load a disk entry if it was built from content with the given digest."""
+    try:
+        entry = json.loads(entry_path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get("digest") != digest:
+        return None
+
+    errors = entry.get("errors") or []
+    data = entry.get("model")
+    if data is None:
+        return None, list(errors)
+    try:
+        return model_class.model_validate(data), list(errors)
+    except ValidationError:
+        return None
+
+
+def _store_disk_entry(
+    entry_path: Path, digest: str, model: BaseModel | None, errors: list[str]
+) -> None:
+    """Atomically write a disk entry, ignoring filesystem failures."""
+    entry = {
+        "digest": digest,
+        "model": model.model_dump(mode="json") if model is not None else None,
+        "errors": errors,
+    }
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, entry_path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def parse_frontmatter_cached(
+    file_path: Path,
+    model_class: type[T],
+    parser: ContentParser,
+    cache_dir: Path | None = None,
+) -> tuple[T | None, list[str]]:
+    """Parse a file's frontmatter through the memo and on-disk cache.
+
+    Args:
+        file_path: Path to the markdown file with YAML frontmatter.
+        model_class: Pydantic model class the frontmatter validates against.
+        parser: Function parsing full file content into (model, errors).
+            Only invoked on a cache miss.
+        cache_dir: Directory for on-disk entries, or None for memo-only caching.
+
+    Returns:
+        Tuple of (model, errors) with the same semantics as
+        frontmatter.parse_frontmatter_with_errors().
+    """
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None, [f"File not found: {file_path}"]
+
+    file_key = str(file_path.resolve())
+    version = model_version(model_class)
+    memo_key = (file_key, version)
+    stat_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    now_ns = time.time_ns()
+
+    entry = _memo.get(memo_key)
+    if (
+        entry is not None
+        and entry.stat_key == stat_key
+        and stat.st_mtime_ns < entry.recorded_ns - _RACY_WINDOW_NS
+    ):
+        return _copy_result(entry.model, entry.errors)
+
+    try:
+        raw = file_path.read_bytes()
+    except OSError as e:
+        return None, [f"Could not read file: {e}"]
+    digest = hashlib.sha256(raw).hexdigest()
+
+    if entry is not None and entry.digest == digest:
+        entry.stat_key = stat_key
+        entry.recorded_ns = now_ns
+        return _copy_result(entry.model, entry.errors)
+
+    result: tuple[T | None, list[str]] | None = None
+    entry_path = _entry_path(cache_dir, file_key, version) if cache_dir else None
+    if entry_path is not None:
+        result = _load_disk_entry(entry_path, digest, model_class)
+
+    if result is None:
+        try:
+            # Match Path.read_text() universal-newline semantics
+            content = raw.decode().replace("\r\n", "\n").replace("\r", "\n")
+        except UnicodeDecodeError as e:
+            return None, [f"Could not read file: {e}"]
+        result = parser(content)
+        if entry_path is not None:
+            _store_disk_entry(entry_path, digest, result[0], result[1])
+
+    model, errors = result
+    _memo[memo_key] = _MemoEntry(
+        stat_key=stat_key,
+        recorded_ns=now_ns,
+        digest=digest,
+        model=model,
+        errors=list(errors),
+    )
+    return _copy_result(model, errors)
@@ -3,6 +3,8 @@
 # Chunk: docs/chunks/integrity_validate - Core referential integrity validation module
 # Chunk: docs/chunks/validate_external_chunks - External chunk detection and skipping
 # Chunk: docs/chunks/chunks_decompose - Standalone validation functions moved from Chunks class
+# Chunk: docs/chunks/integrity_parallel_scan - Process-pool frontmatter parsing and single-pass source scan
+# Chunk: docs/chunks/validate_since_ref - Incremental validation scoped by git diff
 
 This module provides project-wide validation of artifact references:
 - Chunk outbound references (to narratives, investigations, subsystems, friction entries)
@@ -10,22 +12,35 @@ This module provides project-wide validation of artifact references:
 - Proposed chunks in narratives, investigations, and friction log
 - Bidirectional consistency checking
 - External chunk handling (skip validation, validated in home repo)
+
+With jobs > 1, artifact frontmatter parsing and the source file scan are
+fanned out across a process pool and merged back in a fixed order, so the
+result is identical to a serial run.
+
+With a `since` git ref, only artifacts and source files affected by the
+changes since that ref are re-checked (see `_ValidationScope`).
 """
 
 from __future__ import annotations
 
+import os
 import pathlib
 import re
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Literal, Protocol, TYPE_CHECKING
+from typing import Any, Literal, Protocol, TYPE_CHECKING
 
-from backreferences import CHUNK_BACKREF_PATTERN, SUBSYSTEM_BACKREF_PATTERN
+from backreferences import scan_code_backreferences
 from external_refs import is_external_artifact
 from friction import Friction
 from investigations import Investigations
 from models import ArtifactType, ChunkFrontmatter
 from narratives import Narratives
-from source_files import enumerate_source_files
+from source_files import (
+    enumerate_changed_files,
+    enumerate_source_files,
+    find_files_containing,
+)
 from subsystems import Subsystems
 
 if TYPE_CHECKING:
@@ -94,6 +109,87 @@ class IntegrityResult:
     external_chunks_skipped: int = 0
 
 
+# Chunk: docs/chunks/validate_since_ref - Subset of the project an incremental validation re-checks
+@dataclass
+class _ValidationScope:
+    """Artifacts and source files to re-check in an incremental validation.
+
+    Each set names artifacts whose own checks must run again, either because
+    they changed or because something they link to (or that links to them)
+    changed, was deleted, or was renamed.
+    """
+
+    chunks: set[str]
+    narratives: set[str]
+    investigations: set[str]
+    subsystems: set[str]
+    friction: bool
+    source_files: list[pathlib.Path]
+
+
+# Top-level docs/ directories whose subdirectories are artifacts
+_ARTIFACT_DIRS = ("chunks", "narratives", "investigations", "subsystems")
+
+
+# Maps artifact kind -> (Project manager attribute, frontmatter parse method).
+# Used both by the validator and by pool workers, which build their own Project.
+_FRONTMATTER_PARSERS: dict[str, tuple[str, str]] = {
+    "chunk": ("chunks", "parse_chunk_frontmatter"),
+    "narrative": ("narratives", "parse_narrative_frontmatter"),
+    "investigation": ("investigations", "parse_investigation_frontmatter"),
+    "subsystem": ("subsystems", "parse_subsystem_frontmatter"),
+}
+
+# Work items handed to each pool task. Small enough to balance load across
+# workers, large enough that pickling overhead stays negligible.
+_ARTIFACT_BATCH_SIZE = 32
+_SOURCE_FILE_BATCH_SIZE = 128
+
+
+def _batched(items: list, size: int) -> list[list]:
+    """Split items into consecutive batches of at most size elements."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+# Chunk: docs/chunks/integrity_parallel_scan - Pool worker for artifact frontmatter
+def _parse_frontmatter_batch(
+    project_dir: str, kind: str, names: list[str]
+) -> dict[str, Any]:
+    """Parse the frontmatter of a batch of artifacts of one kind.
+
+    Runs in a pool worker, so it takes only picklable arguments and builds
+    its own Project. Parses go through the shared frontmatter cache, which
+    also warms the on-disk entries for later runs.
+
+    Returns:
+        Dict mapping artifact name to its parsed frontmatter (or None).
+    """
+    from project import Project
+
+    attr, method = _FRONTMATTER_PARSERS[kind]
+    parse = getattr(getattr(Project(pathlib.Path(project_dir)), attr), method)
+    return {name: parse(name) for name in names}
+
+
+# Chunk: docs/chunks/integrity_parallel_scan - Pool worker for code backreference scanning
+def _scan_source_batch(paths: list[str]) -> list[list[tuple[int, str, str]] | None]:
+    """Scan a batch of source files for chunk and subsystem backreferences.
+
+    Returns:
+        One entry per path, in order: the file's (line, kind, id) hits, or
+        None if the file could not be read.
+    """
+    results: list[list[tuple[int, str, str]] | None] = []
+    for path in paths:
+        try:
+            content = pathlib.Path(path).read_text()
+        except (IOError, UnicodeDecodeError):
+            results.append(None)
+            continue
+        results.append(scan_code_backreferences(content))
+    return results
+
+
 # Chunk: docs/chunks/integrity_validate - Core integrity validator class
 # Chunk: docs/chunks/project_artifact_registry - Accepts optional Project for unified manager access
 class IntegrityValidator:
@@ -104,9 +200,24 @@ class IntegrityValidator:
     2. Code backreferences: # Chunk: and # Subsystem: comments
     3. Parent artifact → chunk links: proposed_chunks with chunk_directory
     4. Bidirectional consistency (as warnings)
+
+    Args:
+        project_dir: Path to the project root.
+        project: Optional Project whose managers should be reused.
+        jobs: Worker processes used by validate(). 1 runs everything in
+            process; 0 uses one worker per CPU.
     """
 
-    def __init__(self, project_dir: pathlib.Path, project: "Project | None" = None):
+    # Chunk: docs/chunks/integrity_parallel_scan - jobs parameter for process-pool validation
+    def __init__(
+        self,
+        project_dir: pathlib.Path,
+        project: "Project | None" = None,
+        jobs: int = 1,
+    ):
+        if jobs < 0:
+            raise ValueError(f"jobs must be >= 0, got {jobs}")
+        self.jobs = jobs or os.cpu_count() or 1
         self.project_dir = pathlib.Path(project_dir)
         if project is None:
             from project import Project
@@ -138,6 +249,50 @@ class IntegrityValidator:
         # Maps chunk_name -> set of file paths referenced in its code_references
         self._chunk_code_files: dict[str, set[str]] = {}
 
+        # Parsed frontmatter keyed by artifact kind then name. Filled up front
+        # by a full validate(), and on demand by every other lookup.
+        self._frontmatter: dict[str, dict[str, Any]] = {}
+
+    def _get_frontmatter(self, kind: str, name: str) -> Any:
+        """Return frontmatter for an artifact, parsing it on first access."""
+        parsed = self._frontmatter.setdefault(kind, {})
+        if name not in parsed:
+            attr, method = _FRONTMATTER_PARSERS[kind]
+            parsed[name] = getattr(getattr(self, attr), method)(name)
+        return parsed[name]
+
+    # Chunk: docs/chunks/integrity_parallel_scan - Parse every artifact's frontmatter exactly once
+    def _prefetch_frontmatter(self, executor: Executor | None) -> None:
+        """Parse the frontmatter of every indexed artifact once.
+
+        Must run after _build_artifact_index(). With an executor, batches are
+        parsed in pool workers; results are keyed by name, so completion
+        order does not matter.
+        """
+        names_by_kind = {
+            "chunk": sorted(self._chunk_names),
+            "narrative": sorted(self._narrative_names),
+            "investigation": sorted(self._investigation_names),
+            "subsystem": sorted(self._subsystem_names),
+        }
+
+        if executor is None:
+            for kind, names in names_by_kind.items():
+                attr, method = _FRONTMATTER_PARSERS[kind]
+                parse = getattr(getattr(self, attr), method)
+                self._frontmatter[kind] = {name: parse(name) for name in names}
+            return
+
+        project_dir = str(self.project_dir)
+        futures = [
+            (kind, executor.submit(_parse_frontmatter_batch, project_dir, kind, batch))
+            for kind, names in names_by_kind.items()
+            for batch in _batched(names, _ARTIFACT_BATCH_SIZE)
+        ]
+        self._frontmatter = {kind: {} for kind in names_by_kind}
+        for kind, future in futures:
+            self._frontmatter[kind].update(future.result())
+
     def _build_artifact_index(self) -> None:
         """Build in-memory index of all existing artifacts.
 
@@ -181,7 +336,7 @@ class IntegrityValidator:
         """
         # Index narrative → chunks
         for narrative_name in self._narrative_names:
-            frontmatter = self.narratives.parse_narrative_frontmatter(narrative_name)
+            frontmatter = self._get_frontmatter("narrative", narrative_name)
             if frontmatter and frontmatter.proposed_chunks:
                 chunk_dirs: set[str] = set()
                 for proposed in frontmatter.proposed_chunks:
@@ -197,7 +352,7 @@ class IntegrityValidator:
 
         # Index investigation → chunks
         for investigation_name in self._investigation_names:
-            frontmatter = self.investigations.parse_investigation_frontmatter(investigation_name)
+            frontmatter = self._get_frontmatter("investigation", investigation_name)
             if frontmatter and frontmatter.proposed_chunks:
                 chunk_dirs = set()
                 for proposed in frontmatter.proposed_chunks:
@@ -214,7 +369,7 @@ class IntegrityValidator:
         # Index subsystem → chunks
         # Chunk: docs/chunks/integrity_subsystem_bidir - Build subsystem→chunk index for bidirectional validation
         for subsystem_name in self._subsystem_names:
-            frontmatter = self.subsystems.parse_subsystem_frontmatter(subsystem_name)
+            frontmatter = self._get_frontmatter("subsystem", subsystem_name)
             if frontmatter and frontmatter.chunks:
                 chunk_ids: set[str] = set()
                 for chunk_rel in frontmatter.chunks:
@@ -231,20 +386,28 @@ class IntegrityValidator:
         Extracts file path from code_references (format: {file_path}#{symbol}).
         """
         for chunk_name in self._chunk_names:
-            frontmatter = self.chunks.parse_chunk_frontmatter(chunk_name)
-            if frontmatter and frontmatter.code_references:
-                file_paths: set[str] = set()
-                for ref in frontmatter.code_references:
-                    # Extract file path from ref (format: file_path or file_path#symbol)
-                    ref_str = ref.ref
-                    if "#" in ref_str:
-                        file_path = ref_str.split("#")[0]
-                    else:
-                        file_path = ref_str
-                    file_paths.add(file_path)
-                self._chunk_code_files[chunk_name] = file_paths
-            else:
-                self._chunk_code_files[chunk_name] = set()
+            self._get_chunk_code_files(chunk_name)
+
+    # Chunk: docs/chunks/validate_since_ref - Lazy per-chunk code index for incremental validation
+    def _get_chunk_code_files(self, chunk_name: str) -> set[str]:
+        """Return the file paths a chunk's code_references point at."""
+        file_paths = self._chunk_code_files.get(chunk_name)
+        if file_paths is not None:
+            return file_paths
+
+        file_paths = set()
+        frontmatter = self._get_frontmatter("chunk", chunk_name)
+        if frontmatter and frontmatter.code_references:
+            for ref in frontmatter.code_references:
+                # Extract file path from ref (format: file_path or file_path#symbol)
+                ref_str = ref.ref
+                if "#" in ref_str:
+                    file_path = ref_str.split("#")[0]
+                else:
+                    file_path = ref_str
+                file_paths.add(file_path)
+        self._chunk_code_files[chunk_name] = file_paths
+        return file_paths
 
     # Chunk: docs/chunks/integrity_deprecate_standalone - Public single-chunk validation entry point
     # Chunk: docs/chunks/chunks_decompose - Validation entry point used by Chunks wrapper methods
@@ -270,21 +433,61 @@ class IntegrityValidator:
         # Validate the single chunk
         return self._validate_chunk_outbound(chunk_name)
 
-    def validate(self) -> IntegrityResult:
-        """Run full referential integrity validation.
+    # Chunk: docs/chunks/integrity_parallel_scan - Optional process pool shared by prefetch and source scan
+    # Chunk: docs/chunks/validate_since_ref - since parameter for git-diff scoped validation
+    def validate(self, since: str | None = None) -> IntegrityResult:
+        """Run referential integrity validation.
+
+        With jobs > 1, frontmatter parsing and the source scan run in a
+        process pool; artifacts and files are still reported in sorted and
+        enumeration order respectively, so output does not depend on jobs.
+
+        Args:
+            since: Optional git revision. When given, only artifacts and
+                source files affected by changes between that revision and
+                the working tree are checked. Statistics count only what was
+                checked.
 
         Returns:
             IntegrityResult with errors, warnings, and statistics.
+
+        Raises:
+            GitRefError: If since is given but cannot be diffed against.
         """
+        if self.jobs <= 1:
+            return self._validate(None, since)
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            return self._validate(executor, since)
+
+    def _validate(self, executor: Executor | None, since: str | None) -> IntegrityResult:
+        """Run validate() with an optional executor for the parallel phases."""
         errors: list[IntegrityError] = []
         warnings: list[IntegrityWarning] = []
 
         # Build index of existing artifacts
         self._build_artifact_index()
 
-        # Build bidirectional consistency indexes
-        self._build_parent_chunk_index()
-        self._build_chunk_code_index()
+        if since is None:
+            # Parse each artifact's frontmatter once for all checks below
+            self._prefetch_frontmatter(executor)
+            self._build_parent_chunk_index()
+            self._build_chunk_code_index()
+            scope = None
+            chunk_names = self._chunk_names
+            narrative_names = self._narrative_names
+            investigation_names = self._investigation_names
+            subsystem_names = self._subsystem_names
+            check_friction = True
+        else:
+            # Parent indexes are needed to find parents of changed chunks;
+            # chunk frontmatter is parsed on demand.
+            self._build_parent_chunk_index()
+            scope = self._compute_scope(since)
+            chunk_names = scope.chunks
+            narrative_names = scope.narratives
+            investigation_names = scope.investigations
+            subsystem_names = scope.subsystems
+            check_friction = scope.friction
 
         # Statistics
         chunks_scanned = 0
@@ -296,40 +499,42 @@ class IntegrityValidator:
         subsystem_backrefs_found = 0
 
         # 1. Validate chunk outbound references
-        for chunk_name in self._chunk_names:
+        for chunk_name in sorted(chunk_names):
             chunks_scanned += 1
             chunk_errors, chunk_warnings = self._validate_chunk_outbound(chunk_name)
             errors.extend(chunk_errors)
             warnings.extend(chunk_warnings)
 
         # 2. Validate narrative → chunk references
-        for narrative_name in self._narrative_names:
+        for narrative_name in sorted(narrative_names):
             narratives_scanned += 1
             narrative_errors = self._validate_narrative_chunk_refs(narrative_name)
             errors.extend(narrative_errors)
 
         # 3. Validate investigation → chunk references
-        for investigation_name in self._investigation_names:
+        for investigation_name in sorted(investigation_names):
             investigations_scanned += 1
             investigation_errors = self._validate_investigation_chunk_refs(investigation_name)
             errors.extend(investigation_errors)
 
         # 4. Validate subsystem → chunk references
         # Chunk: docs/chunks/integrity_subsystem_bidir - Updated to collect warnings for bidirectional validation
-        for subsystem_name in self._subsystem_names:
+        for subsystem_name in sorted(subsystem_names):
             subsystems_scanned += 1
             subsystem_errors, subsystem_warnings = self._validate_subsystem_chunk_refs(subsystem_name)
             errors.extend(subsystem_errors)
             warnings.extend(subsystem_warnings)
 
         # 5. Validate friction → chunk references
-        if self.friction.exists():
+        if check_friction and self.friction.exists():
             friction_errors = self._validate_friction_chunk_refs()
             errors.extend(friction_errors)
 
         # 6. Validate code backreferences
         backref_errors, backref_warnings, files_count, chunk_refs, subsystem_refs = (
-            self._validate_code_backreferences()
+            self._validate_code_backreferences(
+                executor, scope.source_files if scope is not None else None
+            )
         )
         errors.extend(backref_errors)
         warnings.extend(backref_warnings)
@@ -351,6 +556,100 @@ class IntegrityValidator:
             external_chunks_skipped=len(self._external_chunk_names),
         )
 
+    # Chunk: docs/chunks/validate_since_ref - Map a git diff to the artifacts and files to re-check
+    def _compute_scope(self, since: str) -> _ValidationScope:
+        """Determine what an incremental validation since a git ref must check.
+
+        Must run after _build_artifact_index() and _build_parent_chunk_index().
+        Changed paths under docs/<type>/<name>/ mark that artifact as changed
+        (including deleted and renamed-away names). Checks are then widened
+        to every artifact whose result can depend on a changed one:
+
+        - chunks that changed, or that link to a changed narrative,
+          investigation, subsystem, dependency chunk or friction log
+        - parents that changed, or whose proposed_chunks/chunks list a
+          changed chunk
+        - source files that changed, or that mention a changed chunk or
+          subsystem (found with git grep, so unchanged files whose
+          backreference targets were deleted are still caught)
+        """
+        changed_paths = enumerate_changed_files(self.project_dir, since)
+
+        changed: dict[str, set[str]] = {dir_name: set() for dir_name in _ARTIFACT_DIRS}
+        friction_changed = False
+        for path in changed_paths:
+            parts = path.split("/")
+            if len(parts) >= 3 and parts[0] == "docs" and parts[1] in changed:
+                changed[parts[1]].add(parts[2])
+            elif path == "docs/trunk/FRICTION.md":
+                friction_changed = True
+
+        changed_chunks = changed["chunks"]
+        changed_narratives = changed["narratives"]
+        changed_investigations = changed["investigations"]
+        changed_subsystems = changed["subsystems"]
+
+        chunks = changed_chunks & self._chunk_names
+        if (
+            changed_chunks or changed_narratives or changed_investigations
+            or changed_subsystems or friction_changed
+        ):
+            for chunk_name in self._chunk_names - chunks:
+                frontmatter = self._get_frontmatter("chunk", chunk_name)
+                if frontmatter is None:
+                    continue
+                if (
+                    frontmatter.narrative in changed_narratives
+                    or frontmatter.investigation in changed_investigations
+                    or any(s.subsystem_id in changed_subsystems for s in frontmatter.subsystems or [])
+                    or any(dep in changed_chunks for dep in frontmatter.depends_on or [])
+                    or (friction_changed and frontmatter.friction_entries)
+                ):
+                    chunks.add(chunk_name)
+
+        narratives = (changed_narratives & self._narrative_names) | {
+            name for name, listed in self._narrative_chunks.items() if listed & changed_chunks
+        }
+        investigations = (changed_investigations & self._investigation_names) | {
+            name for name, listed in self._investigation_chunks.items() if listed & changed_chunks
+        }
+        subsystems = (changed_subsystems & self._subsystem_names) | {
+            name for name, listed in self._subsystem_chunks.items() if listed & changed_chunks
+        }
+
+        friction = friction_changed
+        if not friction and changed_chunks and self.friction.exists():
+            frontmatter = self.friction.parse_frontmatter()
+            if frontmatter and frontmatter.proposed_chunks:
+                friction = any(
+                    proposed.chunk_directory
+                    and proposed.chunk_directory.removeprefix("docs/chunks/") in changed_chunks
+                    for proposed in frontmatter.proposed_chunks
+                )
+
+        # Source files: changed ones plus unchanged ones mentioning changed targets
+        target_paths = set(changed_paths)
+        target_paths |= find_files_containing(
+            self.project_dir,
+            [f"docs/chunks/{name}" for name in sorted(changed_chunks)]
+            + [f"docs/subsystems/{name}" for name in sorted(changed_subsystems)],
+        )
+        resolved_project_dir = self.project_dir.resolve()
+        source_files = [
+            path
+            for path in enumerate_source_files(resolved_project_dir)
+            if path.relative_to(resolved_project_dir).as_posix() in target_paths
+        ]
+
+        return _ValidationScope(
+            chunks=chunks,
+            narratives=narratives,
+            investigations=investigations,
+            subsystems=subsystems,
+            friction=friction,
+            source_files=source_files,
+        )
+
     # Chunk: docs/chunks/integrity_bidirectional - Bidirectional checks for chunk↔narrative and chunk↔investigation
     def _validate_chunk_outbound(
         self, chunk_name: str
@@ -359,7 +658,7 @@ class IntegrityValidator:
         errors: list[IntegrityError] = []
         warnings: list[IntegrityWarning] = []
 
-        frontmatter = self.chunks.parse_chunk_frontmatter(chunk_name)
+        frontmatter = self._get_frontmatter("chunk", chunk_name)
         if frontmatter is None:
             errors.append(
                 IntegrityError(
@@ -479,7 +778,7 @@ class IntegrityValidator:
         """Validate narrative's proposed_chunks → chunk references."""
         errors: list[IntegrityError] = []
 
-        frontmatter = self.narratives.parse_narrative_frontmatter(narrative_name)
+        frontmatter = self._get_frontmatter("narrative", narrative_name)
         if frontmatter is None:
             return errors  # Can't validate if we can't parse
 
@@ -517,7 +816,7 @@ class IntegrityValidator:
         """Validate investigation's proposed_chunks → chunk references."""
         errors: list[IntegrityError] = []
 
-        frontmatter = self.investigations.parse_investigation_frontmatter(investigation_name)
+        frontmatter = self._get_frontmatter("investigation", investigation_name)
         if frontmatter is None:
             return errors  # Can't validate if we can't parse
 
@@ -557,7 +856,7 @@ class IntegrityValidator:
         errors: list[IntegrityError] = []
         warnings: list[IntegrityWarning] = []
 
-        frontmatter = self.subsystems.parse_subsystem_frontmatter(subsystem_name)
+        frontmatter = self._get_frontmatter("subsystem", subsystem_name)
         if frontmatter is None:
             return errors, warnings  # Can't validate if we can't parse
 
@@ -579,7 +878,7 @@ class IntegrityValidator:
                 elif is_local_chunk:
                     # Bidirectional check only for local chunks
                     # (external chunks don't have GOAL.md with subsystems field)
-                    chunk_frontmatter = self.chunks.parse_chunk_frontmatter(chunk_id)
+                    chunk_frontmatter = self._get_frontmatter("chunk", chunk_id)
                     if chunk_frontmatter:
                         subsystem_ids = (
                             {s.subsystem_id for s in chunk_frontmatter.subsystems}
@@ -638,46 +937,60 @@ class IntegrityValidator:
     # Chunk: docs/chunks/integrity_code_backrefs - Line-by-line scanning with line number tracking
     # Chunk: docs/chunks/integrity_bidirectional - Extended with code↔chunk bidirectional warnings
     # Chunk: docs/chunks/backref_language_agnostic - Language-agnostic source file enumeration
+    # Chunk: docs/chunks/integrity_parallel_scan - Single-pass scan, optionally fanned out to a pool
+    # Chunk: docs/chunks/validate_since_ref - Optional explicit file list for incremental scans
     def _validate_code_backreferences(
         self,
+        executor: Executor | None = None,
+        source_files: list[pathlib.Path] | None = None,
     ) -> tuple[list[IntegrityError], list[IntegrityWarning], int, int, int]:
         """Validate code backreference comments point to existing artifacts.
 
         Scans source files for # Chunk: and # Subsystem: comments and validates
         that referenced artifacts exist. Reports line numbers for broken references.
 
+        Each file is read once and matched with a single combined pattern. With
+        an executor, batches of files are scanned in pool workers and results
+        are merged in enumeration order.
+
+        Args:
+            executor: Optional pool for scanning batches of files.
+            source_files: Absolute paths to scan instead of every source file
+                in the project (used by incremental validation).
+
         Returns:
             (errors, warnings, files_scanned, chunk_refs_found, subsystem_refs_found)
         """
         errors: list[IntegrityError] = []
         warnings: list[IntegrityWarning] = []
-        files_scanned = 0
         chunk_refs_found = 0
         subsystem_refs_found = 0
 
         # Enumerate all source files across supported languages
         # Resolve to handle symlinks (e.g., /var -> /private/var on macOS)
         resolved_project_dir = self.project_dir.resolve()
-        source_files = enumerate_source_files(resolved_project_dir)
+        if source_files is None:
+            source_files = enumerate_source_files(resolved_project_dir)
         if not source_files:
             return errors, warnings, 0, 0, 0
 
-        for file_path in source_files:
-            files_scanned += 1
-            try:
-                content = file_path.read_text()
-            except (IOError, UnicodeDecodeError):
+        batches = _batched([str(p) for p in source_files], _SOURCE_FILE_BATCH_SIZE)
+        if executor is None:
+            batch_results = map(_scan_source_batch, batches)
+        else:
+            batch_results = executor.map(_scan_source_batch, batches)
+        file_hits = (hits for batch in batch_results for hits in batch)
+
+        for file_path, hits in zip(source_files, file_hits):
+            if not hits:
                 continue
 
             rel_path = file_path.relative_to(resolved_project_dir)
 
-            # Iterate line-by-line to track line numbers (1-indexed)
-            for line_num, line in enumerate(content.splitlines(), start=1):
-                # Check for chunk backreferences
-                match = CHUNK_BACKREF_PATTERN.match(line)
-                if match:
+            for line_num, kind, artifact_id in hits:
+                if kind == "chunk":
                     chunk_refs_found += 1
-                    chunk_id = match.group(1)
+                    chunk_id = artifact_id
                     # Check both local and external chunks - external chunks are valid
                     # targets for code backreferences (their directory exists locally)
                     is_local_chunk = chunk_id in self._chunk_names
@@ -694,7 +1007,7 @@ class IntegrityValidator:
                     elif is_local_chunk:
                         # Bidirectional check only for local chunks
                         # (external chunks don't have GOAL.md with code_references)
-                        chunk_code_files = self._chunk_code_files.get(chunk_id, set())
+                        chunk_code_files = self._get_chunk_code_files(chunk_id)
                         # Match on file path (str(rel_path))
                         if str(rel_path) not in chunk_code_files:
                             warnings.append(
@@ -706,12 +1019,9 @@ class IntegrityValidator:
                                 )
                             )
                     # External chunks: no bidirectional check (validated in home repo)
-
-                # Check for subsystem backreferences
-                match = SUBSYSTEM_BACKREF_PATTERN.match(line)
-                if match:
+                else:
                     subsystem_refs_found += 1
-                    subsystem_id = match.group(1)
+                    subsystem_id = artifact_id
                     if subsystem_id not in self._subsystem_names:
                         errors.append(
                             IntegrityError(
@@ -722,7 +1032,8 @@ class IntegrityValidator:
                             )
                         )
 
-        return errors, warnings, files_scanned, chunk_refs_found, subsystem_refs_found
+        # Unreadable files still count as scanned
+        return errors, warnings, len(source_files), chunk_refs_found, subsystem_refs_found
 
 
 # Chunk: docs/chunks/integrity_deprecate_standalone - Helper to convert IntegrityError to string messages
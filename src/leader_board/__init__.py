@@ -7,6 +7,7 @@ Public API
 - :class:`LeaderBoardCore` — entry-point for all operations
 - :class:`StorageAdapter` — protocol that adapters implement
 - :class:`InMemoryStorage` — reference / test implementation of StorageAdapter
+- :class:`ChannelTailCache` — the core's in-memory cache of recent messages
 - Domain models: :class:`SwarmInfo`, :class:`ChannelMessage`, :class:`ChannelInfo`
 - Exceptions: :class:`CursorExpiredError`, :class:`SwarmNotFoundError`,
   :class:`ChannelNotFoundError`, :class:`AuthFailedError`
@@ -42,9 +43,11 @@ from leader_board.protocol import (
     ChallengeFrame,
     ChannelsFrame,
     ChannelsListFrame,
+    CreditFrame,
     ErrorFrame,
     InvalidFrameError,
     MessageFrame,
+    MessagesFrame,
     RegisterSwarmFrame,
     SendFrame,
     SwarmInfoFrame,
@@ -55,12 +58,14 @@ from leader_board.protocol import (
 )
 from leader_board.server import create_app, run_server
 from leader_board.storage import StorageAdapter
+from leader_board.tail_cache import ChannelTailCache
 
 __all__ = [
     # Core
     "LeaderBoardCore",
     "StorageAdapter",
     "InMemoryStorage",
+    "ChannelTailCache",
     "SwarmInfo",
     "ChannelMessage",
     "ChannelInfo",
@@ -78,12 +83,14 @@ __all__ = [
     "AuthFrame",
     "RegisterSwarmFrame",
     "WatchFrame",
+    "CreditFrame",
     "SendFrame",
     "ChannelsFrame",
     "SwarmInfoFrame",
     "ChallengeFrame",
     "AuthOkFrame",
     "MessageFrame",
+    "MessagesFrame",
     "AckFrame",
     "ChannelsListFrame",
     "SwarmInfoResponseFrame",
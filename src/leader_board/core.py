@@ -1,4 +1,5 @@
 # Chunk: docs/chunks/leader_board_core - Portable leader board core library
+# Chunk: docs/chunks/leader_board_tail_cache - Serve hot watchers from memory
 """Leader board core — host-independent business logic.
 
 The core owns swarm state, channel log operations, auth verification,
@@ -26,6 +27,11 @@ from leader_board.models import (
     SwarmNotFoundError,
 )
 from leader_board.storage import StorageAdapter
+from leader_board.tail_cache import (
+    DEFAULT_TAIL_CACHE_BYTES,
+    DEFAULT_TAIL_MESSAGES,
+    ChannelTailCache,
+)
 
 
 class LeaderBoardCore:
@@ -34,14 +40,45 @@ class LeaderBoardCore:
     All operations delegate to a ``StorageAdapter`` for persistence.
     The core never touches transport or storage directly — it only
     orchestrates validation, auth, and the blocking-read primitive.
+
+    The core assumes it is the only writer of its storage: it keeps the
+    newest messages of recently used channels in a :class:`ChannelTailCache`
+    and remembers which swarms exist, so watchers that keep up are served
+    without storage reads.
+
+    Args:
+        storage: Persistence adapter.
+        tail_messages: Messages cached per channel; ``0`` disables the cache.
+        tail_cache_bytes: Memory ceiling for cached messages across channels.
     """
 
-    def __init__(self, storage: StorageAdapter) -> None:
+    def __init__(
+        self,
+        storage: StorageAdapter,
+        *,
+        tail_messages: int = DEFAULT_TAIL_MESSAGES,
+        tail_cache_bytes: int = DEFAULT_TAIL_CACHE_BYTES,
+    ) -> None:
         self._storage = storage
         # Per-(swarm_id, channel) event used to wake blocked readers
         self._channel_events: dict[tuple[str, str], asyncio.Event] = defaultdict(
             asyncio.Event
         )
+        self._tail_cache = ChannelTailCache(tail_messages, tail_cache_bytes)
+        # Swarms are never deleted, so a successful lookup can be remembered
+        self._known_swarms: set[str] = set()
+
+    @property
+    def tail_cache(self) -> ChannelTailCache:
+        return self._tail_cache
+
+    async def _require_swarm(self, swarm_id: str) -> None:
+        """Raise ``SwarmNotFoundError`` unless the swarm exists."""
+        if swarm_id in self._known_swarms:
+            return
+        if await self._storage.get_swarm(swarm_id) is None:
+            raise SwarmNotFoundError(swarm_id)
+        self._known_swarms.add(swarm_id)
 
     # ------------------------------------------------------------------
     # Swarm operations
@@ -64,6 +101,7 @@ class LeaderBoardCore:
             created_at=datetime.now(UTC),
         )
         await self._storage.save_swarm(swarm)
+        self._known_swarms.add(swarm_id)
         return swarm
 
     async def verify_auth(
@@ -99,9 +137,7 @@ class LeaderBoardCore:
         Wakes any blocked ``read_after`` callers on the same channel.
         """
         # Swarm must exist
-        swarm = await self._storage.get_swarm(swarm_id)
-        if swarm is None:
-            raise SwarmNotFoundError(swarm_id)
+        await self._require_swarm(swarm_id)
 
         # Validate channel name
         if not CHANNEL_NAME_PATTERN.match(channel):
@@ -118,6 +154,7 @@ class LeaderBoardCore:
             )
 
         msg = await self._storage.append_message(swarm_id, channel, body)
+        self._tail_cache.record_append(swarm_id, channel, msg)
 
         # Wake any blocked readers
         key = (swarm_id, channel)
@@ -137,15 +174,48 @@ class LeaderBoardCore:
         Raises ``ChannelNotFoundError`` if the channel has never been written to.
         Raises ``CursorExpiredError`` if *cursor* is behind the compaction frontier.
         """
-        swarm = await self._storage.get_swarm(swarm_id)
-        if swarm is None:
-            raise SwarmNotFoundError(swarm_id)
+        messages = await self._wait_for_messages(swarm_id, channel, cursor, 1)
+        return messages[0]
+
+    # Chunk: docs/chunks/leader_board_stream_watch - Batched blocking read
+    async def read_batch_after(
+        self, swarm_id: str, channel: str, cursor: int, limit: int
+    ) -> list[ChannelMessage]:
+        """Return up to *limit* consecutive messages after *cursor*.
+
+        Blocks until at least one message exists, then returns everything
+        available up to *limit* without waiting for more. Raises the same
+        errors as :meth:`read_after`.
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be positive, got {limit}")
+        return await self._wait_for_messages(swarm_id, channel, cursor, limit)
+
+    async def _wait_for_messages(
+        self, swarm_id: str, channel: str, cursor: int, limit: int
+    ) -> list[ChannelMessage]:
+        """Read up to *limit* messages after *cursor*, waiting for appends if none exist."""
+        await self._require_swarm(swarm_id)
 
         key = (swarm_id, channel)
 
         while True:
+            # Take the event before reading so an append that lands between
+            # the read and the wait still wakes this reader
+            event = self._channel_events[key]
+
+            # Chunk: docs/chunks/leader_board_tail_cache - Cache hit skips storage
+            # A hit means the channel exists and the cursor is within (or
+            # past) retained messages, so no metadata check is needed
+            cached = self._tail_cache.read_after(swarm_id, channel, cursor, limit)
+            if cached is not None:
+                if cached:
+                    return cached
+                await event.wait()
+                continue
+
             # Check if channel exists
-            ch_info = await self._storage.get_channel_info(swarm_id, channel)
+            ch_info = await self._channel_info(swarm_id, channel)
             if ch_info is None:
                 raise ChannelNotFoundError(channel)
 
@@ -156,19 +226,30 @@ class LeaderBoardCore:
                 raise CursorExpiredError(ch_info.oldest_position)
 
             # Try to read
-            msg = await self._storage.read_after(swarm_id, channel, cursor)
-            if msg is not None:
-                return msg
+            if limit == 1:
+                msg = await self._storage.read_after(swarm_id, channel, cursor)
+                messages = [msg] if msg is not None else []
+            else:
+                messages = await self._storage.read_batch_after(
+                    swarm_id, channel, cursor, limit
+                )
+            if messages:
+                return messages
 
             # Block until a new message arrives
-            event = self._channel_events[key]
             await event.wait()
 
+    async def _channel_info(self, swarm_id: str, channel: str) -> ChannelInfo | None:
+        info = self._tail_cache.channel_info(swarm_id, channel)
+        if info is None:
+            info = await self._storage.get_channel_info(swarm_id, channel)
+            if info is not None:
+                self._tail_cache.record_channel_info(swarm_id, info)
+        return info
+
     async def list_channels(self, swarm_id: str) -> list[ChannelInfo]:
         """List all channels in a swarm with their head/oldest positions."""
-        swarm = await self._storage.get_swarm(swarm_id)
-        if swarm is None:
-            raise SwarmNotFoundError(swarm_id)
+        await self._require_swarm(swarm_id)
         return await self._storage.list_channels(swarm_id)
 
     # ------------------------------------------------------------------
@@ -184,7 +265,9 @@ class LeaderBoardCore:
         Returns the count of removed messages.
         Raises ``SwarmNotFoundError`` if the swarm is unknown.
         """
-        swarm = await self._storage.get_swarm(swarm_id)
-        if swarm is None:
-            raise SwarmNotFoundError(swarm_id)
-        return await self._storage.compact(swarm_id, channel, min_age_days)
+        await self._require_swarm(swarm_id)
+        removed = await self._storage.compact(swarm_id, channel, min_age_days)
+        if removed:
+            # The oldest position moved; cached messages may now be expired
+            self._tail_cache.invalidate(swarm_id, channel)
+        return removed
@@ -1,8 +1,13 @@
 # Chunk: docs/chunks/leader_board_local_server - Local WebSocket server adapter
+# Chunk: docs/chunks/leader_board_segmented_log - Segmented message log with sparse index
+# Chunk: docs/chunks/leader_board_stream_watch - Batched reads for streaming watches
+# Chunk: docs/chunks/leader_board_fs_writer - Appends off the event loop with group commit
+# Chunk: docs/chunks/leader_board_stream_compaction - Streaming, metadata-skipping compaction
+# Chunk: docs/chunks/leader_board_binary_records - Length-prefixed binary segment records
 """Filesystem-based storage adapter for the leader board.
 
 Persists swarm registration and channel message logs to disk so state
-survives server restarts. Uses JSON files for simplicity and portability.
+survives server restarts. Metadata is JSON; message logs are binary.
 
 Directory layout under the configurable root::
 
@@ -12,28 +17,188 @@ Directory layout under the configurable root::
           swarm.json
           channels/
             <channel_name>/
-              messages.jsonl   # one JSON object per line, append-only
-              meta.json        # head_position, oldest_position counters
+              meta.json        # head/oldest positions, segment geometry
+              segments/
+                00000000000000000001.log  # positions 1..segment_size
+                00000000000000000001.idx  # sparse "position offset" lines
+                ...
+
+Each channel's log is split into segments holding a fixed number of
+positions; a segment file is named after the first position it can hold,
+so the segment for any position is found arithmetically. Segment files
+are append-only sequences of records, each a fixed header (position,
+``sent_at`` in microseconds since the epoch, body length; see
+:data:`RECORD_HEADER`) followed by the raw body bytes. Every ``index_interval``-th
+position of a segment gets a line in the segment's sparse index recording
+the byte offset of its message, letting reads seek close to the cursor
+instead of parsing the channel from the start.
+
+Compaction unlinks segments whose newest message is expired and rewrites
+only the first surviving segment, so its cost is bounded by the segment
+size rather than the channel length. meta.json records the oldest
+message's timestamp, so channels with nothing expired are skipped without
+opening their segments.
+
+Channels written by older versions, as a single ``messages.jsonl`` file or
+as segments of hex-encoded JSON lines, are converted to binary segments the
+first time they are touched, or all at once by :meth:`FileSystemStorage.migrate`
+(``ve board migrate-storage``).
+
+Appends run on a :class:`~leader_board.fs_writer.GroupCommitWriter` thread,
+which commits concurrent appends to a channel together and fsyncs according
+to the storage's durability mode.
 """
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import fcntl
 import json
+import os
+import shutil
+import struct
 import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+from leader_board.fs_writer import (
+    DURABILITY_BATCHED,
+    GroupCommitWriter,
+    sync_paths,
+)
 from leader_board.models import ChannelInfo, ChannelMessage, SwarmInfo
 
+# Positions per segment file for newly created channels
+DEFAULT_SEGMENT_SIZE = 4096
 
-class FileSystemStorage:
-    """StorageAdapter backed by the local filesystem."""
+# Positions between sparse index entries within a segment
+DEFAULT_INDEX_INTERVAL = 64
+
+
+@dataclass(frozen=True)
+class CompactionStats:
+    """Outcome of compacting one channel."""
+
+    swarm_id: str
+    channel: str
+    removed: int
+    bytes_reclaimed: int
+    duration_seconds: float
+    # True when meta.json showed there was nothing to remove
+    skipped: bool = False
+
+
+@dataclass(frozen=True)
+class MigrationStats:
+    """Outcome of converting one channel to the current record format."""
+
+    swarm_id: str
+    channel: str
+    converted: bool
+    bytes_before: int
+    bytes_after: int
+
+
+# Record header: position, sent_at (microseconds since the epoch), body length
+RECORD_HEADER = struct.Struct(">QqI")
+
+# meta.json "record_format" of channels stored as binary records
+RECORD_FORMAT = "binary"
+
+# Suffix of binary segment files, and of the JSON-line segments they replace
+SEGMENT_SUFFIX = ".log"
+_JSON_SEGMENT_SUFFIX = ".jsonl"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+# A decoded record: (position, sent_at, body)
+Record = tuple[int, datetime, bytes]
+
+
+def encode_record(position: int, sent_at: datetime, body: bytes) -> bytes:
+    """Encode one message as a segment record."""
+    micros = (sent_at - _EPOCH) // _MICROSECOND
+    return RECORD_HEADER.pack(position, micros, len(body)) + body
+
+
+def _read_header(f) -> tuple[int, int, int] | None:
+    """Read a record header, or None at the end of the file."""
+    raw = f.read(RECORD_HEADER.size)
+    if len(raw) < RECORD_HEADER.size:
+        return None
+    return RECORD_HEADER.unpack(raw)
+
+
+def _sent_at(micros: int) -> datetime:
+    return _EPOCH + micros * _MICROSECOND
+
+
+def iter_records(path: Path) -> Iterator[Record]:
+    """Yield every complete record of a segment file, in order."""
+    with open(path, "rb") as f:
+        while (header := _read_header(f)) is not None:
+            position, micros, length = header
+            body = f.read(length)
+            if len(body) < length:
+                # Partially written tail from a concurrent append
+                return
+            yield position, _sent_at(micros), body
 
-    def __init__(self, root: Path) -> None:
+
+def _record_from_json(data: dict) -> Record:
+    return (
+        data["position"],
+        datetime.fromisoformat(data["sent_at"]),
+        bytes.fromhex(data["body"]),
+    )
+
+
+class FileSystemStorage:
+    """StorageAdapter backed by the local filesystem.
+
+    Args:
+        root: Directory holding all swarm data.
+        segment_size: Positions per segment file for new channels. Existing
+            channels keep the geometry recorded in their meta.json.
+        index_interval: Positions between sparse index entries for new
+            channels.
+        durability: When appends are fsynced: ``"none"``, ``"batched"``
+            (default) or ``"per-message"``; see :mod:`leader_board.fs_writer`.
+        sync_interval: Longest delay before a batched-mode fsync, in seconds.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        index_interval: int = DEFAULT_INDEX_INTERVAL,
+        durability: str = DURABILITY_BATCHED,
+        sync_interval: float | None = None,
+    ) -> None:
+        if segment_size < 1 or index_interval < 1:
+            raise ValueError("segment_size and index_interval must be positive")
         self._root = root
         self._swarms_dir = root / "swarms"
         self._swarms_dir.mkdir(parents=True, exist_ok=True)
+        self._segment_size = segment_size
+        self._index_interval = index_interval
+        writer_options = {} if sync_interval is None else {"sync_interval": sync_interval}
+        self._writer = GroupCommitWriter(self._append_group, durability, **writer_options)
+
+    @property
+    def durability(self) -> str:
+        return self._writer.durability
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until queued appends are written and pending fsyncs are done."""
+        return self._writer.flush(timeout)
 
     # ------------------------------------------------------------------
     # Helpers
@@ -48,18 +213,322 @@ class FileSystemStorage:
     def _meta_path(self, swarm_id: str, channel: str) -> Path:
         return self._channel_dir(swarm_id, channel) / "meta.json"
 
-    def _messages_path(self, swarm_id: str, channel: str) -> Path:
+    def _legacy_messages_path(self, swarm_id: str, channel: str) -> Path:
         return self._channel_dir(swarm_id, channel) / "messages.jsonl"
 
+    def _segments_dir(self, swarm_id: str, channel: str) -> Path:
+        return self._channel_dir(swarm_id, channel) / "segments"
+
     def _read_meta(self, swarm_id: str, channel: str) -> dict | None:
         path = self._meta_path(swarm_id, channel)
         if not path.exists():
             return None
         return json.loads(path.read_text())
 
-    def _write_meta(self, swarm_id: str, channel: str, meta: dict) -> None:
+    def _write_meta(
+        self, swarm_id: str, channel: str, meta: dict, *, sync: bool = False
+    ) -> None:
+        # Replace atomically: lock-free readers must never see a torn file
         path = self._meta_path(swarm_id, channel)
-        path.write_text(json.dumps(meta))
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(meta))
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        tmp_path.replace(path)
+        if sync:
+            sync_paths([path.parent])
+
+    @contextmanager
+    def _channel_lock(self, swarm_id: str, channel: str) -> Iterator[None]:
+        """Hold the channel's exclusive lock across processes."""
+        ch_dir = self._channel_dir(swarm_id, channel)
+        ch_dir.mkdir(parents=True, exist_ok=True)
+        lock_path = ch_dir / ".lock"
+        lock_path.touch(exist_ok=True)
+        with open(lock_path) as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    # Segment geometry
+
+    @staticmethod
+    def _segment_start(meta: dict, position: int) -> int:
+        """First position of the segment that holds position."""
+        size = meta["segment_size"]
+        return ((position - 1) // size) * size + 1
+
+    def _segment_path(
+        self, swarm_id: str, channel: str, position: int, meta: dict | None = None
+    ) -> Path:
+        """Path of the segment file that holds position."""
+        if meta is None:
+            meta = self._read_meta(swarm_id, channel) or self._new_meta()
+        start = self._segment_start(meta, position)
+        return self._segments_dir(swarm_id, channel) / f"{start:020d}{SEGMENT_SUFFIX}"
+
+    @staticmethod
+    def _index_path(segment_path: Path) -> Path:
+        return segment_path.with_suffix(".idx")
+
+    def _segment_files(self, swarm_id: str, channel: str) -> list[Path]:
+        """All segment files of a channel, oldest first."""
+        segments_dir = self._segments_dir(swarm_id, channel)
+        if not segments_dir.exists():
+            return []
+        return sorted(segments_dir.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def _new_meta(self) -> dict:
+        return {
+            "head_position": 0,
+            "oldest_position": 1,
+            "segment_size": self._segment_size,
+            "index_interval": self._index_interval,
+            "record_format": RECORD_FORMAT,
+        }
+
+    def _write_segment(
+        self, segment_path: Path, meta: dict, records: list[Record]
+    ) -> None:
+        """Write a whole segment and its index atomically (replacing any old one)."""
+        start = self._segment_start(meta, records[0][0])
+        interval = meta["index_interval"]
+        index_lines: list[str] = []
+        fd, tmp_path = tempfile.mkstemp(
+            dir=segment_path.parent, suffix=f"{SEGMENT_SUFFIX}.tmp"
+        )
+        try:
+            with open(fd, "wb") as f:
+                for position, sent_at, body in records:
+                    if (position - start) % interval == 0:
+                        index_lines.append(f"{position} {f.tell()}\n")
+                    f.write(encode_record(position, sent_at, body))
+            self._replace_index(segment_path, index_lines)
+            Path(tmp_path).replace(segment_path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _replace_index(self, segment_path: Path, index_lines: list[str]) -> None:
+        index_path = self._index_path(segment_path)
+        index_tmp = index_path.with_suffix(".idx.tmp")
+        index_tmp.write_text("".join(index_lines))
+        # Readers validate index entries against the segment, so a
+        # momentarily mismatched pair only costs them a rescan
+        index_tmp.replace(index_path)
+
+    @staticmethod
+    def _is_current(meta: dict) -> bool:
+        return meta.get("record_format") == RECORD_FORMAT
+
+    def _ensure_segmented(self, swarm_id: str, channel: str) -> dict | None:
+        """Return the channel's meta, converting an older log if needed.
+
+        Single-file ``messages.jsonl`` logs and JSON-line segments are
+        rewritten as binary segments. Each step leaves the channel readable
+        by a rerun, so an interrupted conversion resumes where it stopped.
+        Must be called with the channel lock held.
+        """
+        meta = self._read_meta(swarm_id, channel)
+        if meta is None or self._is_current(meta):
+            return meta
+
+        meta = {
+            "segment_size": self._segment_size,
+            "index_interval": self._index_interval,
+            **meta,
+            "record_format": RECORD_FORMAT,
+        }
+        segments_dir = self._segments_dir(swarm_id, channel)
+        segments_dir.mkdir(parents=True, exist_ok=True)
+
+        legacy_path = self._legacy_messages_path(swarm_id, channel)
+        if legacy_path.exists():
+            self._write_segments(segments_dir, meta, self._iter_json_lines(legacy_path))
+        for json_segment in sorted(segments_dir.glob(f"*{_JSON_SEGMENT_SUFFIX}")):
+            records = list(self._iter_json_lines(json_segment))
+            if records:
+                self._write_segment(
+                    json_segment.with_suffix(SEGMENT_SUFFIX), meta, records
+                )
+            json_segment.unlink()
+
+        self._write_meta(swarm_id, channel, meta)
+        legacy_path.unlink(missing_ok=True)
+        return meta
+
+    def migrate(self) -> list[MigrationStats]:
+        """Convert every channel written in an older format to binary records.
+
+        Channels are also converted lazily when first touched; this does
+        them all up front and reports the disk space each one saved.
+        """
+        results: list[MigrationStats] = []
+        for swarm_dir in sorted(self._swarms_dir.iterdir()):
+            channels_dir = swarm_dir / "channels"
+            if not channels_dir.is_dir():
+                continue
+            for ch_dir in sorted(channels_dir.iterdir()):
+                if ch_dir.is_dir() and (ch_dir / "meta.json").exists():
+                    results.append(self._migrate_channel(swarm_dir.name, ch_dir.name))
+        return results
+
+    def _migrate_channel(self, swarm_id: str, channel: str) -> MigrationStats:
+        with self._channel_lock(swarm_id, channel):
+            before = self._log_bytes(swarm_id, channel)
+            meta = self._read_meta(swarm_id, channel)
+            converted = meta is not None and not self._is_current(meta)
+            if converted:
+                self._ensure_segmented(swarm_id, channel)
+            return MigrationStats(
+                swarm_id=swarm_id,
+                channel=channel,
+                converted=converted,
+                bytes_before=before,
+                bytes_after=self._log_bytes(swarm_id, channel) if converted else before,
+            )
+
+    def _log_bytes(self, swarm_id: str, channel: str) -> int:
+        """Bytes used by a channel's message log and indexes."""
+        paths = [self._legacy_messages_path(swarm_id, channel)]
+        segments_dir = self._segments_dir(swarm_id, channel)
+        if segments_dir.is_dir():
+            paths.extend(segments_dir.iterdir())
+        return sum(path.stat().st_size for path in paths if path.is_file())
+
+    @staticmethod
+    def _iter_json_lines(path: Path) -> Iterator[Record]:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield _record_from_json(json.loads(line))
+
+    def _write_segments(
+        self, segments_dir: Path, meta: dict, records: Iterable[Record]
+    ) -> None:
+        """Split position-ordered records into segment files."""
+        batch: list[Record] = []
+        batch_start: int | None = None
+        for record in records:
+            start = self._segment_start(meta, record[0])
+            if batch and start != batch_start:
+                self._write_segment(
+                    segments_dir / f"{batch_start:020d}{SEGMENT_SUFFIX}", meta, batch
+                )
+                batch = []
+            batch_start = start
+            batch.append(record)
+        if batch:
+            self._write_segment(
+                segments_dir / f"{batch_start:020d}{SEGMENT_SUFFIX}", meta, batch
+            )
+
+    def _load_index(self, segment_path: Path) -> tuple[list[int], list[int]]:
+        """Return parallel (positions, offsets) lists of a segment's index."""
+        positions: list[int] = []
+        offsets: list[int] = []
+        try:
+            text = self._index_path(segment_path).read_text()
+        except FileNotFoundError:
+            return positions, offsets
+        for line in text.splitlines():
+            parts = line.split()
+            if len(parts) != 2:
+                continue
+            positions.append(int(parts[0]))
+            offsets.append(int(parts[1]))
+        return positions, offsets
+
+    def _scan_segment(
+        self, segment_path: Path, target: int
+    ) -> ChannelMessage | None:
+        """Return the first message at position >= target in one segment.
+
+        Raises:
+            FileNotFoundError: If the segment was removed by compaction.
+        """
+        with closing(self._iter_segment(segment_path, target)) as messages:
+            return next(messages, None)
+
+    def _iter_segment(
+        self, segment_path: Path, target: int
+    ) -> Iterator[ChannelMessage]:
+        """Yield the messages at positions >= target in one segment, in order.
+
+        Seeks to the closest indexed offset at or before target and skips
+        the bodies of earlier records. If the record there does not hold the
+        indexed position (the file was rewritten by hand or an index write
+        was lost) the scan restarts from the beginning of the segment. Stops
+        at a partially written tail.
+
+        Raises:
+            FileNotFoundError: If the segment was removed by compaction.
+        """
+        # <channel>/segments/<segment>
+        channel = segment_path.parent.parent.name
+        positions, offsets = self._load_index(segment_path)
+        i = bisect.bisect_right(positions, target) - 1
+        with open(segment_path, "rb") as f:
+            if i >= 0:
+                f.seek(offsets[i])
+                expected: int | None = positions[i]
+            else:
+                expected = None
+            while (header := _read_header(f)) is not None:
+                position, micros, length = header
+                if expected is not None:
+                    valid = position == expected
+                    expected = None
+                    if not valid:
+                        # Index entry was stale: rescan this segment
+                        f.seek(0)
+                        continue
+                if position < target:
+                    f.seek(length, os.SEEK_CUR)
+                    continue
+                body = f.read(length)
+                if len(body) < length:
+                    # Partially written tail from a concurrent append
+                    return
+                yield ChannelMessage(
+                    channel=channel,
+                    position=position,
+                    body=body,
+                    sent_at=_sent_at(micros),
+                )
+
+    def _last_record(self, segment_path: Path) -> tuple[int, datetime] | None:
+        """Position and timestamp of a segment's last complete record.
+
+        Scans headers forward from the last index entry, so at most
+        ``index_interval`` records are visited.
+        """
+        positions, offsets = self._load_index(segment_path)
+        size = segment_path.stat().st_size
+        starts = [(offsets[-1], positions[-1])] if offsets else []
+        starts.append((0, None))
+        with open(segment_path, "rb") as f:
+            for offset, expected in starts:
+                f.seek(offset)
+                last: tuple[int, datetime] | None = None
+                while (header := _read_header(f)) is not None:
+                    position, micros, length = header
+                    if expected is not None and position != expected:
+                        # Stale index entry: fall back to a full scan
+                        break
+                    expected = None
+                    if f.tell() + length > size:
+                        break
+                    last = (position, _sent_at(micros))
+                    f.seek(length, os.SEEK_CUR)
+                if last is not None:
+                    return last
+        return None
 
     # ------------------------------------------------------------------
     # StorageAdapter implementation
@@ -94,74 +563,166 @@ class FileSystemStorage:
     async def append_message(
         self, swarm_id: str, channel: str, body: bytes
     ) -> ChannelMessage:
-        """Append a message, assigning a monotonic position and timestamp."""
-        ch_dir = self._channel_dir(swarm_id, channel)
-        ch_dir.mkdir(parents=True, exist_ok=True)
-
-        messages_path = self._messages_path(swarm_id, channel)
-        meta_path = self._meta_path(swarm_id, channel)
-
-        # Use file locking for atomicity across concurrent appends
-        lock_path = ch_dir / ".lock"
-        lock_path.touch(exist_ok=True)
-
-        with open(lock_path) as lock_file:
-            fcntl.flock(lock_file, fcntl.LOCK_EX)
-            try:
-                # Read current position
-                meta = self._read_meta(swarm_id, channel)
-                if meta is None:
-                    meta = {"head_position": 0, "oldest_position": 1}
-
-                position = meta["head_position"] + 1
+        """Append a message, assigning a monotonic position and timestamp.
+
+        The write happens on the writer thread; this returns once it is
+        committed (and fsynced, in ``per-message`` mode).
+        """
+        return await self._writer.submit((swarm_id, channel), body)
+
+    def _append_group(
+        self, key: tuple[str, str], bodies: list[bytes], sync: bool
+    ) -> tuple[list[ChannelMessage], list[Path]]:
+        """Append several messages to one channel. Runs on the writer thread.
+
+        Returns the appended messages and, unless *sync* is set (in which case
+        everything is fsynced before returning), the paths to fsync later.
+        Data files come before meta.json so a sync never makes the head
+        point past unsynced messages.
+        """
+        swarm_id, channel = key
+        # Use file locking for atomicity across processes
+        with self._channel_lock(swarm_id, channel):
+            meta = self._ensure_segmented(swarm_id, channel)
+            if meta is None:
+                meta = self._new_meta()
+
+            messages: list[ChannelMessage] = []
+            # Records and index entries per segment file, in position order
+            records: dict[Path, list[bytes]] = {}
+            index_lines: dict[Path, list[str]] = {}
+            offsets: dict[Path, int] = {}
+            for body in bodies:
+                position = meta["head_position"] + len(messages) + 1
                 sent_at = datetime.now(UTC)
-
-                # Write message line
-                msg_data = {
-                    "channel": channel,
-                    "position": position,
-                    "body": body.hex(),
-                    "sent_at": sent_at.isoformat(),
-                }
-                with open(messages_path, "a") as f:
-                    f.write(json.dumps(msg_data) + "\n")
-
-                # Update meta
-                meta["head_position"] = position
-                self._write_meta(swarm_id, channel, meta)
-
-                return ChannelMessage(
-                    channel=channel,
-                    position=position,
-                    body=body,
-                    sent_at=sent_at,
+                segment_path = self._segment_path(swarm_id, channel, position, meta)
+                if segment_path not in records:
+                    records[segment_path] = []
+                    try:
+                        offsets[segment_path] = segment_path.stat().st_size
+                    except FileNotFoundError:
+                        offsets[segment_path] = 0
+                record = encode_record(position, sent_at, body)
+                # Index every interval-th position of the segment
+                start = self._segment_start(meta, position)
+                if (position - start) % meta["index_interval"] == 0:
+                    index_lines.setdefault(segment_path, []).append(
+                        f"{position} {offsets[segment_path]}\n"
+                    )
+                offsets[segment_path] += len(record)
+                records[segment_path].append(record)
+                messages.append(
+                    ChannelMessage(
+                        channel=channel, position=position, body=body, sent_at=sent_at
+                    )
                 )
-            finally:
-                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+            segments_dir = self._segments_dir(swarm_id, channel)
+            segments_dir.mkdir(parents=True, exist_ok=True)
+            data_paths: list[Path] = []
+            for segment_path, segment_records in records.items():
+                with open(segment_path, "ab") as f:
+                    f.write(b"".join(segment_records))
+                data_paths.append(segment_path)
+                if segment_path in index_lines:
+                    index_path = self._index_path(segment_path)
+                    with open(index_path, "a") as f:
+                        f.write("".join(index_lines[segment_path]))
+                    data_paths.append(index_path)
+            data_paths.append(segments_dir)
+            if sync:
+                sync_paths(data_paths)
+
+            if meta["head_position"] < meta["oldest_position"]:
+                # First message of the channel: lets compaction skip by meta
+                meta["oldest_sent_at"] = messages[0].sent_at.isoformat()
+            meta["head_position"] = messages[-1].position
+            self._write_meta(swarm_id, channel, meta, sync=sync)
+
+        if sync:
+            return messages, []
+        meta_path = self._meta_path(swarm_id, channel)
+        return messages, [*data_paths, meta_path, meta_path.parent]
 
     async def read_after(
         self, swarm_id: str, channel: str, cursor: int
     ) -> ChannelMessage | None:
         """Return the message at position > cursor, or None."""
-        messages_path = self._messages_path(swarm_id, channel)
-        if not messages_path.exists():
+        meta = self._read_meta(swarm_id, channel)
+        if meta is None:
             return None
-
-        with open(messages_path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                data = json.loads(line)
-                if data["position"] > cursor:
-                    return ChannelMessage(
-                        channel=data["channel"],
-                        position=data["position"],
-                        body=bytes.fromhex(data["body"]),
-                        sent_at=datetime.fromisoformat(data["sent_at"]),
-                    )
+        if not self._is_current(meta):
+            with self._channel_lock(swarm_id, channel):
+                meta = self._ensure_segmented(swarm_id, channel)
+
+        # Compaction may unlink a segment between reading meta and opening
+        # it; re-reading meta then yields the new oldest position
+        for _ in range(3):
+            target = max(cursor + 1, meta["oldest_position"])
+            if target > meta["head_position"]:
+                return None
+            try:
+                msg = self._scan_segment(
+                    self._segment_path(swarm_id, channel, target, meta), target
+                )
+            except FileNotFoundError:
+                meta = self._read_meta(swarm_id, channel)
+                if meta is None:
+                    return None
+                continue
+            if msg is not None:
+                return msg
+            # Target sits past this segment's last complete record: either the
+            # next segment holds it or an append is still being written
+            next_start = self._segment_start(meta, target) + meta["segment_size"]
+            if next_start > meta["head_position"]:
+                return None
+            cursor = next_start - 1
         return None
 
+    async def read_batch_after(
+        self, swarm_id: str, channel: str, cursor: int, limit: int
+    ) -> list[ChannelMessage]:
+        """Return up to limit consecutive messages at positions > cursor.
+
+        Reads each segment sequentially from one index seek instead of
+        seeking once per message.
+        """
+        meta = self._read_meta(swarm_id, channel)
+        if meta is None:
+            return []
+        if not self._is_current(meta):
+            with self._channel_lock(swarm_id, channel):
+                meta = self._ensure_segmented(swarm_id, channel)
+
+        batch: list[ChannelMessage] = []
+        retries = 0
+        while len(batch) < limit:
+            target = max(cursor + 1, meta["oldest_position"])
+            if target > meta["head_position"]:
+                break
+            segment_path = self._segment_path(swarm_id, channel, target, meta)
+            try:
+                with closing(self._iter_segment(segment_path, target)) as messages:
+                    for msg in messages:
+                        batch.append(msg)
+                        cursor = msg.position
+                        if len(batch) >= limit:
+                            break
+            except FileNotFoundError:
+                # Removed by compaction: return what was already read, or
+                # retry from the new oldest position
+                retries += 1
+                meta = self._read_meta(swarm_id, channel)
+                if batch or meta is None or retries >= 3:
+                    break
+                continue
+            next_start = self._segment_start(meta, target) + meta["segment_size"]
+            if len(batch) >= limit or next_start > meta["head_position"]:
+                break
+            cursor = max(cursor, next_start - 1)
+        return batch
+
     async def list_channels(self, swarm_id: str) -> list[ChannelInfo]:
         """List all channels in a swarm with head/oldest positions."""
         channels_dir = self._swarm_dir(swarm_id) / "channels"
@@ -200,53 +761,178 @@ class FileSystemStorage:
         self, swarm_id: str, channel: str, min_age_days: int
     ) -> int:
         """Remove messages older than min_age_days, always retaining the most recent."""
-        messages_path = self._messages_path(swarm_id, channel)
-        if not messages_path.exists():
-            return 0
+        stats = await self.compact_channel(swarm_id, channel, min_age_days)
+        return stats.removed
+
+    async def compact_channel(
+        self, swarm_id: str, channel: str, min_age_days: int
+    ) -> CompactionStats:
+        """Compact one channel off the event loop and report what it reclaimed."""
+        return await asyncio.to_thread(
+            self._compact_sync, swarm_id, channel, min_age_days
+        )
 
+    def _compact_sync(
+        self, swarm_id: str, channel: str, min_age_days: int
+    ) -> CompactionStats:
+        """Compact one channel; see :meth:`compact`.
+
+        Messages are timestamped under the channel lock, so sent_at grows
+        with position. A channel whose oldest message (recorded in
+        meta.json) is younger than the cutoff, or that holds a single
+        message, is skipped without taking the lock or opening a segment.
+        Otherwise whole segments whose newest message is expired are
+        unlinked, and the first surviving segment is rewritten by streaming
+        its unexpired records into a new file.
+        """
+        started = time.monotonic()
         cutoff = datetime.now(UTC) - timedelta(days=min_age_days)
 
-        # Read all messages
-        all_messages: list[dict] = []
-        with open(messages_path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+        def result(removed: int = 0, reclaimed: int = 0, skipped: bool = False):
+            return CompactionStats(
+                swarm_id=swarm_id,
+                channel=channel,
+                removed=removed,
+                bytes_reclaimed=reclaimed,
+                duration_seconds=time.monotonic() - started,
+                skipped=skipped,
+            )
+
+        if not self._needs_compaction(self._read_meta(swarm_id, channel), cutoff):
+            return result(skipped=True)
+
+        with self._channel_lock(swarm_id, channel):
+            meta = self._ensure_segmented(swarm_id, channel)
+            if not self._needs_compaction(meta, cutoff):
+                return result(skipped=True)
+            segments = self._segment_files(swarm_id, channel)
+            if not segments:
+                return result()
+
+            head_start = self._segment_start(meta, meta["head_position"])
+            removed = 0
+            reclaimed = 0
+            oldest: dict | None = None
+            for segment_path in segments:
+                is_active = int(segment_path.stem) == head_start
+                last = self._last_record(segment_path)
+                if last is None:
+                    continue
+                last_position, last_sent_at = last
+                if not is_active and last_sent_at < cutoff:
+                    # Entirely expired: drop the segment without reading it
+                    first = int(segment_path.stem)
+                    removed += last_position - max(first, meta["oldest_position"]) + 1
+                    reclaimed += self._unlink_segment(segment_path)
                     continue
-                all_messages.append(json.loads(line))
-
-        if not all_messages:
-            return 0
-
-        # Always retain the most recent message
-        most_recent = all_messages[-1]
-        to_keep = [
-            msg
-            for msg in all_messages
-            if datetime.fromisoformat(msg["sent_at"]) >= cutoff
-            or msg is most_recent
-        ]
-
-        removed = len(all_messages) - len(to_keep)
-        if removed == 0:
-            return 0
-
-        # Write to temp file then rename for atomicity
-        ch_dir = self._channel_dir(swarm_id, channel)
-        fd, tmp_path = tempfile.mkstemp(dir=ch_dir, suffix=".jsonl.tmp")
-        try:
-            with open(fd, "w") as f:
-                for msg in to_keep:
-                    f.write(json.dumps(msg) + "\n")
-            Path(tmp_path).replace(messages_path)
-        except Exception:
-            Path(tmp_path).unlink(missing_ok=True)
-            raise
-
-        # Update meta with new oldest position
-        meta = self._read_meta(swarm_id, channel)
-        if meta is not None and to_keep:
-            meta["oldest_position"] = to_keep[0]["position"]
-            self._write_meta(swarm_id, channel, meta)
 
-        return removed
+                # First surviving segment: drop its expired prefix, always
+                # retaining the channel's most recent message
+                segment_removed, segment_reclaimed, oldest = self._trim_segment(
+                    segment_path, meta, cutoff, keep_last=is_active
+                )
+                removed += segment_removed
+                reclaimed += segment_reclaimed
+                if oldest is not None:
+                    break
+
+            if oldest is not None:
+                oldest_position, oldest_sent_at = oldest
+                if removed or meta.get("oldest_sent_at") != oldest_sent_at.isoformat():
+                    meta["oldest_position"] = oldest_position
+                    meta["oldest_sent_at"] = oldest_sent_at.isoformat()
+                    self._write_meta(swarm_id, channel, meta)
+
+            return result(removed, reclaimed)
+
+    @staticmethod
+    def _needs_compaction(meta: dict | None, cutoff: datetime) -> bool:
+        """Whether meta alone leaves open that the channel has expired messages."""
+        if meta is None or meta["head_position"] <= meta["oldest_position"]:
+            # No messages, or only the most recent one, which is always kept
+            return False
+        oldest_sent_at = meta.get("oldest_sent_at")
+        if oldest_sent_at is None:
+            # Written before the oldest timestamp was recorded
+            return True
+        return datetime.fromisoformat(oldest_sent_at) < cutoff
+
+    def _unlink_segment(self, segment_path: Path) -> int:
+        """Remove a segment and its index, returning the bytes freed."""
+        freed = 0
+        for path in (segment_path, self._index_path(segment_path)):
+            try:
+                freed += path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        return freed
+
+    def _trim_segment(
+        self, segment_path: Path, meta: dict, cutoff: datetime, *, keep_last: bool
+    ) -> tuple[int, int, tuple[int, datetime] | None]:
+        """Drop a segment's messages sent before cutoff.
+
+        Only record headers are read until the first one to keep; the rest
+        of the file is copied as-is into a replacement, and its index entries
+        are carried over shifted by the dropped prefix. With keep_last set,
+        the final message survives even when expired.
+
+        Returns:
+            (messages removed, bytes reclaimed, position and sent_at of the
+            first kept message or None).
+        """
+        old_size = segment_path.stat().st_size
+        index_path = self._index_path(segment_path)
+        old_index_size = index_path.stat().st_size if index_path.exists() else 0
+
+        with open(segment_path, "rb") as src:
+            skipped = 0
+            previous: tuple[int, datetime, int] | None = None
+            first: tuple[int, datetime, int] | None = None
+            while True:
+                offset = src.tell()
+                header = _read_header(src)
+                if header is None or offset + RECORD_HEADER.size + header[2] > old_size:
+                    break
+                position, micros, length = header
+                sent_at = _sent_at(micros)
+                if sent_at >= cutoff:
+                    first = (position, sent_at, offset)
+                    break
+                skipped += 1
+                previous = (position, sent_at, offset)
+                src.seek(length, os.SEEK_CUR)
+            if first is None:
+                if keep_last and previous is not None:
+                    # Retain the most recent message
+                    skipped -= 1
+                    first = previous
+                else:
+                    self._unlink_segment(segment_path)
+                    return skipped, old_size + old_index_size, None
+            if skipped == 0:
+                return 0, 0, first[:2]
+
+            cut = first[2]
+            positions, offsets = self._load_index(segment_path)
+            index_lines = [
+                f"{position} {offset - cut}\n"
+                for position, offset in zip(positions, offsets)
+                if position >= first[0] and offset >= cut
+            ]
+            src.seek(cut)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=segment_path.parent, suffix=f"{SEGMENT_SUFFIX}.tmp"
+            )
+            try:
+                with open(fd, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                self._replace_index(segment_path, index_lines)
+                Path(tmp_path).replace(segment_path)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+        new_size = segment_path.stat().st_size + index_path.stat().st_size
+        return skipped, old_size + old_index_size - new_size, first[:2]
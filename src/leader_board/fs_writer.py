@@ -0,0 +1,234 @@
+# Chunk: docs/chunks/leader_board_fs_writer - Group-commit writer thread
+"""Background writer that group-commits appends for :class:`FileSystemStorage`.
+
+Appends used to run their file locking, writes and ``meta.json`` rewrite
+directly inside ``async def append_message``, blocking the event loop for
+every send. They are now queued to a single writer thread. Each time it
+wakes, the thread takes everything queued, groups it by channel, and hands
+each channel's bodies to the storage in one call: one lock acquisition, one
+segment write and one meta rewrite for the whole group. Each caller's
+future is resolved once its group is written.
+
+Durability modes decide when written data is forced to disk:
+
+- ``none``: never fsync; the OS writes back on its own schedule.
+- ``batched``: fsync the files touched since the last sync at most every
+  ``sync_interval`` seconds, off the acknowledgement path. A crash can lose
+  acknowledged appends from the last interval.
+- ``per-message``: fsync before acknowledging. Appends committed in the
+  same group share one fsync.
+
+The thread exits after ``idle_timeout`` seconds without work (once pending
+syncs are done) and is restarted by the next append, so an idle storage
+holds no thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_NONE = "none"
+DURABILITY_BATCHED = "batched"
+DURABILITY_PER_MESSAGE = "per-message"
+DURABILITY_MODES = (DURABILITY_NONE, DURABILITY_BATCHED, DURABILITY_PER_MESSAGE)
+
+# Longest a batched-mode write may stay unsynced
+DEFAULT_SYNC_INTERVAL = 0.1
+
+# Requests committed per wake-up at most, bounding acknowledgement latency
+DEFAULT_MAX_GROUP = 512
+
+# Seconds without work before the writer thread exits
+DEFAULT_IDLE_TIMEOUT = 1.0
+
+# Commits one channel's group: (key, items, sync) -> (results, paths to sync later)
+WriteGroup = Callable[[Hashable, list[Any], bool], tuple[list[Any], list[Path]]]
+
+
+def sync_paths(paths: list[Path]) -> None:
+    """fsync files and directories, in order, skipping ones that vanished."""
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            continue
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class _Request:
+    __slots__ = ("key", "item", "future", "loop")
+
+    def __init__(self, key, item, future, loop) -> None:
+        self.key = key
+        self.item = item
+        self.future = future
+        self.loop = loop
+
+
+def _resolve(future: asyncio.Future, result: Any, error: BaseException | None) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class GroupCommitWriter:
+    """Single writer thread that commits queued items in per-key groups.
+
+    Args:
+        write_group: Callback that commits one key's items. When its
+            ``sync`` argument is True it must fsync before returning;
+            otherwise it returns the paths to fsync later, in order.
+        durability: One of :data:`DURABILITY_MODES`.
+        sync_interval: Batched mode's longest delay before an fsync.
+        max_group: Most requests taken per wake-up.
+        idle_timeout: Idle seconds before the thread exits.
+    """
+
+    def __init__(
+        self,
+        write_group: WriteGroup,
+        durability: str = DURABILITY_BATCHED,
+        *,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+        max_group: int = DEFAULT_MAX_GROUP,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ) -> None:
+        if durability not in DURABILITY_MODES:
+            raise ValueError(
+                f"durability must be one of {', '.join(DURABILITY_MODES)}, got {durability!r}"
+            )
+        self._write_group = write_group
+        self.durability = durability
+        self.sync_interval = sync_interval
+        self.max_group = max_group
+        self.idle_timeout = idle_timeout
+        self._queue: queue.SimpleQueue[_Request] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        # Batched mode: paths awaiting fsync, in first-dirtied order
+        self._dirty: dict[Path, None] = {}
+        self._sync_deadline: float | None = None
+        self.groups_committed = 0
+        self.items_committed = 0
+
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """Queue an item and wait until its group is committed."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            self._queue.put(_Request(key, item, future, loop))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="leader-board-writer", daemon=True
+                )
+                self._thread.start()
+        return await future
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for queued work and pending syncs to finish.
+
+        Blocking; call it from a thread other than the writer's. Returns
+        False if *timeout* expired first.
+        """
+        done = threading.Event()
+        with self._lock:
+            if self._thread is None:
+                return True
+            self._queue.put(_Request(None, done, None, None))
+        return done.wait(timeout)
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self._wait_time())
+            except queue.Empty:
+                if self._sync_deadline is not None:
+                    self._sync_dirty()
+                    continue
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+
+            requests = [first]
+            while len(requests) < self.max_group:
+                try:
+                    requests.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            barriers = [r.item for r in requests if r.future is None]
+            self._commit([r for r in requests if r.future is not None])
+
+            if barriers or (
+                self._sync_deadline is not None and time.monotonic() >= self._sync_deadline
+            ):
+                self._sync_dirty()
+            for done in barriers:
+                done.set()
+
+    def _wait_time(self) -> float:
+        if self._sync_deadline is None:
+            return self.idle_timeout
+        return max(0.0, self._sync_deadline - time.monotonic())
+
+    def _commit(self, requests: list[_Request]) -> None:
+        groups: dict[Hashable, list[_Request]] = {}
+        for request in requests:
+            groups.setdefault(request.key, []).append(request)
+
+        sync_now = self.durability == DURABILITY_PER_MESSAGE
+        for key, group in groups.items():
+            try:
+                results, dirty = self._write_group(key, [r.item for r in group], sync_now)
+            except Exception as exc:
+                logger.exception("Leader board write failed for %s", key)
+                outcomes = [(None, exc)] * len(group)
+            else:
+                outcomes = [(result, None) for result in results]
+                self.groups_committed += 1
+                self.items_committed += len(group)
+                if self.durability == DURABILITY_BATCHED:
+                    self._dirty.update(dict.fromkeys(dirty))
+                    if self._sync_deadline is None:
+                        self._sync_deadline = time.monotonic() + self.sync_interval
+            for request, (result, error) in zip(group, outcomes):
+                try:
+                    request.loop.call_soon_threadsafe(
+                        _resolve, request.future, result, error
+                    )
+                except RuntimeError:
+                    # The caller's loop has closed
+                    pass
+
+    def _sync_dirty(self) -> None:
+        if not self._dirty:
+            self._sync_deadline = None
+            return
+        paths = list(self._dirty)
+        self._dirty.clear()
+        self._sync_deadline = None
+        try:
+            sync_paths(paths)
+        except OSError:
+            logger.exception("Leader board fsync failed")
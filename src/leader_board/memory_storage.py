@@ -6,6 +6,7 @@ Used in tests and as a reference implementation for adapter authors.
 
 from __future__ import annotations
 
+import bisect
 from datetime import UTC, datetime, timedelta
 
 from leader_board.models import ChannelInfo, ChannelMessage, SwarmInfo
@@ -51,6 +52,14 @@ class InMemoryStorage:
                 return msg
         return None
 
+    # Chunk: docs/chunks/leader_board_stream_watch - Batched reads for streaming watches
+    async def read_batch_after(
+        self, swarm_id: str, channel: str, cursor: int, limit: int
+    ) -> list[ChannelMessage]:
+        messages = self._channels.get((swarm_id, channel), [])
+        start = bisect.bisect_right(messages, cursor, key=lambda msg: msg.position)
+        return messages[start:start + limit]
+
     async def list_channels(self, swarm_id: str) -> list[ChannelInfo]:
         result: list[ChannelInfo] = []
         for (sid, ch), messages in self._channels.items():
@@ -1,4 +1,5 @@
 # Chunk: docs/chunks/leader_board_local_server - Local WebSocket server adapter
+# Chunk: docs/chunks/leader_board_stream_watch - Batched and streaming watch frames
 """Wire protocol frame parsing and serialization.
 
 Defines typed dataclasses for every frame in the leader board wire protocol
@@ -47,11 +48,21 @@ class RegisterSwarmFrame:
 
 @dataclass(frozen=True)
 class WatchFrame:
-    """Subscribe to a channel starting after a cursor position."""
+    """Subscribe to a channel starting after a cursor position.
+
+    Without the optional fields the server answers with one ``message``
+    frame. With ``max_batch`` it answers with one ``messages`` frame of up to
+    that many messages. With ``stream`` the subscription stays open and the
+    server keeps pushing ``messages`` frames while the client holds credits;
+    ``credits`` is the initial window, replenished by ``credit`` frames.
+    """
 
     channel: str
     swarm: str
     cursor: int
+    max_batch: int | None = None
+    stream: bool = False
+    credits: int | None = None
 
 
 @dataclass(frozen=True)
@@ -63,6 +74,15 @@ class SendFrame:
     body: str  # base64-encoded ciphertext
 
 
+@dataclass(frozen=True)
+class CreditFrame:
+    """Grant a streaming watch permission to deliver more messages."""
+
+    channel: str
+    swarm: str
+    credits: int
+
+
 @dataclass(frozen=True)
 class ChannelsFrame:
     """List all channels in a swarm."""
@@ -78,7 +98,13 @@ class SwarmInfoFrame:
 
 
 ClientFrame = Union[
-    AuthFrame, RegisterSwarmFrame, WatchFrame, SendFrame, ChannelsFrame, SwarmInfoFrame
+    AuthFrame,
+    RegisterSwarmFrame,
+    WatchFrame,
+    CreditFrame,
+    SendFrame,
+    ChannelsFrame,
+    SwarmInfoFrame,
 ]
 
 
@@ -111,6 +137,14 @@ class MessageFrame:
     sent_at: str  # ISO 8601 UTC
 
 
+@dataclass(frozen=True)
+class MessagesFrame:
+    """A batch of consecutive messages delivered to a batched or streaming watch."""
+
+    channel: str
+    messages: list[dict]  # [{"position": ..., "body": ..., "sent_at": ...}]
+
+
 @dataclass(frozen=True)
 class AckFrame:
     """Confirmation that a send was appended."""
@@ -148,6 +182,7 @@ ServerFrame = Union[
     ChallengeFrame,
     AuthOkFrame,
     MessageFrame,
+    MessagesFrame,
     AckFrame,
     ChannelsListFrame,
     SwarmInfoResponseFrame,
@@ -163,12 +198,26 @@ _CLIENT_FRAME_REQUIRED_FIELDS: dict[str, list[str]] = {
     "auth": ["swarm", "signature"],
     "register_swarm": ["swarm", "public_key"],
     "watch": ["channel", "swarm", "cursor"],
+    "credit": ["channel", "swarm", "credits"],
     "send": ["channel", "swarm", "body"],
     "channels": ["swarm"],
     "swarm_info": ["swarm"],
 }
 
 
+def _optional_positive_int(obj: dict, field: str) -> int | None:
+    value = obj.get(field)
+    if value is None:
+        return None
+    try:
+        value = int(value)
+    except (TypeError, ValueError) as exc:
+        raise InvalidFrameError(f"Field {field!r} must be an integer") from exc
+    if value < 1:
+        raise InvalidFrameError(f"Field {field!r} must be positive")
+    return value
+
+
 def parse_client_frame(data: str) -> ClientFrame:
     """Parse a JSON string into a typed client frame.
 
@@ -203,8 +252,18 @@ def parse_client_frame(data: str) -> ClientFrame:
         return RegisterSwarmFrame(swarm=obj["swarm"], public_key=obj["public_key"])
     elif frame_type == "watch":
         return WatchFrame(
-            channel=obj["channel"], swarm=obj["swarm"], cursor=int(obj["cursor"])
+            channel=obj["channel"],
+            swarm=obj["swarm"],
+            cursor=int(obj["cursor"]),
+            max_batch=_optional_positive_int(obj, "max_batch"),
+            stream=bool(obj.get("stream", False)),
+            credits=_optional_positive_int(obj, "credits"),
         )
+    elif frame_type == "credit":
+        credits = _optional_positive_int(obj, "credits")
+        if credits is None:
+            raise InvalidFrameError("Field 'credits' must be an integer")
+        return CreditFrame(channel=obj["channel"], swarm=obj["swarm"], credits=credits)
     elif frame_type == "send":
         return SendFrame(
             channel=obj["channel"], swarm=obj["swarm"], body=obj["body"]
@@ -236,6 +295,8 @@ def serialize_server_frame(frame: ServerFrame) -> str:
             "body": frame.body,
             "sent_at": frame.sent_at,
         }
+    elif isinstance(frame, MessagesFrame):
+        obj = {"type": "messages", "channel": frame.channel, "messages": frame.messages}
     elif isinstance(frame, AckFrame):
         obj = {"type": "ack", "channel": frame.channel, "position": frame.position}
     elif isinstance(frame, ChannelsListFrame):
@@ -1,4 +1,7 @@
 # Chunk: docs/chunks/leader_board_local_server - Local WebSocket server adapter
+# Chunk: docs/chunks/leader_board_stream_watch - Batched and streaming watch delivery
+# Chunk: docs/chunks/leader_board_stream_compaction - Concurrent compaction sweep with stats
+# Chunk: docs/chunks/leader_board_watch_registry - Per-connection watch registry
 """Local WebSocket server adapter for the leader board.
 
 Wraps the portable :class:`LeaderBoardCore` with a Starlette/Uvicorn
@@ -11,6 +14,7 @@ import asyncio
 import base64
 import logging
 import os
+from collections import Counter
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncGenerator
@@ -21,7 +25,8 @@ from starlette.routing import WebSocketRoute
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
 from leader_board.core import LeaderBoardCore
-from leader_board.fs_storage import FileSystemStorage
+from leader_board.fs_storage import CompactionStats, FileSystemStorage
+from leader_board.fs_writer import DURABILITY_BATCHED
 from leader_board.models import (
     AuthFailedError,
     ChannelNotFoundError,
@@ -35,9 +40,11 @@ from leader_board.protocol import (
     ChallengeFrame,
     ChannelsFrame,
     ChannelsListFrame,
+    CreditFrame,
     ErrorFrame,
     InvalidFrameError,
     MessageFrame,
+    MessagesFrame,
     RegisterSwarmFrame,
     SendFrame,
     SwarmInfoFrame,
@@ -46,6 +53,7 @@ from leader_board.protocol import (
     parse_client_frame,
     serialize_server_frame,
 )
+from leader_board.tail_cache import DEFAULT_TAIL_CACHE_BYTES
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +61,17 @@ DEFAULT_STORAGE_DIR = Path.home() / ".ve" / "leader_board"
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8374
 DEFAULT_COMPACTION_INTERVAL = 3600  # 1 hour
+DEFAULT_COMPACTION_CONCURRENCY = 4
+COMPACTION_MIN_AGE_DAYS = 30
+
+# Largest batch a watch may request; larger max_batch values are clamped
+MAX_WATCH_BATCH = 256
+
+# Credit window of a streaming watch that does not specify one
+DEFAULT_STREAM_CREDITS = 256
+
+# Channels one connection may watch at once
+DEFAULT_MAX_WATCHES_PER_CONNECTION = 1024
 
 
 # ---------------------------------------------------------------------------
@@ -70,13 +89,168 @@ async def _send_error(ws: WebSocket, code: str, message: str, **kwargs) -> None:
     await _send_frame(ws, ErrorFrame(code=code, message=message, **kwargs))
 
 
+def _wire_message(msg) -> dict:
+    """Encode a channel message's fields for a message or messages frame."""
+    return {
+        "position": msg.position,
+        "body": base64.b64encode(msg.body).decode("ascii"),
+        "sent_at": msg.sent_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+class _StreamCredits:
+    """Flow-control window of one streaming watch.
+
+    The server only reads and sends as many messages as the client has
+    granted, so a slow consumer leaves the backlog in storage instead of in
+    server memory or the socket buffer.
+    """
+
+    def __init__(self, credits: int) -> None:
+        self.available = credits
+        self._granted = asyncio.Event()
+        if credits > 0:
+            self._granted.set()
+
+    def grant(self, credits: int) -> None:
+        self.available += credits
+        self._granted.set()
+
+    def spend(self, count: int) -> None:
+        self.available -= count
+        if self.available <= 0:
+            self._granted.clear()
+
+    async def wait(self) -> None:
+        await self._granted.wait()
+
+
+class WatcherCounts:
+    """Active watches per channel across all connections of a server.
+
+    Available as ``app.state.watchers``.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Counter[tuple[str, str]] = Counter()
+
+    def add(self, swarm_id: str, channel: str) -> None:
+        self._counts[(swarm_id, channel)] += 1
+
+    def remove(self, swarm_id: str, channel: str) -> None:
+        key = (swarm_id, channel)
+        self._counts[key] -= 1
+        if self._counts[key] <= 0:
+            del self._counts[key]
+
+    def count(self, swarm_id: str, channel: str) -> int:
+        """Active watches of one channel."""
+        return self._counts[(swarm_id, channel)]
+
+    @property
+    def total(self) -> int:
+        return sum(self._counts.values())
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """Active watch counts as ``{swarm_id: {channel: count}}``."""
+        result: dict[str, dict[str, int]] = {}
+        for (swarm_id, channel), count in sorted(self._counts.items()):
+            result.setdefault(swarm_id, {})[channel] = count
+        return result
+
+
+class _ConnectionWatches:
+    """The watches of one connection, at most one per channel.
+
+    Registering a watch for a channel cancels the one it replaces, and a
+    finished watch removes itself, so the registry holds only live tasks.
+    """
+
+    def __init__(self, swarm_id: str, counts: WatcherCounts, limit: int) -> None:
+        self._swarm_id = swarm_id
+        self._counts = counts
+        self._limit = limit
+        self._watches: dict[str, tuple[asyncio.Task, _StreamCredits | None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    def has_room_for(self, channel: str) -> bool:
+        """Whether a watch on *channel* fits under the connection's limit."""
+        return channel in self._watches or len(self._watches) < self._limit
+
+    def register(
+        self, channel: str, task: asyncio.Task, credits: _StreamCredits | None = None
+    ) -> None:
+        previous = self._watches.pop(channel, None)
+        if previous is not None:
+            previous[0].cancel()
+        self._watches[channel] = (task, credits)
+        self._counts.add(self._swarm_id, channel)
+        task.add_done_callback(lambda done: self._finished(channel, done))
+
+    def credits(self, channel: str) -> _StreamCredits | None:
+        """Flow-control window of the channel's stream, if one is running."""
+        entry = self._watches.get(channel)
+        if entry is None or entry[0].done():
+            return None
+        return entry[1]
+
+    def _finished(self, channel: str, task: asyncio.Task) -> None:
+        self._counts.remove(self._swarm_id, channel)
+        entry = self._watches.get(channel)
+        if entry is not None and entry[0] is task:
+            del self._watches[channel]
+
+    async def cancel_all(self) -> None:
+        tasks = [task for task, _ in self._watches.values()]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+async def _stream_watch(
+    ws: WebSocket,
+    core: LeaderBoardCore,
+    frame: WatchFrame,
+    credits: _StreamCredits,
+) -> None:
+    """Push every message after the cursor, in batches, as credits allow."""
+    max_batch = min(frame.max_batch or MAX_WATCH_BATCH, MAX_WATCH_BATCH)
+    cursor = frame.cursor
+    while True:
+        await credits.wait()
+        messages = await core.read_batch_after(
+            frame.swarm, frame.channel, cursor, min(max_batch, credits.available)
+        )
+        credits.spend(len(messages))
+        await _send_frame(
+            ws,
+            MessagesFrame(
+                channel=frame.channel,
+                messages=[_wire_message(msg) for msg in messages],
+            ),
+        )
+        cursor = messages[-1].position
+
+
 async def _handle_watch(
     ws: WebSocket,
     core: LeaderBoardCore,
     frame: WatchFrame,
     authenticated_swarm: str,
+    credits: _StreamCredits | None = None,
 ) -> None:
-    """Handle a watch frame — runs as a separate task to allow concurrency."""
+    """Handle a watch frame — runs as a separate task to allow concurrency.
+
+    A plain watch gets one ``message`` frame, a watch with ``max_batch`` one
+    ``messages`` frame, and a streaming watch (``credits`` given) keeps
+    sending ``messages`` frames until cancelled or an error ends it.
+    """
     if frame.swarm != authenticated_swarm:
         await _send_error(
             ws,
@@ -87,16 +261,25 @@ async def _handle_watch(
         return
 
     try:
-        msg = await core.read_after(frame.swarm, frame.channel, frame.cursor)
-        await _send_frame(
-            ws,
-            MessageFrame(
-                channel=msg.channel,
-                position=msg.position,
-                body=base64.b64encode(msg.body).decode("ascii"),
-                sent_at=msg.sent_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            ),
-        )
+        if credits is not None:
+            await _stream_watch(ws, core, frame, credits)
+        elif frame.max_batch is not None:
+            messages = await core.read_batch_after(
+                frame.swarm,
+                frame.channel,
+                frame.cursor,
+                min(frame.max_batch, MAX_WATCH_BATCH),
+            )
+            await _send_frame(
+                ws,
+                MessagesFrame(
+                    channel=frame.channel,
+                    messages=[_wire_message(msg) for msg in messages],
+                ),
+            )
+        else:
+            msg = await core.read_after(frame.swarm, frame.channel, frame.cursor)
+            await _send_frame(ws, MessageFrame(channel=msg.channel, **_wire_message(msg)))
     except ChannelNotFoundError:
         await _send_error(ws, "channel_not_found", f"Channel not found: {frame.channel}")
     except CursorExpiredError as exc:
@@ -179,7 +362,11 @@ async def websocket_handler(ws: WebSocket) -> None:
     await _send_frame(ws, AuthOkFrame())
 
     # Step 4: Message loop
-    watch_tasks: list[asyncio.Task] = []
+    watches = _ConnectionWatches(
+        authenticated_swarm,
+        ws.app.state.watchers,
+        ws.app.state.max_watches_per_connection,
+    )
 
     try:
         while True:
@@ -195,7 +382,9 @@ async def websocket_handler(ws: WebSocket) -> None:
                 continue
 
             # All post-auth frames must reference the authenticated swarm
-            if isinstance(frame, (WatchFrame, SendFrame, ChannelsFrame, SwarmInfoFrame)):
+            if isinstance(
+                frame, (WatchFrame, CreditFrame, SendFrame, ChannelsFrame, SwarmInfoFrame)
+            ):
                 if frame.swarm != authenticated_swarm:
                     await _send_error(
                         ws,
@@ -206,11 +395,30 @@ async def websocket_handler(ws: WebSocket) -> None:
                     continue
 
             if isinstance(frame, WatchFrame):
-                # Run watch in a separate task for concurrency
+                if not watches.has_room_for(frame.channel):
+                    await _send_error(
+                        ws,
+                        "too_many_watches",
+                        f"Connection already watches {len(watches)} channels; "
+                        f"cannot watch {frame.channel!r}",
+                    )
+                    continue
+                # Run watch in a separate task for concurrency. A re-sent
+                # watch replaces the channel's previous one, so a streaming
+                # watch restarts from the new cursor.
+                credits = None
+                if frame.stream:
+                    credits = _StreamCredits(frame.credits or DEFAULT_STREAM_CREDITS)
                 task = asyncio.create_task(
-                    _handle_watch(ws, core, frame, authenticated_swarm)
+                    _handle_watch(ws, core, frame, authenticated_swarm, credits)
                 )
-                watch_tasks.append(task)
+                watches.register(frame.channel, task, credits)
+
+            elif isinstance(frame, CreditFrame):
+                # Credits for a stream that already ended are dropped
+                credits = watches.credits(frame.channel)
+                if credits is not None:
+                    credits.grant(frame.credits)
 
             elif isinstance(frame, SendFrame):
                 try:
@@ -278,13 +486,7 @@ async def websocket_handler(ws: WebSocket) -> None:
                 )
     finally:
         # Cancel any outstanding watch tasks
-        for task in watch_tasks:
-            task.cancel()
-        for task in watch_tasks:
-            try:
-                await task
-            except (asyncio.CancelledError, Exception):
-                pass
+        await watches.cancel_all()
 
 
 # ---------------------------------------------------------------------------
@@ -296,22 +498,68 @@ async def _compaction_loop(
     core: LeaderBoardCore,
     storage: FileSystemStorage,
     interval_seconds: int,
+    concurrency: int = DEFAULT_COMPACTION_CONCURRENCY,
 ) -> None:
     """Periodically run compaction on all swarms and channels."""
     while True:
         await asyncio.sleep(interval_seconds)
         try:
-            channels = await _enumerate_all_channels(storage)
-            total_removed = 0
-            for swarm_id, channel in channels:
-                removed = await core.compact(swarm_id, channel, min_age_days=30)
-                total_removed += removed
-            if total_removed > 0:
-                logger.info("Compaction removed %d messages", total_removed)
+            await _compact_all(core, storage, concurrency)
         except Exception:
             logger.exception("Compaction error")
 
 
+async def _compact_all(
+    core: LeaderBoardCore,
+    storage: FileSystemStorage,
+    concurrency: int = DEFAULT_COMPACTION_CONCURRENCY,
+) -> list[CompactionStats]:
+    """Compact every channel, at most *concurrency* at a time.
+
+    Channels with nothing to remove are skipped by the storage using their
+    metadata. Returns the stats of every channel, including skipped ones.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def compact_one(swarm_id: str, channel: str) -> CompactionStats | None:
+        async with semaphore:
+            try:
+                stats = await storage.compact_channel(
+                    swarm_id, channel, COMPACTION_MIN_AGE_DAYS
+                )
+            except Exception:
+                logger.exception("Compaction of %s/%s failed", swarm_id, channel)
+                return None
+        if stats.removed:
+            # Same bookkeeping as LeaderBoardCore.compact
+            core.tail_cache.invalidate(swarm_id, channel)
+            logger.info(
+                "Compacted %s/%s: removed %d messages, reclaimed %d bytes in %.3fs",
+                swarm_id,
+                channel,
+                stats.removed,
+                stats.bytes_reclaimed,
+                stats.duration_seconds,
+            )
+        return stats
+
+    channels = await _enumerate_all_channels(storage)
+    results = await asyncio.gather(
+        *(compact_one(swarm_id, channel) for swarm_id, channel in channels)
+    )
+    stats = [r for r in results if r is not None]
+    total_removed = sum(s.removed for s in stats)
+    if total_removed > 0:
+        logger.info(
+            "Compaction removed %d messages from %d of %d channels, reclaiming %d bytes",
+            total_removed,
+            sum(1 for s in stats if s.removed),
+            len(channels),
+            sum(s.bytes_reclaimed for s in stats),
+        )
+    return stats
+
+
 async def _enumerate_all_channels(
     storage: FileSystemStorage,
 ) -> list[tuple[str, str]]:
@@ -344,6 +592,10 @@ def create_app(
     port: int = DEFAULT_PORT,
     compaction_interval_seconds: int = DEFAULT_COMPACTION_INTERVAL,
     *,
+    tail_cache_bytes: int = DEFAULT_TAIL_CACHE_BYTES,
+    durability: str = DURABILITY_BATCHED,
+    compaction_concurrency: int = DEFAULT_COMPACTION_CONCURRENCY,
+    max_watches_per_connection: int = DEFAULT_MAX_WATCHES_PER_CONNECTION,
     core: LeaderBoardCore | None = None,
     storage: FileSystemStorage | None = None,
 ) -> Starlette:
@@ -359,6 +611,17 @@ def create_app(
         Bind port (stored on app.state for ``run_server``).
     compaction_interval_seconds:
         How often (in seconds) to run the compaction sweep.
+    tail_cache_bytes:
+        Memory ceiling of the core's cache of recent channel messages.
+        Ignored when *core* is given.
+    durability:
+        When the filesystem storage fsyncs appends: ``"none"``, ``"batched"``
+        or ``"per-message"``. Ignored when *storage* is given.
+    compaction_concurrency:
+        Most channels compacted at once during a sweep.
+    max_watches_per_connection:
+        Most channels one connection may watch at once; further watches are
+        rejected with ``too_many_watches``.
     core:
         Optional pre-configured core instance (for testing).
     storage:
@@ -367,10 +630,10 @@ def create_app(
     if storage is None:
         if storage_dir is None:
             storage_dir = DEFAULT_STORAGE_DIR
-        storage = FileSystemStorage(storage_dir)
+        storage = FileSystemStorage(storage_dir, durability=durability)
 
     if core is None:
-        core = LeaderBoardCore(storage)
+        core = LeaderBoardCore(storage, tail_cache_bytes=tail_cache_bytes)
 
     compaction_task: asyncio.Task | None = None
 
@@ -379,7 +642,9 @@ def create_app(
         nonlocal compaction_task
         # Start compaction scheduler
         compaction_task = asyncio.create_task(
-            _compaction_loop(core, storage, compaction_interval_seconds)
+            _compaction_loop(
+                core, storage, compaction_interval_seconds, compaction_concurrency
+            )
         )
         try:
             yield
@@ -390,12 +655,16 @@ def create_app(
                 await compaction_task
             except asyncio.CancelledError:
                 pass
+            # Sync batched appends before the process exits
+            await asyncio.to_thread(storage.flush)
 
     app = Starlette(
         routes=[WebSocketRoute("/ws", websocket_handler)],
         lifespan=lifespan,
     )
     app.state.core = core
+    app.state.watchers = WatcherCounts()
+    app.state.max_watches_per_connection = max_watches_per_connection
     app.state.host = host
     app.state.port = port
 
@@ -407,6 +676,8 @@ def run_server(
     host: str = DEFAULT_HOST,
     port: int = DEFAULT_PORT,
     compaction_interval_seconds: int = DEFAULT_COMPACTION_INTERVAL,
+    tail_cache_bytes: int = DEFAULT_TAIL_CACHE_BYTES,
+    durability: str = DURABILITY_BATCHED,
 ) -> None:
     """Create and run the leader board server.
 
@@ -417,5 +688,7 @@ def run_server(
         host=host,
         port=port,
         compaction_interval_seconds=compaction_interval_seconds,
+        tail_cache_bytes=tail_cache_bytes,
+        durability=durability,
     )
     uvicorn.run(app, host=host, port=port)
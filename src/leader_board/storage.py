@@ -39,6 +39,16 @@ class StorageAdapter(Protocol):
         """Return the message at position > cursor, or None if none exists."""
         ...
 
+    # Chunk: docs/chunks/leader_board_stream_watch - Batched reads for streaming watches
+    async def read_batch_after(
+        self, swarm_id: str, channel: str, cursor: int, limit: int
+    ) -> list[ChannelMessage]:
+        """Return up to *limit* consecutive messages at positions > cursor.
+
+        Returns an empty list if none exist.
+        """
+        ...
+
     async def list_channels(self, swarm_id: str) -> list[ChannelInfo]:
         """List all channels in a swarm with head/oldest positions."""
         ...
@@ -0,0 +1,170 @@
+# Chunk: docs/chunks/leader_board_tail_cache - In-memory channel tail cache
+"""Bounded in-memory cache of the most recent messages of each channel.
+
+:class:`LeaderBoardCore` records every message it appends here, so watchers
+that keep up with a channel are served from memory: a wake-up after an
+append no longer re-reads the channel's metadata and log from storage.
+
+Each cached channel holds a contiguous run of its newest messages (a ring
+buffer of at most ``max_messages_per_channel``) together with its head
+position, which is authoritative because the core is the only writer. Reads
+that fall before the cached run are misses and go to storage. Channels are
+evicted least recently used first once the cached bodies exceed
+``max_bytes``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+
+from leader_board.models import ChannelInfo, ChannelMessage
+
+# Messages kept per channel
+DEFAULT_TAIL_MESSAGES = 256
+
+# Ceiling on cached message bytes across all channels
+DEFAULT_TAIL_CACHE_BYTES = 64 * 1024 * 1024
+
+# Per-message bookkeeping charged on top of the body length
+MESSAGE_OVERHEAD_BYTES = 200
+
+
+def _message_cost(msg: ChannelMessage) -> int:
+    return len(msg.body) + MESSAGE_OVERHEAD_BYTES
+
+
+@dataclass
+class _ChannelTail:
+    messages: deque[ChannelMessage] = field(default_factory=deque)
+    head_position: int = 0
+    # Learned from storage on a miss; None until then
+    oldest_position: int | None = None
+    size: int = 0
+
+
+class ChannelTailCache:
+    """LRU cache of per-channel message tails.
+
+    Args:
+        max_messages_per_channel: Ring buffer length per channel.
+        max_bytes: Ceiling on the estimated memory of all cached messages.
+            Either limit set to ``0`` disables the cache.
+    """
+
+    def __init__(
+        self,
+        max_messages_per_channel: int = DEFAULT_TAIL_MESSAGES,
+        max_bytes: int = DEFAULT_TAIL_CACHE_BYTES,
+    ) -> None:
+        self.max_messages_per_channel = max_messages_per_channel
+        self.max_bytes = max_bytes
+        self._tails: OrderedDict[tuple[str, str], _ChannelTail] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def size(self) -> int:
+        """Estimated bytes currently cached."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._tails)
+
+    def record_append(self, swarm_id: str, channel: str, msg: ChannelMessage) -> None:
+        """Add a message the core just appended."""
+        if self.max_messages_per_channel <= 0 or self.max_bytes <= 0:
+            return
+        key = (swarm_id, channel)
+        tail = self._tails.get(key)
+        if tail is None:
+            tail = self._tails[key] = _ChannelTail()
+        self._tails.move_to_end(key)
+
+        if msg.position <= tail.head_position:
+            # A later append was recorded first; storage has this one
+            return
+        if tail.messages and msg.position != tail.head_position + 1:
+            # Keep the run contiguous
+            self._drop_messages(tail)
+        tail.messages.append(msg)
+        tail.head_position = msg.position
+        cost = _message_cost(msg)
+        tail.size += cost
+        self._size += cost
+        while len(tail.messages) > self.max_messages_per_channel:
+            old = tail.messages.popleft()
+            tail.size -= _message_cost(old)
+            self._size -= _message_cost(old)
+        self._evict()
+
+    def read_after(
+        self, swarm_id: str, channel: str, cursor: int, limit: int
+    ) -> list[ChannelMessage] | None:
+        """Return up to *limit* messages after *cursor* from memory.
+
+        Returns an empty list when *cursor* is at or past the channel head,
+        and ``None`` on a miss (the channel is not cached or *cursor* is
+        older than the cached run).
+        """
+        tail = self._tails.get((swarm_id, channel))
+        if tail is None:
+            self.misses += 1
+            return None
+        if cursor >= tail.head_position:
+            self._tails.move_to_end((swarm_id, channel))
+            self.hits += 1
+            return []
+        if not tail.messages or cursor + 1 < tail.messages[0].position:
+            self.misses += 1
+            return None
+        self._tails.move_to_end((swarm_id, channel))
+        self.hits += 1
+        start = cursor + 1 - tail.messages[0].position
+        return [tail.messages[i] for i in range(start, min(start + limit, len(tail.messages)))]
+
+    def channel_info(self, swarm_id: str, channel: str) -> ChannelInfo | None:
+        """Cached channel metadata, or None if unknown."""
+        tail = self._tails.get((swarm_id, channel))
+        if tail is None or tail.oldest_position is None:
+            return None
+        return ChannelInfo(
+            name=channel,
+            head_position=tail.head_position,
+            oldest_position=tail.oldest_position,
+        )
+
+    def record_channel_info(self, swarm_id: str, info: ChannelInfo) -> None:
+        """Remember metadata read from storage for an already cached channel."""
+        tail = self._tails.get((swarm_id, info.name))
+        if tail is not None and info.head_position >= tail.head_position:
+            tail.oldest_position = info.oldest_position
+
+    def invalidate(self, swarm_id: str, channel: str) -> None:
+        """Forget a channel, e.g. after compaction changed its oldest position."""
+        tail = self._tails.pop((swarm_id, channel), None)
+        if tail is not None:
+            self._size -= tail.size
+
+    def _drop_messages(self, tail: _ChannelTail) -> None:
+        self._size -= tail.size
+        tail.size = 0
+        tail.messages.clear()
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and self._tails:
+            _, tail = self._tails.popitem(last=False)
+            self._size -= tail.size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Counters for monitoring and tests."""
+        return {
+            "channels": len(self._tails),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -88,24 +88,8 @@ class Narratives(ArtifactManager[NarrativeFrontmatter, NarrativeStatus]):
             - OVERVIEW.md doesn't exist
             - Frontmatter is malformed or fails validation
         """
-        from frontmatter import extract_frontmatter_dict
-
-        overview_path = self.narratives_dir / narrative_id / "OVERVIEW.md"
-        if not overview_path.exists():
-            return None
-
-        # Use extract_frontmatter_dict for raw parsing, then apply legacy field mapping
-        frontmatter_data = extract_frontmatter_dict(overview_path)
-        if frontmatter_data is None:
-            return None
-
-        try:
-            # Handle legacy 'chunks' field by mapping to 'proposed_chunks'
-            if "chunks" in frontmatter_data and "proposed_chunks" not in frontmatter_data:
-                frontmatter_data["proposed_chunks"] = frontmatter_data.pop("chunks")
-            return NarrativeFrontmatter.model_validate(frontmatter_data)
-        except ValidationError:
-            return None
+        frontmatter, _ = self.parse_narrative_frontmatter_with_errors(narrative_id)
+        return frontmatter
 
     # Override parse_frontmatter to use the specialized parsing for legacy support
     def parse_frontmatter(self, artifact_id: str) -> NarrativeFrontmatter | None:
@@ -135,15 +119,22 @@ class Narratives(ArtifactManager[NarrativeFrontmatter, NarrativeStatus]):
             - frontmatter is the validated model if successful, None otherwise
             - errors is a list of error messages (empty if parsing succeeded)
         """
-        from frontmatter import extract_frontmatter_dict
-
         overview_path = self.narratives_dir / narrative_id / "OVERVIEW.md"
         if not overview_path.exists():
             return None, [f"Narrative '{narrative_id}' not found"]
 
-        frontmatter_data = extract_frontmatter_dict(overview_path)
+        return self._parse_file_with_errors(overview_path)
+
+    # Chunk: docs/chunks/frontmatter_parse_cache - Legacy field mapping on the cache-miss path
+    def _parse_content_with_errors(
+        self, content: str, file_path: Path
+    ) -> tuple[NarrativeFrontmatter | None, list[str]]:
+        """Parse OVERVIEW.md content, mapping the legacy 'chunks' field."""
+        from frontmatter import extract_frontmatter_dict_from_content
+
+        frontmatter_data = extract_frontmatter_dict_from_content(content)
         if frontmatter_data is None:
-            return None, [f"Could not parse frontmatter in {overview_path}"]
+            return None, [f"Could not parse frontmatter in {file_path}"]
 
         try:
             # Handle legacy 'chunks' field by mapping to 'proposed_chunks'
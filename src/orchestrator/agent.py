@@ -352,11 +352,46 @@ _EVENT_TYPE_TAG: dict[type, str] = {
 }
 
 
-def create_log_callback(chunk: str, phase: WorkUnitPhase, log_dir: Path):
-    """Create a logging callback for agent execution.
+# Chunk: docs/chunks/orch_phase_log_writer - Log sink that keeps the phase log open
+class PhaseLogCallback:
+    """LogEvent sink for one phase of a work unit.
 
     Serializes each :class:`LogEvent` as a single JSON line containing a
-    ``timestamp``, ``type`` tag, and the event's own fields.
+    ``timestamp``, ``type`` tag, and the event's own fields, appends it
+    through a buffered :class:`~orchestrator.phase_log.PhaseLogWriter`, then
+    publishes the line on the daemon's log bus so open log viewers see it
+    immediately. Call :meth:`close` when the phase ends to flush the buffer.
+    """
+
+    def __init__(self, chunk: str, phase: WorkUnitPhase, log_dir: Path):
+        from orchestrator.log_bus import get_log_bus
+        from orchestrator.phase_log import PhaseLogWriter
+
+        self.chunk = chunk
+        self.phase_name = phase.value.lower()
+        self.writer = PhaseLogWriter(log_dir, self.phase_name)
+        self._bus = get_log_bus()
+
+    def __call__(self, event: LogEvent) -> None:
+        now = datetime.now(timezone.utc)
+        type_tag = _EVENT_TYPE_TAG.get(type(event), type(event).__name__)
+        record = {"timestamp": now.isoformat(), "type": type_tag, **asdict(event)}
+        line = json.dumps(record, default=str) + "\n"
+        start, end = self.writer.write(line, now.timestamp())
+        # Chunk: docs/chunks/orch_log_bus - Publish each record as it is written
+        self._bus.publish(self.chunk, self.phase_name, start, end, line)
+
+    def flush(self) -> None:
+        """Write buffered records to the phase log."""
+        self.writer.flush()
+
+    def close(self) -> None:
+        """Flush and close the phase log."""
+        self.writer.close()
+
+
+def create_log_callback(chunk: str, phase: WorkUnitPhase, log_dir: Path) -> PhaseLogCallback:
+    """Create a logging callback for agent execution.
 
     Args:
         chunk: Chunk name
@@ -364,16 +399,6 @@ def create_log_callback(chunk: str, phase: WorkUnitPhase, log_dir: Path):
         log_dir: Directory for log files
 
     Returns:
-        Callback function for logging LogEvent messages
+        Callable that logs LogEvent messages; close it when the phase ends
     """
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / f"{phase.value.lower()}.txt"
-
-    def callback(event: LogEvent) -> None:
-        timestamp = datetime.now(timezone.utc).isoformat()
-        type_tag = _EVENT_TYPE_TAG.get(type(event), type(event).__name__)
-        record = {"timestamp": timestamp, "type": type_tag, **asdict(event)}
-        with open(log_file, "a") as f:
-            f.write(json.dumps(record, default=str) + "\n")
-
-    return callback
+    return PhaseLogCallback(chunk, phase, log_dir)
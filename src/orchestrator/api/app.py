@@ -35,6 +35,7 @@ from orchestrator.api.scheduling import (
 )
 from orchestrator.api.streaming import (
     dashboard_endpoint,
+    log_page_endpoint,
     log_stream_websocket_endpoint,
     websocket_endpoint,
 )
@@ -53,6 +54,8 @@ from orchestrator.api.worktrees import (
     prune_work_unit_endpoint,
     remove_worktree_endpoint,
 )
+from orchestrator.async_state import AsyncStateStore
+from orchestrator.git_runner import GitRunner
 from orchestrator.models import detect_task_context
 from orchestrator.state import StateStore, get_default_db_path
 
@@ -63,6 +66,8 @@ def create_app(project_dir: Path) -> Starlette:
     Initializes application state and assembles routes from all sub-modules.
     The application state includes:
     - store: StateStore for persistence
+    - async_store: AsyncStateStore endpoints use so SQLite never blocks the loop
+    - git_runner: GitRunner endpoints use so git never blocks the loop
     - project_dir: Path to the project directory
     - started_at: Datetime when the daemon was started
     - task_info: TaskContextInfo for multi-repo support
@@ -127,6 +132,12 @@ def create_app(project_dir: Path) -> Starlette:
             endpoint=get_status_history_endpoint,
             methods=["GET"],
         ),
+        # Chunk: docs/chunks/orch_paged_log_view - Paged log reads
+        Route(
+            "/work-units/{chunk}/log",
+            endpoint=log_page_endpoint,
+            methods=["GET"],
+        ),
         Route(
             "/work-units/{chunk}/priority",
             endpoint=prioritize_endpoint,
@@ -172,6 +183,10 @@ def create_app(project_dir: Path) -> Starlette:
     # Initialize application state
     # These replace the module-level globals from the original api.py
     app.state.store = store
+    # Chunk: docs/chunks/orch_async_state_store - Endpoints reach the store through this
+    app.state.async_store = AsyncStateStore(store)
+    # Chunk: docs/chunks/orch_async_git_runner - Endpoints run worktree git work through this
+    app.state.git_runner = GitRunner()
     app.state.project_dir = project_dir
     app.state.started_at = datetime.now(timezone.utc)
     app.state.task_info = task_info
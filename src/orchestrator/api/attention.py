@@ -20,7 +20,7 @@ from starlette.responses import JSONResponse, RedirectResponse
 from orchestrator.api.common import (
     error_response,
     get_chunk_directory,
-    get_store,
+    get_async_store,
     not_found_response,
 )
 from orchestrator.models import WorkUnitPhase, WorkUnitStatus
@@ -68,9 +68,9 @@ async def attention_endpoint(request: Request) -> JSONResponse:
     1. Number of work units blocked by this one (descending)
     2. Time waiting (older first)
     """
-    store = get_store(request)
+    store = get_async_store(request)
 
-    attention_items = store.get_attention_queue()
+    attention_items = await store.get_attention_queue()
 
     now = datetime.now(timezone.utc)
     result = []
@@ -112,10 +112,10 @@ async def answer_endpoint(request: Request):
     Supports both JSON and form submissions for dashboard compatibility.
     """
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Get existing work unit
-    unit = store.get_work_unit(chunk)
+    unit = await store.get_work_unit(chunk)
     if unit is None:
         return not_found_response("Work unit", chunk)
 
@@ -159,7 +159,7 @@ async def answer_endpoint(request: Request):
     unit.updated_at = datetime.now(timezone.utc)
 
     try:
-        updated = store.update_work_unit(
+        updated = await store.update_work_unit(
             unit, expected_updated_at=expected_updated_at
         )
     except StaleWriteError as e:
@@ -201,10 +201,10 @@ async def retry_endpoint(request: Request) -> JSONResponse:
     PATCH endpoint which only updates explicitly provided fields.
     """
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Get existing work unit
-    unit = store.get_work_unit(chunk)
+    unit = await store.get_work_unit(chunk)
     if unit is None:
         return not_found_response("Work unit", chunk)
 
@@ -234,7 +234,7 @@ async def retry_endpoint(request: Request) -> JSONResponse:
     unit.updated_at = datetime.now(timezone.utc)
 
     try:
-        updated = store.update_work_unit(
+        updated = await store.update_work_unit(
             unit, expected_updated_at=expected_updated_at
         )
     except StaleWriteError as e:
@@ -265,7 +265,7 @@ async def retry_all_endpoint(request: Request) -> JSONResponse:
 
     Returns count of retried work units and list of chunk names.
     """
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Parse optional phase filter from query params
     phase_filter: Optional[str] = request.query_params.get("phase")
@@ -283,7 +283,7 @@ async def retry_all_endpoint(request: Request) -> JSONResponse:
             )
 
     # Get all NEEDS_ATTENTION work units
-    all_units = store.list_work_units(status=WorkUnitStatus.NEEDS_ATTENTION)
+    all_units = await store.list_work_units(status=WorkUnitStatus.NEEDS_ATTENTION)
 
     # Filter by phase if specified
     if phase_filter:
@@ -312,7 +312,7 @@ async def retry_all_endpoint(request: Request) -> JSONResponse:
         unit.updated_at = datetime.now(timezone.utc)
 
         try:
-            updated = store.update_work_unit(
+            updated = await store.update_work_unit(
                 unit, expected_updated_at=expected_updated_at
             )
             retried_chunks.append(unit.chunk)
@@ -14,6 +14,8 @@ from jinja2 import Environment, PackageLoader, select_autoescape
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from orchestrator.async_state import AsyncStateStore
+from orchestrator.git_runner import GitRunner
 from orchestrator.models import TaskContextInfo, get_chunk_location
 from orchestrator.state import StateStore
 
@@ -54,6 +56,51 @@ def get_store(request: Request) -> StateStore:
     return store
 
 
+# Chunk: docs/chunks/orch_async_state_store - Awaitable store accessor for endpoints
+def get_async_store(request: Request) -> AsyncStateStore:
+    """Get the awaitable state store from application state.
+
+    Endpoints should use this rather than get_store() so that SQLite work
+    runs on the store's worker threads instead of the event loop.
+
+    Args:
+        request: Starlette request object
+
+    Returns:
+        The AsyncStateStore instance
+
+    Raises:
+        RuntimeError: If state store not initialized
+    """
+    async_store = getattr(request.app.state, "async_store", None)
+    if async_store is None:
+        raise RuntimeError("State store not initialized")
+    return async_store
+
+
+# Chunk: docs/chunks/orch_async_git_runner - Git runner accessor for endpoints
+def get_git_runner(request: Request) -> GitRunner:
+    """Get the git operation runner from application state.
+
+    Endpoints should run WorktreeManager operations through this so git
+    subprocesses don't block the event loop and merges are serialized with
+    the scheduler's.
+
+    Args:
+        request: Starlette request object
+
+    Returns:
+        The GitRunner instance
+
+    Raises:
+        RuntimeError: If git runner not initialized
+    """
+    git_runner = getattr(request.app.state, "git_runner", None)
+    if git_runner is None:
+        raise RuntimeError("Git runner not initialized")
+    return git_runner
+
+
 def get_project_dir(request: Request) -> Path:
     """Get the project directory from application state.
 
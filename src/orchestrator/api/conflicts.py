@@ -9,6 +9,7 @@ Provides REST endpoints for conflict detection and resolution between
 concurrent work units.
 """
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from urllib.parse import parse_qs
@@ -18,8 +19,9 @@ from starlette.responses import JSONResponse, RedirectResponse
 
 from orchestrator.api.common import (
     error_response,
+    get_git_runner,
     get_project_dir,
-    get_store,
+    get_async_store,
     not_found_response,
 )
 from orchestrator.models import ConflictVerdict, WorkUnitStatus
@@ -40,9 +42,9 @@ async def get_conflicts_endpoint(request: Request) -> JSONResponse:
     creation time (newest first).
     """
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
 
-    conflicts = store.list_conflicts_for_chunk(chunk)
+    conflicts = await store.list_conflicts_for_chunk(chunk)
 
     return JSONResponse({
         "chunk": chunk,
@@ -57,7 +59,7 @@ async def list_all_conflicts_endpoint(request: Request) -> JSONResponse:
     Optional query parameter:
     - verdict: Filter by verdict (INDEPENDENT, SERIALIZE, ASK_OPERATOR)
     """
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Optional verdict filter
     verdict_param = request.query_params.get("verdict")
@@ -68,7 +70,7 @@ async def list_all_conflicts_endpoint(request: Request) -> JSONResponse:
         except ValueError:
             return error_response(f"Invalid verdict: {verdict_param}")
 
-    conflicts = store.list_all_conflicts(verdict=verdict_filter)
+    conflicts = await store.list_all_conflicts(verdict=verdict_filter)
 
     return JSONResponse({
         "conflicts": [c.model_dump_json_serializable() for c in conflicts],
@@ -87,7 +89,7 @@ async def analyze_conflicts_endpoint(request: Request) -> JSONResponse:
 
     Returns the conflict analysis result.
     """
-    store = get_store(request)
+    store = get_async_store(request)
     project_dir = get_project_dir(request)
 
     try:
@@ -101,11 +103,16 @@ async def analyze_conflicts_endpoint(request: Request) -> JSONResponse:
     if not chunk_a or not chunk_b:
         return error_response("Missing required fields: chunk_a and chunk_b")
 
-    # Create oracle and analyze
-    oracle = create_oracle(project_dir, store)
+    # Analyze on a worker thread (the oracle reads chunk files) and send
+    # only the resulting row through the store's writer
+    oracle = create_oracle(project_dir, store.store)
 
     try:
-        analysis = oracle.analyze_conflict(chunk_a, chunk_b)
+        analyses, _ = await asyncio.to_thread(
+            oracle.evaluate_conflicts, chunk_a, [chunk_b]
+        )
+        analysis = analyses[chunk_b]
+        await store.save_conflict_analysis(analysis)
     except Exception as e:
         return error_response(f"Analysis failed: {e}", status_code=500)
 
@@ -127,10 +134,10 @@ async def resolve_conflict_endpoint(request: Request):
     Supports both JSON and form submissions for dashboard compatibility.
     """
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Get existing work unit
-    unit = store.get_work_unit(chunk)
+    unit = await store.get_work_unit(chunk)
     if unit is None:
         return not_found_response("Work unit", chunk)
 
@@ -189,7 +196,7 @@ async def resolve_conflict_endpoint(request: Request):
                 unit.attention_reason = None
 
     try:
-        updated = store.update_work_unit(
+        updated = await store.update_work_unit(
             unit, expected_updated_at=expected_updated_at
         )
     except StaleWriteError as e:
@@ -228,11 +235,11 @@ async def retry_merge_endpoint(request: Request):
     use this endpoint to retry the merge.
     """
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
     project_dir = get_project_dir(request)
 
     # Get existing work unit
-    unit = store.get_work_unit(chunk)
+    unit = await store.get_work_unit(chunk)
     if unit is None:
         return not_found_response("Work unit", chunk)
 
@@ -254,22 +261,26 @@ async def retry_merge_endpoint(request: Request):
         )
 
     # Get worktree manager
-    worktree_manager = WorktreeManager(project_dir)
+    # Chunk: docs/chunks/orch_async_git_runner - Merge retry runs off the event loop
+    git_runner = get_git_runner(request)
+    worktree_manager = await git_runner.query(WorktreeManager, project_dir)
 
     # Retry the merge
     try:
-        if worktree_manager.has_changes(chunk):
-            worktree_manager.merge_to_base(chunk, delete_branch=True)
+        if await git_runner.query(worktree_manager.has_changes, chunk):
+            await git_runner.call(
+                project_dir, worktree_manager.merge_to_base, chunk, delete_branch=True
+            )
         else:
             # No changes - just clean up the branch using WorktreeManager
             # Chunk: docs/chunks/orchestrator_api_decompose - Use WorktreeManager.delete_branch instead of subprocess
-            worktree_manager.delete_branch(chunk)
+            await git_runner.call(project_dir, worktree_manager.delete_branch, chunk)
     except WorktreeError as e:
         # Still failing - update the error message
         unit.attention_reason = f"Merge to base failed: {e}"
         unit.updated_at = datetime.now(timezone.utc)
         try:
-            store.update_work_unit(unit, expected_updated_at=expected_updated_at)
+            await store.update_work_unit(unit, expected_updated_at=expected_updated_at)
         except StaleWriteError:
             pass  # Best effort - merge error takes precedence
 
@@ -287,7 +298,7 @@ async def retry_merge_endpoint(request: Request):
     unit.updated_at = datetime.now(timezone.utc)
 
     try:
-        updated = store.update_work_unit(
+        updated = await store.update_work_unit(
             unit, expected_updated_at=expected_updated_at
         )
     except StaleWriteError as e:
@@ -308,7 +319,7 @@ async def retry_merge_endpoint(request: Request):
 
     # Chunk: docs/chunks/orch_manual_done_unblock - Unblock dependents after successful merge retry
     # After a successful merge marks the work unit as DONE, unblock any dependent work units
-    unblock_dependents(store, chunk)
+    await store.run_write(unblock_dependents, chunk)
 
     # Check if form submission for redirect
     content_type = request.headers.get("content-type", "")
@@ -23,7 +23,7 @@ from chunks import Chunks, plan_has_content
 from orchestrator.api.common import (
     error_response,
     get_chunk_directory,
-    get_store,
+    get_async_store,
     not_found_response,
 )
 from orchestrator.models import (
@@ -117,7 +117,7 @@ async def inject_endpoint(request: Request) -> JSONResponse:
     In task context mode, chunks are validated against the external artifacts repo.
     In single-repo mode, chunks are validated against the project's docs/chunks/.
     """
-    store = get_store(request)
+    store = get_async_store(request)
 
     try:
         body = await request.json()
@@ -143,7 +143,7 @@ async def inject_endpoint(request: Request) -> JSONResponse:
         return error_response(error_message, status_code=400)
 
     # Check if work unit already exists
-    existing = store.get_work_unit(chunk)
+    existing = await store.get_work_unit(chunk)
     if existing:
         return error_response(
             f"Work unit for chunk '{chunk}' already exists (status: {existing.status.value})",
@@ -187,7 +187,7 @@ async def inject_endpoint(request: Request) -> JSONResponse:
     # Keep blockers that don't exist (can't assume they're DONE - may be injected later).
     active_blockers = []
     for blocker in blocked_by:
-        blocker_unit = store.get_work_unit(blocker)
+        blocker_unit = await store.get_work_unit(blocker)
         if blocker_unit is None or blocker_unit.status != WorkUnitStatus.DONE:
             active_blockers.append(blocker)
     blocked_by = active_blockers
@@ -211,7 +211,7 @@ async def inject_endpoint(request: Request) -> JSONResponse:
     )
 
     try:
-        created = store.create_work_unit(unit)
+        created = await store.create_work_unit(unit)
     except ValueError as e:
         return error_response(str(e), status_code=409)
 
@@ -236,10 +236,10 @@ async def inject_endpoint(request: Request) -> JSONResponse:
 
 async def queue_endpoint(request: Request) -> JSONResponse:
     """GET /work-units/queue - Get ready queue ordered by priority."""
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Get ready queue
-    units = store.get_ready_queue()
+    units = await store.get_ready_queue()
 
     return JSONResponse({
         "work_units": [u.model_dump_json_serializable() for u in units],
@@ -251,10 +251,10 @@ async def queue_endpoint(request: Request) -> JSONResponse:
 async def prioritize_endpoint(request: Request) -> JSONResponse:
     """PATCH /work-units/{chunk}/priority - Update work unit priority."""
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Get existing unit
-    unit = store.get_work_unit(chunk)
+    unit = await store.get_work_unit(chunk)
     if unit is None:
         return not_found_response("Work unit", chunk)
 
@@ -278,7 +278,7 @@ async def prioritize_endpoint(request: Request) -> JSONResponse:
     unit.updated_at = datetime.now(timezone.utc)
 
     try:
-        updated = store.update_work_unit(
+        updated = await store.update_work_unit(
             unit, expected_updated_at=expected_updated_at
         )
     except StaleWriteError as e:
@@ -302,19 +302,19 @@ async def prioritize_endpoint(request: Request) -> JSONResponse:
 
 async def get_config_endpoint(request: Request) -> JSONResponse:
     """GET /config - Get orchestrator configuration."""
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Build config from stored values
     config = OrchestratorConfig()
 
-    max_agents_str = store.get_config("max_agents")
+    max_agents_str = await store.get_config("max_agents")
     if max_agents_str:
         try:
             config.max_agents = int(max_agents_str)
         except ValueError:
             pass
 
-    dispatch_str = store.get_config("dispatch_interval_seconds")
+    dispatch_str = await store.get_config("dispatch_interval_seconds")
     if dispatch_str:
         try:
             config.dispatch_interval_seconds = float(dispatch_str)
@@ -322,7 +322,7 @@ async def get_config_endpoint(request: Request) -> JSONResponse:
             pass
 
     # Chunk: docs/chunks/orch_worktree_retain - Read worktree_warning_threshold from config
-    threshold_str = store.get_config("worktree_warning_threshold")
+    threshold_str = await store.get_config("worktree_warning_threshold")
     if threshold_str:
         try:
             config.worktree_warning_threshold = int(threshold_str)
@@ -330,14 +330,14 @@ async def get_config_endpoint(request: Request) -> JSONResponse:
             pass
 
     # Chunk: docs/chunks/orch_max_turns_config - Read max_turns_* from config
-    max_turns_implement_str = store.get_config("max_turns_implement")
+    max_turns_implement_str = await store.get_config("max_turns_implement")
     if max_turns_implement_str:
         try:
             config.max_turns_implement = int(max_turns_implement_str)
         except ValueError:
             pass
 
-    max_turns_complete_str = store.get_config("max_turns_complete")
+    max_turns_complete_str = await store.get_config("max_turns_complete")
     if max_turns_complete_str:
         try:
             config.max_turns_complete = int(max_turns_complete_str)
@@ -345,7 +345,7 @@ async def get_config_endpoint(request: Request) -> JSONResponse:
             pass
 
     # Chunk: docs/chunks/backend_config - Read backend from config
-    backend_str = store.get_config("backend")
+    backend_str = await store.get_config("backend")
     if backend_str:
         config.backend = backend_str
 
@@ -354,7 +354,7 @@ async def get_config_endpoint(request: Request) -> JSONResponse:
 
 async def update_config_endpoint(request: Request) -> JSONResponse:
     """PATCH /config - Update orchestrator configuration."""
-    store = get_store(request)
+    store = get_async_store(request)
 
     try:
         body = await request.json()
@@ -366,35 +366,35 @@ async def update_config_endpoint(request: Request) -> JSONResponse:
         max_agents = body["max_agents"]
         if not isinstance(max_agents, int) or max_agents < 1:
             return error_response("max_agents must be a positive integer")
-        store.set_config("max_agents", str(max_agents))
+        await store.set_config("max_agents", str(max_agents))
 
     # Update dispatch_interval_seconds if provided
     if "dispatch_interval_seconds" in body:
         interval = body["dispatch_interval_seconds"]
         if not isinstance(interval, (int, float)) or interval <= 0:
             return error_response("dispatch_interval_seconds must be a positive number")
-        store.set_config("dispatch_interval_seconds", str(interval))
+        await store.set_config("dispatch_interval_seconds", str(interval))
 
     # Chunk: docs/chunks/orch_worktree_retain - Update worktree_warning_threshold if provided
     if "worktree_warning_threshold" in body:
         threshold = body["worktree_warning_threshold"]
         if not isinstance(threshold, int) or threshold < 1:
             return error_response("worktree_warning_threshold must be a positive integer")
-        store.set_config("worktree_warning_threshold", str(threshold))
+        await store.set_config("worktree_warning_threshold", str(threshold))
 
     # Chunk: docs/chunks/orch_max_turns_config - Update max_turns_implement if provided
     if "max_turns_implement" in body:
         max_turns_implement = body["max_turns_implement"]
         if not isinstance(max_turns_implement, int) or max_turns_implement < 1:
             return error_response("max_turns_implement must be a positive integer")
-        store.set_config("max_turns_implement", str(max_turns_implement))
+        await store.set_config("max_turns_implement", str(max_turns_implement))
 
     # Chunk: docs/chunks/orch_max_turns_config - Update max_turns_complete if provided
     if "max_turns_complete" in body:
         max_turns_complete = body["max_turns_complete"]
         if not isinstance(max_turns_complete, int) or max_turns_complete < 1:
             return error_response("max_turns_complete must be a positive integer")
-        store.set_config("max_turns_complete", str(max_turns_complete))
+        await store.set_config("max_turns_complete", str(max_turns_complete))
 
     # Chunk: docs/chunks/backend_config - Update backend if provided
     if "backend" in body:
@@ -407,19 +407,19 @@ async def update_config_endpoint(request: Request) -> JSONResponse:
             create_backend(backend_value)
         except ValueError as e:
             return error_response(str(e))
-        store.set_config("backend", backend_value)
+        await store.set_config("backend", backend_value)
 
     # Return updated config
     config = OrchestratorConfig()
 
-    max_agents_str = store.get_config("max_agents")
+    max_agents_str = await store.get_config("max_agents")
     if max_agents_str:
         try:
             config.max_agents = int(max_agents_str)
         except ValueError:
             pass
 
-    dispatch_str = store.get_config("dispatch_interval_seconds")
+    dispatch_str = await store.get_config("dispatch_interval_seconds")
     if dispatch_str:
         try:
             config.dispatch_interval_seconds = float(dispatch_str)
@@ -427,7 +427,7 @@ async def update_config_endpoint(request: Request) -> JSONResponse:
             pass
 
     # Chunk: docs/chunks/orch_worktree_retain - Read worktree_warning_threshold from config
-    threshold_str = store.get_config("worktree_warning_threshold")
+    threshold_str = await store.get_config("worktree_warning_threshold")
     if threshold_str:
         try:
             config.worktree_warning_threshold = int(threshold_str)
@@ -435,14 +435,14 @@ async def update_config_endpoint(request: Request) -> JSONResponse:
             pass
 
     # Chunk: docs/chunks/orch_max_turns_config - Read max_turns_* from config
-    max_turns_implement_str = store.get_config("max_turns_implement")
+    max_turns_implement_str = await store.get_config("max_turns_implement")
     if max_turns_implement_str:
         try:
             config.max_turns_implement = int(max_turns_implement_str)
         except ValueError:
             pass
 
-    max_turns_complete_str = store.get_config("max_turns_complete")
+    max_turns_complete_str = await store.get_config("max_turns_complete")
     if max_turns_complete_str:
         try:
             config.max_turns_complete = int(max_turns_complete_str)
@@ -450,7 +450,7 @@ async def update_config_endpoint(request: Request) -> JSONResponse:
             pass
 
     # Chunk: docs/chunks/backend_config - Read backend from config
-    backend_str = store.get_config("backend")
+    backend_str = await store.get_config("backend")
     if backend_str:
         config.backend = backend_str
 
@@ -1,18 +1,21 @@
 # Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
 # Chunk: docs/chunks/orchestrator_api_decompose - WebSocket streaming and dashboard endpoints
+# Chunk: docs/chunks/orch_log_bus - Push-based log streaming
+# Chunk: docs/chunks/orch_paged_log_view - Paged log reads
 """WebSocket streaming and dashboard endpoints for the orchestrator API.
 
 Provides WebSocket endpoints for real-time log streaming and dashboard updates,
-plus the dashboard HTML endpoint.
+the dashboard HTML endpoint, and paged reads of work unit logs.
 """
 
 import asyncio
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 from starlette.requests import Request
-from starlette.responses import HTMLResponse
+from starlette.responses import HTMLResponse, JSONResponse
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
 from orchestrator.api.attention import _get_goal_summary
@@ -20,16 +23,28 @@ from orchestrator.api.common import (
     get_chunk_directory,
     get_jinja_env,
     get_project_dir,
-    get_store,
+    get_async_store,
+    error_response,
+    not_found_response,
 )
-from orchestrator.log_parser import (
-    format_entry_for_html,
-    format_phase_header_for_html,
-    parse_log_line,
+from orchestrator.log_bus import LogFrame, format_html_lines, get_log_bus
+from orchestrator.log_streaming import (
+    awatch_log_dir,
+    get_phase_log_files,
+    parse_log_time,
+    read_log_pages,
 )
-from orchestrator.models import WorkUnitStatus
+from orchestrator.models import WorkUnitPhase, WorkUnitStatus
+from orchestrator.phase_log import read_page, read_records
 from orchestrator.websocket import get_manager
 
+# Entries a log page holds when no range is requested, and at most
+DEFAULT_LOG_PAGE_SIZE = 100
+MAX_LOG_PAGE_SIZE = 1000
+
+# Most recent entries replayed to a log websocket when it connects
+LOG_REPLAY_ENTRIES = 500
+
 
 def _get_log_directory(project_dir: Path, chunk: str) -> Path:
     """Get the log directory for a chunk.
@@ -44,98 +59,81 @@ def _get_log_directory(project_dir: Path, chunk: str) -> Path:
     return project_dir / ".ve" / "chunks" / chunk / "log"
 
 
-def _detect_current_phase(log_dir: Path) -> Optional[str]:
-    """Detect the current phase from existing log files.
-
-    Returns the most recent phase based on file modification time.
-
-    Args:
-        log_dir: Path to the log directory
+# Chunk: docs/chunks/orch_log_bus - Offset tracking shared by file reads and bus frames
+class _LogFollower:
+    """Turns one chunk's log records into dashboard lines exactly once.
 
-    Returns:
-        Phase name (e.g., 'plan', 'implement') or None if no logs
+    Records arrive either from the phase log files (history, and writes the
+    log bus did not deliver) or as LogFrames from the bus. Both carry logical
+    byte offsets into the phase log, so a per-phase position is enough to
+    skip anything already sent, across segment rotations too.
     """
-    if not log_dir.exists():
-        return None
-
-    phases = ["goal", "plan", "implement", "review", "complete"]
-    latest_mtime = 0.0
-    latest_phase = None
-
-    for phase in phases:
-        log_file = log_dir / f"{phase}.txt"
-        if log_file.exists():
-            mtime = log_file.stat().st_mtime
-            if mtime > latest_mtime:
-                latest_mtime = mtime
-                latest_phase = phase
 
-    return latest_phase
-
-
-async def _stream_log_file(
-    websocket: WebSocket,
-    log_file: Path,
-    phase: str,
-    start_position: int = 0,
-) -> int:
-    """Stream log file contents to the WebSocket.
-
-    Parses existing log lines and sends them as formatted HTML.
-
-    Args:
-        websocket: WebSocket connection to send to
-        log_file: Path to the log file
-        phase: Phase name for header
-        start_position: File position to start reading from
-
-    Returns:
-        Final file position after reading
-    """
-    if not log_file.exists():
-        return 0
-
-    with open(log_file, "r") as f:
-        f.seek(start_position)
-
-        # If starting from beginning, send phase header
-        if start_position == 0:
-            # Get first entry timestamp for header
-            first_line = f.readline()
-            if first_line:
-                entry = parse_log_line(first_line)
-                if entry:
-                    header = format_phase_header_for_html(
-                        phase.upper(), entry.timestamp
-                    )
-                    await websocket.send_json({
-                        "type": "log_line",
-                        "content": header,
-                        "is_header": True,
-                    })
-                    # Also send the first entry
-                    lines = format_entry_for_html(entry)
-                    for line in lines:
-                        await websocket.send_json({
-                            "type": "log_line",
-                            "content": line,
-                        })
-            else:
-                # Empty file, reset position
-                f.seek(0)
-
-        # Read remaining lines
-        for line in f:
-            entry = parse_log_line(line)
-            if entry:
-                formatted_lines = format_entry_for_html(entry)
-                for formatted_line in formatted_lines:
-                    await websocket.send_json({
-                        "type": "log_line",
-                        "content": formatted_line,
-                    })
-
-        return f.tell()
+    def __init__(self, log_dir: Path):
+        self.log_dir = log_dir
+        self.positions: dict[str, int] = {}
+
+    # Chunk: docs/chunks/orch_paged_log_view - Replay only the latest entries
+    def replay(self, limit: int) -> list[dict]:
+        """Lines for the last ``limit`` entries; later reads continue after them.
+
+        Entries before the replayed page are summarized in one notice line.
+        """
+        pages = read_log_pages(self.log_dir, last=limit)
+        lines: list[dict] = []
+        omitted = sum(page.first for _, page in pages)
+        if omitted:
+            lines.append({
+                "content": f"{omitted} earlier log entries not shown",
+                "is_header": True,
+            })
+        for phase, page in pages:
+            name = phase.value.lower()
+            for i, (_, line) in enumerate(page.records):
+                lines.extend(format_html_lines(name, line, i == 0))
+            self.positions[name] = page.end
+        return lines
+
+    def catch_up(self) -> list[dict]:
+        """Read every complete record past the current positions."""
+        lines: list[dict] = []
+        for phase, _ in get_phase_log_files(self.log_dir):
+            name = phase.value.lower()
+            records, self.positions[name] = read_records(
+                self.log_dir, name, self.positions.get(name, 0)
+            )
+            for offset, line in records:
+                lines.extend(format_html_lines(name, line, offset == 0))
+        return lines
+
+    def apply(self, frames: list[LogFrame], overflowed: bool) -> list[dict]:
+        """Lines for bus frames not yet sent, re-reading the files on a gap."""
+        if overflowed:
+            return self.catch_up()
+
+        lines: list[dict] = []
+        for frame in frames:
+            position = self.positions.get(frame.phase, 0)
+            if frame.end <= position:
+                # Already read from the file
+                continue
+            if frame.start != position:
+                # Records were published without reaching us. Read what has
+                # been flushed to the file; earlier records may still sit in
+                # the writer's buffer, in which case this frame waits for the
+                # file watcher too.
+                lines.extend(self.catch_up())
+                if self.positions.get(frame.phase, 0) != frame.start:
+                    continue
+            lines.extend(frame.html_lines())
+            self.positions[frame.phase] = frame.end
+        return lines
+
+
+async def _send_log_lines(websocket: WebSocket, lines: list[dict]) -> None:
+    """Send formatted log lines as a single batched frame."""
+    if lines:
+        await websocket.send_json({"type": "log_lines", "lines": lines})
 
 
 async def log_stream_websocket_endpoint(websocket: WebSocket) -> None:
@@ -143,6 +141,12 @@ async def log_stream_websocket_endpoint(websocket: WebSocket) -> None:
 
     Connects to /ws/log/{chunk} and streams log entries for the specified chunk.
     Streams existing logs then follows for new entries.
+
+    Existing logs go out as one ``log_lines`` frame. New records are pushed
+    by the daemon's log bus as they are written, batched into one frame per
+    wakeup; filesystem notifications on the log directory catch anything
+    written outside the bus. Completion and removal are detected through
+    store change notifications rather than polling.
     """
     import logging
     logger = logging.getLogger(__name__)
@@ -163,8 +167,8 @@ async def log_stream_websocket_endpoint(websocket: WebSocket) -> None:
         return
 
     # Check if chunk exists
-    store = get_store(websocket)
-    work_unit = store.get_work_unit(chunk)
+    store = get_async_store(websocket)
+    work_unit = await store.get_work_unit(chunk)
 
     if work_unit is None:
         await websocket.send_json({
@@ -174,93 +178,93 @@ async def log_stream_websocket_endpoint(websocket: WebSocket) -> None:
         await websocket.close()
         return
 
-    # Detect current phase
-    current_phase = _detect_current_phase(log_dir)
+    # Subscribe before reading the files so nothing written in between is lost;
+    # the follower's offsets drop what the file read already covered
+    subscription = get_log_bus().subscribe(chunk)
+    follower = _LogFollower(log_dir)
 
-    if current_phase is None:
-        # No logs yet - send informative message
-        await websocket.send_json({
-            "type": "info",
-            "content": "Waiting for log output...",
-        })
+    status_changed = asyncio.Event()
 
-    # Track file positions for each phase
-    file_positions: dict[str, int] = {}
-    phases = ["goal", "plan", "implement", "review", "complete"]
+    def on_store_change(unit) -> None:
+        # Deletes are reported without a unit
+        if unit is None or unit.chunk == chunk:
+            status_changed.set()
 
-    # Stream existing logs
-    if current_phase:
-        for phase in phases:
-            log_file = log_dir / f"{phase}.txt"
-            if log_file.exists():
-                position = await _stream_log_file(websocket, log_file, phase, 0)
-                file_positions[phase] = position
+    store.add_change_listener(on_store_change)
 
-                # Stop if we've reached the current phase
-                if phase == current_phase:
-                    break
+    stop_watching = asyncio.Event()
+    files_changed = asyncio.Event()
+
+    async def watch_files() -> None:
+        async for _ in awatch_log_dir(log_dir, stop_watching):
+            files_changed.set()
+
+    tasks = {
+        "watcher": asyncio.create_task(watch_files()),
+        "bus": asyncio.create_task(subscription.wait()),
+        "files": asyncio.create_task(files_changed.wait()),
+        "status": asyncio.create_task(status_changed.wait()),
+        "client": asyncio.create_task(websocket.receive_text()),
+    }
 
-    # Enter follow mode - poll for new content
-    poll_interval = 0.5  # 500ms polling
     try:
+        lines = follower.replay(LOG_REPLAY_ENTRIES)
+        if lines:
+            await _send_log_lines(websocket, lines)
+        else:
+            # No logs yet - send informative message
+            await websocket.send_json({
+                "type": "info",
+                "content": "Waiting for log output...",
+            })
+
+        check_status = True
         while True:
-            # Check if work unit is still running
-            work_unit = store.get_work_unit(chunk)
-            if work_unit is None:
-                await websocket.send_json({
-                    "type": "info",
-                    "content": "Work unit removed",
-                })
-                break
+            if check_status:
+                work_unit = await store.get_work_unit(chunk)
+                if work_unit is None:
+                    await websocket.send_json({
+                        "type": "info",
+                        "content": "Work unit removed",
+                    })
+                    break
 
-            if work_unit.status == WorkUnitStatus.DONE:
-                await websocket.send_json({
-                    "type": "completed",
-                    "content": "Work unit completed",
-                })
-                break
+                if work_unit.status == WorkUnitStatus.DONE:
+                    await websocket.send_json({
+                        "type": "completed",
+                        "content": "Work unit completed",
+                    })
+                    break
 
-            # Re-detect current phase (might have transitioned)
-            new_phase = _detect_current_phase(log_dir)
-
-            if new_phase and new_phase != current_phase:
-                # Phase transition - stream the new phase's logs
-                log_file = log_dir / f"{new_phase}.txt"
-                if log_file.exists():
-                    position = await _stream_log_file(
-                        websocket, log_file, new_phase, 0
-                    )
-                    file_positions[new_phase] = position
-                    current_phase = new_phase
-
-            elif current_phase:
-                # Check for new content in current phase
-                log_file = log_dir / f"{current_phase}.txt"
-                if log_file.exists():
-                    current_size = log_file.stat().st_size
-                    last_position = file_positions.get(current_phase, 0)
-
-                    if current_size > last_position:
-                        # New content available
-                        position = await _stream_log_file(
-                            websocket, log_file, current_phase, last_position
-                        )
-                        file_positions[current_phase] = position
-
-            # Wait for next poll or client message
-            try:
-                # Use asyncio.wait_for to implement timeout while still
-                # being able to receive messages (like heartbeat)
-                await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=poll_interval,
-                )
-            except asyncio.TimeoutError:
-                # Normal timeout, continue polling
-                pass
-            except WebSocketDisconnect:
-                # Client disconnected
-                break
+            await asyncio.wait(
+                [tasks[name] for name in ("bus", "files", "status", "client")],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            if tasks["client"].done():
+                # Client messages (heartbeats) are ignored; a disconnect ends
+                # the stream
+                if tasks["client"].exception() is not None:
+                    raise tasks["client"].exception()
+                tasks["client"] = asyncio.create_task(websocket.receive_text())
+
+            lines = []
+            if tasks["bus"].done():
+                frames, overflowed = subscription.drain()
+                lines.extend(follower.apply(frames, overflowed))
+                tasks["bus"] = asyncio.create_task(subscription.wait())
+
+            if tasks["files"].done():
+                files_changed.clear()
+                lines.extend(follower.catch_up())
+                tasks["files"] = asyncio.create_task(files_changed.wait())
+
+            check_status = tasks["status"].done()
+            if check_status:
+                status_changed.clear()
+                tasks["status"] = asyncio.create_task(status_changed.wait())
+
+            await _send_log_lines(websocket, lines)
 
     except WebSocketDisconnect:
         pass
@@ -273,6 +277,12 @@ async def log_stream_websocket_endpoint(websocket: WebSocket) -> None:
             })
         except Exception:
             pass
+    finally:
+        stop_watching.set()
+        for task in tasks.values():
+            task.cancel()
+        subscription.close()
+        store.remove_change_listener(on_store_change)
 
     try:
         await websocket.close()
@@ -280,22 +290,109 @@ async def log_stream_websocket_endpoint(websocket: WebSocket) -> None:
         pass
 
 
+def _int_param(request: Request, name: str) -> Optional[int]:
+    value = request.query_params.get(name)
+    if value is None:
+        return None
+    number = int(value)
+    if number < 0:
+        raise ValueError(f"{name} must not be negative")
+    return number
+
+
+# Chunk: docs/chunks/orch_paged_log_view - HTTP log pages
+async def log_page_endpoint(request: Request) -> JSONResponse:
+    """GET /work-units/{chunk}/log - Read a page of a phase log.
+
+    Query parameters select the page: ``phase`` (default: the latest phase
+    with a log), ``start`` (first entry number), ``count``, ``last`` (only
+    the last N entries), and ``since``/``until`` (ISO 8601 or Unix seconds).
+    Pages hold at most MAX_LOG_PAGE_SIZE entries. Entries are located through
+    the log's offset index, so only the requested records are read.
+    """
+    chunk = request.path_params["chunk"]
+    store = get_async_store(request)
+    if await store.get_work_unit(chunk) is None:
+        return not_found_response("Work unit", chunk)
+
+    params = request.query_params
+    try:
+        start = _int_param(request, "start")
+        count = _int_param(request, "count")
+        last = _int_param(request, "last")
+        since = parse_log_time(params["since"]) if "since" in params else None
+        until = parse_log_time(params["until"]) if "until" in params else None
+    except ValueError as e:
+        return error_response(f"Invalid log range: {e}")
+
+    log_dir = _get_log_directory(get_project_dir(request), chunk)
+    if "phase" in params:
+        try:
+            phase = WorkUnitPhase(params["phase"].upper())
+        except ValueError:
+            return error_response(f"Invalid phase: {params['phase']}")
+    else:
+        phase_logs = get_phase_log_files(log_dir)
+        phase = phase_logs[-1][0] if phase_logs else None
+
+    if phase is None:
+        return JSONResponse({
+            "chunk": chunk,
+            "phase": None,
+            "first": 0,
+            "total": 0,
+            "entries": [],
+        })
+
+    if last is not None:
+        last = min(last, MAX_LOG_PAGE_SIZE)
+    elif count is None:
+        count = DEFAULT_LOG_PAGE_SIZE
+    if count is not None:
+        count = min(count, MAX_LOG_PAGE_SIZE)
+
+    page = await asyncio.to_thread(
+        read_page,
+        log_dir,
+        phase.value.lower(),
+        start=start,
+        count=count,
+        last=last,
+        since=since,
+        until=until,
+    )
+
+    entries = []
+    for i, (offset, line) in enumerate(page.records):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        entries.append({"index": page.first + i, "offset": offset, "record": record})
+
+    return JSONResponse({
+        "chunk": chunk,
+        "phase": phase.value,
+        "first": page.first,
+        "total": page.total,
+        "entries": entries,
+    })
+
+
 async def websocket_endpoint(websocket: WebSocket) -> None:
     """WebSocket endpoint for real-time dashboard updates.
 
     Sends initial state on connection and broadcasts updates when state changes.
     """
     manager = get_manager()
-    await manager.connect(websocket)
+    store = get_async_store(websocket)
 
-    try:
-        # Send initial state snapshot
-        store = get_store(websocket)
-        work_units = store.list_work_units()
-        attention_items = store.get_attention_queue()
+    async def initial_state() -> dict:
+        """Snapshot of all work units, sent before any queued update."""
+        work_units = await store.list_work_units()
+        attention_items = await store.get_attention_queue()
         now = datetime.now(timezone.utc)
-
-        initial_state = {
+        return {
             "type": "initial_state",
             "data": {
                 "work_units": [u.model_dump_json_serializable() for u in work_units],
@@ -309,7 +406,10 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
                 ],
             },
         }
-        await websocket.send_json(initial_state)
+
+    try:
+        # Chunk: docs/chunks/orch_ws_send_queues - Snapshot goes out ahead of queued updates
+        await manager.connect(websocket, initial_message=initial_state)
 
         # Keep the connection open and wait for messages or disconnect
         while True:
@@ -327,10 +427,10 @@ async def dashboard_endpoint(request: Request) -> HTMLResponse:
 
     Shows the attention queue and work unit status grid with real-time updates.
     """
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Get attention queue items
-    attention_items = store.get_attention_queue()
+    attention_items = await store.get_attention_queue()
     now = datetime.now(timezone.utc)
 
     attention_list = []
@@ -355,7 +455,7 @@ async def dashboard_endpoint(request: Request) -> HTMLResponse:
         })
 
     # Get all work units for the process grid
-    all_units = store.list_work_units()
+    all_units = await store.list_work_units()
     work_units = [
         {
             "chunk": u.chunk,
@@ -17,9 +17,10 @@ from starlette.responses import JSONResponse
 
 from orchestrator.api.common import (
     error_response,
+    get_git_runner,
     get_project_dir,
     get_started_at,
-    get_store,
+    get_async_store,
     not_found_response,
 )
 from orchestrator.models import (
@@ -33,6 +34,7 @@ from orchestrator.state import StaleWriteError
 from orchestrator.websocket import (
     broadcast_attention_update,
     broadcast_work_unit_update,
+    get_manager,
 )
 from orchestrator.worktree import WorktreeManager
 
@@ -41,10 +43,10 @@ logger = logging.getLogger(__name__)
 
 async def status_endpoint(request: Request) -> JSONResponse:
     """GET /status - Return daemon status information."""
-    store = get_store(request)
+    store = get_async_store(request)
     started_at = get_started_at(request)
 
-    work_unit_counts = store.count_by_status()
+    work_unit_counts = await store.count_by_status()
 
     uptime_seconds = None
     if started_at:
@@ -56,6 +58,8 @@ async def status_endpoint(request: Request) -> JSONResponse:
         uptime_seconds=uptime_seconds,
         started_at=started_at,
         work_unit_counts=work_unit_counts,
+        store_latency=store.latency_snapshot(),
+        websocket=get_manager().metrics(),
     )
 
     return JSONResponse(state.model_dump_json_serializable())
@@ -63,7 +67,7 @@ async def status_endpoint(request: Request) -> JSONResponse:
 
 async def list_work_units_endpoint(request: Request) -> JSONResponse:
     """GET /work-units - List all work units."""
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Optional status filter
     status_param = request.query_params.get("status")
@@ -74,7 +78,7 @@ async def list_work_units_endpoint(request: Request) -> JSONResponse:
         except ValueError:
             return error_response(f"Invalid status: {status_param}")
 
-    units = store.list_work_units(status=status_filter)
+    units = await store.list_work_units(status=status_filter)
 
     return JSONResponse({
         "work_units": [u.model_dump_json_serializable() for u in units],
@@ -85,9 +89,9 @@ async def list_work_units_endpoint(request: Request) -> JSONResponse:
 async def get_work_unit_endpoint(request: Request) -> JSONResponse:
     """GET /work-units/{chunk} - Get a specific work unit."""
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
 
-    unit = store.get_work_unit(chunk)
+    unit = await store.get_work_unit(chunk)
     if unit is None:
         return not_found_response("Work unit", chunk)
 
@@ -96,7 +100,7 @@ async def get_work_unit_endpoint(request: Request) -> JSONResponse:
 
 async def create_work_unit_endpoint(request: Request) -> JSONResponse:
     """POST /work-units - Create a new work unit."""
-    store = get_store(request)
+    store = get_async_store(request)
 
     try:
         body = await request.json()
@@ -134,7 +138,7 @@ async def create_work_unit_endpoint(request: Request) -> JSONResponse:
     )
 
     try:
-        created = store.create_work_unit(unit)
+        created = await store.create_work_unit(unit)
     except ValueError as e:
         return error_response(str(e), status_code=409)  # Conflict
 
@@ -157,10 +161,10 @@ async def create_work_unit_endpoint(request: Request) -> JSONResponse:
 async def update_work_unit_endpoint(request: Request) -> JSONResponse:
     """PATCH /work-units/{chunk} - Update a work unit."""
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Get existing unit
-    unit = store.get_work_unit(chunk)
+    unit = await store.get_work_unit(chunk)
     if unit is None:
         return not_found_response("Work unit", chunk)
 
@@ -208,7 +212,7 @@ async def update_work_unit_endpoint(request: Request) -> JSONResponse:
     unit.updated_at = datetime.now(timezone.utc)
 
     try:
-        updated = store.update_work_unit(
+        updated = await store.update_work_unit(
             unit, expected_updated_at=expected_updated_at
         )
     except StaleWriteError as e:
@@ -238,7 +242,7 @@ async def update_work_unit_endpoint(request: Request) -> JSONResponse:
     # Chunk: docs/chunks/orch_manual_done_unblock - Unblock dependents when manually set to DONE
     # When status transitions to DONE via API, unblock any dependent work units
     if old_status != WorkUnitStatus.DONE and updated.status == WorkUnitStatus.DONE:
-        unblock_dependents(store, chunk)
+        await store.run_write(unblock_dependents, chunk)
 
     return JSONResponse(updated.model_dump_json_serializable())
 
@@ -253,7 +257,7 @@ async def delete_work_unit_endpoint(request: Request) -> JSONResponse:
                commits exist.
     """
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
     project_dir = get_project_dir(request)
 
     # Parse force query parameter
@@ -262,10 +266,14 @@ async def delete_work_unit_endpoint(request: Request) -> JSONResponse:
 
     # Check for unmerged commits before deleting
     # This may fail if project_dir is not a git repo (e.g., in tests)
+    # Chunk: docs/chunks/orch_async_git_runner - Git checks and cleanup run off the event loop
+    git_runner = get_git_runner(request)
     worktree_manager = None
     try:
-        worktree_manager = WorktreeManager(project_dir)
-        has_unmerged, commit_count = worktree_manager.has_unmerged_commits(chunk)
+        worktree_manager = await git_runner.query(WorktreeManager, project_dir)
+        has_unmerged, commit_count = await git_runner.query(
+            worktree_manager.has_unmerged_commits, chunk
+        )
 
         if has_unmerged and not force:
             return error_response(
@@ -279,7 +287,7 @@ async def delete_work_unit_endpoint(request: Request) -> JSONResponse:
         # and non-git environments.
         logger.debug(f"Could not check for unmerged commits: {e}")
 
-    deleted = store.delete_work_unit(chunk)
+    deleted = await store.delete_work_unit(chunk)
     if not deleted:
         return not_found_response("Work unit", chunk)
 
@@ -294,7 +302,13 @@ async def delete_work_unit_endpoint(request: Request) -> JSONResponse:
     # Remove worktree and branch to prevent stale branch reuse on re-inject
     if worktree_manager is not None:
         try:
-            worktree_manager.remove_worktree(chunk, remove_branch=True, force=force)
+            await git_runner.call(
+                project_dir,
+                worktree_manager.remove_worktree,
+                chunk,
+                remove_branch=True,
+                force=force,
+            )
         except Exception as e:
             # Worktree cleanup is best-effort; don't fail the delete
             logger.warning(f"Failed to cleanup worktree for '{chunk}': {e}")
@@ -305,14 +319,14 @@ async def delete_work_unit_endpoint(request: Request) -> JSONResponse:
 async def get_status_history_endpoint(request: Request) -> JSONResponse:
     """GET /work-units/{chunk}/history - Get status transition history."""
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
 
     # Verify work unit exists
-    unit = store.get_work_unit(chunk)
+    unit = await store.get_work_unit(chunk)
     if unit is None:
         return not_found_response("Work unit", chunk)
 
-    history = store.get_status_history(chunk)
+    history = await store.get_status_history(chunk)
 
     return JSONResponse({
         "chunk": chunk,
@@ -16,8 +16,9 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from orchestrator.api.common import (
+    get_git_runner,
     get_project_dir,
-    get_store,
+    get_async_store,
     not_found_response,
 )
 from orchestrator.models import WorktreeInfo, WorkUnitStatus
@@ -35,9 +36,9 @@ async def list_worktrees_endpoint(request: Request) -> JSONResponse:
     - retained: Work unit is DONE with retain_worktree=True
     - orphaned: No work unit exists, or work unit is not RUNNING/DONE
     """
-    store = get_store(request)
+    store = get_async_store(request)
     project_dir = get_project_dir(request)
-    worktree_manager = WorktreeManager(project_dir)
+    worktree_manager = await get_git_runner(request).query(WorktreeManager, project_dir)
 
     # Get all worktrees from the filesystem
     worktree_chunks = worktree_manager.list_worktrees()
@@ -54,7 +55,7 @@ async def list_worktrees_endpoint(request: Request) -> JSONResponse:
             created_at = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
 
         # Look up work unit to determine status
-        unit = store.get_work_unit(chunk_name)
+        unit = await store.get_work_unit(chunk_name)
 
         if unit is None:
             # No work unit - orphaned
@@ -111,14 +112,18 @@ async def remove_worktree_endpoint(request: Request) -> JSONResponse:
     query = request.query_params
     remove_branch = query.get("remove_branch", "true").lower() == "true"
 
-    worktree_manager = WorktreeManager(project_dir)
+    # Chunk: docs/chunks/orch_async_git_runner - Removal runs off the event loop
+    git_runner = get_git_runner(request)
+    worktree_manager = await git_runner.query(WorktreeManager, project_dir)
 
     # Check worktree exists
     if not worktree_manager.worktree_exists(chunk):
         return not_found_response("Worktree", chunk)
 
     try:
-        worktree_manager.remove_worktree(chunk, remove_branch=remove_branch)
+        await git_runner.call(
+            project_dir, worktree_manager.remove_worktree, chunk, remove_branch=remove_branch
+        )
     except WorktreeError as e:
         return JSONResponse({
             "chunk": chunk,
@@ -142,7 +147,7 @@ async def prune_work_unit_endpoint(request: Request) -> JSONResponse:
     Only works on DONE work units with retain_worktree=True.
     """
     chunk = request.path_params["chunk"]
-    store = get_store(request)
+    store = get_async_store(request)
     project_dir = get_project_dir(request)
 
     try:
@@ -153,7 +158,7 @@ async def prune_work_unit_endpoint(request: Request) -> JSONResponse:
     dry_run = body.get("dry_run", False)
 
     # Get existing work unit
-    unit = store.get_work_unit(chunk)
+    unit = await store.get_work_unit(chunk)
     if unit is None:
         return not_found_response("Work unit", chunk)
 
@@ -182,10 +187,12 @@ async def prune_work_unit_endpoint(request: Request) -> JSONResponse:
         })
 
     # Chunk: docs/chunks/orch_prune_consolidate - Use consolidated finalize_work_unit
-    worktree_manager = WorktreeManager(project_dir)
+    # Chunk: docs/chunks/orch_async_git_runner - Finalize runs off the event loop
+    git_runner = get_git_runner(request)
+    worktree_manager = await git_runner.query(WorktreeManager, project_dir)
 
     try:
-        worktree_manager.finalize_work_unit(chunk)
+        await git_runner.call(project_dir, worktree_manager.finalize_work_unit, chunk)
     except WorktreeError as e:
         return JSONResponse({
             "chunk": chunk,
@@ -198,7 +205,7 @@ async def prune_work_unit_endpoint(request: Request) -> JSONResponse:
     unit.worktree = None
     unit.updated_at = datetime.now(timezone.utc)
     try:
-        store.update_work_unit(unit, expected_updated_at=expected_updated_at)
+        await store.update_work_unit(unit, expected_updated_at=expected_updated_at)
     except StaleWriteError:
         # Best effort - prune succeeded, just flag update failed
         pass
@@ -216,7 +223,7 @@ async def prune_all_endpoint(request: Request) -> JSONResponse:
 
     Finds all DONE work units with retain_worktree=True and prunes them.
     """
-    store = get_store(request)
+    store = get_async_store(request)
     project_dir = get_project_dir(request)
 
     try:
@@ -227,7 +234,7 @@ async def prune_all_endpoint(request: Request) -> JSONResponse:
     dry_run = body.get("dry_run", False)
 
     # Find all DONE work units with retain_worktree
-    all_units = store.list_work_units(status=WorkUnitStatus.DONE)
+    all_units = await store.list_work_units(status=WorkUnitStatus.DONE)
     retained_units = [u for u in all_units if u.retain_worktree]
 
     results = []
@@ -241,21 +248,23 @@ async def prune_all_endpoint(request: Request) -> JSONResponse:
         return JSONResponse({"results": results})
 
     # Chunk: docs/chunks/orch_prune_consolidate - Use consolidated finalize_work_unit
-    worktree_manager = WorktreeManager(project_dir)
+    # Chunk: docs/chunks/orch_async_git_runner - Finalize runs off the event loop
+    git_runner = get_git_runner(request)
+    worktree_manager = await git_runner.query(WorktreeManager, project_dir)
 
     for unit in retained_units:
         chunk = unit.chunk
         # Capture expected timestamp for optimistic locking
         expected_updated_at = unit.updated_at
         try:
-            worktree_manager.finalize_work_unit(chunk)
+            await git_runner.call(project_dir, worktree_manager.finalize_work_unit, chunk)
 
             # Clear retain_worktree flag
             unit.retain_worktree = False
             unit.worktree = None
             unit.updated_at = datetime.now(timezone.utc)
             try:
-                store.update_work_unit(unit, expected_updated_at=expected_updated_at)
+                await store.update_work_unit(unit, expected_updated_at=expected_updated_at)
             except StaleWriteError:
                 # Best effort - prune succeeded, just flag update failed
                 pass
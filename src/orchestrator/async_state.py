@@ -0,0 +1,437 @@
+# Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
+# Chunk: docs/chunks/orch_async_state_store - Non-blocking StateStore access from the event loop
+# Chunk: docs/chunks/orch_event_dispatch - Change listeners that wake the scheduler
+"""Awaitable access to the orchestrator StateStore.
+
+The scheduler, API handlers and websocket broadcasters all run on a single
+asyncio event loop. Calling the synchronous StateStore from that loop means
+every SQLite statement (and every wait on SQLite's write lock) stalls
+dispatch ticks and dashboard requests alike.
+
+AsyncStateStore moves that I/O off the loop:
+
+- Writes run on one dedicated writer thread that owns the wrapped
+  StateStore's connection. SQLite allows one writer at a time anyway, so
+  serializing writes in-process costs nothing and keeps explicit
+  transactions (BEGIN ... COMMIT) from interleaving across threads.
+- Reads run on a small pool of reader threads, each with its own read-only
+  connection. WAL mode lets those readers proceed while a write is in
+  flight, so dashboard polling never queues behind the scheduler.
+
+Every call is timed from submission to completion (queue wait included,
+since that is what the caller experiences) into a per-query-type latency
+histogram exposed via latency_snapshot().
+
+Because every loop-side write goes through here, AsyncStateStore is also
+where state changes become observable: change listeners registered with
+add_change_listener() run on the event loop after each successful write.
+The scheduler uses this to dispatch as soon as something changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import functools
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, TypeVar
+
+from orchestrator.models import ConflictAnalysis, ConflictVerdict, WorkUnit, WorkUnitStatus
+from orchestrator.state import StateStore
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Called with the written WorkUnit, or None for writes that don't return one
+ChangeListener = Callable[[Optional[WorkUnit]], None]
+
+# Upper bounds (milliseconds) of the latency histogram buckets. Observations
+# above the last bound land in an overflow bucket.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000,
+)
+
+# Default number of reader threads (and read-only connections)
+DEFAULT_READER_COUNT = 4
+
+
+@dataclass
+class QueryLatency:
+    """Latency histogram for one query type."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    # One counter per LATENCY_BUCKETS_MS bound, plus the overflow bucket
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def record(self, elapsed_ms: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Estimate a percentile as the upper bound of the bucket containing it.
+
+        The overflow bucket reports the observed maximum.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return min(LATENCY_BUCKETS_MS[index], self.max_ms)
+                break
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        """JSON-serializable summary of this histogram."""
+        labels = [f"le_{bound:g}" for bound in LATENCY_BUCKETS_MS] + ["overflow"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+def _shutdown_executors(executors: list[Optional[ThreadPoolExecutor]]) -> None:
+    """Finalizer: stop worker threads once the owning store is unreachable."""
+    for executor in executors:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+class AsyncStateStore:
+    """Awaitable facade over a StateStore that never touches SQLite on the loop.
+
+    The wrapped StateStore keeps working for synchronous callers (CLI code,
+    daemon start-up, tests); all asynchronous callers should share one
+    AsyncStateStore per StateStore so that their writes are serialized on the
+    same writer thread.
+
+    Methods are looked up on the wrapped store at call time, so patching a
+    StateStore method (e.g., in tests) also affects calls made through this
+    facade.
+
+    Args:
+        store: The StateStore whose connection the writer thread uses.
+        reader_count: Reader threads for queries. 0 routes reads through the
+            writer thread too (needed for in-memory databases, which
+            separate connections cannot share).
+    """
+
+    def __init__(self, store: StateStore, reader_count: int = DEFAULT_READER_COUNT):
+        self.store = store
+        self.reader_count = reader_count
+        self._latency: dict[str, QueryLatency] = {}
+        self._change_listeners: list[ChangeListener] = []
+        self._reader_local = threading.local()
+        self._reader_stores: list[StateStore] = []
+        self._reader_stores_lock = threading.Lock()
+        # [writer, readers]; a list so the finalizer sees executors created later
+        self._executors: list[Optional[ThreadPoolExecutor]] = [None, None]
+        self._finalizer = weakref.finalize(self, _shutdown_executors, self._executors)
+
+    # Execution plumbing
+
+    def _writer(self) -> ThreadPoolExecutor:
+        if self._executors[0] is None:
+            self._executors[0] = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="state-writer"
+            )
+        return self._executors[0]
+
+    def _readers(self) -> ThreadPoolExecutor:
+        if self.reader_count <= 0:
+            return self._writer()
+        if self._executors[1] is None:
+            self._executors[1] = ThreadPoolExecutor(
+                max_workers=self.reader_count, thread_name_prefix="state-reader"
+            )
+        return self._executors[1]
+
+    def _reader_store(self) -> StateStore:
+        """Return this reader thread's read-only StateStore."""
+        if self.reader_count <= 0:
+            return self.store
+        reader = getattr(self._reader_local, "store", None)
+        if reader is None:
+            reader = StateStore(self.store.db_path)
+            reader.connection.execute("PRAGMA query_only=ON")
+            self._reader_local.store = reader
+            with self._reader_stores_lock:
+                self._reader_stores.append(reader)
+        return reader
+
+    async def _submit(
+        self, query: str, executor: ThreadPoolExecutor, fn: Callable[[], T]
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            return await loop.run_in_executor(executor, fn)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._latency.setdefault(query, QueryLatency()).record(elapsed_ms)
+
+    async def _read(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        def call() -> Any:
+            return getattr(self._reader_store(), method)(*args, **kwargs)
+
+        return await self._submit(method, self._readers(), call)
+
+    async def _write(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        def call() -> Any:
+            return getattr(self.store, method)(*args, **kwargs)
+
+        result = await self._submit(method, self._writer(), call)
+        self._notify_change(result if isinstance(result, WorkUnit) else None)
+        return result
+
+    def _notify_change(self, work_unit: Optional[WorkUnit]) -> None:
+        for listener in list(self._change_listeners):
+            try:
+                listener(work_unit)
+            except Exception as e:
+                logger.error(f"State change listener failed: {e}")
+
+    async def run_write(
+        self, fn: Callable[..., T], *args: Any, query: Optional[str] = None
+    ) -> T:
+        """Run fn(store, *args) on the writer thread.
+
+        Use this for multi-step operations that must not interleave with
+        other writes (e.g., read-modify-write loops such as
+        unblock_dependents) or for synchronous helpers that hold a reference
+        to the wrapped store.
+
+        Args:
+            fn: Callable taking the wrapped StateStore as first argument.
+            *args: Extra positional arguments for fn.
+            query: Name recorded in the latency histogram (defaults to
+                fn's name).
+        """
+        name = query or getattr(fn, "__name__", "run_write")
+        result = await self._submit(
+            name, self._writer(), functools.partial(fn, self.store, *args)
+        )
+        self._notify_change(None)
+        return result
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """Call listener on the event loop after every successful write.
+
+        Listeners receive the written WorkUnit for create, update and rename,
+        and None for every other write (deletes, config, conflict data,
+        run_write). They must not block.
+        """
+        self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: ChangeListener) -> None:
+        """Stop calling a listener registered with add_change_listener()."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def latency_snapshot(self) -> dict[str, dict]:
+        """Return latency histograms keyed by query type."""
+        return {name: stats.to_dict() for name, stats in sorted(self._latency.items())}
+
+    def reset_latency(self) -> None:
+        """Discard recorded latency observations."""
+        self._latency.clear()
+
+    def close(self) -> None:
+        """Stop worker threads and close reader connections.
+
+        The wrapped StateStore is left open (its owner closes it). The
+        facade stays usable: threads are recreated on the next call.
+        """
+        _shutdown_executors(self._executors)
+        self._executors[0] = self._executors[1] = None
+        with self._reader_stores_lock:
+            for reader in self._reader_stores:
+                reader.close()
+            self._reader_stores.clear()
+        self._reader_local = threading.local()
+
+    # Work units
+
+    async def create_work_unit(self, work_unit: WorkUnit) -> WorkUnit:
+        """Create a new work unit (see StateStore.create_work_unit)."""
+        return await self._write("create_work_unit", work_unit)
+
+    async def get_work_unit(self, chunk: str) -> Optional[WorkUnit]:
+        """Get a work unit by chunk name."""
+        return await self._read("get_work_unit", chunk)
+
+    async def update_work_unit(
+        self,
+        work_unit: WorkUnit,
+        expected_updated_at: Optional[datetime] = None,
+    ) -> WorkUnit:
+        """Update a work unit (see StateStore.update_work_unit)."""
+        if expected_updated_at is None:
+            return await self._write("update_work_unit", work_unit)
+        return await self._write(
+            "update_work_unit", work_unit, expected_updated_at=expected_updated_at
+        )
+
+    # Chunk: docs/chunks/orch_work_unit_dirty_fields - Compare-and-swap wrapper
+    async def compare_and_swap_work_unit(
+        self,
+        work_unit: WorkUnit,
+        expected_updated_at: Optional[datetime] = None,
+    ) -> WorkUnit:
+        """Write a unit's changed fields if unchanged since read (see StateStore)."""
+        return await self._write(
+            "compare_and_swap_work_unit", work_unit, expected_updated_at=expected_updated_at
+        )
+
+    async def delete_work_unit(self, chunk: str) -> bool:
+        """Delete a work unit."""
+        return await self._write("delete_work_unit", chunk)
+
+    async def list_work_units(
+        self, status: Optional[WorkUnitStatus] = None
+    ) -> list[WorkUnit]:
+        """List work units, optionally filtered by status."""
+        return await self._read("list_work_units", status=status)
+
+    async def count_by_status(self) -> dict[str, int]:
+        """Count work units by status."""
+        return await self._read("count_by_status")
+
+    async def get_status_history(self, chunk: str) -> list[dict]:
+        """Get the status transition history for a work unit."""
+        return await self._read("get_status_history", chunk)
+
+    async def rename_work_unit(self, old_chunk: str, new_chunk: str) -> WorkUnit:
+        """Rename a work unit (see StateStore.rename_work_unit)."""
+        return await self._write("rename_work_unit", old_chunk, new_chunk)
+
+    async def update_blocked_by_references(self, old_chunk: str, new_chunk: str) -> int:
+        """Rewrite blocked_by entries after a rename."""
+        return await self._write("update_blocked_by_references", old_chunk, new_chunk)
+
+    async def update_conflict_verdicts_references(self, old_chunk: str, new_chunk: str) -> int:
+        """Rewrite conflict_verdicts keys after a rename."""
+        return await self._write("update_conflict_verdicts_references", old_chunk, new_chunk)
+
+    async def update_conflict_analyses_references(self, old_chunk: str, new_chunk: str) -> int:
+        """Rewrite conflict analysis rows after a rename."""
+        return await self._write("update_conflict_analyses_references", old_chunk, new_chunk)
+
+    # Queues
+
+    async def get_ready_queue(self, limit: Optional[int] = None) -> list[WorkUnit]:
+        """Get READY work units in dispatch order."""
+        return await self._read("get_ready_queue", limit=limit)
+
+    # Chunk: docs/chunks/orch_dispatch_candidates - Lazy dispatch candidate iteration
+    async def get_dispatch_candidates(
+        self,
+        limit: int,
+        exclude: Iterable[str] = (),
+        now: Optional[datetime] = None,
+    ) -> list[WorkUnit]:
+        """Get dispatchable READY work units (see StateStore.get_dispatch_candidates)."""
+        return await self._read(
+            "get_dispatch_candidates", limit, exclude=list(exclude), now=now
+        )
+
+    async def iter_dispatch_candidates(
+        self, batch_size: int = 16, now: Optional[datetime] = None
+    ) -> AsyncIterator[WorkUnit]:
+        """Lazily yield dispatch candidates, one reader round trip per batch.
+
+        Mirrors StateStore.iter_dispatch_candidates(): each batch excludes
+        the chunks already yielded, so a caller that breaks out early never
+        reads past the rows it needed.
+        """
+        seen: list[str] = []
+        while True:
+            batch = await self.get_dispatch_candidates(batch_size, exclude=seen, now=now)
+            if not batch:
+                return
+            for unit in batch:
+                seen.append(unit.chunk)
+                yield unit
+            if len(batch) < batch_size:
+                return
+
+    async def get_next_retry_at(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Get the earliest future next_retry_at among READY work units."""
+        return await self._read("get_next_retry_at", now=now)
+
+    async def get_attention_queue(self) -> list[tuple[WorkUnit, int]]:
+        """Get NEEDS_ATTENTION work units with their blocking counts."""
+        return await self._read("get_attention_queue")
+
+    async def list_blocked_by_chunk(self, chunk: str) -> list[WorkUnit]:
+        """List work units whose blocked_by contains chunk."""
+        return await self._read("list_blocked_by_chunk", chunk)
+
+    # Config
+
+    async def get_config(self, key: str) -> Optional[str]:
+        """Get a config value."""
+        return await self._read("get_config", key)
+
+    async def set_config(self, key: str, value: str) -> None:
+        """Set a config value."""
+        await self._write("set_config", key, value)
+
+    # Conflicts
+
+    async def save_conflict_analysis(self, analysis: ConflictAnalysis) -> None:
+        """Store a conflict analysis."""
+        await self._write("save_conflict_analysis", analysis)
+
+    async def save_conflict_analyses(self, analyses: Iterable[ConflictAnalysis]) -> None:
+        """Store a batch of conflict analyses in one transaction."""
+        await self._write("save_conflict_analyses", list(analyses))
+
+    # Chunk: docs/chunks/orch_conflict_verdict_table - Batched verdict upserts
+    async def save_conflict_verdicts(
+        self,
+        verdicts: Iterable[tuple[str, str, str, Optional[str]]],
+        updated_at: Optional[datetime] = None,
+    ) -> int:
+        """Record (chunk, other_chunk, verdict, stage) verdicts in one transaction."""
+        return await self._write("save_conflict_verdicts", list(verdicts), updated_at)
+
+    async def get_conflict_analysis(
+        self, chunk_a: str, chunk_b: str
+    ) -> Optional[ConflictAnalysis]:
+        """Get the stored analysis for a pair of chunks."""
+        return await self._read("get_conflict_analysis", chunk_a, chunk_b)
+
+    async def list_conflicts_for_chunk(self, chunk: str) -> list[ConflictAnalysis]:
+        """List conflict analyses involving chunk."""
+        return await self._read("list_conflicts_for_chunk", chunk)
+
+    async def list_all_conflicts(
+        self, verdict: Optional[ConflictVerdict] = None
+    ) -> list[ConflictAnalysis]:
+        """List all conflict analyses, optionally filtered by verdict."""
+        return await self._read("list_all_conflicts", verdict)
+
+    async def clear_conflicts_for_chunk(self, chunk: str) -> int:
+        """Delete conflict analyses involving chunk."""
+        return await self._write("clear_conflicts_for_chunk", chunk)
@@ -636,8 +636,16 @@ async def _run_daemon_async(
     """
     from orchestrator.scheduler import create_scheduler
 
-    # Create scheduler with base branch and task context
-    scheduler = create_scheduler(store, project_dir, config, base_branch, task_info)
+    # Create scheduler with base branch and task context. It shares the API's
+    # AsyncStateStore so both write through one writer thread, and its
+    # GitRunner so merges from either side are serialized per repository.
+    # Chunk: docs/chunks/orch_async_state_store - Single writer shared by API and scheduler
+    # Chunk: docs/chunks/orch_async_git_runner - One git runner shared by API and scheduler
+    scheduler = create_scheduler(
+        store, project_dir, config, base_branch, task_info,
+        async_store=getattr(app.state, "async_store", None),
+        git_runner=getattr(app.state, "git_runner", None),
+    )
 
     # Resolve port if auto-selecting
     actual_port = port if port != 0 else find_available_port(host)
@@ -0,0 +1,178 @@
+# Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
+# Chunk: docs/chunks/orch_async_git_runner - Git operations off the event loop
+"""Awaitable execution of git operations for the orchestrator.
+
+WorktreeManager and the merge strategies in orchestrator.merge shell out to
+git with blocking subprocess.run() calls. A single finalize runs a dozen or
+more of them (commit, worktree remove, rev-parse, merge-base, merge-tree,
+commit-tree, update-ref, branch -d), and calling that from a scheduler
+coroutine freezes dispatch, websocket broadcasts and API responses for the
+whole duration.
+
+GitRunner moves that work off the loop:
+
+- Operations run on a small pool of worker threads. An asyncio semaphore of
+  the same size bounds how many git operations are in flight; callers beyond
+  the bound wait on the loop (cancellably) rather than in the pool's queue.
+- Mutating operations take a per-repository lock first, so two finalizes
+  against the same repository never race on refs, the index or worktree
+  metadata. Operations on different repositories (task context mode, or
+  several daemons sharing a runner in tests) still run in parallel.
+- Read-only queries skip the repository lock and only count against the
+  concurrency bound.
+
+The WorktreeManager API stays synchronous so CLI code and tests can keep
+calling it directly; asynchronous callers hand its bound methods to
+GitRunner.call() or GitRunner.query().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike
+from typing import Any, Callable, Optional, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Default number of git operations allowed in flight at once
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def _shutdown_executor(executors: list[Optional[ThreadPoolExecutor]]) -> None:
+    """Finalizer: stop worker threads once the owning runner is unreachable."""
+    for executor in executors:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+class GitRunner:
+    """Runs blocking git operations on worker threads with bounded concurrency.
+
+    One GitRunner should be shared by every asynchronous caller in a daemon
+    (scheduler and API) so that the per-repository locks and the concurrency
+    bound apply across all of them.
+
+    Args:
+        max_concurrency: Maximum number of git operations running at once.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._repo_locks: dict[str, asyncio.Lock] = {}
+        self._in_flight = 0
+        self._waiting = 0
+        # A list so the finalizer sees the executor created later
+        self._executors: list[Optional[ThreadPoolExecutor]] = [None]
+        self._finalizer = weakref.finalize(self, _shutdown_executor, self._executors)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executors[0] is None:
+            self._executors[0] = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="git"
+            )
+        return self._executors[0]
+
+    def _repo_lock(self, repo_dir: Union[str, PathLike]) -> asyncio.Lock:
+        key = str(repo_dir)
+        lock = self._repo_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._repo_locks[key] = lock
+        return lock
+
+    async def _run(
+        self,
+        lock: Optional[asyncio.Lock],
+        fn: Callable[..., T],
+        args: tuple,
+        kwargs: dict,
+    ) -> T:
+        self._waiting += 1
+        try:
+            if lock is not None:
+                await lock.acquire()
+            try:
+                await self._slots.acquire()
+            except BaseException:
+                if lock is not None:
+                    lock.release()
+                raise
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._pool(), functools.partial(fn, *args, **kwargs))
+
+        def release(done: asyncio.Future) -> None:
+            # Runs when the thread finishes, even if the awaiting caller was
+            # cancelled, so the lock is never released under a running git
+            self._in_flight -= 1
+            self._slots.release()
+            if lock is not None:
+                lock.release()
+            if not done.cancelled():
+                # Mark any exception retrieved; the caller may have gone away
+                done.exception()
+
+        future.add_done_callback(release)
+        return await asyncio.shield(future)
+
+    async def call(
+        self,
+        repo_dir: Union[str, PathLike],
+        fn: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run a git operation that modifies repo_dir.
+
+        Operations against the same repository run one at a time, in the
+        order they were submitted.
+
+        Args:
+            repo_dir: Repository the operation modifies; the serialization key.
+            fn: Blocking callable, typically a bound WorktreeManager method.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            Whatever fn returns. Exceptions raised by fn propagate unchanged.
+        """
+        return await self._run(self._repo_lock(repo_dir), fn, args, kwargs)
+
+    async def query(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a read-only git operation.
+
+        Queries are not serialized against each other or against call(),
+        only bounded by max_concurrency.
+        """
+        return await self._run(None, fn, args, kwargs)
+
+    def stats(self) -> dict:
+        """JSON-serializable snapshot of runner load."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+        }
+
+    def close(self) -> None:
+        """Stop the worker threads.
+
+        Operations already running finish; the runner creates a fresh pool if
+        it is used again.
+        """
+        executor = self._executors[0]
+        self._executors[0] = None
+        if executor is not None:
+            executor.shutdown(wait=False)
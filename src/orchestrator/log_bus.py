@@ -0,0 +1,241 @@
+# Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
+# Chunk: docs/chunks/orch_log_bus - Push-based agent log delivery
+"""In-daemon publish/subscribe bus for agent log records.
+
+The log callback created by :func:`orchestrator.agent.create_log_callback`
+appends each record to the phase log file and then publishes it here. Log
+viewers in the daemon (the dashboard's ``/ws/log/{chunk}`` websocket)
+subscribe per chunk and are woken the moment a record is written, instead of
+re-opening and re-reading the log files on a timer.
+
+Records are delivered as :class:`LogFrame` objects carrying the byte range
+they occupy in the phase log file. Subscribers that also read the file (to
+catch up on history, or after falling behind) use those offsets to drop
+records they have already seen, so the file remains the source of truth and
+the bus only has to be fast, not lossless:
+
+- Each subscription buffers at most ``max_pending`` frames. A subscriber that
+  falls further behind is marked ``overflowed`` and its buffer is dropped; it
+  re-reads the gap from the file.
+- HTML formatting for the dashboard happens once per record, on first use,
+  no matter how many subscribers receive it.
+
+Publishing is cheap when nobody is subscribed and safe from any thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Frames buffered per subscription before it is marked overflowed
+DEFAULT_MAX_PENDING = 1000
+
+
+@dataclass(eq=False)
+class LogFrame:
+    """One log record as written to a phase log file.
+
+    Attributes:
+        chunk: Chunk the record belongs to
+        phase: Lowercase phase name, matching the log file stem
+        start: Byte offset of the record in the phase log file
+        end: Byte offset just past the record's trailing newline
+        line: The JSON line as written, including the newline
+    """
+
+    chunk: str
+    phase: str
+    start: int
+    end: int
+    line: str
+    _html: Optional[list[dict]] = field(default=None, repr=False)
+
+    def html_lines(self) -> list[dict]:
+        """Dashboard log lines for this record, formatted once and shared.
+
+        Returns:
+            List of ``{"content": html}`` dicts, preceded by a phase header
+            line (``"is_header": True``) for the first record in a file.
+        """
+        if self._html is None:
+            self._html = format_html_lines(self.phase, self.line, self.start == 0)
+        return self._html
+
+
+def format_html_lines(phase: str, line: str, first_in_file: bool) -> list[dict]:
+    """Format one raw log line for the dashboard log panel.
+
+    Args:
+        phase: Lowercase phase name
+        line: Raw JSON log line
+        first_in_file: Whether to emit the phase header first
+
+    Returns:
+        List of line dicts; empty if the line does not parse.
+    """
+    from orchestrator.log_parser import (
+        format_entry_for_html,
+        format_phase_header_for_html,
+        parse_log_line,
+    )
+
+    entry = parse_log_line(line)
+    if entry is None:
+        return []
+
+    lines = []
+    if first_in_file:
+        lines.append({
+            "content": format_phase_header_for_html(phase.upper(), entry.timestamp),
+            "is_header": True,
+        })
+    lines.extend({"content": html} for html in format_entry_for_html(entry))
+    return lines
+
+
+class LogSubscription:
+    """A subscriber's buffer of frames for one chunk.
+
+    Created by :meth:`LogBus.subscribe` on the subscriber's event loop;
+    frames published from other threads are handed over through that loop.
+    """
+
+    def __init__(
+        self,
+        bus: LogBus,
+        chunk: str,
+        loop: asyncio.AbstractEventLoop,
+        max_pending: int,
+    ):
+        self.bus = bus
+        self.chunk = chunk
+        self.max_pending = max_pending
+        self.overflowed = False
+        self._loop = loop
+        self._pending: deque[LogFrame] = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def _deliver(self, frame: LogFrame) -> None:
+        if self._closed:
+            return
+        if len(self._pending) >= self.max_pending:
+            # The reader re-reads the file from its own offsets
+            self._pending.clear()
+            self.overflowed = True
+        else:
+            self._pending.append(frame)
+        self._ready.set()
+
+    def _publish(self, frame: LogFrame) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._deliver(frame)
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._deliver, frame)
+            except RuntimeError:
+                # Subscriber's loop is closed
+                pass
+
+    async def wait(self) -> None:
+        """Wait until at least one frame (or an overflow) is pending."""
+        await self._ready.wait()
+
+    def drain(self) -> tuple[list[LogFrame], bool]:
+        """Take every pending frame.
+
+        Returns:
+            Tuple of (frames, overflowed). When overflowed is True some frames
+            were dropped and the caller should re-read the log files.
+        """
+        frames = list(self._pending)
+        overflowed = self.overflowed
+        self._pending.clear()
+        self.overflowed = False
+        self._ready.clear()
+        return frames, overflowed
+
+    def close(self) -> None:
+        """Stop receiving frames."""
+        self._closed = True
+        self.bus.unsubscribe(self)
+
+
+class LogBus:
+    """Fan-out of published log frames to per-chunk subscribers."""
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING):
+        self.max_pending = max_pending
+        self._subscribers: dict[str, set[LogSubscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, chunk: str) -> LogSubscription:
+        """Subscribe to records for a chunk.
+
+        Must be called from the event loop that will consume the frames.
+        """
+        subscription = LogSubscription(
+            self, chunk, asyncio.get_running_loop(), self.max_pending
+        )
+        with self._lock:
+            self._subscribers.setdefault(chunk, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.chunk)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.chunk]
+
+    def publish(self, chunk: str, phase: str, start: int, end: int, line: str) -> None:
+        """Publish a record that was just written to a phase log file.
+
+        Args:
+            chunk: Chunk name
+            phase: Lowercase phase name (log file stem)
+            start: Byte offset the record was written at
+            end: Byte offset just past the record
+            line: The JSON line as written
+        """
+        with self._lock:
+            subscribers = tuple(self._subscribers.get(chunk, ()))
+        if not subscribers:
+            return
+        frame = LogFrame(chunk=chunk, phase=phase, start=start, end=end, line=line)
+        for subscription in subscribers:
+            subscription._publish(frame)
+
+
+# Global log bus instance
+_bus: Optional[LogBus] = None
+
+
+def get_log_bus() -> LogBus:
+    """Get the global log bus instance.
+
+    Returns:
+        The LogBus singleton
+    """
+    global _bus
+    if _bus is None:
+        _bus = LogBus()
+    return _bus
+
+
+def reset_log_bus() -> None:
+    """Reset the global log bus (for testing)."""
+    global _bus
+    _bus = None
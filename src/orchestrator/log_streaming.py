@@ -2,14 +2,29 @@
 
 This module contains the log file management and streaming logic extracted from
 the CLI layer to enable independent testing and reuse.
+
+Followers are woken by filesystem notifications (inotify on Linux, via
+watchfiles) rather than fixed-interval polling. Inside the daemon the log bus
+in orchestrator.log_bus delivers records first; the watchers here cover writes
+the bus never sees, such as the CLI reading a daemon's logs from another
+process.
+
+Logs are displayed as they are read rather than parsed whole first, and
+read_log_pages selects ranges of entries through each phase log's offset
+index without reading the rest of the log.
 """
 # Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
 # Chunk: docs/chunks/cli_decompose - Extract log streaming from CLI
+# Chunk: docs/chunks/orch_log_bus - Notification-driven log following
+# Chunk: docs/chunks/orch_paged_log_view - Index-backed log pages
 
+import asyncio
+from datetime import datetime
 from pathlib import Path
-from typing import Callable, Iterator
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional
 
 from orchestrator.models import WorkUnitPhase
+from orchestrator.phase_log import LogPage, iter_records, read_page
 
 
 # Phase order for log file iteration
@@ -82,7 +97,7 @@ def display_phase_log(
     show_header: bool = True,
     output: Callable[[str], None] = print,
 ) -> None:
-    """Display a complete phase log file.
+    """Display a complete phase log, including rotated segments.
 
     Parses and formats log entries using the log_parser module, then outputs
     them using the provided output function.
@@ -93,23 +108,163 @@ def display_phase_log(
         show_header: Whether to show a phase header before entries
         output: Function to call with each output line (default: print)
     """
+    # Chunk: docs/chunks/orch_phase_log_writer - Read every segment of the phase
+    # Chunk: docs/chunks/orch_paged_log_view - Output entries as they are read
+    display_log_records(
+        phase,
+        iter_records(log_file.parent, log_file.stem),
+        show_header=show_header,
+        output=output,
+    )
+
+
+# Chunk: docs/chunks/orch_paged_log_view - Shared by full and paged display
+def display_log_records(
+    phase: WorkUnitPhase,
+    records: Iterable[tuple[int, str]],
+    show_header: bool = True,
+    output: Callable[[str], None] = print,
+) -> None:
+    """Display log records, formatting each one as it arrives.
+
+    Args:
+        phase: The phase the records belong to
+        records: (offset, line) pairs, such as from iter_records or a LogPage
+        show_header: Whether to show a phase header before the first entry
+        output: Function to call with each output line (default: print)
+    """
     from orchestrator.log_parser import (
-        parse_log_file,
+        parse_log_line,
         format_entry,
         format_phase_header,
     )
 
-    entries = parse_log_file(log_file)
-    if not entries:
-        return
+    for _, line in records:
+        entry = parse_log_line(line)
+        if entry is None:
+            continue
+        if show_header:
+            header = format_phase_header(phase.value, entry.timestamp)
+            output(f"\n{header}\n")
+            show_header = False
+        for display_line in format_entry(entry):
+            output(display_line)
+
+
+# Chunk: docs/chunks/orch_paged_log_view - Selected entries across phases
+def read_log_pages(
+    log_dir: Path,
+    phases: Optional[Iterable[WorkUnitPhase]] = None,
+    last: Optional[int] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+) -> list[tuple[WorkUnitPhase, LogPage]]:
+    """Read the selected entries of each phase log through the offset index.
+
+    ``last`` counts across phases, newest first, the way ``tail -n`` would
+    over the phase logs concatenated in order. Every existing phase log gets
+    a page, possibly empty, so callers can learn each phase's size and end.
+
+    Args:
+        log_dir: Path to the log directory for a work unit
+        phases: Phases to include (default: all)
+        last: Only the last N entries
+        since: Earliest entry timestamp to include (Unix time)
+        until: Latest entry timestamp to include (Unix time)
+
+    Returns:
+        List of (phase, LogPage) tuples in phase order
+    """
+    wanted = set(phases) if phases is not None else None
+    selected = [
+        phase for phase, _ in get_phase_log_files(log_dir)
+        if wanted is None or phase in wanted
+    ]
+
+    pages = []
+    remaining = last
+    for phase in reversed(selected):
+        page = read_page(
+            log_dir, phase.value.lower(), last=remaining, since=since, until=until
+        )
+        pages.append((phase, page))
+        if remaining is not None:
+            remaining -= len(page.records)
+    pages.reverse()
+    return pages
+
+
+def parse_log_time(value: str) -> float:
+    """Parse a log range bound given as Unix seconds or an ISO 8601 time.
+
+    ISO times without a UTC offset are taken as local time.
+
+    Raises:
+        ValueError: If the value is neither
+    """
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    return datetime.fromisoformat(value).astimezone().timestamp()
+
+
+# How long watchers group filesystem changes before waking the follower.
+# watchfiles defaults to 1.6s, which is far too laggy for a live log.
+WATCH_DEBOUNCE_MS = 100
+WATCH_STEP_MS = 20
+
+# How often to check for a log directory that does not exist yet
+LOG_DIR_POLL_INTERVAL = 1.0
+
+
+def watch_log_dir(log_dir: Path, timeout: float = 1.0) -> Iterator[None]:
+    """Yield whenever files in log_dir change, and at least every timeout.
+
+    Blocks between yields on filesystem notifications. KeyboardInterrupt
+    propagates to the caller.
+
+    Args:
+        log_dir: Existing log directory to watch
+        timeout: Maximum seconds between yields when nothing changes
+    """
+    from watchfiles import watch
+
+    for _ in watch(
+        log_dir,
+        debounce=WATCH_DEBOUNCE_MS,
+        step=WATCH_STEP_MS,
+        rust_timeout=int(timeout * 1000),
+        yield_on_timeout=True,
+    ):
+        yield
+
+
+async def awatch_log_dir(
+    log_dir: Path,
+    stop_event: Optional[asyncio.Event] = None,
+) -> AsyncIterator[None]:
+    """Yield on the event loop whenever files in log_dir change.
+
+    Waits for the directory to be created if it does not exist yet, and
+    yields once when it appears.
+
+    Args:
+        log_dir: Log directory to watch
+        stop_event: Ends the iteration when set
+    """
+    from watchfiles import awatch
 
-    # Show phase header
-    if show_header and entries:
-        header = format_phase_header(phase.value, entries[0].timestamp)
-        output(f"\n{header}\n")
+    while not log_dir.is_dir():
+        if stop_event is not None and stop_event.is_set():
+            return
+        await asyncio.sleep(LOG_DIR_POLL_INTERVAL)
+    yield
 
-    # Display entries
-    for entry in entries:
-        lines = format_entry(entry)
-        for line in lines:
-            output(line)
+    async for _ in awatch(
+        log_dir,
+        debounce=WATCH_DEBOUNCE_MS,
+        step=WATCH_STEP_MS,
+        stop_event=stop_event,
+    ):
+        yield
@@ -4,6 +4,7 @@
 # Chunk: docs/chunks/explicit_deps_workunit_flag - WorkUnit explicit_deps field
 # Chunk: docs/chunks/orch_verify_active - completion_retries and max_completion_retries fields
 # Chunk: docs/chunks/orch_conflict_oracle - ConflictVerdict and ConflictAnalysis models
+# Chunk: docs/chunks/orch_work_unit_dirty_fields - Persisted snapshot and dirty field tracking
 """Pydantic models for the orchestrator daemon.
 
 These models define the data contract between CLI, daemon, and SQLite.
@@ -13,9 +14,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, PrivateAttr, field_validator
 
 
 class ConflictVerdict(StrEnum):
@@ -140,6 +141,55 @@ class WorkUnit(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    # Chunk: docs/chunks/orch_work_unit_dirty_fields - Field values as last read from or written to the store
+    # None until the unit has been loaded or saved by a StateStore
+    _persisted: Optional[dict[str, Any]] = PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        # Compare fields only; the persisted snapshot is bookkeeping
+        if not isinstance(other, WorkUnit):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def mark_persisted(self) -> None:
+        """Record the current field values as the stored state.
+
+        Called by StateStore whenever the unit is loaded or written.
+        Lists and dicts are copied, so in-place edits count as changes.
+        """
+        self._persisted = {
+            name: value.copy() if isinstance(value, (list, dict)) else value
+            for name, value in self.__dict__.items()
+        }
+
+    @property
+    def is_persisted(self) -> bool:
+        """Whether the unit carries a snapshot of its stored state."""
+        return self._persisted is not None
+
+    def persisted_value(self, name: str) -> Any:
+        """Return a field's value as last stored.
+
+        Raises:
+            ValueError: If the unit has no stored snapshot
+        """
+        if self._persisted is None:
+            raise ValueError(f"Work unit '{self.chunk}' has not been persisted")
+        return self._persisted[name]
+
+    def dirty_fields(self) -> list[str]:
+        """Names of fields changed since the unit was last stored.
+
+        Every field counts as dirty for a unit that was never stored.
+        """
+        if self._persisted is None:
+            return list(self.__dict__)
+        return [
+            name
+            for name, value in self.__dict__.items()
+            if self._persisted.get(name) != value
+        ]
+
     @field_validator("chunk")
     @classmethod
     def validate_chunk(cls, v: str) -> str:
@@ -194,6 +244,10 @@ class OrchestratorState(BaseModel):
     started_at: Optional[datetime] = None
     work_unit_counts: dict[str, int] = {}  # Status -> count mapping
     version: str = "0.1.0"
+    # Chunk: docs/chunks/orch_async_state_store - Per-query store latency histograms
+    store_latency: dict[str, dict] = {}  # Query type -> latency summary
+    # Chunk: docs/chunks/orch_ws_send_queues - Dashboard broadcast queue metrics
+    websocket: dict[str, int] = {}  # ConnectionManager.metrics()
 
     def model_dump_json_serializable(self) -> dict:
         """Return a JSON-serializable dict representation.
@@ -207,6 +261,8 @@ class OrchestratorState(BaseModel):
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "work_unit_counts": self.work_unit_counts,
             "version": self.version,
+            "store_latency": self.store_latency,
+            "websocket": self.websocket,
         }
 
 
@@ -217,7 +273,8 @@ class OrchestratorConfig(BaseModel):
     """
 
     max_agents: int = 4  # Maximum concurrent agents
-    dispatch_interval_seconds: float = 1.0  # How often to check for READY work units
+    # Chunk: docs/chunks/orch_event_dispatch - Fallback tick; state changes dispatch immediately
+    dispatch_interval_seconds: float = 10.0  # Fallback poll interval for READY work units
     max_completion_retries: int = 2  # Max retries for ACTIVE status verification
     # Chunk: docs/chunks/orch_worktree_retain - Warn when retained worktrees exceed threshold
     worktree_warning_threshold: int = 10  # Threshold for warning about retained worktrees
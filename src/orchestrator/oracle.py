@@ -1,5 +1,6 @@
 # Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
 # Chunk: docs/chunks/orch_conflict_oracle - Conflict Oracle for scheduling decisions
+# Chunk: docs/chunks/orch_oracle_footprint_index - Footprint index and verdict cache
 """Conflict Oracle for intelligent chunk scheduling.
 
 The oracle analyzes potential conflicts between chunks to determine whether
@@ -15,13 +16,24 @@ The oracle returns one of three verdicts:
 - INDEPENDENT: Safe to parallelize (high confidence no overlap)
 - SERIALIZE: Must sequence (high confidence overlap)
 - ASK_OPERATOR: Uncertain, needs human judgment
+
+Everything an analysis compares about a chunk (stage, PLAN.md locations,
+code_references and significant GOAL.md terms) is captured once in a
+ChunkFootprint, cached by the hash of the chunk's GOAL.md and PLAN.md. A
+FootprintIndex maps locations and referenced files back to chunks, so
+analyzing one chunk against a queue looks up the chunks it could overlap
+instead of comparing every pair symbol by symbol. Verdicts are cached per
+pair of footprint digests and only recomputed when either chunk changes.
 """
 
+import hashlib
 import logging
 import re
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from chunks import Chunks, compute_symbolic_overlap
 from orchestrator.models import ConflictAnalysis, ConflictVerdict
@@ -40,12 +52,120 @@ class AnalysisStage:
     COMPLETED = "COMPLETED"  # code_references populated
 
 
+_STAGE_ORDER = [
+    AnalysisStage.PROPOSED,
+    AnalysisStage.GOAL,
+    AnalysisStage.PLAN,
+    AnalysisStage.COMPLETED,
+]
+
+# Files modified within this window of being fingerprinted may have been
+# rewritten without a visible mtime change, so their content is re-hashed
+# instead of trusting the stat signature.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Words ignored when comparing goals
+_GOAL_STOPWORDS = frozenset({
+    "the", "and", "for", "this", "that", "with", "from",
+    "will", "should", "must", "can", "may", "when", "where",
+    "which", "what", "how", "why", "are", "was", "were",
+    "been", "being", "have", "has", "had", "having", "does",
+    "did", "doing", "would", "could", "might", "shall",
+})
+
+
+# Chunk: docs/chunks/orch_oracle_footprint_index - Cached per-chunk analysis inputs
+@dataclass(frozen=True)
+class ChunkFootprint:
+    """What the oracle compares about one chunk, derived from its files.
+
+    Attributes:
+        chunk: Chunk name
+        digest: Hash of the chunk's GOAL.md and PLAN.md the footprint was built from
+        stage: AnalysisStage the chunk's files support
+        locations: File paths from PLAN.md Location: lines
+        code_references: Symbolic references from GOAL.md frontmatter
+        reference_files: (project, file) pairs the code references point into
+        opaque_references: True if some reference could not be parsed, in which
+            case the chunk is a symbol-overlap candidate for every other chunk
+        goal_terms: Significant terms of GOAL.md with HTML comments stripped
+    """
+
+    chunk: str
+    digest: str
+    stage: str
+    locations: frozenset[str]
+    code_references: tuple[str, ...]
+    reference_files: frozenset[tuple[str, str]]
+    opaque_references: bool
+    goal_terms: frozenset[str]
+
+    def index_keys(self) -> Iterable[tuple[str, object]]:
+        """Keys under which this footprint is indexed."""
+        for location in self.locations:
+            yield ("location", location)
+        for reference_file in self.reference_files:
+            yield ("reference", reference_file)
+        if self.opaque_references:
+            yield ("reference", None)
+
+
+# Chunk: docs/chunks/orch_oracle_footprint_index - Inverted index from footprint keys to chunks
+class FootprintIndex:
+    """Inverted index from PLAN.md locations and referenced files to chunks.
+
+    Goal terms are not indexed: GOAL.md frontmatter keys make nearly every
+    pair share some term, and the term comparison is a cheap set intersection
+    on the footprints anyway.
+    """
+
+    def __init__(self):
+        self._postings: dict[tuple[str, object], set[str]] = {}
+        # Chunks with unparseable references overlap-check against everyone
+        self._opaque: set[str] = set()
+
+    def add(self, footprint: ChunkFootprint) -> None:
+        for key in footprint.index_keys():
+            self._postings.setdefault(key, set()).add(footprint.chunk)
+        if footprint.opaque_references:
+            self._opaque.add(footprint.chunk)
+
+    def remove(self, footprint: ChunkFootprint) -> None:
+        for key in footprint.index_keys():
+            chunks = self._postings.get(key)
+            if chunks is not None:
+                chunks.discard(footprint.chunk)
+                if not chunks:
+                    del self._postings[key]
+        self._opaque.discard(footprint.chunk)
+
+    def related(self, footprint: ChunkFootprint) -> set[str]:
+        """Chunks sharing at least one location or referenced file."""
+        related: set[str] = set(self._opaque)
+        for key in footprint.index_keys():
+            related |= self._postings.get(key, set())
+        if footprint.opaque_references:
+            related |= {
+                chunk
+                for (kind, _), chunks in self._postings.items()
+                if kind == "reference"
+                for chunk in chunks
+            }
+        related.discard(footprint.chunk)
+        return related
+
+
 class ConflictOracle:
     """Analyzes potential conflicts between chunks for scheduling decisions.
 
     The oracle uses progressive analysis based on what information is available
     for each chunk, providing increasingly precise verdicts as chunks advance
     through their lifecycle.
+
+    An oracle instance keeps its footprint cache, index and verdict cache for
+    its lifetime; long-lived callers such as the scheduler should reuse one.
+    The caches are not locked, so a shared instance must only be used from
+    one thread at a time.
     """
 
     def __init__(self, project_dir: Path, store: StateStore):
@@ -58,6 +178,12 @@ class ConflictOracle:
         self.project_dir = project_dir
         self.store = store
         self.chunks = Chunks(project_dir)
+        self._footprints: dict[str, ChunkFootprint] = {}
+        # chunk -> (stat signature, time the signature was recorded)
+        self._signatures: dict[str, tuple[tuple, int]] = {}
+        self._index = FootprintIndex()
+        # (chunk_a, chunk_b) -> (digest_a, digest_b, analysis)
+        self._verdicts: dict[tuple[str, str], tuple[str, str, ConflictAnalysis]] = {}
 
     def analyze_conflict(self, chunk_a: str, chunk_b: str) -> ConflictAnalysis:
         """Analyze potential conflict between two chunks.
@@ -72,39 +198,195 @@ class ConflictOracle:
         Returns:
             ConflictAnalysis with verdict, confidence, and reasoning
         """
-        # Detect stages for both chunks
-        stage_a = self._detect_stage(chunk_a)
-        stage_b = self._detect_stage(chunk_b)
-
-        # Use the least precise stage (minimum information available)
-        stage_order = [
-            AnalysisStage.PROPOSED,
-            AnalysisStage.GOAL,
-            AnalysisStage.PLAN,
-            AnalysisStage.COMPLETED,
-        ]
-        stage_a_idx = stage_order.index(stage_a) if stage_a in stage_order else 0
-        stage_b_idx = stage_order.index(stage_b) if stage_b in stage_order else 0
-        analysis_stage = stage_order[min(stage_a_idx, stage_b_idx)]
+        return self.analyze_conflicts(chunk_a, [chunk_b])[chunk_b]
+
+    # Chunk: docs/chunks/orch_oracle_footprint_index - Batched analysis against a queue
+    def analyze_conflicts(
+        self, chunk: str, others: Iterable[str]
+    ) -> dict[str, ConflictAnalysis]:
+        """Analyze one chunk against several others and persist new analyses.
+
+        Only recomputed analyses are persisted; cached verdicts were saved
+        when they were computed. See evaluate_conflicts() for the analysis.
+
+        Args:
+            chunk: Chunk being checked
+            others: Chunks to compare it against
+
+        Returns:
+            Mapping of other chunk name to ConflictAnalysis
+        """
+        results, recomputed = self.evaluate_conflicts(chunk, others)
+        for analysis in recomputed:
+            self.store.save_conflict_analysis(analysis)
+        return results
+
+    def evaluate_conflicts(
+        self, chunk: str, others: Iterable[str]
+    ) -> tuple[dict[str, ConflictAnalysis], list[ConflictAnalysis]]:
+        """Analyze one chunk against several others without touching the store.
+
+        Each footprint is validated once per call. Pairs whose footprints are
+        unchanged since their last analysis reuse the cached verdict; the rest
+        are analyzed from footprints, with overlap checks limited to the chunks
+        the index relates to this one.
+
+        Args:
+            chunk: Chunk being checked
+            others: Chunks to compare it against
+
+        Returns:
+            Tuple of (mapping of other chunk name to ConflictAnalysis, the
+            analyses that were recomputed and still need persisting)
+        """
+        footprint = self.footprint(chunk)
+        others = [other for other in dict.fromkeys(others) if other != chunk]
+        other_footprints = {other: self.footprint(other) for other in others}
+        related = self._index.related(footprint)
+
+        results: dict[str, ConflictAnalysis] = {}
+        recomputed: list[ConflictAnalysis] = []
+        for other, other_footprint in other_footprints.items():
+            cached = self._verdicts.get((chunk, other))
+            if (
+                cached is not None
+                and cached[0] == footprint.digest
+                and cached[1] == other_footprint.digest
+            ):
+                analysis = cached[2]
+            else:
+                analysis = self._analyze_footprints(
+                    footprint, other_footprint, may_overlap=other in related
+                )
+                self._verdicts[(chunk, other)] = (
+                    footprint.digest,
+                    other_footprint.digest,
+                    analysis,
+                )
+                recomputed.append(analysis)
+            results[other] = analysis
+
+        return results, recomputed
+
+    def forget(self, chunk: str) -> None:
+        """Drop cached verdicts involving chunk so they are recomputed and saved.
+
+        Called when the chunk's persisted analyses are cleared, since cached
+        verdicts are not reported for persisting again.
+        """
+        self._verdicts = {
+            pair: cached for pair, cached in self._verdicts.items() if chunk not in pair
+        }
+
+    # Chunk: docs/chunks/orch_oracle_footprint_index - Footprint cache keyed by file hash
+    def footprint(self, chunk: str) -> ChunkFootprint:
+        """Return the chunk's footprint, rebuilding it only if its files changed.
+
+        Unchanged stat signatures are trusted outside a short racy window;
+        otherwise GOAL.md and PLAN.md are re-hashed and the footprint is only
+        rebuilt when the hash differs.
+        """
+        chunk_dir = self.chunks.chunk_dir / chunk
+        paths = (chunk_dir / "GOAL.md", chunk_dir / "PLAN.md")
+        stats = []
+        for path in paths:
+            try:
+                stat = path.stat()
+                stats.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+            except OSError:
+                stats.append(None)
+        signature = (chunk_dir.is_dir(), *stats)
+
+        cached = self._footprints.get(chunk)
+        recorded = self._signatures.get(chunk)
+        now_ns = time.time_ns()
+        if (
+            cached is not None
+            and recorded is not None
+            and recorded[0] == signature
+            and all(
+                stat is None or stat[0] < recorded[1] - _RACY_WINDOW_NS
+                for stat in stats
+            )
+        ):
+            return cached
+
+        hasher = hashlib.sha256(b"dir" if signature[0] else b"")
+        for path in paths:
+            try:
+                content = path.read_bytes()
+                hasher.update(b"\1" + len(content).to_bytes(8, "big") + content)
+            except OSError:
+                hasher.update(b"\0")
+        digest = hasher.hexdigest()
+        self._signatures[chunk] = (signature, now_ns)
+
+        if cached is not None and cached.digest == digest:
+            return cached
+
+        footprint = self._build_footprint(chunk, digest)
+        if cached is not None:
+            self._index.remove(cached)
+        self._index.add(footprint)
+        self._footprints[chunk] = footprint
+        return footprint
+
+    def _build_footprint(self, chunk: str, digest: str) -> ChunkFootprint:
+        refs = self._get_code_references(chunk)
+        reference_files: set[tuple[str, str]] = set()
+        opaque = False
+        for ref in refs:
+            try:
+                project, file_path, _ = parse_reference(qualify_ref(ref, "."))
+                reference_files.add((project, file_path))
+            except ValueError:
+                opaque = True
+
+        goal_content = ""
+        goal_path = self.chunks.get_chunk_goal_path(chunk)
+        if goal_path and goal_path.exists():
+            try:
+                goal_content = goal_path.read_text()
+            except Exception:
+                pass
+
+        return ChunkFootprint(
+            chunk=chunk,
+            digest=digest,
+            stage=self._detect_stage(chunk),
+            locations=frozenset(self._extract_locations_from_plan(chunk)),
+            code_references=tuple(refs),
+            reference_files=frozenset(reference_files),
+            opaque_references=opaque,
+            # Strip HTML comments to avoid false positives from template boilerplate
+            # (e.g., example paths like src/segment/writer.rs in the GOAL.md template)
+            goal_terms=frozenset(
+                self._significant_terms(self._strip_html_comments(goal_content))
+            ),
+        )
+
+    def _analyze_footprints(
+        self, footprint_a: ChunkFootprint, footprint_b: ChunkFootprint, may_overlap: bool
+    ) -> ConflictAnalysis:
+        """Analyze a pair at the least precise stage of the two footprints."""
+        stage_a_idx = _STAGE_ORDER.index(footprint_a.stage) if footprint_a.stage in _STAGE_ORDER else 0
+        stage_b_idx = _STAGE_ORDER.index(footprint_b.stage) if footprint_b.stage in _STAGE_ORDER else 0
+        analysis_stage = _STAGE_ORDER[min(stage_a_idx, stage_b_idx)]
 
         logger.info(
-            f"Analyzing conflict {chunk_a} vs {chunk_b} at stage {analysis_stage}"
+            f"Analyzing conflict {footprint_a.chunk} vs {footprint_b.chunk} "
+            f"at stage {analysis_stage}"
         )
 
         # Perform analysis based on stage
         if analysis_stage == AnalysisStage.COMPLETED:
-            analysis = self._analyze_completed_stage(chunk_a, chunk_b)
+            return self._analyze_completed_stage(footprint_a, footprint_b, may_overlap)
         elif analysis_stage == AnalysisStage.PLAN:
-            analysis = self._analyze_plan_stage(chunk_a, chunk_b)
+            return self._analyze_plan_stage(footprint_a, footprint_b)
         elif analysis_stage == AnalysisStage.GOAL:
-            analysis = self._analyze_goal_stage(chunk_a, chunk_b)
+            return self._analyze_goal_stage(footprint_a, footprint_b)
         else:
-            analysis = self._analyze_proposed_stage(chunk_a, chunk_b)
-
-        # Persist the analysis
-        self.store.save_conflict_analysis(analysis)
-
-        return analysis
+            return self._analyze_proposed_stage(footprint_a.chunk, footprint_b.chunk)
 
     def should_serialize(self, chunk_a: str, chunk_b: str) -> ConflictVerdict:
         """Main entry point: determine if two chunks should be serialized.
@@ -218,22 +500,28 @@ class ConflictOracle:
         return []
 
     def _analyze_completed_stage(
-        self, chunk_a: str, chunk_b: str
+        self,
+        footprint_a: ChunkFootprint,
+        footprint_b: ChunkFootprint,
+        may_overlap: bool = True,
     ) -> ConflictAnalysis:
         """Analyze conflict using code_references (highest precision).
 
         Uses the existing compute_symbolic_overlap() function for symbol-level
-        comparison.
+        comparison. Symbols can only overlap within one file, so the comparison
+        is skipped when the footprints reference no common file.
 
         Args:
-            chunk_a: First chunk name
-            chunk_b: Second chunk name
+            footprint_a: First chunk's footprint
+            footprint_b: Second chunk's footprint
+            may_overlap: False if the footprint index found nothing shared
 
         Returns:
             ConflictAnalysis with verdict based on symbol overlap
         """
-        refs_a = self._get_code_references(chunk_a)
-        refs_b = self._get_code_references(chunk_b)
+        chunk_a, chunk_b = footprint_a.chunk, footprint_b.chunk
+        refs_a = list(footprint_a.code_references)
+        refs_b = list(footprint_b.code_references)
 
         now = datetime.now(timezone.utc)
 
@@ -253,7 +541,16 @@ class ConflictOracle:
 
         # Use local project context for symbol comparison
         local_project = "."
-        has_overlap = compute_symbolic_overlap(refs_a, refs_b, local_project)
+        shares_file = (
+            footprint_a.opaque_references
+            or footprint_b.opaque_references
+            or bool(footprint_a.reference_files & footprint_b.reference_files)
+        )
+        has_overlap = (
+            may_overlap
+            and shares_file
+            and compute_symbolic_overlap(refs_a, refs_b, local_project)
+        )
 
         if has_overlap:
             # Find overlapping symbols for reporting
@@ -283,20 +580,23 @@ class ConflictOracle:
                 created_at=now,
             )
 
-    def _analyze_plan_stage(self, chunk_a: str, chunk_b: str) -> ConflictAnalysis:
+    def _analyze_plan_stage(
+        self, footprint_a: ChunkFootprint, footprint_b: ChunkFootprint
+    ) -> ConflictAnalysis:
         """Analyze conflict using Location: lines from PLAN.md.
 
         File-level overlap detection from plan files.
 
         Args:
-            chunk_a: First chunk name
-            chunk_b: Second chunk name
+            footprint_a: First chunk's footprint
+            footprint_b: Second chunk's footprint
 
         Returns:
             ConflictAnalysis with verdict based on file overlap
         """
-        locations_a = set(self._extract_locations_from_plan(chunk_a))
-        locations_b = set(self._extract_locations_from_plan(chunk_b))
+        chunk_a, chunk_b = footprint_a.chunk, footprint_b.chunk
+        locations_a = footprint_a.locations
+        locations_b = footprint_b.locations
 
         now = datetime.now(timezone.utc)
 
@@ -360,48 +660,27 @@ class ConflictOracle:
                 created_at=now,
             )
 
-    def _analyze_goal_stage(self, chunk_a: str, chunk_b: str) -> ConflictAnalysis:
+    def _analyze_goal_stage(
+        self, footprint_a: ChunkFootprint, footprint_b: ChunkFootprint
+    ) -> ConflictAnalysis:
         """Analyze conflict using GOAL.md content (LLM semantic analysis).
 
         For now, returns ASK_OPERATOR since LLM integration is complex.
         A future enhancement could use Claude to compare goal descriptions.
 
         Args:
-            chunk_a: First chunk name
-            chunk_b: Second chunk name
+            footprint_a: First chunk's footprint
+            footprint_b: Second chunk's footprint
 
         Returns:
             ConflictAnalysis with verdict based on goal comparison
         """
+        chunk_a, chunk_b = footprint_a.chunk, footprint_b.chunk
         now = datetime.now(timezone.utc)
 
-        # Read GOAL.md content for both chunks
-        goal_a_path = self.chunks.get_chunk_goal_path(chunk_a)
-        goal_b_path = self.chunks.get_chunk_goal_path(chunk_b)
-
-        goal_a_content = ""
-        goal_b_content = ""
-
-        if goal_a_path and goal_a_path.exists():
-            try:
-                goal_a_content = goal_a_path.read_text()
-            except Exception:
-                pass
-
-        if goal_b_path and goal_b_path.exists():
-            try:
-                goal_b_content = goal_b_path.read_text()
-            except Exception:
-                pass
-
-        # Strip HTML comments to avoid false positives from template boilerplate
-        # (e.g., example paths like src/segment/writer.rs in the GOAL.md template)
-        goal_a_cleaned = self._strip_html_comments(goal_a_content)
-        goal_b_cleaned = self._strip_html_comments(goal_b_content)
-
         # Simple heuristic: check for common terms that suggest overlap
         # This is a basic approach - LLM would be more accurate
-        overlap_terms = self._find_common_terms(goal_a_cleaned, goal_b_cleaned)
+        overlap_terms = sorted(footprint_a.goal_terms & footprint_b.goal_terms)[:10]
 
         if overlap_terms:
             return ConflictAnalysis(
@@ -530,32 +809,29 @@ class ConflictOracle:
         Returns:
             List of common significant terms
         """
-        # Simple word extraction (lowercase, alphanumeric only)
-        def extract_words(text: str) -> set[str]:
-            words = re.findall(r"\b[a-z_][a-z0-9_]+\b", text.lower())
-            # Filter out common words
-            stopwords = {
-                "the", "and", "for", "this", "that", "with", "from",
-                "will", "should", "must", "can", "may", "when", "where",
-                "which", "what", "how", "why", "are", "was", "were",
-                "been", "being", "have", "has", "had", "having", "does",
-                "did", "doing", "would", "could", "might", "shall",
-            }
-            return {w for w in words if len(w) > 3 and w not in stopwords}
+        common = self._significant_terms(text_a) & self._significant_terms(text_b)
+        return sorted(common)[:10]
 
-        words_a = extract_words(text_a)
-        words_b = extract_words(text_b)
+    def _significant_terms(self, text: str) -> set[str]:
+        """Extract the terms of a text that _find_common_terms compares.
 
-        common = words_a & words_b
-
-        # Filter to more significant terms
-        # Prioritize terms that look like identifiers
-        significant = [
-            w for w in common
-            if "_" in w or any(c.isupper() for c in w) or len(w) > 6
-        ]
+        Args:
+            text: Input text
 
-        return sorted(significant)[:10]
+        Returns:
+            Set of significant lowercase terms
+        """
+        # Simple word extraction (lowercase, alphanumeric only)
+        words = re.findall(r"\b[a-z_][a-z0-9_]+\b", text.lower())
+        # Filter out common words, then prioritize terms that look like
+        # identifiers
+        return {
+            w
+            for w in words
+            if len(w) > 3
+            and w not in _GOAL_STOPWORDS
+            and ("_" in w or len(w) > 6)
+        }
 
 
 def create_oracle(project_dir: Path, store: StateStore) -> ConflictOracle:
@@ -0,0 +1,620 @@
+# Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
+# Chunk: docs/chunks/orch_phase_log_writer - Buffered rotating phase log writer
+"""Storage for agent phase logs: buffered writes, rotation and an offset index.
+
+Each phase of a work unit logs JSON lines to ``{log_dir}/{phase}.txt``. For
+chatty agents that file receives thousands of records per phase, so rather
+than opening and closing it per record, :class:`PhaseLogWriter` keeps it open
+and buffers writes, flushing when the buffer fills or shortly after the last
+write.
+
+Offsets
+    Records are addressed by *logical* byte offsets: positions in the
+    concatenation of every segment the phase has ever written. Offsets keep
+    increasing across rotations, so a reader (or a log bus subscriber) can
+    remember one number per phase and never confuse a new segment with the
+    start of the old one.
+
+Rotation
+    When the active segment would exceed ``max_segment_bytes`` it is renamed
+    to ``{phase}.{base:012d}.txt``, where ``base`` is its first logical
+    offset, and compressed to ``.txt.gz`` on a background thread. The active
+    segment keeps the ``{phase}.txt`` name so readers that only know the
+    current file keep working.
+
+Index
+    ``{phase}.idx`` is a sidecar with a 16-byte header (magic and the logical
+    base of the active segment) followed by one fixed-width record per log
+    entry: its logical start offset and its timestamp. Entry ``i`` lives at
+    byte ``16 + 16 * i``, so readers can page through a log by entry number or
+    by time without reading the log itself.
+
+The index is derived data. A writer opening a phase log re-indexes anything
+the index does not cover (logs written before the index existed, or records
+flushed just before a crash) and drops entries that point past the data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import gzip
+import json
+import logging
+import os
+import re
+import shutil
+import struct
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Size at which the active segment is rotated out
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+# Buffered bytes that force a flush
+DEFAULT_BUFFER_BYTES = 64 * 1024
+
+# Seconds a record may sit in the buffer before it is flushed
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+INDEX_MAGIC = b"VEIDX1\0\0"
+_HEADER = struct.Struct("<8sQ")
+_ENTRY = struct.Struct("<Qd")
+INDEX_HEADER_SIZE = _HEADER.size
+INDEX_ENTRY_SIZE = _ENTRY.size
+
+
+def log_path(log_dir: Path, phase: str) -> Path:
+    """Path of the active segment for a phase."""
+    return log_dir / f"{phase}.txt"
+
+
+def index_path(log_dir: Path, phase: str) -> Path:
+    """Path of the offset index for a phase."""
+    return log_dir / f"{phase}.idx"
+
+
+def _entry_timestamp(line: bytes) -> float:
+    """Timestamp of a raw log line as a Unix time, or 0.0 if it has none."""
+    try:
+        return datetime.fromisoformat(json.loads(line)["timestamp"]).timestamp()
+    except (ValueError, KeyError, TypeError):
+        return 0.0
+
+
+# Chunk: docs/chunks/orch_phase_log_writer - Read-only view of the offset index
+@dataclass(frozen=True)
+class PhaseLogIndex:
+    """Snapshot of a phase's offset index.
+
+    Attributes:
+        base: Logical offset of the first byte of the active segment
+        entries: Packed index entries (see INDEX_ENTRY_SIZE)
+    """
+
+    base: int
+    entries: bytes
+
+    def __len__(self) -> int:
+        return len(self.entries) // INDEX_ENTRY_SIZE
+
+    def entry(self, i: int) -> tuple[int, float]:
+        """(logical offset, timestamp) of entry i."""
+        return _ENTRY.unpack_from(self.entries, i * INDEX_ENTRY_SIZE)
+
+    def offset(self, i: int) -> int:
+        return self.entry(i)[0]
+
+    def timestamp(self, i: int) -> float:
+        return self.entry(i)[1]
+
+
+def read_index(log_dir: Path, phase: str) -> PhaseLogIndex:
+    """Load a phase's offset index.
+
+    A missing or unrecognized index reads as empty with base 0.
+    """
+    try:
+        data = index_path(log_dir, phase).read_bytes()
+    except OSError:
+        return PhaseLogIndex(base=0, entries=b"")
+    if len(data) < INDEX_HEADER_SIZE:
+        return PhaseLogIndex(base=0, entries=b"")
+    magic, base = _HEADER.unpack_from(data)
+    if magic != INDEX_MAGIC:
+        return PhaseLogIndex(base=0, entries=b"")
+    usable = (len(data) - INDEX_HEADER_SIZE) // INDEX_ENTRY_SIZE * INDEX_ENTRY_SIZE
+    return PhaseLogIndex(
+        base=base, entries=data[INDEX_HEADER_SIZE:INDEX_HEADER_SIZE + usable]
+    )
+
+
+def _read_base(log_dir: Path, phase: str) -> int:
+    try:
+        with open(index_path(log_dir, phase), "rb") as f:
+            header = f.read(INDEX_HEADER_SIZE)
+    except OSError:
+        return 0
+    if len(header) < INDEX_HEADER_SIZE:
+        return 0
+    magic, base = _HEADER.unpack(header)
+    return base if magic == INDEX_MAGIC else 0
+
+
+def rotated_segments(log_dir: Path, phase: str) -> list[tuple[int, Path]]:
+    """Rotated segments of a phase as (logical base, path), oldest first.
+
+    A segment still being compressed is returned as its uncompressed file.
+    """
+    pattern = re.compile(rf"^{re.escape(phase)}\.(\d+)\.txt(\.gz)?$")
+    segments: dict[int, Path] = {}
+    try:
+        names = os.listdir(log_dir)
+    except OSError:
+        return []
+    for name in names:
+        match = pattern.match(name)
+        if match is None:
+            continue
+        base = int(match.group(1))
+        # Prefer the plain file while compression is in progress
+        if match.group(2) is None or base not in segments:
+            segments[base] = log_dir / name
+    return sorted(segments.items())
+
+
+def log_end(log_dir: Path, phase: str) -> int:
+    """Logical offset just past the last byte written to disk for a phase."""
+    for _ in range(3):
+        base = _read_base(log_dir, phase)
+        try:
+            size = log_path(log_dir, phase).stat().st_size
+        except OSError:
+            size = 0
+        # A rotation between the two reads changes the base; read again
+        if _read_base(log_dir, phase) == base:
+            return base + size
+    return base + size
+
+
+# Attempts at a consistent view of the segments while rotation moves them
+_READ_ATTEMPTS = 3
+
+
+def _segments(log_dir: Path, phase: str) -> list[tuple[int, Path, Optional[int]]]:
+    """Segments of a phase as (logical base, path, logical end), oldest first.
+
+    The active segment comes last with an end of None. Retries when a
+    rotation lands between listing the segments and reading the base.
+    """
+    for _ in range(_READ_ATTEMPTS):
+        base = _read_base(log_dir, phase)
+        rotated = rotated_segments(log_dir, phase)
+        if _read_base(log_dir, phase) == base and all(b < base for b, _ in rotated):
+            break
+    bases = [b for b, _ in rotated] + [base]
+    segments = [(b, path, bases[i + 1]) for i, (b, path) in enumerate(rotated)]
+    segments.append((base, log_path(log_dir, phase), None))
+    return segments
+
+
+def _iter_raw(
+    log_dir: Path,
+    phase: str,
+    start: int,
+    end: Optional[int],
+) -> Iterator[tuple[int, bytes]]:
+    """Yield (logical offset, raw line) for complete records in [start, end)."""
+    position = start
+    for _ in range(_READ_ATTEMPTS):
+        retry = False
+        for base, path, segment_end in _segments(log_dir, phase):
+            if segment_end is not None and position >= segment_end:
+                continue
+            position = max(position, base)
+            if end is not None and position >= end:
+                return
+            opener = gzip.open if path.suffix == ".gz" else open
+            try:
+                f = opener(path, "rb")
+            except FileNotFoundError:
+                if segment_end is None:
+                    # No active segment yet
+                    return
+                # Compressed while listing; list again
+                retry = True
+                break
+            with f:
+                if segment_end is None and _read_base(log_dir, phase) != base:
+                    # Rotated after listing; this file starts at a new base
+                    retry = True
+                    break
+                try:
+                    f.seek(position - base)
+                    for raw in f:
+                        if end is not None and position >= end:
+                            return
+                        if not raw.endswith(b"\n"):
+                            break
+                        yield position, raw
+                        position += len(raw)
+                except (OSError, EOFError) as e:
+                    logger.warning(f"Failed to read log segment {path}: {e}")
+            if segment_end is None:
+                return
+            # Skip a partial record at the end of a rotated segment
+            position = max(position, segment_end)
+        if not retry:
+            return
+
+
+# Chunk: docs/chunks/orch_paged_log_view - Streaming reads across segments
+def iter_records(
+    log_dir: Path,
+    phase: str,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[tuple[int, str]]:
+    """Yield complete records of a phase one at a time, across segments.
+
+    Reads incrementally, so callers can show the first records of a large
+    log before the rest is read.
+
+    Args:
+        log_dir: Log directory of the work unit
+        phase: Lowercase phase name
+        start: Logical offset to read from
+        end: Logical offset to stop before, or None to read to the end
+
+    Yields:
+        (logical offset, line) pairs
+    """
+    for offset, raw in _iter_raw(log_dir, phase, start, end):
+        yield offset, raw.decode(errors="replace")
+
+
+# Chunk: docs/chunks/orch_phase_log_writer - Reads across rotated segments
+def read_records(
+    log_dir: Path,
+    phase: str,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> tuple[list[tuple[int, str]], int]:
+    """Read complete records at or after a logical offset, across segments.
+
+    A trailing line without a newline is a record still being written and is
+    left for the next read. If start falls in a segment that no longer
+    exists, reading resumes at the oldest remaining data.
+
+    Args:
+        log_dir: Log directory of the work unit
+        phase: Lowercase phase name
+        start: Logical offset to read from
+        end: Logical offset to stop before, or None to read to the end
+
+    Returns:
+        Tuple of (records, position): (logical offset, line) pairs and the
+        logical offset just past the last complete record.
+    """
+    records = []
+    position = start
+    for offset, raw in _iter_raw(log_dir, phase, start, end):
+        records.append((offset, raw.decode(errors="replace")))
+        position = offset + len(raw)
+    return records, position
+
+
+# Chunk: docs/chunks/orch_paged_log_view - One page of a phase log
+@dataclass
+class LogPage:
+    """A contiguous run of entries from one phase log.
+
+    Attributes:
+        phase: Lowercase phase name
+        first: Entry number of the first record (0 is the first entry ever
+            written to the phase)
+        total: Entries in the phase log when the page was read
+        records: (logical offset, line) pairs
+        end: Logical offset just past the phase's last entry, where a
+            follower would continue reading
+    """
+
+    phase: str
+    first: int
+    total: int
+    records: list[tuple[int, str]]
+    end: int
+
+
+# Chunk: docs/chunks/orch_paged_log_view - Index-backed range reads
+def read_page(
+    log_dir: Path,
+    phase: str,
+    start: Optional[int] = None,
+    count: Optional[int] = None,
+    last: Optional[int] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+) -> LogPage:
+    """Read a range of entries from a phase log without scanning it.
+
+    Entries are located through the offset index, so only the bytes of the
+    requested entries are read. Records the index does not cover yet (a log
+    written before indexing, before a writer next opens it) are found by
+    scanning from the last indexed entry.
+
+    Filters combine: the time window is applied first, then ``start`` and
+    ``last`` narrow the window from the front and back, then ``count``
+    caps the page.
+
+    Args:
+        log_dir: Log directory of the work unit
+        phase: Lowercase phase name
+        start: First entry number to include
+        count: Maximum entries to return
+        last: Return only the last N entries of the window
+        since: Earliest entry timestamp to include (Unix time)
+        until: Latest entry timestamp to include (Unix time)
+
+    Returns:
+        The selected LogPage
+    """
+    index = read_index(log_dir, phase)
+    indexed = len(index)
+    tail_from = index.offset(indexed - 1) if indexed else 0
+    tail, end = read_records(log_dir, phase, tail_from)
+    if indexed:
+        tail = [record for record in tail if record[0] > tail_from]
+    total = indexed + len(tail)
+
+    def offset(i: int) -> int:
+        return index.offset(i) if i < indexed else tail[i - indexed][0]
+
+    def timestamp(i: int) -> float:
+        if i < indexed:
+            return index.timestamp(i)
+        return _entry_timestamp(tail[i - indexed][1].encode())
+
+    lo, hi = 0, total
+    if since is not None:
+        lo = bisect.bisect_left(range(total), since, key=timestamp)
+    if until is not None:
+        hi = bisect.bisect_right(range(total), until, key=timestamp)
+    if start is not None:
+        lo = max(lo, start)
+    if last is not None:
+        lo = max(lo, hi - last)
+    if count is not None:
+        hi = min(hi, lo + count)
+
+    records: list[tuple[int, str]] = []
+    if lo < hi:
+        stop = offset(hi) if hi < total else end
+        records, _ = read_records(log_dir, phase, offset(lo), stop)
+        records = records[: hi - lo]
+    return LogPage(phase=phase, first=lo, total=total, records=records, end=end)
+
+
+def _compress_segment(path: Path) -> None:
+    """Gzip a rotated segment and remove the uncompressed copy."""
+    target = path.with_name(path.name + ".gz")
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        with open(path, "rb") as src, gzip.open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp, target)
+        path.unlink()
+    except OSError as e:
+        logger.warning(f"Failed to compress log segment {path}: {e}")
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+class PhaseLogWriter:
+    """Append-only, buffered writer for one phase log.
+
+    Safe to call from any thread. When called on an event loop, buffered
+    records are flushed from a loop timer shortly after the last write;
+    without a running loop every write is flushed immediately.
+
+    Args:
+        log_dir: Log directory of the work unit (created if needed)
+        phase: Lowercase phase name
+        max_segment_bytes: Rotate the active segment before it exceeds this
+        buffer_bytes: Flush once this many bytes are buffered
+        flush_interval: Seconds a buffered record may wait for a flush
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        phase: str,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_dir = log_dir
+        self.phase = phase
+        self.max_segment_bytes = max_segment_bytes
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._data: list[bytes] = []
+        self._entries: list[bytes] = []
+        self._buffered = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._file = None
+        self._index = None
+        self._open()
+
+    @property
+    def path(self) -> Path:
+        return log_path(self.log_dir, self.phase)
+
+    def _open(self) -> None:
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+
+        path = index_path(self.log_dir, self.phase)
+        self._index = open(path, "r+b" if path.exists() else "w+b", buffering=0)
+        fd = self._index.fileno()
+        data = b""
+        length = os.fstat(fd).st_size
+        if length:
+            data = os.pread(fd, length, 0)
+
+        base = 0
+        entries = b""
+        if len(data) >= INDEX_HEADER_SIZE and data[:8] == INDEX_MAGIC:
+            _, base = _HEADER.unpack_from(data)
+            usable = (len(data) - INDEX_HEADER_SIZE) // INDEX_ENTRY_SIZE * INDEX_ENTRY_SIZE
+            entries = data[INDEX_HEADER_SIZE:INDEX_HEADER_SIZE + usable]
+        # With no usable index (a new phase, or a log written before
+        # indexing), or a crash between renaming a segment and recording the
+        # new base, continue after the last rotated segment
+        segments = rotated_segments(self.log_dir, self.phase)
+        if segments and segments[-1][0] >= base:
+            last_base, last_path = segments[-1]
+            if last_path.suffix == ".gz":
+                with gzip.open(last_path, "rb") as f:
+                    last_size = f.seek(0, os.SEEK_END)
+            else:
+                last_size = last_path.stat().st_size
+            base = last_base + last_size
+        self._base = base
+
+        # Drop entries past the end of the data, then index whatever the
+        # index does not cover yet
+        end = base + self._size
+        count = len(entries) // INDEX_ENTRY_SIZE
+        while count and _ENTRY.unpack_from(entries, (count - 1) * INDEX_ENTRY_SIZE)[0] >= end:
+            count -= 1
+        indexed_to = base
+        if count:
+            last_offset = _ENTRY.unpack_from(entries, (count - 1) * INDEX_ENTRY_SIZE)[0]
+            if last_offset >= base:
+                count -= 1
+                indexed_to = last_offset
+            else:
+                indexed_to = base
+
+        os.ftruncate(fd, INDEX_HEADER_SIZE + count * INDEX_ENTRY_SIZE)
+        os.pwrite(fd, _HEADER.pack(INDEX_MAGIC, base), 0)
+        if indexed_to < end:
+            self._reindex(indexed_to, count)
+
+    def _reindex(self, start: int, count: int) -> None:
+        """Append index entries for the active segment from a logical offset."""
+        with open(self.path, "rb") as f:
+            f.seek(start - self._base)
+            data = f.read()
+        position = start
+        packed = []
+        for raw in data.splitlines(keepends=True):
+            if not raw.endswith(b"\n"):
+                break
+            packed.append(_ENTRY.pack(position, _entry_timestamp(raw)))
+            position += len(raw)
+        os.pwrite(
+            self._index.fileno(),
+            b"".join(packed),
+            INDEX_HEADER_SIZE + count * INDEX_ENTRY_SIZE,
+        )
+
+    def write(self, line: str, timestamp: float) -> tuple[int, int]:
+        """Append one record.
+
+        Args:
+            line: The JSON line, including its trailing newline
+            timestamp: Record time as a Unix timestamp, for the index
+
+        Returns:
+            (start, end) logical offsets of the record
+        """
+        data = line.encode()
+        with self._lock:
+            if self._file is None:
+                raise ValueError("write to closed PhaseLogWriter")
+            if self._size and self._size + len(data) > self.max_segment_bytes:
+                self._rotate()
+            start = self._base + self._size
+            self._data.append(data)
+            self._entries.append(_ENTRY.pack(start, timestamp))
+            self._size += len(data)
+            self._buffered += len(data)
+            if self._buffered >= self.buffer_bytes:
+                self._flush_locked()
+            else:
+                self._schedule_flush()
+        return start, start + len(data)
+
+    def _schedule_flush(self) -> None:
+        if self.flush_interval <= 0:
+            self._flush_locked()
+            return
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to flush from later
+            self._flush_locked()
+            return
+        self._flush_handle = loop.call_later(self.flush_interval, self.flush)
+
+    def flush(self) -> None:
+        """Write buffered records and their index entries to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._data or self._file is None:
+            return
+        # Data before index, so the index never points past the data
+        self._file.write(b"".join(self._data))
+        self._file.flush()
+        fd = self._index.fileno()
+        os.pwrite(fd, b"".join(self._entries), os.fstat(fd).st_size)
+        self._data.clear()
+        self._entries.clear()
+        self._buffered = 0
+
+    def _rotate(self) -> None:
+        """Move the active segment aside and start a new one."""
+        self._flush_locked()
+        self._file.close()
+        rotated = self.log_dir / f"{self.phase}.{self._base:012d}.txt"
+        os.replace(self.path, rotated)
+        self._base += self._size
+        self._size = 0
+        os.pwrite(self._index.fileno(), _HEADER.pack(INDEX_MAGIC, self._base), 0)
+        self._file = open(self.path, "ab")
+        threading.Thread(
+            target=_compress_segment,
+            args=(rotated,),
+            name="log-compress",
+            daemon=True,
+        ).start()
+
+    def close(self) -> None:
+        """Flush and close. Further writes raise ValueError."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush_locked()
+            self._file.close()
+            self._file = None
+            self._index.close()
+            self._index = None
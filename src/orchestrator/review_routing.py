@@ -61,7 +61,7 @@ class ReviewRoutingCallbacks(Protocol):
         """Mark work unit as needing operator attention."""
         ...
 
-    def update_work_unit(self, work_unit: WorkUnit) -> None:
+    async def update_work_unit(self, work_unit: WorkUnit) -> None:
         """Persist work unit changes to the store."""
         ...
 
@@ -214,7 +214,7 @@ async def route_review_decision(
         work_unit.updated_at = __import__("datetime").datetime.now(
             __import__("datetime").timezone.utc
         )
-        callbacks.update_work_unit(work_unit)
+        await callbacks.update_work_unit(work_unit)
 
         if work_unit.review_nudge_count < config.max_nudges:
             # Continue the session with a nudge prompt
@@ -235,7 +235,7 @@ async def route_review_decision(
             work_unit.updated_at = __import__("datetime").datetime.now(
                 __import__("datetime").timezone.utc
             )
-            callbacks.update_work_unit(work_unit)
+            await callbacks.update_work_unit(work_unit)
 
             await callbacks.broadcast_work_unit_update(
                 chunk=work_unit.chunk,
@@ -314,7 +314,7 @@ async def _apply_review_decision(
         # Chunk: docs/chunks/orch_implement_reentry_prompt - Reset implement iterations on APPROVE
         work_unit.implement_iterations = 0
         work_unit.updated_at = datetime.now(timezone.utc)
-        callbacks.update_work_unit(work_unit)
+        await callbacks.update_work_unit(work_unit)
         await callbacks.advance_phase(work_unit)
 
     elif review_result.decision == ReviewDecision.FEEDBACK:
@@ -354,7 +354,7 @@ async def _apply_review_decision(
         work_unit.session_id = None  # Fresh session for re-implementation
         work_unit.attention_reason = None
         work_unit.updated_at = datetime.now(timezone.utc)
-        callbacks.update_work_unit(work_unit)
+        await callbacks.update_work_unit(work_unit)
 
         # Broadcast via WebSocket
         await callbacks.broadcast_work_unit_update(
@@ -370,7 +370,7 @@ async def _apply_review_decision(
         work_unit.review_nudge_count = 0  # Reset nudge count
         work_unit.session_id = session_id  # Preserve session for resume with operator answer
         work_unit.updated_at = datetime.now(timezone.utc)
-        callbacks.update_work_unit(work_unit)
+        await callbacks.update_work_unit(work_unit)
         await callbacks.mark_needs_attention(
             work_unit,
             f"Review escalated: {review_result.reason or review_result.summary}",
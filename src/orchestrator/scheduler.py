@@ -11,6 +11,8 @@
 # Chunk: docs/chunks/scheduler_decompose - Decomposed into focused modules
 # Chunk: docs/chunks/optimistic_locking - Optimistic locking for stale write detection
 # Chunk: docs/chunks/finalization_recovery - Crash recovery for incomplete finalization
+# Chunk: docs/chunks/orch_async_state_store - StateStore access off the event loop
+# Chunk: docs/chunks/orch_event_dispatch - Dispatch on state changes and retry deadlines
 """Scheduler for dispatching work units to agents.
 
 The scheduler runs a background loop that:
@@ -21,13 +23,17 @@ The scheduler runs a background loop that:
 """
 
 import asyncio
+import heapq
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 
 # Chunk: docs/chunks/reviewer_decision_tool - ReviewDecision tool for explicit review decisions
 from orchestrator.agent import AgentRunner, create_log_callback
+from orchestrator.async_state import AsyncStateStore
+from orchestrator.git_runner import GitRunner
 from orchestrator.models import (
     AgentResult,
     ConflictVerdict,
@@ -68,6 +74,8 @@ from orchestrator.retry import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class SchedulerError(Exception):
     """Exception raised for scheduler-related errors."""
@@ -182,9 +190,9 @@ class _SchedulerReviewCallbacks:
         """Mark work unit as needing operator attention."""
         await self._scheduler._mark_needs_attention(work_unit, reason)
 
-    def update_work_unit(self, work_unit: WorkUnit) -> None:
+    async def update_work_unit(self, work_unit: WorkUnit) -> None:
         """Persist work unit changes to the store."""
-        self._scheduler.store.update_work_unit(work_unit)
+        await self._scheduler.async_store.update_work_unit(work_unit)
 
     async def broadcast_work_unit_update(
         self, chunk: str, status: str, phase: str
@@ -211,7 +219,7 @@ class Scheduler:
 
         Pattern:
             work_unit.status = WorkUnitStatus.RUNNING
-            self.store.update_work_unit(work_unit)
+            await self.async_store.update_work_unit(work_unit)
             await broadcast_work_unit_update(
                 chunk=work_unit.chunk,
                 status=work_unit.status.value,
@@ -228,6 +236,8 @@ class Scheduler:
         agent_runner: AgentRunner,
         config: OrchestratorConfig,
         project_dir: Path,
+        async_store: Optional[AsyncStateStore] = None,
+        git_runner: Optional[GitRunner] = None,
     ):
         """Initialize the scheduler.
 
@@ -237,9 +247,19 @@ class Scheduler:
             agent_runner: Agent runner for phase execution
             config: Scheduler configuration
             project_dir: Root project directory
+            async_store: Awaitable facade over store. Pass the one shared with
+                the API server so all writes go through a single writer
+                thread; a private one is created if omitted.
+            git_runner: Runner for git operations. Pass the one shared with
+                the API server so merges into the same repository are
+                serialized; a private one is created if omitted.
         """
         self.store = store
+        # Chunk: docs/chunks/orch_async_state_store - All loop-side store access goes through here
+        self.async_store = async_store if async_store is not None else AsyncStateStore(store)
         self.worktree_manager = worktree_manager
+        # Chunk: docs/chunks/orch_async_git_runner - Worktree git work runs off the loop
+        self.git_runner = git_runner if git_runner is not None else GitRunner()
         self.agent_runner = agent_runner
         self.config = config
         self.project_dir = project_dir
@@ -248,6 +268,39 @@ class Scheduler:
         self._stop_event = asyncio.Event()
         self._lock = asyncio.Lock()
 
+        # Chunk: docs/chunks/orch_event_dispatch - Wakeup signal and retry timer heap
+        # Set whenever something may have made a unit dispatchable; the loop
+        # otherwise sleeps until the earliest retry deadline or the fallback tick.
+        self._wakeup = asyncio.Event()
+        self._retry_deadlines: list[datetime] = []
+        self._retry_deadline_set: set[datetime] = set()
+        self.async_store.add_change_listener(self._on_store_change)
+
+        # Chunk: docs/chunks/orch_oracle_footprint_index - Oracle caches live across checks
+        self._oracle = None
+        # The oracle reads and hashes chunk files; it runs on its own thread so
+        # neither the loop nor the store's writer thread waits on that I/O.
+        # One worker keeps the oracle's unlocked caches single-threaded.
+        self._oracle_executor: Optional[ThreadPoolExecutor] = None
+
+    # Chunk: docs/chunks/orch_async_git_runner - Serialized worktree operations
+    async def _git(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a WorktreeManager operation that modifies the repository.
+
+        The operation runs on a git worker thread, serialized with every
+        other modifying operation on this project's repository.
+        """
+        return await self.git_runner.call(self.project_dir, fn, *args, **kwargs)
+
+    async def _oracle_call(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run an oracle method on the oracle thread."""
+        if self._oracle_executor is None:
+            self._oracle_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="conflict-oracle"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._oracle_executor, fn, *args)
+
     @property
     def running_count(self) -> int:
         """Get the number of currently running agents."""
@@ -272,16 +325,20 @@ class Scheduler:
         await self._recover_from_crash()
 
         while not self._stop_event.is_set():
+            # Changes made during the tick set the event again and trigger
+            # another tick straight away
+            self._wakeup.clear()
+            self._pop_due_retry_deadlines()
             try:
                 await self._dispatch_tick()
             except Exception as e:
                 logger.error(f"Error in dispatch tick: {e}")
 
-            # Wait for next tick or stop signal
+            # Wait for a wakeup, the next retry deadline, or the fallback tick
             try:
                 await asyncio.wait_for(
-                    self._stop_event.wait(),
-                    timeout=self.config.dispatch_interval_seconds,
+                    self._wakeup.wait(),
+                    timeout=self._next_wakeup_timeout(),
                 )
             except asyncio.TimeoutError:
                 pass
@@ -296,6 +353,7 @@ class Scheduler:
         """
         logger.info("Stopping scheduler...")
         self._stop_event.set()
+        self._wakeup.set()
 
         # Wait for running agents to complete
         if self._running_agents:
@@ -312,6 +370,51 @@ class Scheduler:
                 for task in tasks:
                     task.cancel()
 
+        if self._oracle_executor is not None:
+            self._oracle_executor.shutdown(wait=False)
+            self._oracle_executor = None
+
+    # Chunk: docs/chunks/orch_event_dispatch - Wake the dispatch loop
+    def wake(self) -> None:
+        """Request a dispatch tick as soon as the loop is free.
+
+        Called automatically for every write through async_store and when an
+        agent task finishes; other components may call it directly.
+        """
+        self._wakeup.set()
+
+    def _on_store_change(self, work_unit: Optional[WorkUnit]) -> None:
+        """Change listener: wake the loop and track retry deadlines."""
+        if (
+            work_unit is not None
+            and work_unit.status == WorkUnitStatus.READY
+            and work_unit.next_retry_at is not None
+        ):
+            self._schedule_retry_deadline(work_unit.next_retry_at)
+        self.wake()
+
+    def _schedule_retry_deadline(self, when: datetime) -> None:
+        """Make sure the loop wakes up at ``when``."""
+        if when not in self._retry_deadline_set:
+            self._retry_deadline_set.add(when)
+            heapq.heappush(self._retry_deadlines, when)
+
+    def _pop_due_retry_deadlines(self) -> None:
+        """Drop deadlines the upcoming tick will handle."""
+        now = datetime.now(timezone.utc)
+        while self._retry_deadlines and self._retry_deadlines[0] <= now:
+            self._retry_deadline_set.discard(heapq.heappop(self._retry_deadlines))
+
+    def _next_wakeup_timeout(self) -> float:
+        """Seconds until the earliest retry deadline, capped by the fallback tick."""
+        timeout = self.config.dispatch_interval_seconds
+        if self._retry_deadlines:
+            until_deadline = (
+                self._retry_deadlines[0] - datetime.now(timezone.utc)
+            ).total_seconds()
+            timeout = min(timeout, max(0.0, until_deadline))
+        return timeout
+
     # Chunk: docs/chunks/persist_retry_state - Preserve retry backoff across daemon restarts
     async def _recover_from_crash(self) -> None:
         """Recover from a previous daemon crash.
@@ -327,7 +430,7 @@ class Scheduler:
         logger.info("Checking for recovery from previous crash...")
 
         # Get all RUNNING work units
-        running_units = self.store.list_work_units(status=WorkUnitStatus.RUNNING)
+        running_units = await self.async_store.list_work_units(status=WorkUnitStatus.RUNNING)
 
         for unit in running_units:
             logger.warning(f"Found orphaned RUNNING work unit: {unit.chunk}")
@@ -353,7 +456,7 @@ class Scheduler:
                     f"(attempt {unit.api_retry_count}, backoff {backoff.total_seconds():.1f}s)"
                 )
 
-            self.store.update_work_unit(unit)
+            await self.async_store.update_work_unit(unit)
 
         # Chunk: docs/chunks/orch_worktree_retain - Retain worktrees after completion
         # Detect orphaned worktrees but do NOT remove them automatically.
@@ -363,7 +466,7 @@ class Scheduler:
         orphaned_count = 0
 
         for chunk in worktrees:
-            unit = self.store.get_work_unit(chunk)
+            unit = await self.async_store.get_work_unit(chunk)
             if unit is not None and unit.status == WorkUnitStatus.RUNNING:
                 # Active agent - skip counting
                 continue
@@ -394,12 +497,12 @@ class Scheduler:
         # Chunk: docs/chunks/finalization_recovery - Recover incomplete finalizations
         # After handling RUNNING work units, check for work units that crashed during
         # finalization (worktree removed but merge not completed)
-        incomplete_finalizations = self._find_incomplete_finalizations()
+        incomplete_finalizations = await self._find_incomplete_finalizations()
         for chunk in incomplete_finalizations:
-            self._recover_incomplete_finalization(chunk)
+            await self._recover_incomplete_finalization(chunk)
 
     # Chunk: docs/chunks/finalization_recovery - Detect work units that crashed during finalization
-    def _find_incomplete_finalizations(self) -> list[str]:
+    async def _find_incomplete_finalizations(self) -> list[str]:
         """Find work units that crashed during finalization.
 
         Looks for work units where:
@@ -416,10 +519,10 @@ class Scheduler:
         # Get work units in terminal state that might have incomplete finalization
         # Check COMPLETE phase (normal finalization crash) or DONE status (rare case)
         complete_phase_units = [
-            u for u in self.store.list_work_units()
+            u for u in await self.async_store.list_work_units()
             if u.phase == WorkUnitPhase.COMPLETE
         ]
-        done_units = self.store.list_work_units(status=WorkUnitStatus.DONE)
+        done_units = await self.async_store.list_work_units(status=WorkUnitStatus.DONE)
 
         # Deduplicate by chunk name (a DONE unit in COMPLETE phase appears in both lists)
         seen_chunks: set[str] = set()
@@ -434,7 +537,7 @@ class Scheduler:
             branch = self.worktree_manager.get_branch_name(chunk)
 
             # Check if branch exists
-            if not self.worktree_manager._branch_exists(branch):
+            if not await self.git_runner.query(self.worktree_manager._branch_exists, branch):
                 continue
 
             # Check if worktree has been removed (crash was after worktree removal)
@@ -443,7 +546,7 @@ class Scheduler:
 
             # Check if branch has changes ahead of base (merge wasn't completed)
             # If no changes, just need branch cleanup
-            has_changes = self.worktree_manager.has_changes(chunk)
+            has_changes = await self.git_runner.query(self.worktree_manager.has_changes, chunk)
             if has_changes:
                 logger.warning(
                     f"Found incomplete finalization for {chunk}: branch {branch} exists "
@@ -455,12 +558,12 @@ class Scheduler:
                 logger.info(
                     f"Found dangling branch for {chunk} with no changes, cleaning up"
                 )
-                self.worktree_manager.delete_branch(chunk)
+                await self._git(self.worktree_manager.delete_branch, chunk)
 
         return incomplete
 
     # Chunk: docs/chunks/finalization_recovery - Recover a single incomplete finalization
-    def _recover_incomplete_finalization(self, chunk: str) -> None:
+    async def _recover_incomplete_finalization(self, chunk: str) -> None:
         """Recover a work unit that crashed during finalization.
 
         Attempts to complete the merge to base. On conflict, escalates
@@ -473,14 +576,14 @@ class Scheduler:
 
         try:
             # Attempt to complete the merge
-            self.worktree_manager.merge_to_base(chunk, delete_branch=True)
+            await self._git(self.worktree_manager.merge_to_base, chunk, delete_branch=True)
 
             logger.warning(
                 f"Auto-recovered incomplete finalization for {chunk}: merged to base"
             )
 
             # Get the work unit to update status and unblock dependents
-            unit = self.store.get_work_unit(chunk)
+            unit = await self.async_store.get_work_unit(chunk)
             if unit is not None:
                 # If still in COMPLETE phase, transition to DONE
                 if unit.phase == WorkUnitPhase.COMPLETE and unit.status != WorkUnitStatus.DONE:
@@ -489,10 +592,10 @@ class Scheduler:
                     unit.api_retry_count = 0
                     unit.next_retry_at = None
                     unit.updated_at = datetime.now(timezone.utc)
-                    self.store.update_work_unit(unit)
+                    await self.async_store.update_work_unit(unit)
 
                     # Unblock any dependents that were waiting on this chunk
-                    unblock_dependents(self.store, chunk)
+                    await self.async_store.run_write(unblock_dependents, chunk)
 
         except WorktreeError as e:
             # Merge conflict - escalate to NEEDS_ATTENTION
@@ -501,7 +604,7 @@ class Scheduler:
                 f"escalating to NEEDS_ATTENTION"
             )
 
-            unit = self.store.get_work_unit(chunk)
+            unit = await self.async_store.get_work_unit(chunk)
             if unit is not None:
                 reason = (
                     f"Crash during finalization left unmerged branch '{branch}'. "
@@ -511,7 +614,7 @@ class Scheduler:
                 unit.status = WorkUnitStatus.NEEDS_ATTENTION
                 unit.attention_reason = reason
                 unit.updated_at = datetime.now(timezone.utc)
-                self.store.update_work_unit(unit)
+                await self.async_store.update_work_unit(unit)
 
     async def _dispatch_tick(self) -> None:
         """Execute one dispatch cycle.
@@ -534,22 +637,36 @@ class Scheduler:
             if slots <= 0:
                 return
 
-            # Get ready queue
-            ready_units = self.store.get_ready_queue(limit=slots)
-
-            for unit in ready_units:
+            # Chunk: docs/chunks/orch_dispatch_candidates - Lazy candidate iteration until slots fill
+            # Units in retry backoff or already known to be blocked are
+            # filtered in SQL, so they can't take the rows meant for
+            # dispatchable work. The earliest backoff expiry gets a timer.
+            next_retry_at = await self.async_store.get_next_retry_at()
+            if next_retry_at is not None:
+                self._schedule_retry_deadline(next_retry_at)
+
+            async for unit in self.async_store.iter_dispatch_candidates(batch_size=slots):
+                if self.available_slots <= 0:
+                    break
                 if unit.chunk in self._running_agents:
                     continue  # Already running
 
                 # Chunk: docs/chunks/orch_api_retry - Respect retry backoff timing
                 if unit.next_retry_at is not None:
                     if datetime.now(timezone.utc) < unit.next_retry_at:
-                        # Not ready yet - still in backoff period
+                        # Not ready yet - still in backoff period. Units whose
+                        # backoff was set before start-up have no timer yet.
+                        self._schedule_retry_deadline(unit.next_retry_at)
                         continue
                     # Backoff period elapsed - clear the retry timestamp
+                    # Chunk: docs/chunks/orch_work_unit_dirty_fields - Two-column CAS instead of a full rewrite
                     unit.next_retry_at = None
                     unit.updated_at = datetime.now(timezone.utc)
-                    self.store.update_work_unit(unit)
+                    try:
+                        await self.async_store.compare_and_swap_work_unit(unit)
+                    except StaleWriteError:
+                        # Changed since it was read; the next tick sees the new state
+                        continue
 
                 blocking_chunks = await self._check_conflicts(unit)
                 if blocking_chunks:
@@ -563,6 +680,8 @@ class Scheduler:
                     self._run_work_unit(unit),
                     name=f"agent-{unit.chunk}",
                 )
+                # A finished agent frees a slot
+                task.add_done_callback(lambda _task: self.wake())
                 self._running_agents[unit.chunk] = task
 
                 logger.info(
@@ -593,7 +712,7 @@ class Scheduler:
         # unit (e.g., PATCH /work-units/{chunk} to NEEDS_ATTENTION). This guard
         # prevents wasted work (worktree creation, activation) when the work unit
         # is no longer eligible for dispatch.
-        fresh_unit = self.store.get_work_unit(chunk)
+        fresh_unit = await self.async_store.get_work_unit(chunk)
         if fresh_unit is None:
             logger.warning(
                 f"Skipping dispatch for {chunk}: work unit was deleted"
@@ -614,7 +733,7 @@ class Scheduler:
         try:
             # Create worktree
             logger.info(f"Creating worktree for {chunk}")
-            worktree_path = self.worktree_manager.create_worktree(chunk)
+            worktree_path = await self._git(self.worktree_manager.create_worktree, chunk)
             # Chunk: docs/chunks/orch_worktree_cleanup - Worktree cleanup on activation failure
             worktree_created = True
 
@@ -635,7 +754,7 @@ class Scheduler:
                     # Clean up the worktree since we're returning early after creation
                     if worktree_created:
                         try:
-                            self.worktree_manager.remove_worktree(chunk, remove_branch=False)
+                            await self._git(self.worktree_manager.remove_worktree, chunk, remove_branch=False)
                             logger.info(f"Cleaned up worktree for {chunk} after activation failure")
                         except WorktreeError as cleanup_error:
                             logger.warning(
@@ -664,7 +783,7 @@ class Scheduler:
             work_unit.blocked_by = []  # Clear stale blockers
             work_unit.updated_at = datetime.now(timezone.utc)
             try:
-                self.store.update_work_unit(
+                await self.async_store.update_work_unit(
                     work_unit, expected_updated_at=expected_updated_at
                 )
             except StaleWriteError as e:
@@ -674,7 +793,7 @@ class Scheduler:
                 )
                 # Clean up the worktree we just created
                 try:
-                    self.worktree_manager.remove_worktree(chunk, remove_branch=False)
+                    await self._git(self.worktree_manager.remove_worktree, chunk, remove_branch=False)
                 except WorktreeError:
                     pass
                 return
@@ -686,10 +805,6 @@ class Scheduler:
                 phase=work_unit.phase.value,
             )
 
-            # Set up logging
-            log_dir = self.worktree_manager.get_log_path(chunk)
-            log_callback = create_log_callback(chunk, phase, log_dir)
-
             # Check if there's a pending answer to inject
             pending_answer = work_unit.pending_answer
             if pending_answer:
@@ -729,7 +844,7 @@ class Scheduler:
                     work_unit.status = WorkUnitStatus.READY
                     work_unit.session_id = None
                     work_unit.updated_at = datetime.now(timezone.utc)
-                    self.store.update_work_unit(work_unit)
+                    await self.async_store.update_work_unit(work_unit)
                     await broadcast_work_unit_update(
                         chunk=work_unit.chunk,
                         status=work_unit.status.value,
@@ -769,27 +884,36 @@ class Scheduler:
                 # Increment the counter
                 work_unit.implement_iterations += 1
                 work_unit.updated_at = datetime.now(timezone.utc)
-                self.store.update_work_unit(work_unit)
+                await self.async_store.update_work_unit(work_unit)
+
+            # Set up logging. Opening the phase log is the last step before
+            # the try, so early returns above leave no writer or empty log.
+            log_dir = self.worktree_manager.get_log_path(chunk)
+            log_callback = create_log_callback(chunk, phase, log_dir)
 
             # Run the agent
             logger.info(f"Running agent for {chunk} phase {phase.value}")
-            result = await self.agent_runner.run_phase(
-                chunk=chunk,
-                phase=phase,
-                worktree_path=worktree_path,
-                resume_session_id=work_unit.session_id,
-                answer=pending_answer,
-                reentry_context=reentry_context,
-                log_callback=log_callback,
-                question_callback=question_callback,
-                review_decision_callback=review_decision_callback,
-            )
+            try:
+                result = await self.agent_runner.run_phase(
+                    chunk=chunk,
+                    phase=phase,
+                    worktree_path=worktree_path,
+                    resume_session_id=work_unit.session_id,
+                    answer=pending_answer,
+                    reentry_context=reentry_context,
+                    log_callback=log_callback,
+                    question_callback=question_callback,
+                    review_decision_callback=review_decision_callback,
+                )
+            finally:
+                # Chunk: docs/chunks/orch_phase_log_writer - Flush the phase log
+                log_callback.close()
 
             # Clear pending_answer after successful dispatch
             if pending_answer:
                 work_unit.pending_answer = None
                 work_unit.updated_at = datetime.now(timezone.utc)
-                self.store.update_work_unit(work_unit)
+                await self.async_store.update_work_unit(work_unit)
 
             # Handle result
             await self._handle_agent_result(work_unit, result)
@@ -835,7 +959,7 @@ class Scheduler:
                 question_text = "Agent asked a question"
             work_unit.attention_reason = f"Question: {question_text}"
             work_unit.updated_at = datetime.now(timezone.utc)
-            self.store.update_work_unit(work_unit)
+            await self.async_store.update_work_unit(work_unit)
 
             # Broadcast via WebSocket so dashboard updates
             await broadcast_attention_update(
@@ -1000,7 +1124,7 @@ class Scheduler:
             work_unit.api_retry_count = 0
             work_unit.next_retry_at = None
             work_unit.updated_at = datetime.now(timezone.utc)
-            self.store.update_work_unit(work_unit)
+            await self.async_store.update_work_unit(work_unit)
 
             # Broadcast via WebSocket so dashboard updates
             await broadcast_work_unit_update(
@@ -1057,7 +1181,7 @@ class Scheduler:
             # Resume the agent to finish marking ACTIVE
             work_unit.completion_retries += 1
             work_unit.updated_at = datetime.now(timezone.utc)
-            self.store.update_work_unit(work_unit)
+            await self.async_store.update_work_unit(work_unit)
 
             logger.info(
                 f"Resuming agent for {chunk} to mark ACTIVE "
@@ -1080,7 +1204,7 @@ class Scheduler:
                 # Update session_id if it changed
                 if result.session_id:
                     work_unit.session_id = result.session_id
-                    self.store.update_work_unit(work_unit)
+                    await self.async_store.update_work_unit(work_unit)
 
                 # Re-handle the result (will call _advance_phase again if completed)
                 await self._handle_agent_result(work_unit, result)
@@ -1089,6 +1213,8 @@ class Scheduler:
                 await self._mark_needs_attention(
                     work_unit, f"Resume for ACTIVE status failed: {e}"
                 )
+            finally:
+                log_callback.close()
             return
 
         elif verification.status == VerificationStatus.ERROR:
@@ -1116,10 +1242,10 @@ class Scheduler:
         if work_unit.retain_worktree:
             # Chunk: docs/chunks/finalize_double_commit - Commit only for retained worktrees
             # Retained worktrees skip finalize_work_unit, so commit here directly
-            if self.worktree_manager.has_uncommitted_changes(chunk):
+            if await self.git_runner.query(self.worktree_manager.has_uncommitted_changes, chunk):
                 logger.info(f"Uncommitted changes detected for retained worktree {chunk}, committing")
                 try:
-                    committed = self.worktree_manager.commit_changes(chunk)
+                    committed = await self._git(self.worktree_manager.commit_changes, chunk)
                     if committed:
                         logger.info(f"Committed changes for {chunk}")
                     else:
@@ -1139,7 +1265,7 @@ class Scheduler:
             # Commit changes, remove worktree, merge to base, cleanup branch
             try:
                 logger.info(f"Finalizing worktree for {chunk}")
-                self.worktree_manager.finalize_work_unit(chunk)
+                await self._git(self.worktree_manager.finalize_work_unit, chunk)
             except WorktreeError as e:
                 logger.error(f"Failed to finalize {chunk}: {e}")
 
@@ -1160,7 +1286,7 @@ class Scheduler:
                 work_unit.status = WorkUnitStatus.NEEDS_ATTENTION
                 work_unit.attention_reason = reason
                 work_unit.updated_at = datetime.now(timezone.utc)
-                self.store.update_work_unit(work_unit)
+                await self.async_store.update_work_unit(work_unit)
 
                 # Broadcast via WebSocket so dashboard updates
                 await broadcast_attention_update("added", work_unit.chunk, reason)
@@ -1179,7 +1305,7 @@ class Scheduler:
         # Chunk: docs/chunks/orch_merge_rebase_retry - Reset merge conflict retry counter
         work_unit.merge_conflict_retries = 0
         work_unit.updated_at = datetime.now(timezone.utc)
-        self.store.update_work_unit(work_unit)
+        await self.async_store.update_work_unit(work_unit)
 
         # Broadcast via WebSocket so dashboard updates
         await broadcast_work_unit_update(
@@ -1188,7 +1314,7 @@ class Scheduler:
             phase=work_unit.phase.value,
         )
 
-        self._unblock_dependents(chunk)
+        await self._unblock_dependents(chunk)
 
     # Chunk: docs/chunks/orch_merge_rebase_retry - Handle merge conflict during finalization
     async def _handle_merge_conflict_retry(
@@ -1237,7 +1363,9 @@ class Scheduler:
         )
 
         try:
-            worktree_path = self.worktree_manager.recreate_worktree_from_branch(chunk)
+            worktree_path = await self._git(
+                self.worktree_manager.recreate_worktree_from_branch, chunk
+            )
         except WorktreeError as e:
             logger.error(f"Failed to recreate worktree for {chunk}: {e}")
             await self._mark_needs_attention(
@@ -1257,7 +1385,7 @@ class Scheduler:
         work_unit.api_retry_count = 0
         work_unit.next_retry_at = None
         work_unit.updated_at = datetime.now(timezone.utc)
-        self.store.update_work_unit(work_unit)
+        await self.async_store.update_work_unit(work_unit)
 
         logger.info(
             f"Work unit {chunk} cycling back to REBASE phase "
@@ -1298,8 +1426,8 @@ class Scheduler:
         blocking_chunks = []
 
         # Get all RUNNING and READY work units (except self)
-        running_units = self.store.list_work_units(status=WorkUnitStatus.RUNNING)
-        ready_units = self.store.list_work_units(status=WorkUnitStatus.READY)
+        running_units = await self.async_store.list_work_units(status=WorkUnitStatus.RUNNING)
+        ready_units = await self.async_store.list_work_units(status=WorkUnitStatus.READY)
 
         # When explicit_deps=True, skip oracle analysis entirely. The blocked_by list
         # was populated at injection time from declared dependencies - trust that
@@ -1327,34 +1455,44 @@ class Scheduler:
         if not active_chunks:
             return []
 
-        # Create oracle for conflict analysis
-        oracle = create_oracle(self.project_dir, self.store)
-
-        for other_chunk in active_chunks:
-            # Check cached verdict first
-            verdict = work_unit.conflict_verdicts.get(other_chunk)
+        # The oracle is kept for the scheduler's lifetime so its footprint and
+        # verdict caches survive between dispatch ticks
+        if self._oracle is None:
+            self._oracle = create_oracle(self.project_dir, self.async_store.store)
+        oracle = self._oracle
 
-            if verdict is None:
-                # No cached verdict - analyze conflict
-                try:
-                    analysis = oracle.analyze_conflict(chunk, other_chunk)
+        # Chunk: docs/chunks/orch_oracle_footprint_index - One batched analysis per check
+        uncached = [c for c in active_chunks if c not in work_unit.conflict_verdicts]
+        if uncached:
+            try:
+                # Analysis runs on the oracle thread; only the resulting rows
+                # go through the store's writer.
+                analyses, recomputed = await self._oracle_call(
+                    oracle.evaluate_conflicts, chunk, uncached
+                )
+                if recomputed:
+                    await self.async_store.save_conflict_analyses(recomputed)
+            except Exception as e:
+                logger.error(f"Error analyzing conflicts for {chunk}: {e}")
+                analyses = {}
+
+            if analyses:
+                # Chunk: docs/chunks/orch_conflict_verdict_table - One batched upsert per check
+                # Cache the verdicts on both work units. Verdict rows are
+                # written in one batch without rewriting either work unit.
+                verdict_rows = []
+                for other_chunk, analysis in analyses.items():
                     verdict = analysis.verdict.value
-
-                    # Cache the verdict on both work units
                     work_unit.conflict_verdicts[other_chunk] = verdict
-                    work_unit.updated_at = datetime.now(timezone.utc)
-                    self.store.update_work_unit(work_unit)
-
-                    # Also update the other work unit if it exists
-                    other_unit = self.store.get_work_unit(other_chunk)
-                    if other_unit:
-                        other_unit.conflict_verdicts[chunk] = verdict
-                        other_unit.updated_at = datetime.now(timezone.utc)
-                        self.store.update_work_unit(other_unit)
+                    verdict_rows.append((chunk, other_chunk, verdict, analysis.analysis_stage))
+                    verdict_rows.append((other_chunk, chunk, verdict, analysis.analysis_stage))
+                await self.async_store.save_conflict_verdicts(verdict_rows)
 
-                except Exception as e:
-                    logger.error(f"Error analyzing conflict {chunk} vs {other_chunk}: {e}")
-                    continue
+        for other_chunk in active_chunks:
+            verdict = work_unit.conflict_verdicts.get(other_chunk)
+            if verdict is None:
+                # Analysis failed; retried on the next dispatch tick
+                continue
 
             # Handle verdict - only block if the other chunk is RUNNING
             # READY vs READY conflicts don't block; we just need to resolve
@@ -1398,7 +1536,7 @@ class Scheduler:
         if blocking_chunks and set(blocking_chunks) != set(work_unit.blocked_by):
             work_unit.blocked_by = list(set(work_unit.blocked_by + blocking_chunks))
             work_unit.updated_at = datetime.now(timezone.utc)
-            self.store.update_work_unit(work_unit)
+            await self.async_store.update_work_unit(work_unit)
 
         return blocking_chunks
 
@@ -1412,25 +1550,27 @@ class Scheduler:
             chunk: The chunk that advanced
         """
         # Clear existing conflicts for this chunk
-        deleted = self.store.clear_conflicts_for_chunk(chunk)
+        deleted = await self.async_store.clear_conflicts_for_chunk(chunk)
         if deleted:
             logger.info(f"Cleared {deleted} stale conflict analyses for {chunk}")
+        if self._oracle is not None:
+            await self._oracle_call(self._oracle.forget, chunk)
 
         # Get the work unit
-        work_unit = self.store.get_work_unit(chunk)
+        work_unit = await self.async_store.get_work_unit(chunk)
         if work_unit is None:
             return
 
         # Clear cached verdicts
         work_unit.conflict_verdicts = {}
         work_unit.updated_at = datetime.now(timezone.utc)
-        self.store.update_work_unit(work_unit)
+        await self.async_store.update_work_unit(work_unit)
 
         # The next dispatch tick will trigger fresh analysis
 
     # Chunk: docs/chunks/orch_blocked_lifecycle - Automatic unblock when blockers complete
     # Chunk: docs/chunks/orch_unblock_transition - Fix NEEDS_ATTENTION to READY transition when blockers complete
-    def _unblock_dependents(self, completed_chunk: str) -> None:
+    async def _unblock_dependents(self, completed_chunk: str) -> None:
         """Unblock work units that were blocked by a now-completed chunk.
 
         This is a thin wrapper around the module-level unblock_dependents function,
@@ -1439,7 +1579,7 @@ class Scheduler:
         Args:
             completed_chunk: The chunk name that just completed
         """
-        unblock_dependents(self.store, completed_chunk)
+        await self.async_store.run_write(unblock_dependents, completed_chunk)
 
     # Chunk: docs/chunks/orch_review_phase - Route work unit based on review decision (APPROVE/FEEDBACK/ESCALATE)
     # Chunk: docs/chunks/reviewer_decision_tool - ReviewDecision tool for explicit review decisions
@@ -1544,7 +1684,7 @@ class Scheduler:
         work_unit.attention_reason = None  # Clear any stale reason
         work_unit.updated_at = datetime.now(timezone.utc)
 
-        self.store.update_work_unit(work_unit)
+        await self.async_store.update_work_unit(work_unit)
 
         logger.info(
             f"Retrying {chunk} after API error (attempt {work_unit.api_retry_count}/"
@@ -1599,7 +1739,7 @@ class Scheduler:
         work_unit.attention_reason = None  # Clear any stale reason
         work_unit.updated_at = datetime.now(timezone.utc)
 
-        self.store.update_work_unit(work_unit)
+        await self.async_store.update_work_unit(work_unit)
 
         logger.info(
             f"Session limit hit for {chunk}, scheduled retry at {reset_time.isoformat()}"
@@ -1628,7 +1768,7 @@ class Scheduler:
         work_unit.status = WorkUnitStatus.NEEDS_ATTENTION
         work_unit.attention_reason = reason
         work_unit.updated_at = datetime.now(timezone.utc)
-        self.store.update_work_unit(work_unit)
+        await self.async_store.update_work_unit(work_unit)
 
         # Broadcast via WebSocket so dashboard updates
         await broadcast_attention_update("added", work_unit.chunk, reason)
@@ -1670,7 +1810,7 @@ class Scheduler:
 
         # Step 1: Git branch rename (do this first - easier to roll back if it fails)
         try:
-            self.worktree_manager.rename_branch(old_name, new_name)
+            await self._git(self.worktree_manager.rename_branch, old_name, new_name)
             logger.info(f"Renamed git branch orch/{old_name} -> orch/{new_name}")
         except WorktreeError as e:
             logger.error(f"Failed to rename git branch: {e}")
@@ -1678,12 +1818,12 @@ class Scheduler:
 
         # Step 2: Filesystem rename
         try:
-            self.worktree_manager.rename_chunk_directory(old_name, new_name)
+            await self._git(self.worktree_manager.rename_chunk_directory, old_name, new_name)
             logger.info(f"Renamed chunk directory .ve/chunks/{old_name} -> .ve/chunks/{new_name}")
         except WorktreeError as e:
             # Try to roll back git branch rename
             try:
-                self.worktree_manager.rename_branch(new_name, old_name)
+                await self._git(self.worktree_manager.rename_branch, new_name, old_name)
             except WorktreeError:
                 pass
             logger.error(f"Failed to rename chunk directory: {e}")
@@ -1691,7 +1831,7 @@ class Scheduler:
 
         # Step 3: Database work unit rename
         try:
-            renamed_unit = self.store.rename_work_unit(old_name, new_name)
+            renamed_unit = await self.async_store.rename_work_unit(old_name, new_name)
 
             # Update the worktree path to point to the new location
             if renamed_unit.worktree:
@@ -1706,32 +1846,32 @@ class Scheduler:
                     for c in renamed_unit.baseline_implementing
                 ]
 
-            self.store.update_work_unit(renamed_unit)
+            await self.async_store.update_work_unit(renamed_unit)
             logger.info(f"Renamed work unit in database")
         except ValueError as e:
             # Database rename failed - try to roll back filesystem and git
             try:
-                self.worktree_manager.rename_chunk_directory(new_name, old_name)
+                await self._git(self.worktree_manager.rename_chunk_directory, new_name, old_name)
             except WorktreeError:
                 pass
             try:
-                self.worktree_manager.rename_branch(new_name, old_name)
+                await self._git(self.worktree_manager.rename_branch, new_name, old_name)
             except WorktreeError:
                 pass
             logger.error(f"Failed to rename work unit in database: {e}")
             raise
 
         # Step 4: Update cross-references in other work units
-        blocked_by_updated = self.store.update_blocked_by_references(old_name, new_name)
+        blocked_by_updated = await self.async_store.update_blocked_by_references(old_name, new_name)
         if blocked_by_updated > 0:
             logger.info(f"Updated blocked_by references in {blocked_by_updated} work units")
 
-        verdicts_updated = self.store.update_conflict_verdicts_references(old_name, new_name)
+        verdicts_updated = await self.async_store.update_conflict_verdicts_references(old_name, new_name)
         if verdicts_updated > 0:
-            logger.info(f"Updated conflict_verdicts references in {verdicts_updated} work units")
+            logger.info(f"Updated conflict_verdicts references in {verdicts_updated} verdict rows")
 
         # Step 5: Update conflict_analyses table
-        analyses_updated = self.store.update_conflict_analyses_references(old_name, new_name)
+        analyses_updated = await self.async_store.update_conflict_analyses_references(old_name, new_name)
         if analyses_updated > 0:
             logger.info(f"Updated conflict_analyses references in {analyses_updated} rows")
 
@@ -1839,6 +1979,8 @@ def create_scheduler(
     config: Optional[OrchestratorConfig] = None,
     base_branch: Optional[str] = None,
     task_info: Optional[TaskContextInfo] = None,
+    async_store: Optional[AsyncStateStore] = None,
+    git_runner: Optional[GitRunner] = None,
 ) -> Scheduler:
     """Create a configured scheduler instance.
 
@@ -1848,6 +1990,8 @@ def create_scheduler(
         config: Optional config (uses defaults if not provided)
         base_branch: Git branch to use as base for worktrees (uses current if None)
         task_info: Task context information (None for single-repo mode)
+        async_store: Awaitable facade over store shared with the API server
+        git_runner: Git operation runner shared with the API server
 
     Returns:
         Configured Scheduler instance
@@ -1872,4 +2016,6 @@ def create_scheduler(
         agent_runner=agent_runner,
         config=config,
         project_dir=project_dir,
+        async_store=async_store,
+        git_runner=git_runner,
     )
@@ -5,18 +5,22 @@
 # Chunk: docs/chunks/orch_verify_active - Database migration adding completion_retries column
 # Chunk: docs/chunks/orch_conflict_oracle - Conflict analysis persistence and retrieval
 # Chunk: docs/chunks/optimistic_locking - Optimistic locking for stale write detection
+# Chunk: docs/chunks/orch_dispatch_candidates - Materialized blocks_count and dispatch candidate query
+# Chunk: docs/chunks/orch_conflict_verdict_table - Normalized conflict verdict storage
+# Chunk: docs/chunks/orch_work_unit_dirty_fields - Minimal UPDATEs, compare-and-swap and statement caching
 """SQLite state store for the orchestrator daemon.
 
 Provides persistent storage for work units and their state transitions.
 Uses a simple migrations infrastructure for schema evolution.
 """
 
+import functools
 import json
 import sqlite3
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Iterator
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from orchestrator.models import (
     ConflictAnalysis,
@@ -27,6 +31,62 @@ from orchestrator.models import (
 )
 
 
+# Chunk: docs/chunks/orch_work_unit_dirty_fields - Column encoding and cached UPDATE statements
+# Prepared statements kept per connection (sqlite3 defaults to 128). Minimal
+# UPDATEs add one statement per distinct set of changed columns.
+STATEMENT_CACHE_SIZE = 512
+
+
+def _encode_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+# How each WorkUnit field is stored in its work_units column, in column order.
+# chunk is the key; conflict_verdicts live in the conflict_verdicts table.
+_COLUMN_ENCODERS: dict[str, Callable[[Any], object]] = {
+    "phase": lambda value: value.value,
+    "status": lambda value: value.value,
+    "blocked_by": json.dumps,
+    "worktree": lambda value: value,
+    "priority": lambda value: value,
+    "session_id": lambda value: value,
+    "completion_retries": lambda value: value,
+    "attention_reason": lambda value: value,
+    "displaced_chunk": lambda value: value,
+    "pending_answer": lambda value: value,
+    "conflict_override": lambda value: value,
+    "explicit_deps": lambda value: 1 if value else 0,
+    "review_iterations": lambda value: value,
+    "review_nudge_count": lambda value: value,
+    "retain_worktree": lambda value: 1 if value else 0,
+    "api_retry_count": lambda value: value,
+    "next_retry_at": _encode_datetime,
+    "merge_conflict_retries": lambda value: value,
+    "implement_iterations": lambda value: value,
+    "reentry_context": lambda value: value,
+    "baseline_implementing": json.dumps,
+    "created_at": _encode_datetime,
+    "updated_at": _encode_datetime,
+}
+
+# Columns an update may change; created_at is fixed at creation
+_UPDATABLE_COLUMNS = tuple(name for name in _COLUMN_ENCODERS if name != "created_at")
+
+
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _update_statement(columns: tuple[str, ...], compare_updated_at: bool) -> str:
+    """Build (once per column set) the UPDATE that sets just these columns.
+
+    Reusing the identical string lets sqlite3's statement cache hand back the
+    already prepared statement.
+    """
+    assignments = ", ".join(f"{column} = ?" for column in columns)
+    statement = f"UPDATE work_units SET {assignments} WHERE chunk = ?"
+    if compare_updated_at:
+        statement += " AND updated_at = ?"
+    return statement
+
+
 # Chunk: docs/chunks/optimistic_locking - Optimistic locking for stale write detection
 class StaleWriteError(Exception):
     """Raised when a work unit has been modified since it was read.
@@ -78,7 +138,7 @@ class StateStore:
         for multi-statement operations that must be atomic.
     """
 
-    CURRENT_VERSION = 16
+    CURRENT_VERSION = 18
 
     def __init__(self, db_path: Path):
         """Initialize the state store.
@@ -102,6 +162,7 @@ class StateStore:
                 self.db_path,
                 check_same_thread=False,  # Allow multi-threaded access
                 isolation_level=None,  # Autocommit mode
+                cached_statements=STATEMENT_CACHE_SIZE,
             )
             self._connection.row_factory = sqlite3.Row
             # Enable WAL mode for better concurrent access
@@ -180,6 +241,8 @@ class StateStore:
             14: self._migrate_v14,
             15: self._migrate_v15,
             16: self._migrate_v16,
+            17: self._migrate_v17,
+            18: self._migrate_v18,
         }
 
         for version in range(from_version + 1, self.CURRENT_VERSION + 1):
@@ -456,6 +519,120 @@ class StateStore:
             """
         )
 
+    # Chunk: docs/chunks/orch_dispatch_candidates - Materialized blocks_count maintained by triggers
+    def _migrate_v17(self) -> None:
+        """Materialize blocks_count and keep it current with triggers.
+
+        blocks_count is the number of BLOCKED or READY work units whose
+        blocked_by contains this chunk. get_ready_queue() used to compute it
+        per row with a correlated json_each() subquery on every read; the
+        triggers below adjust it on each insert, delete, and status or
+        blocked_by change instead, so dispatch ordering is a plain indexed
+        column.
+
+        The insert trigger computes the new row's own count from scratch, which
+        also covers renames (INSERT new name, DELETE old name).
+        """
+        self.connection.executescript(
+            """
+            ALTER TABLE work_units ADD COLUMN blocks_count INTEGER NOT NULL DEFAULT 0;
+
+            UPDATE work_units SET blocks_count = (
+                SELECT COUNT(*) FROM work_units b
+                WHERE b.status IN ('BLOCKED', 'READY')
+                AND EXISTS (
+                    SELECT 1 FROM json_each(b.blocked_by)
+                    WHERE value = work_units.chunk
+                )
+            );
+
+            CREATE TRIGGER work_units_blocks_count_insert
+            AFTER INSERT ON work_units
+            BEGIN
+                UPDATE work_units SET blocks_count = (
+                    SELECT COUNT(*) FROM work_units b
+                    WHERE b.status IN ('BLOCKED', 'READY')
+                    AND EXISTS (
+                        SELECT 1 FROM json_each(b.blocked_by)
+                        WHERE value = NEW.chunk
+                    )
+                ) WHERE chunk = NEW.chunk;
+                UPDATE work_units SET blocks_count = blocks_count + 1
+                WHERE NEW.status IN ('BLOCKED', 'READY')
+                AND chunk != NEW.chunk
+                AND chunk IN (SELECT value FROM json_each(NEW.blocked_by));
+            END;
+
+            CREATE TRIGGER work_units_blocks_count_update
+            AFTER UPDATE OF status, blocked_by ON work_units
+            WHEN (OLD.status IN ('BLOCKED', 'READY')) != (NEW.status IN ('BLOCKED', 'READY'))
+                OR OLD.blocked_by IS NOT NEW.blocked_by
+            BEGIN
+                UPDATE work_units SET blocks_count = blocks_count - 1
+                WHERE OLD.status IN ('BLOCKED', 'READY')
+                AND chunk IN (SELECT value FROM json_each(OLD.blocked_by));
+                UPDATE work_units SET blocks_count = blocks_count + 1
+                WHERE NEW.status IN ('BLOCKED', 'READY')
+                AND chunk IN (SELECT value FROM json_each(NEW.blocked_by));
+            END;
+
+            CREATE TRIGGER work_units_blocks_count_delete
+            AFTER DELETE ON work_units
+            WHEN OLD.status IN ('BLOCKED', 'READY')
+            BEGIN
+                UPDATE work_units SET blocks_count = blocks_count - 1
+                WHERE chunk IN (SELECT value FROM json_each(OLD.blocked_by));
+            END;
+
+            CREATE INDEX IF NOT EXISTS idx_work_units_dispatch_order
+            ON work_units(status, blocks_count DESC, priority DESC, created_at ASC);
+            """
+        )
+
+    # Chunk: docs/chunks/orch_conflict_verdict_table - Verdicts move out of the work_units JSON blob
+    def _migrate_v18(self) -> None:
+        """Move cached conflict verdicts into their own table.
+
+        work_units.conflict_verdicts held each unit's verdicts as one JSON
+        object, so recording a single verdict rewrote the whole blob (and the
+        whole row). Each verdict is now a row keyed by (chunk_a, chunk_b):
+        chunk_a is the work unit holding the verdict and chunk_b the chunk it
+        was judged against. The old column is left in place but cleared.
+
+        Verdict rows follow their work unit: the delete trigger drops them
+        when the unit is deleted, and rename_work_unit re-keys them.
+        """
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS conflict_verdicts (
+                chunk_a TEXT NOT NULL,
+                chunk_b TEXT NOT NULL,
+                verdict TEXT NOT NULL,
+                stage TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (chunk_a, chunk_b)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_conflict_verdicts_chunk_b
+                ON conflict_verdicts(chunk_b);
+
+            INSERT OR REPLACE INTO conflict_verdicts
+                (chunk_a, chunk_b, verdict, stage, updated_at)
+            SELECT w.chunk, v.key, v.value, NULL, w.updated_at
+            FROM work_units w, json_each(w.conflict_verdicts) v
+            WHERE w.conflict_verdicts IS NOT NULL AND json_valid(w.conflict_verdicts);
+
+            UPDATE work_units SET conflict_verdicts = NULL
+            WHERE conflict_verdicts IS NOT NULL;
+
+            CREATE TRIGGER work_units_conflict_verdicts_delete
+            AFTER DELETE ON work_units
+            BEGIN
+                DELETE FROM conflict_verdicts WHERE chunk_a = OLD.chunk;
+            END;
+            """
+        )
+
     def _record_migration(self, version: int) -> None:
         """Record a completed migration."""
         now = datetime.now(timezone.utc).isoformat()
@@ -466,6 +643,31 @@ class StateStore:
 
     # CRUD Operations
 
+    # Chunk: docs/chunks/orch_conflict_verdict_table - One column mapping for INSERT and UPDATE
+    @staticmethod
+    def _work_unit_columns(
+        work_unit: WorkUnit, fields: Optional[Iterable[str]] = None
+    ) -> dict[str, object]:
+        """Map a work unit to its work_units column values (except chunk).
+
+        Only the given fields are encoded when fields is passed. Conflict
+        verdicts are not a column; they live in the conflict_verdicts table.
+        """
+        if fields is None:
+            fields = _COLUMN_ENCODERS
+        return {name: _COLUMN_ENCODERS[name](getattr(work_unit, name)) for name in fields}
+
+    def _insert_work_unit_row(self, chunk: str, work_unit: WorkUnit) -> None:
+        """INSERT a work_units row for work_unit under the given chunk name."""
+        columns = self._work_unit_columns(work_unit)
+        self.connection.execute(
+            f"""
+            INSERT INTO work_units (chunk, {", ".join(columns)})
+            VALUES (?{", ?" * len(columns)})
+            """,
+            (chunk, *columns.values()),
+        )
+
     # Chunk: docs/chunks/orch_attention_reason - Persisting attention_reason on work unit creation
     # Chunk: docs/chunks/orch_state_transactions - Atomic work unit creation with status log
     # Chunk: docs/chunks/orch_rename_propagation - baseline_implementing persistence
@@ -485,58 +687,20 @@ class StateStore:
         Raises:
             ValueError: If a work unit with the same chunk already exists
         """
-        blocked_by_json = json.dumps(work_unit.blocked_by)
-        conflict_verdicts_json = json.dumps(work_unit.conflict_verdicts)
-        baseline_implementing_json = json.dumps(work_unit.baseline_implementing)
-
         with self.transaction():
             try:
-                self.connection.execute(
-                    """
-                    INSERT INTO work_units
-                        (chunk, phase, status, blocked_by, worktree, priority, session_id,
-                         completion_retries, attention_reason, displaced_chunk, pending_answer,
-                         conflict_verdicts, conflict_override, explicit_deps, review_iterations,
-                         review_nudge_count, retain_worktree, api_retry_count, next_retry_at,
-                         merge_conflict_retries, implement_iterations, reentry_context,
-                         baseline_implementing,
-                         created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        work_unit.chunk,
-                        work_unit.phase.value,
-                        work_unit.status.value,
-                        blocked_by_json,
-                        work_unit.worktree,
-                        work_unit.priority,
-                        work_unit.session_id,
-                        work_unit.completion_retries,
-                        work_unit.attention_reason,
-                        work_unit.displaced_chunk,
-                        work_unit.pending_answer,
-                        conflict_verdicts_json,
-                        work_unit.conflict_override,
-                        1 if work_unit.explicit_deps else 0,
-                        work_unit.review_iterations,
-                        work_unit.review_nudge_count,
-                        1 if work_unit.retain_worktree else 0,
-                        work_unit.api_retry_count,
-                        work_unit.next_retry_at.isoformat() if work_unit.next_retry_at else None,
-                        work_unit.merge_conflict_retries,
-                        work_unit.implement_iterations,
-                        work_unit.reentry_context,
-                        baseline_implementing_json,
-                        work_unit.created_at.isoformat(),
-                        work_unit.updated_at.isoformat(),
-                    ),
-                )
+                self._insert_work_unit_row(work_unit.chunk, work_unit)
             except sqlite3.IntegrityError:
                 raise ValueError(f"Work unit for chunk '{work_unit.chunk}' already exists")
 
+            self._write_conflict_verdict_changes(
+                work_unit.chunk, {}, work_unit.conflict_verdicts, work_unit.updated_at
+            )
+
             # Log the initial status
             self._log_status_transition(work_unit.chunk, None, work_unit.status)
 
+        work_unit.mark_persisted()
         return work_unit
 
     def get_work_unit(self, chunk: str) -> Optional[WorkUnit]:
@@ -571,7 +735,12 @@ class StateStore:
 
         The SELECT, UPDATE, and status log INSERT are wrapped in a transaction
         to ensure atomicity. The status log is only written if the update
-        succeeds, and both changes commit together.
+        succeeds, and both changes commit together. Only columns and conflict
+        verdicts that differ from the stored work unit are written.
+
+        When expected_updated_at matches the updated_at the unit was loaded
+        with, the update goes through compare_and_swap_work_unit() and skips
+        the SELECT.
 
         When expected_updated_at is provided, the update performs optimistic
         locking: it verifies that the work unit's current updated_at timestamp
@@ -592,9 +761,12 @@ class StateStore:
             StaleWriteError: If expected_updated_at is provided and doesn't match
                 the work unit's current updated_at (indicating concurrent modification)
         """
-        blocked_by_json = json.dumps(work_unit.blocked_by)
-        conflict_verdicts_json = json.dumps(work_unit.conflict_verdicts)
-        baseline_implementing_json = json.dumps(work_unit.baseline_implementing)
+        if (
+            expected_updated_at is not None
+            and work_unit.is_persisted
+            and work_unit.persisted_value("updated_at") == expected_updated_at
+        ):
+            return self._compare_and_swap(work_unit, expected_updated_at)
 
         with self.transaction():
             # Get the old status for logging (within transaction)
@@ -611,46 +783,32 @@ class StateStore:
                         actual_updated_at=old_unit.updated_at,
                     )
 
-            self.connection.execute(
-                """
-                UPDATE work_units
-                SET phase = ?, status = ?, blocked_by = ?, worktree = ?,
-                    priority = ?, session_id = ?, completion_retries = ?,
-                    attention_reason = ?, displaced_chunk = ?, pending_answer = ?,
-                    conflict_verdicts = ?, conflict_override = ?, explicit_deps = ?,
-                    review_iterations = ?, review_nudge_count = ?, retain_worktree = ?,
-                    api_retry_count = ?, next_retry_at = ?,
-                    merge_conflict_retries = ?, implement_iterations = ?,
-                    reentry_context = ?, baseline_implementing = ?,
-                    updated_at = ?
-                WHERE chunk = ?
-                """,
-                (
-                    work_unit.phase.value,
-                    work_unit.status.value,
-                    blocked_by_json,
-                    work_unit.worktree,
-                    work_unit.priority,
-                    work_unit.session_id,
-                    work_unit.completion_retries,
-                    work_unit.attention_reason,
-                    work_unit.displaced_chunk,
-                    work_unit.pending_answer,
-                    conflict_verdicts_json,
-                    work_unit.conflict_override,
-                    1 if work_unit.explicit_deps else 0,
-                    work_unit.review_iterations,
-                    work_unit.review_nudge_count,
-                    1 if work_unit.retain_worktree else 0,
-                    work_unit.api_retry_count,
-                    work_unit.next_retry_at.isoformat() if work_unit.next_retry_at else None,
-                    work_unit.merge_conflict_retries,
-                    work_unit.implement_iterations,
-                    work_unit.reentry_context,
-                    baseline_implementing_json,
-                    work_unit.updated_at.isoformat(),
-                    work_unit.chunk,
-                ),
+            # Only SET the columns that differ from the stored row, so the
+            # blocks_count trigger only fires when status or blocked_by moved
+            changed = [
+                name
+                for name in _UPDATABLE_COLUMNS
+                if getattr(old_unit, name) != getattr(work_unit, name)
+            ]
+            if changed:
+                values = self._work_unit_columns(work_unit, changed)
+                self.connection.execute(
+                    _update_statement(tuple(changed), False),
+                    (*values.values(), work_unit.chunk),
+                )
+
+            # Diff verdicts against what the caller loaded, not the current
+            # rows, so verdicts recorded since then (save_conflict_verdicts)
+            # are not deleted as if the caller had removed them
+            if work_unit.is_persisted:
+                loaded_verdicts = work_unit.persisted_value("conflict_verdicts")
+            else:
+                loaded_verdicts = old_unit.conflict_verdicts
+            self._write_conflict_verdict_changes(
+                work_unit.chunk,
+                loaded_verdicts,
+                work_unit.conflict_verdicts,
+                work_unit.updated_at,
             )
 
             # Log status transition if status changed
@@ -659,6 +817,100 @@ class StateStore:
                     work_unit.chunk, old_unit.status, work_unit.status
                 )
 
+        work_unit.mark_persisted()
+        return work_unit
+
+    # Chunk: docs/chunks/orch_work_unit_dirty_fields - Optimistic update without the pre-read
+    def compare_and_swap_work_unit(
+        self,
+        work_unit: WorkUnit,
+        expected_updated_at: Optional[datetime] = None,
+    ) -> WorkUnit:
+        """Write a work unit's changed fields if nobody else wrote it first.
+
+        The unit's dirty fields (see WorkUnit.dirty_fields) are written with
+        one UPDATE whose WHERE clause also matches expected_updated_at, so the
+        stale-write check costs no extra SELECT. The old status for the status
+        log comes from the unit's persisted snapshot.
+
+        Args:
+            work_unit: A work unit loaded from (or written by) a StateStore
+            expected_updated_at: The updated_at the row must still have;
+                defaults to the one the unit was loaded with
+
+        Returns:
+            The updated work unit
+
+        Raises:
+            ValueError: If the work unit doesn't exist, or it was never
+                persisted and expected_updated_at is not given
+            StaleWriteError: If the row's updated_at no longer matches
+        """
+        if expected_updated_at is None:
+            if not work_unit.is_persisted:
+                raise ValueError(
+                    f"Work unit '{work_unit.chunk}' was not loaded from the store; "
+                    "pass expected_updated_at"
+                )
+            expected_updated_at = work_unit.persisted_value("updated_at")
+        elif (
+            not work_unit.is_persisted
+            or work_unit.persisted_value("updated_at") != expected_updated_at
+        ):
+            # The snapshot doesn't describe the row being replaced
+            return self.update_work_unit(work_unit, expected_updated_at)
+        return self._compare_and_swap(work_unit, expected_updated_at)
+
+    def _compare_and_swap(self, work_unit: WorkUnit, expected_updated_at: datetime) -> WorkUnit:
+        """Write the dirty fields of a unit whose snapshot is at expected_updated_at."""
+        dirty = work_unit.dirty_fields()
+        columns = tuple(name for name in _UPDATABLE_COLUMNS if name in dirty)
+        values = self._work_unit_columns(work_unit, columns)
+        key = (work_unit.chunk, expected_updated_at.isoformat())
+
+        with self.transaction():
+            if columns:
+                matched = self.connection.execute(
+                    _update_statement(columns, True), (*values.values(), *key)
+                ).rowcount
+            else:
+                matched = self.connection.execute(
+                    "SELECT 1 FROM work_units WHERE chunk = ? AND updated_at = ?", key
+                ).fetchone() is not None
+
+            if not matched:
+                row = self.connection.execute(
+                    "SELECT updated_at FROM work_units WHERE chunk = ?", (work_unit.chunk,)
+                ).fetchone()
+                if row is None:
+                    raise ValueError(f"Work unit for chunk '{work_unit.chunk}' not found")
+                actual_updated_at = datetime.fromisoformat(row["updated_at"])
+                if actual_updated_at != expected_updated_at:
+                    raise StaleWriteError(
+                        chunk=work_unit.chunk,
+                        expected_updated_at=expected_updated_at,
+                        actual_updated_at=actual_updated_at,
+                    )
+                # Same instant stored in another ISO spelling
+                if columns:
+                    self.connection.execute(
+                        _update_statement(columns, False),
+                        (*values.values(), work_unit.chunk),
+                    )
+
+            if "conflict_verdicts" in dirty:
+                self._write_conflict_verdict_changes(
+                    work_unit.chunk,
+                    work_unit.persisted_value("conflict_verdicts"),
+                    work_unit.conflict_verdicts,
+                    work_unit.updated_at,
+                )
+
+            old_status = work_unit.persisted_value("status")
+            if old_status != work_unit.status:
+                self._log_status_transition(work_unit.chunk, old_status, work_unit.status)
+
+        work_unit.mark_persisted()
         return work_unit
 
     def delete_work_unit(self, chunk: str) -> bool:
@@ -696,7 +948,7 @@ class StateStore:
                 "SELECT * FROM work_units ORDER BY created_at"
             )
 
-        return [self._row_to_work_unit(row) for row in cursor.fetchall()]
+        return self._rows_to_work_units(cursor.fetchall())
 
     def count_by_status(self) -> dict[str, int]:
         """Count work units by status.
@@ -814,24 +1066,29 @@ class StateStore:
                     SELECT 1 FROM json_each(b.blocked_by)
                     WHERE value = w.chunk
                 )
-            ) as blocks_count
+            ) as dependents_count
             FROM work_units w
             WHERE w.status = ?
-            ORDER BY blocks_count DESC, w.updated_at ASC
+            ORDER BY dependents_count DESC, w.updated_at ASC
             """,
             (WorkUnitStatus.NEEDS_ATTENTION.value,),
         )
 
+        rows = cursor.fetchall()
+        verdicts = self._load_conflict_verdicts([row["chunk"] for row in rows])
         results: list[tuple[WorkUnit, int]] = []
-        for row in cursor.fetchall():
-            work_unit = self._row_to_work_unit(row)
-            blocks_count = row["blocks_count"]
+        for row in rows:
+            work_unit = self._row_to_work_unit(row, verdicts.get(row["chunk"], {}))
+            # Counts blockers in any status, unlike the materialized
+            # blocks_count column (BLOCKED/READY only)
+            blocks_count = row["dependents_count"]
             results.append((work_unit, blocks_count))
 
         return results
 
     # Chunk: docs/chunks/orch_ready_critical_path - Critical-path scheduling for ready queue
     # Chunk: docs/chunks/artifact_index_cache - Optimized to use single SQL query with subquery
+    # Chunk: docs/chunks/orch_dispatch_candidates - Ordered by the materialized blocks_count column
     def get_ready_queue(self, limit: Optional[int] = None) -> list[WorkUnit]:
         """Get READY work units ordered by critical-path priority.
 
@@ -843,6 +1100,10 @@ class StateStore:
         The blocks_count is the number of BLOCKED or READY work units that have
         this chunk in their blocked_by list. This ensures critical-path chunks
         (those blocking dependency chains) are dispatched before leaf chunks.
+        It is a column kept current by triggers (see _migrate_v17).
+
+        This lists every READY unit, including those waiting out a retry
+        backoff; the scheduler uses get_dispatch_candidates() instead.
 
         Args:
             limit: Optional maximum number of work units to return
@@ -850,28 +1111,12 @@ class StateStore:
         Returns:
             List of READY work units in scheduling order
         """
-        # Single query with subquery to compute blocks_count
-        # Uses json_each() to search the blocked_by JSON array
-        # Only counts BLOCKED or READY work units as blockers
         query = """
-            SELECT w.*, (
-                SELECT COUNT(*) FROM work_units b
-                WHERE b.status IN (?, ?)
-                AND EXISTS (
-                    SELECT 1 FROM json_each(b.blocked_by)
-                    WHERE value = w.chunk
-                )
-            ) as blocks_count
-            FROM work_units w
-            WHERE w.status = ?
-            ORDER BY blocks_count DESC, w.priority DESC, w.created_at ASC
+            SELECT * FROM work_units
+            WHERE status = ?
+            ORDER BY blocks_count DESC, priority DESC, created_at ASC
         """
-
-        params: tuple = (
-            WorkUnitStatus.BLOCKED.value,
-            WorkUnitStatus.READY.value,
-            WorkUnitStatus.READY.value,
-        )
+        params: tuple = (WorkUnitStatus.READY.value,)
 
         # Apply LIMIT at SQL level if specified
         if limit is not None:
@@ -880,7 +1125,113 @@ class StateStore:
 
         cursor = self.connection.execute(query, params)
 
-        return [self._row_to_work_unit(row) for row in cursor.fetchall()]
+        return self._rows_to_work_units(cursor.fetchall())
+
+    # Chunk: docs/chunks/orch_dispatch_candidates - Filter before LIMIT so skipped units can't starve slots
+    def get_dispatch_candidates(
+        self,
+        limit: int,
+        exclude: Iterable[str] = (),
+        now: Optional[datetime] = None,
+    ) -> list[WorkUnit]:
+        """Get READY work units that can be dispatched now, in ready-queue order.
+
+        Unlike get_ready_queue(), units the scheduler would skip anyway are
+        filtered out before the LIMIT:
+
+        - units whose next_retry_at is still in the future, and
+        - units already known to be blocked: a chunk in their blocked_by is
+          RUNNING and either the unit uses explicit dependencies or its cached
+          conflict verdict against that chunk is SERIALIZE (directly, or
+          ASK_OPERATOR with a SERIALIZE override).
+
+        Units whose conflicts are not yet analysed or recorded still come back;
+        the scheduler's conflict check decides those.
+
+        Args:
+            limit: Maximum number of work units to return
+            exclude: Chunk names to leave out (e.g., already considered)
+            now: Reference time for retry backoff (defaults to current UTC time)
+
+        Returns:
+            List of dispatchable READY work units in scheduling order
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        cursor = self.connection.execute(
+            """
+            SELECT * FROM work_units w
+            WHERE w.status = :ready
+            AND (
+                w.next_retry_at IS NULL
+                OR julianday(w.next_retry_at) <= julianday(:now)
+            )
+            AND w.chunk NOT IN (SELECT value FROM json_each(:exclude))
+            AND NOT EXISTS (
+                SELECT 1 FROM json_each(w.blocked_by) j
+                JOIN work_units r ON r.chunk = j.value AND r.status = :running
+                WHERE w.explicit_deps = 1
+                OR EXISTS (
+                    SELECT 1 FROM conflict_verdicts v
+                    WHERE v.chunk_a = w.chunk AND v.chunk_b = j.value
+                    AND (
+                        v.verdict = :serialize
+                        OR (v.verdict = :ask_operator AND w.conflict_override = :serialize)
+                    )
+                )
+            )
+            ORDER BY w.blocks_count DESC, w.priority DESC, w.created_at ASC
+            LIMIT :limit
+            """,
+            {
+                "ready": WorkUnitStatus.READY.value,
+                "running": WorkUnitStatus.RUNNING.value,
+                "serialize": ConflictVerdict.SERIALIZE.value,
+                "ask_operator": ConflictVerdict.ASK_OPERATOR.value,
+                "now": now.isoformat(),
+                "exclude": json.dumps(list(exclude)),
+                "limit": limit,
+            },
+        )
+        return self._rows_to_work_units(cursor.fetchall())
+
+    def iter_dispatch_candidates(
+        self, batch_size: int = 16, now: Optional[datetime] = None
+    ) -> Iterator[WorkUnit]:
+        """Lazily yield dispatch candidates, fetching batch_size rows at a time.
+
+        Each batch excludes the chunks already yielded, so callers can stop as
+        soon as they have filled their slots without reading the whole queue.
+        """
+        seen: list[str] = []
+        while True:
+            batch = self.get_dispatch_candidates(batch_size, exclude=seen, now=now)
+            if not batch:
+                return
+            for unit in batch:
+                seen.append(unit.chunk)
+                yield unit
+            if len(batch) < batch_size:
+                return
+
+    def get_next_retry_at(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Get the earliest future next_retry_at among READY work units."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        row = self.connection.execute(
+            """
+            SELECT next_retry_at FROM work_units
+            WHERE status = ? AND next_retry_at IS NOT NULL
+            AND julianday(next_retry_at) > julianday(?)
+            ORDER BY julianday(next_retry_at) ASC
+            LIMIT 1
+            """,
+            (WorkUnitStatus.READY.value, now.isoformat()),
+        ).fetchone()
+        if row is None:
+            return None
+        return datetime.fromisoformat(row["next_retry_at"])
 
     # Chunk: docs/chunks/orch_blocked_lifecycle - Query for work units blocked by a specific chunk
     def list_blocked_by_chunk(self, chunk: str) -> list[WorkUnit]:
@@ -905,14 +1256,23 @@ class StateStore:
             """,
             (chunk,),
         )
-        return [self._row_to_work_unit(row) for row in cursor.fetchall()]
+        return self._rows_to_work_units(cursor.fetchall())
 
     # Helper methods
 
     # Chunk: docs/chunks/orch_attention_reason - Reading attention_reason from database with fallback
     # Chunk: docs/chunks/orch_activate_on_inject - Handle displaced_chunk column in row-to-model conversion
-    def _row_to_work_unit(self, row: sqlite3.Row) -> WorkUnit:
-        """Convert a database row to a WorkUnit model."""
+    # Chunk: docs/chunks/orch_conflict_verdict_table - Verdicts come from the conflict_verdicts table
+    def _row_to_work_unit(
+        self, row: sqlite3.Row, conflict_verdicts: Optional[dict[str, str]] = None
+    ) -> WorkUnit:
+        """Convert a database row to a WorkUnit model.
+
+        Args:
+            row: A work_units row
+            conflict_verdicts: The unit's verdicts if already loaded; when
+                None they are read from the conflict_verdicts table.
+        """
         blocked_by = json.loads(row["blocked_by"]) if row["blocked_by"] else []
 
         # Handle priority and session_id which may not exist in old databases
@@ -948,11 +1308,10 @@ class StateStore:
         except (IndexError, KeyError):
             pending_answer = None
 
-        try:
-            conflict_verdicts_str = row["conflict_verdicts"]
-            conflict_verdicts = json.loads(conflict_verdicts_str) if conflict_verdicts_str else {}
-        except (IndexError, KeyError):
-            conflict_verdicts = {}
+        if conflict_verdicts is None:
+            conflict_verdicts = self._load_conflict_verdicts([row["chunk"]]).get(
+                row["chunk"], {}
+            )
 
         try:
             conflict_override = row["conflict_override"]
@@ -1025,7 +1384,7 @@ class StateStore:
         except (IndexError, KeyError):
             baseline_implementing = []
 
-        return WorkUnit(
+        work_unit = WorkUnit(
             chunk=row["chunk"],
             phase=WorkUnitPhase(row["phase"]),
             status=WorkUnitStatus(row["status"]),
@@ -1052,7 +1411,112 @@ class StateStore:
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
         )
+        work_unit.mark_persisted()
+        return work_unit
 
+    def _rows_to_work_units(self, rows: list[sqlite3.Row]) -> list[WorkUnit]:
+        """Convert work_units rows, loading their verdicts in one query."""
+        verdicts = self._load_conflict_verdicts([row["chunk"] for row in rows])
+        return [self._row_to_work_unit(row, verdicts.get(row["chunk"], {})) for row in rows]
+
+    # Conflict verdicts
+
+    # Chunk: docs/chunks/orch_conflict_verdict_table - Per-pair verdict rows
+    def _load_conflict_verdicts(self, chunks: list[str]) -> dict[str, dict[str, str]]:
+        """Read the verdicts held by each of chunks, keyed by holder then other chunk."""
+        if not chunks:
+            return {}
+        cursor = self.connection.execute(
+            """
+            SELECT chunk_a, chunk_b, verdict FROM conflict_verdicts
+            WHERE chunk_a IN (SELECT value FROM json_each(?))
+            """,
+            (json.dumps(chunks),),
+        )
+        verdicts: dict[str, dict[str, str]] = {}
+        for row in cursor.fetchall():
+            verdicts.setdefault(row["chunk_a"], {})[row["chunk_b"]] = row["verdict"]
+        return verdicts
+
+    def _write_conflict_verdict_changes(
+        self,
+        chunk: str,
+        old: dict[str, str],
+        new: dict[str, str],
+        updated_at: datetime,
+    ) -> None:
+        """Upsert the verdicts that changed between old and new and delete removed ones."""
+        changed = [
+            (chunk, other, verdict, None, updated_at.isoformat())
+            for other, verdict in new.items()
+            if old.get(other) != verdict
+        ]
+        if changed:
+            self.connection.executemany(
+                """
+                INSERT INTO conflict_verdicts (chunk_a, chunk_b, verdict, stage, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (chunk_a, chunk_b) DO UPDATE SET
+                    verdict = excluded.verdict,
+                    stage = excluded.stage,
+                    updated_at = excluded.updated_at
+                """,
+                changed,
+            )
+        removed = [(chunk, other) for other in old if other not in new]
+        if removed:
+            self.connection.executemany(
+                "DELETE FROM conflict_verdicts WHERE chunk_a = ? AND chunk_b = ?",
+                removed,
+            )
+
+    def save_conflict_verdicts(
+        self,
+        verdicts: Iterable[tuple[str, str, str, Optional[str]]],
+        updated_at: Optional[datetime] = None,
+    ) -> int:
+        """Record a batch of conflict verdicts in one transaction.
+
+        Each entry is (chunk, other_chunk, verdict, stage): the work unit
+        holding the verdict, the chunk it was judged against, the
+        ConflictVerdict value, and the analysis stage that produced it.
+        Existing verdicts for the same pair are replaced. Entries whose
+        holding work unit doesn't exist are skipped.
+
+        Unlike assigning WorkUnit.conflict_verdicts and calling
+        update_work_unit(), this writes only the verdict rows; the work_units
+        rows (and their updated_at) are untouched.
+
+        Args:
+            verdicts: The verdicts to record
+            updated_at: Timestamp stored with each verdict (defaults to now)
+
+        Returns:
+            Number of verdicts recorded
+        """
+        if updated_at is None:
+            updated_at = datetime.now(timezone.utc)
+        stamp = updated_at.isoformat()
+        rows = [
+            (chunk, other_chunk, verdict, stage, stamp, chunk)
+            for chunk, other_chunk, verdict, stage in verdicts
+        ]
+        if not rows:
+            return 0
+        with self.transaction():
+            cursor = self.connection.executemany(
+                """
+                INSERT INTO conflict_verdicts (chunk_a, chunk_b, verdict, stage, updated_at)
+                SELECT ?, ?, ?, ?, ?
+                WHERE EXISTS (SELECT 1 FROM work_units WHERE chunk = ?)
+                ON CONFLICT (chunk_a, chunk_b) DO UPDATE SET
+                    verdict = excluded.verdict,
+                    stage = excluded.stage,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+        return cursor.rowcount
 
     def save_conflict_analysis(self, analysis: ConflictAnalysis) -> None:
         """Save or update a conflict analysis.
@@ -1089,6 +1553,16 @@ class StateStore:
             ),
         )
 
+    def save_conflict_analyses(self, analyses: Iterable[ConflictAnalysis]) -> None:
+        """Save a batch of conflict analyses in one transaction.
+
+        Args:
+            analyses: The conflict analyses to save
+        """
+        with self.transaction():
+            for analysis in analyses:
+                self.save_conflict_analysis(analysis)
+
     def get_conflict_analysis(
         self, chunk_a: str, chunk_b: str
     ) -> Optional[ConflictAnalysis]:
@@ -1245,46 +1719,13 @@ class StateStore:
             if self.get_work_unit(new_chunk) is not None:
                 raise ValueError(f"Work unit '{new_chunk}' already exists")
 
-            # Prepare JSON fields
-            blocked_by_json = json.dumps(old_unit.blocked_by)
-            conflict_verdicts_json = json.dumps(old_unit.conflict_verdicts)
-            baseline_implementing_json = json.dumps(old_unit.baseline_implementing)
-
             # Insert new row with new chunk name
+            self._insert_work_unit_row(new_chunk, old_unit)
+
+            # Move the unit's verdicts before the delete trigger drops them
             self.connection.execute(
-                """
-                INSERT INTO work_units
-                    (chunk, phase, status, blocked_by, worktree, priority, session_id,
-                     completion_retries, attention_reason, displaced_chunk, pending_answer,
-                     conflict_verdicts, conflict_override, explicit_deps, review_iterations,
-                     review_nudge_count, retain_worktree, api_retry_count, next_retry_at,
-                     baseline_implementing, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    new_chunk,  # Use new chunk name
-                    old_unit.phase.value,
-                    old_unit.status.value,
-                    blocked_by_json,
-                    old_unit.worktree,
-                    old_unit.priority,
-                    old_unit.session_id,
-                    old_unit.completion_retries,
-                    old_unit.attention_reason,
-                    old_unit.displaced_chunk,
-                    old_unit.pending_answer,
-                    conflict_verdicts_json,
-                    old_unit.conflict_override,
-                    1 if old_unit.explicit_deps else 0,
-                    old_unit.review_iterations,
-                    old_unit.review_nudge_count,
-                    1 if old_unit.retain_worktree else 0,
-                    old_unit.api_retry_count,
-                    old_unit.next_retry_at.isoformat() if old_unit.next_retry_at else None,
-                    baseline_implementing_json,
-                    old_unit.created_at.isoformat(),
-                    old_unit.updated_at.isoformat(),
-                ),
+                "UPDATE conflict_verdicts SET chunk_a = ? WHERE chunk_a = ?",
+                (new_chunk, old_chunk),
             )
 
             # Delete old row
@@ -1294,7 +1735,7 @@ class StateStore:
             )
 
         # Return the renamed work unit
-        return WorkUnit(
+        renamed = WorkUnit(
             chunk=new_chunk,
             phase=old_unit.phase,
             status=old_unit.status,
@@ -1314,10 +1755,15 @@ class StateStore:
             retain_worktree=old_unit.retain_worktree,
             api_retry_count=old_unit.api_retry_count,
             next_retry_at=old_unit.next_retry_at,
+            merge_conflict_retries=old_unit.merge_conflict_retries,
+            implement_iterations=old_unit.implement_iterations,
+            reentry_context=old_unit.reentry_context,
             baseline_implementing=old_unit.baseline_implementing,
             created_at=old_unit.created_at,
             updated_at=old_unit.updated_at,
         )
+        renamed.mark_persisted()
+        return renamed
 
     def update_blocked_by_references(self, old_chunk: str, new_chunk: str) -> int:
         """Update blocked_by lists in all work units that reference the old chunk.
@@ -1348,30 +1794,34 @@ class StateStore:
 
         return updated_count
 
+    # Chunk: docs/chunks/orch_conflict_verdict_table - Re-key verdict rows in place
     def update_conflict_verdicts_references(self, old_chunk: str, new_chunk: str) -> int:
-        """Update conflict_verdicts dicts in work units that reference the old chunk.
+        """Update conflict verdicts in work units that reference the old chunk.
 
-        Re-keys entries in conflict_verdicts from old_chunk to new_chunk.
+        Re-keys verdicts judged against old_chunk to new_chunk. A verdict
+        already recorded against new_chunk wins over the re-keyed one.
 
         Args:
             old_chunk: Old chunk name to find
             new_chunk: New chunk name to replace with
 
         Returns:
-            Number of work units updated
+            Number of verdict rows re-keyed (not counting rows dropped in
+            favour of an existing verdict against new_chunk)
         """
-        updated_count = 0
-        all_units = self.list_work_units()
-
-        for unit in all_units:
-            if old_chunk in unit.conflict_verdicts:
-                # Re-key the verdict
-                verdict = unit.conflict_verdicts.pop(old_chunk)
-                unit.conflict_verdicts[new_chunk] = verdict
-                unit.updated_at = datetime.now(timezone.utc)
-                self.update_work_unit(unit)
-                updated_count += 1
-
+        cursor = self.connection.execute(
+            """
+            UPDATE OR IGNORE conflict_verdicts
+            SET chunk_b = ?
+            WHERE chunk_b = ?
+            """,
+            (new_chunk, old_chunk),
+        )
+        updated_count = cursor.rowcount
+        # Rows left behind lost to an existing verdict against new_chunk
+        self.connection.execute(
+            "DELETE FROM conflict_verdicts WHERE chunk_b = ?", (old_chunk,)
+        )
         return updated_count
 
     def update_conflict_analyses_references(self, old_chunk: str, new_chunk: str) -> int:
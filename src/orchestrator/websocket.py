@@ -1,43 +1,125 @@
 # Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
+# Chunk: docs/chunks/orch_ws_send_queues - Per-connection send queues
 """WebSocket support for real-time dashboard updates.
 
 Provides a ConnectionManager for tracking active WebSocket connections
 and broadcasting state updates to all connected clients.
+
+Broadcasting never waits on a client. Each message is serialized once and
+appended to a bounded queue per connection, and a sender task per
+connection drains its queue. A slow dashboard therefore only delays itself,
+not other dashboards or the scheduler coroutine that broadcast the change.
+
+- ``work_unit_update`` messages carry a chunk's complete status, so a queued
+  update that has not been sent yet is replaced by a newer one for the same
+  chunk. Senders hold each batch for a short window so bursts collapse.
+- A client whose queue fills up, or whose send stalls past a timeout, is
+  disconnected. The dashboard reconnects and receives a fresh
+  ``initial_state`` snapshot, which is cheaper and more correct than
+  delivering a partial backlog.
 """
 
 import asyncio
 import json
 import logging
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
 
+# Messages queued per connection before the client is disconnected
+DEFAULT_MAX_QUEUE = 256
+
+# Seconds a sender holds a batch so repeated updates for a chunk coalesce
+DEFAULT_COALESCE_WINDOW = 0.025
+
+# Seconds a single send may take before the client is treated as stalled
+DEFAULT_SEND_TIMEOUT = 5.0
+
+# Close code for clients disconnected for falling behind ("try again later")
+SLOW_CLIENT_CLOSE_CODE = 1013
+
+
+def _coalesce_key(message: dict[str, Any]) -> Optional[str]:
+    """Key under which newer copies of a message replace queued ones."""
+    if message.get("type") == "work_unit_update":
+        chunk = (message.get("data") or {}).get("chunk")
+        if chunk is not None:
+            return f"work_unit_update:{chunk}"
+    return None
+
+
+class _Client:
+    """Send queue and sender task for one connection."""
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        # Entries are [coalesce key, payload] so a queued payload can be
+        # replaced in place
+        self.queue: deque[list] = deque()
+        self.pending: dict[str, list] = {}
+        self.wake = asyncio.Event()
+        self.overflowed = False
+        self.task: Optional[asyncio.Task] = None
+
 
 class ConnectionManager:
     """Manages WebSocket connections for broadcasting state updates.
 
-    Tracks active connections and provides methods to broadcast messages
-    to all connected clients. Thread-safe for use with asyncio.
+    Tracks active connections and queues broadcast messages for each of
+    them; per-connection sender tasks do the sending. Must be used from a
+    single event loop.
+
+    Args:
+        max_queue: Messages queued per connection before it is dropped
+        coalesce_window: Seconds senders wait to batch and coalesce updates
+        send_timeout: Seconds a send may take before the client is dropped
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT,
+    ):
         """Initialize the connection manager."""
-        self._connections: set[WebSocket] = set()
-        self._lock = asyncio.Lock()
-
-    async def connect(self, websocket: WebSocket) -> None:
+        self.max_queue = max_queue
+        self.coalesce_window = coalesce_window
+        self.send_timeout = send_timeout
+        self._clients: dict[WebSocket, _Client] = {}
+        self.messages_sent = 0
+        self.messages_coalesced = 0
+        self.clients_dropped = 0
+        self.peak_queue_depth = 0
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        initial_message: Optional[Callable[[], Awaitable[dict[str, Any]]]] = None,
+    ) -> None:
         """Accept a new WebSocket connection and add it to the active set.
 
+        Broadcasts are queued for the connection from the moment it is
+        added. When initial_message is given, it is called after that and
+        its result is sent before anything queued, so a state snapshot is
+        never followed by an update older than itself.
+
         Args:
             websocket: The WebSocket connection to add
+            initial_message: Coroutine function building the first message
         """
         await websocket.accept()
-        async with self._lock:
-            self._connections.add(websocket)
-        logger.debug(f"WebSocket connected, total connections: {len(self._connections)}")
+        client = _Client(websocket)
+        self._clients[websocket] = client
+        logger.debug(f"WebSocket connected, total connections: {len(self._clients)}")
+
+        if initial_message is not None:
+            message = await initial_message()
+            await websocket.send_text(json.dumps(message))
+        client.task = asyncio.create_task(self._send_loop(client))
 
     async def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection from the active set.
@@ -45,50 +127,120 @@ class ConnectionManager:
         Args:
             websocket: The WebSocket connection to remove
         """
-        async with self._lock:
-            self._connections.discard(websocket)
-        logger.debug(f"WebSocket disconnected, total connections: {len(self._connections)}")
+        client = self._clients.pop(websocket, None)
+        if client is not None and client.task is not None:
+            if client.task is not asyncio.current_task():
+                client.task.cancel()
+        logger.debug(f"WebSocket disconnected, total connections: {len(self._clients)}")
 
     async def broadcast(self, message: dict[str, Any]) -> None:
         """Broadcast a message to all connected clients.
 
-        Sends the message as JSON to all active connections. Connections
-        that fail to receive the message are removed from the active set.
+        Serializes the message once and queues it for every active
+        connection; returns without waiting for any client to receive it.
 
         Args:
             message: The message dict to broadcast
         """
-        if not self._connections:
+        if not self._clients:
             return
 
         # Add timestamp to all messages
         message["timestamp"] = datetime.now(timezone.utc).isoformat()
 
-        json_message = json.dumps(message)
+        payload = json.dumps(message)
+        key = _coalesce_key(message)
+        for client in list(self._clients.values()):
+            self._enqueue(client, key, payload)
 
-        # Create a copy of connections to iterate over
-        async with self._lock:
-            connections = set(self._connections)
-
-        # Send to all connections, tracking failures
-        failed_connections: list[WebSocket] = []
-        for connection in connections:
-            try:
-                await connection.send_text(json_message)
-            except Exception as e:
-                logger.warning(f"Failed to send WebSocket message: {e}")
-                failed_connections.append(connection)
-
-        # Remove failed connections
-        if failed_connections:
-            async with self._lock:
-                for conn in failed_connections:
-                    self._connections.discard(conn)
+    def _enqueue(self, client: _Client, key: Optional[str], payload: str) -> None:
+        if client.overflowed:
+            return
+        if key is not None and key in client.pending:
+            client.pending[key][1] = payload
+            self.messages_coalesced += 1
+            return
+        if len(client.queue) >= self.max_queue:
+            # The sender disconnects the client; it will resync on reconnect
+            client.overflowed = True
+            client.queue.clear()
+            client.pending.clear()
+            client.wake.set()
+            return
+        entry = [key, payload]
+        client.queue.append(entry)
+        if key is not None:
+            client.pending[key] = entry
+        self.peak_queue_depth = max(self.peak_queue_depth, len(client.queue))
+        client.wake.set()
+
+    async def _send_loop(self, client: _Client) -> None:
+        """Drain one connection's queue until it fails or is dropped."""
+        websocket = client.websocket
+        try:
+            while True:
+                await client.wake.wait()
+                if self.coalesce_window > 0 and not client.overflowed:
+                    await asyncio.sleep(self.coalesce_window)
+                client.wake.clear()
+
+                if client.overflowed:
+                    logger.warning(
+                        f"WebSocket client fell {self.max_queue} messages behind; disconnecting"
+                    )
+                    await self._drop(client)
+                    return
+
+                while client.queue:
+                    key, payload = client.queue.popleft()
+                    if key is not None:
+                        del client.pending[key]
+                    await asyncio.wait_for(websocket.send_text(payload), self.send_timeout)
+                    self.messages_sent += 1
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"WebSocket send stalled for {self.send_timeout}s; disconnecting"
+            )
+            await self._drop(client)
+        except (WebSocketDisconnect, RuntimeError, OSError) as e:
+            logger.warning(f"Failed to send WebSocket message: {e}")
+            await self.disconnect(websocket)
+
+    async def _drop(self, client: _Client) -> None:
+        """Disconnect a client that fell behind."""
+        self.clients_dropped += 1
+        await self.disconnect(client.websocket)
+        try:
+            await asyncio.wait_for(
+                client.websocket.close(code=SLOW_CLIENT_CLOSE_CODE),
+                self.send_timeout,
+            )
+        except Exception:
+            pass
 
     @property
     def connection_count(self) -> int:
         """Return the number of active connections."""
-        return len(self._connections)
+        return len(self._clients)
+
+    def metrics(self) -> dict[str, int]:
+        """Queue depth and delivery counters for monitoring.
+
+        Returns:
+            Dict with current connections and queued messages, the deepest
+            current and all-time queue, and counts of messages sent,
+            updates coalesced away and clients dropped for falling behind.
+        """
+        depths = [len(client.queue) for client in self._clients.values()]
+        return {
+            "connections": len(depths),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "peak_queue_depth": self.peak_queue_depth,
+            "messages_sent": self.messages_sent,
+            "messages_coalesced": self.messages_coalesced,
+            "clients_dropped": self.clients_dropped,
+        }
 
 
 # Global connection manager instance
@@ -1,6 +1,7 @@
 """Language-agnostic source file enumeration for backreference scanning.
 
 # Chunk: docs/chunks/backref_language_agnostic - Language-agnostic source file enumeration
+# Chunk: docs/chunks/validate_since_ref - git diff based changed-file discovery
 
 This module provides utilities for discovering source files in a project
 directory, supporting any programming language. It uses git to enumerate
@@ -208,3 +209,90 @@ def enumerate_source_files(
 
     # Filter by extension
     return _filter_by_extension(paths, extensions)
+
+
+# Chunk: docs/chunks/validate_since_ref - Error for a ref that cannot be diffed against
+class GitRefError(ValueError):
+    """A git ref cannot be diffed against (unknown revision or not a repository)."""
+
+
+# Chunk: docs/chunks/validate_since_ref - Changed-file set for incremental validation
+def enumerate_changed_files(project_dir: pathlib.Path, since: str) -> set[str]:
+    """List files that differ between a git ref and the working tree.
+
+    Includes staged, unstaged and untracked (non-ignored) changes. Renames are
+    reported as a deletion of the old path plus an addition of the new one so
+    callers see both sides.
+
+    Args:
+        project_dir: Path to the project directory (may be a repo subdirectory).
+        since: Any git revision (branch, tag, commit, ``HEAD~3``...).
+
+    Returns:
+        Set of paths relative to project_dir, including deleted paths.
+
+    Raises:
+        GitRefError: If project_dir is not a git repository or since is not a
+            valid revision.
+    """
+    project_dir = pathlib.Path(project_dir).resolve()
+    if not _is_git_repository(project_dir):
+        raise GitRefError(f"{project_dir} is not a git repository")
+
+    diff = subprocess.run(
+        ["git", "diff", "--name-only", "--no-renames", "--relative", since, "--"],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if diff.returncode != 0:
+        raise GitRefError(f"Cannot diff against '{since}': {diff.stderr.strip()}")
+
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    changed = {line for line in diff.stdout.splitlines() if line}
+    changed.update(line for line in untracked.stdout.splitlines() if line)
+    return changed
+
+
+# Chunk: docs/chunks/validate_since_ref - Locate unchanged files that mention changed artifacts
+def find_files_containing(project_dir: pathlib.Path, needles: list[str]) -> set[str]:
+    """List tracked and untracked files containing any of the given strings.
+
+    Uses ``git grep`` so the search runs against git's index rather than
+    reading every file from Python. Matching is a plain substring match, so
+    callers should expect (and tolerate) false positives.
+
+    Args:
+        project_dir: Path to the project directory inside a git repository.
+        needles: Fixed strings to search for.
+
+    Returns:
+        Set of paths relative to project_dir. Empty if nothing matches or git
+        is unavailable.
+    """
+    if not needles:
+        return set()
+
+    args = ["git", "grep", "-l", "-I", "--untracked", "-F"]
+    for needle in needles:
+        args.extend(["-e", needle])
+    try:
+        result = subprocess.run(
+            args,
+            cwd=pathlib.Path(project_dir).resolve(),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except FileNotFoundError:
+        return set()
+    # git grep exits 1 when nothing matched
+    return {line for line in result.stdout.splitlines() if line}
@@ -11,9 +11,9 @@ import pytest
 from artifact_ordering import (
     ArtifactIndex,
     ArtifactType,
-    _enumerate_artifacts,
     _normalize_created_after,
-    _parse_created_after,
+    _parse_ordering_fields,
+    _scan_artifact_files,
     _topological_sort_multi_parent,
 )
 
@@ -129,11 +129,11 @@ class TestTopologicalSort:
         assert len(result) == 6
 
 
-class TestEnumerateArtifacts:
-    """Tests for _enumerate_artifacts function."""
+class TestScanArtifactFiles:
+    """Tests for _scan_artifact_files function."""
 
-    def test_enumerate_artifacts_returns_set_of_directories(self, tmp_path):
-        """Returns set of artifact directory names."""
+    def test_scan_artifact_files_returns_artifact_directories(self, tmp_path):
+        """Returns entries keyed by artifact directory name."""
         chunks_dir = tmp_path / "docs" / "chunks"
         chunks_dir.mkdir(parents=True)
 
@@ -143,28 +143,31 @@ class TestEnumerateArtifacts:
         (chunks_dir / "0002-second").mkdir()
         (chunks_dir / "0002-second" / "GOAL.md").write_text("# Second")
 
-        result = _enumerate_artifacts(chunks_dir, ArtifactType.CHUNK)
+        result = _scan_artifact_files(chunks_dir, ArtifactType.CHUNK)
 
-        assert result == {"0001-first", "0002-second"}
+        assert set(result) == {"0001-first", "0002-second"}
+        kind, path, _ = result["0001-first"]
+        assert kind == "local"
+        assert path == str(chunks_dir / "0001-first" / "GOAL.md")
 
-    def test_enumerate_artifacts_empty_dir(self, tmp_path):
-        """Returns empty set for empty directory."""
+    def test_scan_artifact_files_empty_dir(self, tmp_path):
+        """Returns no entries for empty directory."""
         chunks_dir = tmp_path / "docs" / "chunks"
         chunks_dir.mkdir(parents=True)
 
-        result = _enumerate_artifacts(chunks_dir, ArtifactType.CHUNK)
+        result = _scan_artifact_files(chunks_dir, ArtifactType.CHUNK)
 
-        assert result == set()
+        assert result == {}
 
-    def test_enumerate_artifacts_nonexistent_dir(self, tmp_path):
-        """Returns empty set for nonexistent directory."""
+    def test_scan_artifact_files_nonexistent_dir(self, tmp_path):
+        """Returns no entries for nonexistent directory."""
         chunks_dir = tmp_path / "docs" / "chunks"  # Not created
 
-        result = _enumerate_artifacts(chunks_dir, ArtifactType.CHUNK)
+        result = _scan_artifact_files(chunks_dir, ArtifactType.CHUNK)
 
-        assert result == set()
+        assert result == {}
 
-    def test_enumerate_artifacts_ignores_missing_main_file(self, tmp_path):
+    def test_scan_artifact_files_ignores_missing_main_file(self, tmp_path):
         """Ignores directories without the required main file."""
         chunks_dir = tmp_path / "docs" / "chunks"
         chunks_dir.mkdir(parents=True)
@@ -176,11 +179,11 @@ class TestEnumerateArtifacts:
         # Invalid chunk (no GOAL.md)
         (chunks_dir / "0002-incomplete").mkdir()
 
-        result = _enumerate_artifacts(chunks_dir, ArtifactType.CHUNK)
+        result = _scan_artifact_files(chunks_dir, ArtifactType.CHUNK)
 
-        assert result == {"0001-first"}
+        assert set(result) == {"0001-first"}
 
-    def test_enumerate_artifacts_handles_overview_md(self, tmp_path):
+    def test_scan_artifact_files_handles_overview_md(self, tmp_path):
         """Uses OVERVIEW.md for narratives/subsystems."""
         narratives_dir = tmp_path / "docs" / "narratives"
         narratives_dir.mkdir(parents=True)
@@ -188,9 +191,9 @@ class TestEnumerateArtifacts:
         (narratives_dir / "0001-test").mkdir()
         (narratives_dir / "0001-test" / "OVERVIEW.md").write_text("# Narrative")
 
-        result = _enumerate_artifacts(narratives_dir, ArtifactType.NARRATIVE)
+        result = _scan_artifact_files(narratives_dir, ArtifactType.NARRATIVE)
 
-        assert result == {"0001-test"}
+        assert set(result) == {"0001-test"}
 
 
 # Chunk: docs/chunks/artifact_pattern_consolidation - Tests for unified created_after normalization
@@ -225,27 +228,22 @@ class TestNormalizeCreatedAfter:
 
 
 class TestFrontmatterParsing:
-    """Tests for frontmatter parsing functions."""
+    """Tests for _parse_ordering_fields on artifact file content."""
 
-    def test_parse_created_after_empty_list(self, tmp_path):
+    def test_parse_created_after_empty_list(self):
         """Empty created_after returns empty list."""
-        goal = tmp_path / "GOAL.md"
-        goal.write_text(
-            """---
+        content = """---
 status: IMPLEMENTING
 created_after: []
 ---
 # Chunk Goal
 """
-        )
-        result = _parse_created_after(goal)
+        result, _ = _parse_ordering_fields("local", content)
         assert result == []
 
-    def test_parse_created_after_list(self, tmp_path):
+    def test_parse_created_after_list(self):
         """List of short names is returned as-is."""
-        goal = tmp_path / "GOAL.md"
-        goal.write_text(
-            """---
+        content = """---
 status: IMPLEMENTING
 created_after:
   - "0001-first"
@@ -253,77 +251,82 @@ created_after:
 ---
 # Chunk Goal
 """
-        )
-        result = _parse_created_after(goal)
+        result, _ = _parse_ordering_fields("local", content)
         assert result == ["0001-first", "0002-second"]
 
-    def test_parse_created_after_legacy_string(self, tmp_path):
+    def test_parse_created_after_legacy_string(self):
         """Legacy single string is converted to list."""
-        goal = tmp_path / "GOAL.md"
-        goal.write_text(
-            """---
+        content = """---
 status: IMPLEMENTING
 created_after: "0001-first"
 ---
 # Chunk Goal
 """
-        )
-        result = _parse_created_after(goal)
+        result, _ = _parse_ordering_fields("local", content)
         assert result == ["0001-first"]
 
-    def test_parse_created_after_missing_field(self, tmp_path):
+    def test_parse_created_after_missing_field(self):
         """Missing created_after field defaults to empty list."""
-        goal = tmp_path / "GOAL.md"
-        goal.write_text(
-            """---
+        content = """---
 status: IMPLEMENTING
 ---
 # Chunk Goal
 """
-        )
-        result = _parse_created_after(goal)
+        result, _ = _parse_ordering_fields("local", content)
         assert result == []
 
-    def test_parse_created_after_null_value(self, tmp_path):
+    def test_parse_created_after_null_value(self):
         """Null created_after field returns empty list."""
-        goal = tmp_path / "GOAL.md"
-        goal.write_text(
-            """---
+        content = """---
 status: IMPLEMENTING
 created_after: null
 ---
 # Chunk Goal
 """
-        )
-        result = _parse_created_after(goal)
+        result, _ = _parse_ordering_fields("local", content)
         assert result == []
 
-    def test_parse_created_after_no_frontmatter(self, tmp_path):
+    def test_parse_created_after_no_frontmatter(self):
         """File without frontmatter returns empty list."""
-        goal = tmp_path / "GOAL.md"
-        goal.write_text("# Chunk Goal\n\nNo frontmatter here.")
-        result = _parse_created_after(goal)
+        content = "# Chunk Goal\n\nNo frontmatter here."
+        result, _ = _parse_ordering_fields("local", content)
         assert result == []
 
-    def test_parse_created_after_invalid_yaml(self, tmp_path):
+    def test_parse_created_after_invalid_yaml(self):
         """Invalid YAML returns empty list."""
-        goal = tmp_path / "GOAL.md"
-        goal.write_text(
-            """---
+        content = """---
 status: IMPLEMENTING
 created_after: [unclosed bracket
 ---
 # Chunk Goal
 """
-        )
-        result = _parse_created_after(goal)
+        result, _ = _parse_ordering_fields("local", content)
         assert result == []
 
-    def test_parse_created_after_nonexistent_file(self, tmp_path):
-        """Nonexistent file returns empty list."""
-        goal = tmp_path / "nonexistent.md"
-        result = _parse_created_after(goal)
-        assert result == []
+    def test_parse_status(self):
+        """Status is returned alongside created_after."""
+        content = """---
+status: ACTIVE
+created_after: ["0001-first"]
+---
+# Chunk Goal
+"""
+        assert _parse_ordering_fields("local", content) == (["0001-first"], "ACTIVE")
+
+    def test_parse_status_missing_or_invalid(self):
+        """Missing or non-string status returns None."""
+        assert _parse_ordering_fields("local", "---\ncreated_after: []\n---\n") == ([], None)
+        assert _parse_ordering_fields("local", "---\nstatus: [ACTIVE]\n---\n") == ([], None)
+
+    def test_parse_external_yaml(self):
+        """external.yaml content is plain YAML with the EXTERNAL pseudo-status."""
+        content = 'repo: acme/other\nchunk: feature\ncreated_after: "0001-first"\n'
+        assert _parse_ordering_fields("external", content) == (["0001-first"], "EXTERNAL")
+
+    def test_parse_external_yaml_invalid(self):
+        """Invalid or empty external.yaml still yields the EXTERNAL pseudo-status."""
+        assert _parse_ordering_fields("external", "") == ([], "EXTERNAL")
+        assert _parse_ordering_fields("external", "[unclosed") == ([], "EXTERNAL")
 
 
 def _create_chunk(
@@ -623,7 +626,14 @@ class TestArtifactIndexIntegration:
         assert chunk_data["ordered"] == ["0001-test"]
         assert chunk_data["tips"] == ["0001-test"]
         assert chunk_data["directories"] == ["0001-test"]
-        assert chunk_data["version"] == 3
+        assert chunk_data["version"] == 4
+
+        # Per-artifact entries carry the data needed for incremental refresh
+        entry = chunk_data["artifacts"]["0001-test"]
+        assert entry["kind"] == "local"
+        assert entry["created_after"] == []
+        assert entry["status"] == "IMPLEMENTING"
+        assert {"mtime_ns", "size", "hash"} <= set(entry)
 
     def test_separate_type_indexes(self, tmp_path):
         """Different artifact types have separate index entries."""
@@ -879,19 +889,28 @@ class TestNonGitOperation:
         result2 = index.get_ordered(ArtifactType.CHUNK)
         assert result2 == ["0001-first"]
 
-    def test_content_changes_do_not_trigger_rebuild(self, tmp_path):
-        """Content changes don't trigger rebuild since created_after is immutable."""
+    def test_content_changes_do_not_trigger_rebuild(self, tmp_path, monkeypatch):
+        """Content changes re-parse only the changed artifact, not the whole index."""
+        import artifact_ordering
+
         chunks_dir = tmp_path / "docs" / "chunks"
         chunks_dir.mkdir(parents=True)
 
         _create_chunk(chunks_dir, "0001-first")
+        _create_chunk(chunks_dir, "0002-second", created_after=["0001-first"])
 
         index = ArtifactIndex(tmp_path)
-        index.get_ordered(ArtifactType.CHUNK)
+        ordered = index.get_ordered(ArtifactType.CHUNK)
+        tips = index.find_tips(ArtifactType.CHUNK)
 
-        # Get the index file content
-        index_file = tmp_path / ".artifact-order.json"
-        initial_content = index_file.read_text()
+        parsed: list[str] = []
+        real_parse = artifact_ordering._parse_ordering_fields
+
+        def counting_parse(kind, content):
+            parsed.append(content)
+            return real_parse(kind, content)
+
+        monkeypatch.setattr(artifact_ordering, "_parse_ordering_fields", counting_parse)
 
         # Modify the artifact content (but keep same directory)
         (chunks_dir / "0001-first" / "GOAL.md").write_text(
@@ -903,11 +922,11 @@ created_after: []
 """
         )
 
-        # Query again - should use cached index (no rebuild)
-        index.get_ordered(ArtifactType.CHUNK)
-
-        # Index file should be unchanged
-        assert index_file.read_text() == initial_content
+        # Query again - ordering is unchanged and only the edited file is parsed
+        assert index.get_ordered(ArtifactType.CHUNK) == ordered
+        assert index.find_tips(ArtifactType.CHUNK) == tips
+        assert len(parsed) == 1
+        assert "Modified content here" in parsed[0]
 
 
 class TestStatusFilteredTips:
@@ -1238,9 +1257,11 @@ class TestExternalChunkOrdering:
         # External chunk reference
         self._create_external_chunk(chunks_dir, "0002-external")
 
-        result = _enumerate_artifacts(chunks_dir, ArtifactType.CHUNK)
+        result = _scan_artifact_files(chunks_dir, ArtifactType.CHUNK)
 
-        assert result == {"0001-local", "0002-external"}
+        assert set(result) == {"0001-local", "0002-external"}
+        assert result["0001-local"][0] == "local"
+        assert result["0002-external"][0] == "external"
 
     def test_external_chunks_included_in_ordered_list(self, tmp_path):
         """External chunks appear in get_ordered() output."""
@@ -1449,3 +1470,148 @@ class TestExternalChunkOrdering:
         # Tips should only include ext_merge
         tips = index.find_tips(ArtifactType.CHUNK)
         assert tips == ["ext_merge"]
+
+
+def _age_artifacts(artifact_dir: Path, seconds: int = 60) -> None:
+    """Backdate artifact files so their stat signatures are outside the racy window."""
+    import os
+
+    for path in artifact_dir.glob("*/*"):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+# Chunk: docs/chunks/artifact_index_incremental - Incremental refresh behavior
+class TestIncrementalRefresh:
+    """Tests that index refreshes only re-parse changed artifacts."""
+
+    @pytest.fixture
+    def counters(self, monkeypatch):
+        """Count ordering-field parses and topological sorts."""
+        import artifact_ordering
+
+        counts = {"parse": 0, "sort": 0}
+        real_parse = artifact_ordering._parse_ordering_fields
+        real_sort = artifact_ordering._topological_sort_multi_parent
+
+        def counting_parse(kind, content):
+            counts["parse"] += 1
+            return real_parse(kind, content)
+
+        def counting_sort(deps):
+            counts["sort"] += 1
+            return real_sort(deps)
+
+        monkeypatch.setattr(artifact_ordering, "_parse_ordering_fields", counting_parse)
+        monkeypatch.setattr(artifact_ordering, "_topological_sort_multi_parent", counting_sort)
+        return counts
+
+    def test_unchanged_artifacts_are_not_reparsed(self, tmp_path, counters):
+        """A fresh index instance over unchanged files parses nothing."""
+        chunks_dir = tmp_path / "docs" / "chunks"
+        chunks_dir.mkdir(parents=True)
+        for i in range(5):
+            _create_chunk(chunks_dir, f"{i:04d}-chunk", status="ACTIVE")
+
+        ArtifactIndex(tmp_path).find_tips(ArtifactType.CHUNK)
+        counters["parse"] = counters["sort"] = 0
+
+        index_file = tmp_path / ".artifact-order.json"
+        before = index_file.read_text()
+        ArtifactIndex(tmp_path).find_tips(ArtifactType.CHUNK)
+
+        assert counters == {"parse": 0, "sort": 0}
+        assert index_file.read_text() == before
+
+    def test_status_change_updates_tips_without_resorting(self, tmp_path, counters):
+        """Status edits recompute tips from the cached graph only."""
+        chunks_dir = tmp_path / "docs" / "chunks"
+        chunks_dir.mkdir(parents=True)
+        _create_chunk(chunks_dir, "a_chunk", status="ACTIVE")
+        _create_chunk(chunks_dir, "b_chunk", created_after=["a_chunk"], status="ACTIVE")
+
+        index = ArtifactIndex(tmp_path)
+        assert index.find_tips(ArtifactType.CHUNK) == ["b_chunk"]
+        counters["parse"] = counters["sort"] = 0
+
+        _create_chunk(chunks_dir, "b_chunk", created_after=["a_chunk"], status="FUTURE")
+
+        assert index.find_tips(ArtifactType.CHUNK) == ["a_chunk"]
+        assert counters == {"parse": 1, "sort": 0}
+
+    def test_new_artifact_parses_only_itself(self, tmp_path, counters):
+        """Adding an artifact parses just that artifact and re-sorts the cached graph."""
+        chunks_dir = tmp_path / "docs" / "chunks"
+        chunks_dir.mkdir(parents=True)
+        for i in range(5):
+            created_after = [f"{i - 1:04d}-chunk"] if i > 0 else None
+            _create_chunk(chunks_dir, f"{i:04d}-chunk", created_after=created_after, status="ACTIVE")
+        _age_artifacts(chunks_dir)
+
+        index = ArtifactIndex(tmp_path)
+        index.get_ordered(ArtifactType.CHUNK)
+        counters["parse"] = counters["sort"] = 0
+
+        _create_chunk(chunks_dir, "0005-chunk", created_after=["0004-chunk"], status="ACTIVE")
+
+        assert index.get_ordered(ArtifactType.CHUNK)[-1] == "0005-chunk"
+        assert index.find_tips(ArtifactType.CHUNK) == ["0005-chunk"]
+        assert counters == {"parse": 1, "sort": 1}
+
+    def test_same_size_rewrite_with_preserved_mtime_is_detected(self, tmp_path):
+        """Racy rewrites that keep size and mtime are caught by the content hash."""
+        import os
+
+        chunks_dir = tmp_path / "docs" / "chunks"
+        chunks_dir.mkdir(parents=True)
+        _create_chunk(chunks_dir, "a_chunk", status="ACTIVE")
+        _create_chunk(chunks_dir, "b_chunk", created_after=["a_chunk"], status="ACTIVE")
+        goal = chunks_dir / "b_chunk" / "GOAL.md"
+        st = goal.stat()
+
+        index = ArtifactIndex(tmp_path)
+        assert index.find_tips(ArtifactType.CHUNK) == ["b_chunk"]
+
+        # FUTURE and ACTIVE have the same length
+        _create_chunk(chunks_dir, "b_chunk", created_after=["a_chunk"], status="FUTURE")
+        os.utime(goal, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert ArtifactIndex(tmp_path).find_tips(ArtifactType.CHUNK) == ["a_chunk"]
+
+    def test_stale_version_index_is_rebuilt(self, tmp_path):
+        """Indexes written by older versions are rebuilt transparently."""
+        import json
+
+        chunks_dir = tmp_path / "docs" / "chunks"
+        chunks_dir.mkdir(parents=True)
+        _create_chunk(chunks_dir, "a_chunk", status="ACTIVE")
+        (tmp_path / ".artifact-order.json").write_text(json.dumps({
+            "chunk": {"ordered": ["bogus"], "tips": ["bogus"],
+                      "directories": ["a_chunk"], "version": 3},
+        }))
+
+        index = ArtifactIndex(tmp_path)
+
+        assert index.get_ordered(ArtifactType.CHUNK) == ["a_chunk"]
+        assert index.find_tips(ArtifactType.CHUNK) == ["a_chunk"]
+
+    def test_warm_tip_query_on_1000_chunks(self, tmp_path):
+        """Warm tip listing on 1,000 settled chunks avoids parsing entirely."""
+        import time
+
+        chunks_dir = tmp_path / "docs" / "chunks"
+        chunks_dir.mkdir(parents=True)
+        for i in range(1000):
+            created_after = [f"{i - 1:04d}-chunk"] if i > 0 else None
+            _create_chunk(chunks_dir, f"{i:04d}-chunk", created_after=created_after, status="ACTIVE")
+        _age_artifacts(chunks_dir)
+
+        ArtifactIndex(tmp_path).find_tips(ArtifactType.CHUNK)
+
+        start = time.perf_counter()
+        tips = ArtifactIndex(tmp_path).find_tips(ArtifactType.CHUNK)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert tips == ["0999-chunk"]
+        # Dominated by one stat per artifact; generous headroom for CI
+        assert elapsed_ms < 250, f"Warm query took {elapsed_ms:.1f}ms, expected <250ms"
@@ -1,6 +1,7 @@
 """Tests for backreference scanning and management.
 
 # Chunk: docs/chunks/backref_language_agnostic - Tests for backreference filter bug fix
+# Chunk: docs/chunks/integrity_parallel_scan - Tests for single-pass backreference scanning
 """
 
 import pathlib
@@ -9,7 +10,13 @@ import subprocess
 import pytest
 
 from conftest import make_ve_initialized_git_repo
-from backreferences import count_backreferences, BackreferenceInfo
+from backreferences import (
+    CHUNK_BACKREF_PATTERN,
+    SUBSYSTEM_BACKREF_PATTERN,
+    BackreferenceInfo,
+    count_backreferences,
+    scan_code_backreferences,
+)
 
 
 class TestCountBackreferencesFilterBugFix:
@@ -312,3 +319,55 @@ class TestBackreferenceInfoProperties:
         assert results[0].unique_chunk_count == 3
         assert results[1].unique_chunk_count == 2
         assert results[2].unique_chunk_count == 1
+
+
+class TestScanCodeBackreferences:
+    """Tests for the combined single-pass chunk/subsystem scanner."""
+
+    def test_finds_chunk_and_subsystem_refs_with_line_numbers(self):
+        """Hits are reported in file order with 1-indexed line numbers."""
+        content = (
+            '"""Module."""\n'
+            "# Chunk: docs/chunks/alpha - First\n"
+            "\n"
+            "# Subsystem: docs/subsystems/beta - Second\n"
+            "#   Chunk:   docs/chunks/gamma\n"
+        )
+        assert scan_code_backreferences(content) == [
+            (2, "chunk", "alpha"),
+            (4, "subsystem", "beta"),
+            (5, "chunk", "gamma"),
+        ]
+
+    def test_ignores_non_matching_lines(self):
+        """Indented, narrative and non-comment mentions are not backreferences."""
+        content = (
+            "    # Chunk: docs/chunks/indented\n"
+            "# Narrative: docs/narratives/story\n"
+            "x = '# Chunk: docs/chunks/in_string'\n"
+            "#Chunk: docs/chunks/no_space\n"
+        )
+        assert scan_code_backreferences(content) == []
+
+    def test_content_without_markers_is_empty(self):
+        """Files with no markers are rejected without line scanning."""
+        assert scan_code_backreferences("def foo():\n    return 1\n") == []
+
+    def test_matches_separate_patterns(self):
+        """The combined scan agrees with the per-kind patterns line by line."""
+        content = (
+            "# Chunk: docs/chunks/a_1 - x\r\n"
+            "# Subsystem: docs/subsystems/s-2\n"
+            "# Chunk: docs/chunks/UPPER\n"
+            "# Subsystem:\tdocs/subsystems/tabbed\n"
+            "# Chunk: docs/subsystems/wrong_dir\n"
+        )
+        expected = []
+        for line_num, line in enumerate(content.splitlines(), start=1):
+            if match := CHUNK_BACKREF_PATTERN.match(line):
+                expected.append((line_num, "chunk", match.group(1)))
+            if match := SUBSYSTEM_BACKREF_PATTERN.match(line):
+                expected.append((line_num, "subsystem", match.group(1)))
+
+        assert scan_code_backreferences(content) == expected
+        assert len(expected) == 3
@@ -735,6 +735,51 @@ def test_watch_multi_command_output_format(runner, stored_swarm, tmp_path):
     assert "[ch-beta] message from beta" in result.output
 
 
+# Chunk: docs/chunks/leader_board_stream_watch - --stream flag
+def test_watch_multi_stream_flag_requests_streaming(runner, stored_swarm, tmp_path):
+    """watch-multi --stream asks the client for a streaming subscription."""
+    swarm_id, seed, pub, keys_dir = stored_swarm
+    sym_key = derive_symmetric_key(seed)
+    received_kwargs = {}
+
+    async def mock_watch_multi(channels, count=1, auto_ack=True, **kwargs):
+        received_kwargs.update(kwargs)
+        yield {
+            "channel": "ch-alpha",
+            "position": 1,
+            "body": encrypt("hello", sym_key),
+            "sent_at": "2026-03-16T00:00:00Z",
+        }
+
+    with patch("cli.board.load_keypair", return_value=(seed, pub)), \
+         patch("cli.board.load_cursor", return_value=0), \
+         patch("cli.board.save_cursor"), \
+         patch("cli.board.load_board_config", return_value=BoardConfig()), \
+         patch("cli.board.BoardClient") as MockClient:
+
+        instance = MockClient.return_value
+        instance.connect = AsyncMock()
+        instance.watch_multi_with_reconnect = mock_watch_multi
+        instance.close = AsyncMock()
+
+        result = runner.invoke(board, [
+            "watch-multi", "ch-alpha",
+            "--swarm", swarm_id,
+            "--server", "ws://test:8787",
+            "--project-root", str(tmp_path),
+            "--stream",
+        ])
+
+    assert result.exit_code == 0
+    assert received_kwargs["stream"] is True
+    assert "[ch-alpha] hello" in result.output
+
+    result = runner.invoke(board, [
+        "watch-multi", "ch-alpha", "--swarm", swarm_id, "--stream", "--no-auto-ack",
+    ])
+    assert result.exit_code != 0
+
+
 def test_watch_multi_advances_cursors(runner, stored_swarm, tmp_path):
     """watch-multi auto-advances cursor files for each channel independently."""
     swarm_id, seed, pub, keys_dir = stored_swarm
@@ -1939,3 +1984,28 @@ def test_ack_head_guard_no_swarm_skips_guard(runner, tmp_path):
     assert result.exit_code == 0
     assert load_cursor("ch", tmp_path) == 1  # advanced from 0 to 1
     assert "ack rejected" not in result.output
+
+
+# Chunk: docs/chunks/leader_board_binary_records - migrate-storage command
+def test_migrate_storage_converts_json_segments(runner, tmp_path):
+    ch_dir = tmp_path / "swarms" / "s" / "channels" / "ch"
+    (ch_dir / "segments").mkdir(parents=True)
+    (ch_dir / "segments" / f"{1:020d}.jsonl").write_text(json.dumps({
+        "channel": "ch",
+        "position": 1,
+        "body": b"hello".hex(),
+        "sent_at": "2026-01-01T00:00:00+00:00",
+    }) + "\n")
+    (ch_dir / "meta.json").write_text(json.dumps({
+        "head_position": 1,
+        "oldest_position": 1,
+        "segment_size": 4096,
+        "index_interval": 64,
+    }))
+
+    result = runner.invoke(board, ["migrate-storage", "--storage-dir", str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert "s/ch:" in result.output
+    assert "Converted 1 channel(s)" in result.output
+    assert (ch_dir / "segments" / f"{1:020d}.log").exists()
@@ -3169,3 +3169,100 @@ async def test_watch_multi_with_reconnect_5xx_handshake_exhausts_budget(keypair)
                         pass
 
     assert connect_call_count == 3
+
+
+# ---------------------------------------------------------------------------
+# Chunk: docs/chunks/leader_board_stream_watch - Streaming watch_multi tests
+# ---------------------------------------------------------------------------
+
+
+def _messages_frame(channel, positions):
+    return json.dumps({
+        "type": "messages",
+        "channel": channel,
+        "messages": [
+            {"position": p, "body": f"b{p}==", "sent_at": "2026-03-16T00:00:00Z"}
+            for p in positions
+        ],
+    })
+
+
+@pytest.mark.asyncio
+async def test_watch_multi_stream_yields_batches_and_returns_credits(keypair):
+    """Streaming mode opens one subscription and returns credits in bulk."""
+    seed, pub, swarm_id = keypair
+    challenge = json.dumps({"type": "challenge", "nonce": "aa" * 32})
+    auth_ok = json.dumps({"type": "auth_ok"})
+
+    mock_ws = _make_mock_ws([])
+    mock_ws.recv = AsyncMock(side_effect=[
+        challenge, auth_ok,
+        _messages_frame("ch-a", [1, 2]),
+        _messages_frame("ch-a", [3]),
+        _messages_frame("ch-a", [4, 5]),
+        websockets.exceptions.ConnectionClosedError(None, None),
+    ])
+
+    with patch("board.client.websockets.connect", return_value=_async_ctx(mock_ws)):
+        client = BoardClient("ws://localhost:8787", swarm_id, seed)
+        await client.connect()
+
+        results = []
+        with pytest.raises(websockets.exceptions.ConnectionClosedError):
+            async for msg in client.watch_multi({"ch-a": 0}, count=0, stream=True, window=6):
+                results.append(msg)
+
+    assert [m["position"] for m in results] == [1, 2, 3, 4, 5]
+    assert results[0] == {
+        "channel": "ch-a", "position": 1, "body": "b1==", "sent_at": "2026-03-16T00:00:00Z",
+    }
+
+    sent_frames = [json.loads(call.args[0]) for call in mock_ws.send.call_args_list]
+    watch_frames = [f for f in sent_frames if f["type"] == "watch"]
+    assert watch_frames == [{
+        "type": "watch", "channel": "ch-a", "swarm": swarm_id, "cursor": 0,
+        "stream": True, "max_batch": 6, "credits": 6,
+    }]
+    # Credits go back once half the window (3 messages) has been consumed
+    assert [f["credits"] for f in sent_frames if f["type"] == "credit"] == [3]
+
+
+@pytest.mark.asyncio
+async def test_watch_multi_stream_falls_back_to_single_messages(keypair):
+    """A server without streaming answers with message frames; the client re-watches."""
+    seed, pub, swarm_id = keypair
+    challenge = json.dumps({"type": "challenge", "nonce": "aa" * 32})
+    auth_ok = json.dumps({"type": "auth_ok"})
+    msg = json.dumps({
+        "type": "message", "channel": "ch-a", "position": 7,
+        "body": "body==", "sent_at": "2026-03-16T00:00:00Z",
+    })
+
+    mock_ws = _make_mock_ws([])
+    mock_ws.recv = AsyncMock(side_effect=[
+        challenge, auth_ok, msg,
+        websockets.exceptions.ConnectionClosedError(None, None),
+    ])
+
+    with patch("board.client.websockets.connect", return_value=_async_ctx(mock_ws)):
+        client = BoardClient("ws://localhost:8787", swarm_id, seed)
+        await client.connect()
+
+        results = []
+        with pytest.raises(websockets.exceptions.ConnectionClosedError):
+            async for m in client.watch_multi({"ch-a": 6}, count=0, stream=True):
+                results.append(m)
+
+    assert [m["position"] for m in results] == [7]
+    sent_frames = [json.loads(call.args[0]) for call in mock_ws.send.call_args_list]
+    assert [f["cursor"] for f in sent_frames if f["type"] == "watch"] == [6, 7]
+
+
+@pytest.mark.asyncio
+async def test_watch_multi_stream_requires_auto_ack(keypair):
+    seed, pub, swarm_id = keypair
+    client = BoardClient("ws://localhost:8787", swarm_id, seed)
+
+    with pytest.raises(ValueError):
+        async for _ in client.watch_multi({"ch-a": 0}, stream=True, auto_ack=False):
+            pass
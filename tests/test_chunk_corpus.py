@@ -0,0 +1,142 @@
+"""Tests for the persisted TF-IDF chunk corpus."""
+# Subsystem: docs/subsystems/cluster_analysis - Chunk naming and clustering
+# Chunk: docs/chunks/cluster_tfidf_corpus - Persisted incremental TF-IDF corpus
+
+import pytest
+
+import chunk_corpus
+from chunk_corpus import ChunkCorpus, analyze
+
+
+GOALS = {
+    "orch_scheduler": "The scheduler dispatches work units to agents in worktrees.",
+    "orch_worktree": "Worktree creation and cleanup for orchestrator work units.",
+    "orch_merge": "Merge finished worktree branches back into the base branch.",
+    "template_render": "Render Jinja templates into chunk documents.",
+    "template_include": "Template includes share partial Jinja fragments.",
+}
+
+
+def write_goal(root, name, text):
+    goal_path = root / "docs" / "chunks" / name / "GOAL.md"
+    goal_path.parent.mkdir(parents=True, exist_ok=True)
+    goal_path.write_text(f"---\nstatus: ACTIVE\n---\n\n{text}\n")
+    return goal_path
+
+
+@pytest.fixture
+def corpus_docs(tmp_path):
+    return [(name, write_goal(tmp_path, name, text)) for name, text in GOALS.items()]
+
+
+class TestAnalyze:
+    def test_drops_stop_words_and_short_tokens_before_bigrams(self):
+        counts = analyze("The Scheduler and the scheduler, a x worktree")
+
+        assert counts["scheduler"] == 2
+        assert counts["scheduler scheduler"] == 1
+        assert counts["scheduler worktree"] == 1
+        assert "the" not in counts
+        assert "x" not in counts
+
+
+class TestTfidfModel:
+    def test_matches_scikit_learn_vectorizer(self, tmp_path, corpus_docs):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+        from chunks import extract_goal_text
+
+        corpus = ChunkCorpus(tmp_path)
+        keys = corpus.sync(corpus_docs)
+        model = corpus.model()
+
+        texts = [extract_goal_text(path) for _, path in corpus_docs]
+        vectorizer = TfidfVectorizer(
+            stop_words="english", max_features=500, ngram_range=(1, 2)
+        )
+        expected = cosine_similarity(vectorizer.fit_transform(texts))
+
+        assert set(model.idf) == set(vectorizer.vocabulary_)
+        for i, key in enumerate(keys):
+            sims = model.similarities(key)
+            for j, other in enumerate(keys):
+                assert sims.get(other, 0.0) == pytest.approx(expected[i, j], abs=1e-12)
+
+    def test_top_k_excludes_self_and_fills_with_zero_scores(self, tmp_path, corpus_docs):
+        corpus = ChunkCorpus(tmp_path)
+        keys = corpus.sync(corpus_docs)
+
+        ranked = corpus.model().top_k(keys, 0, 4)
+        names = [corpus.documents[keys[i]].name for i, _ in ranked]
+
+        assert 0 not in [i for i, _ in ranked]
+        assert names[0] in ("orch_worktree", "orch_merge")
+        # The template chunks share nothing with the scheduler chunk
+        assert ranked[-1][1] == 0.0
+
+    def test_subset_model_matches_fresh_corpus(self, tmp_path, corpus_docs):
+        corpus = ChunkCorpus(tmp_path)
+        keys = corpus.sync(corpus_docs)
+        subset = corpus.model(keys[:3])
+
+        fresh_root = tmp_path / "fresh"
+        fresh = ChunkCorpus(fresh_root)
+        fresh_keys = fresh.sync(
+            [(name, write_goal(fresh_root, name, GOALS[name])) for name, _ in corpus_docs[:3]]
+        )
+
+        # Keys are relative to each corpus root, so they line up
+        assert fresh_keys == keys[:3]
+        assert subset.idf == pytest.approx(fresh.model().idf)
+        assert subset.similarities(keys[0]) == pytest.approx(
+            fresh.model().similarities(keys[0])
+        )
+
+    def test_empty_vocabulary_raises(self, tmp_path):
+        corpus = ChunkCorpus(tmp_path)
+        corpus.sync([("empty", write_goal(tmp_path, "empty", "the and of"))])
+
+        with pytest.raises(ValueError):
+            corpus.model()
+
+
+class TestChunkCorpusPersistence:
+    def test_only_changed_goals_are_retokenized(self, tmp_path, corpus_docs, monkeypatch):
+        ChunkCorpus(tmp_path).sync(corpus_docs)
+
+        analyzed = []
+        real_analyze = chunk_corpus.analyze
+        monkeypatch.setattr(
+            chunk_corpus, "analyze", lambda text: analyzed.append(text) or real_analyze(text)
+        )
+        write_goal(tmp_path, "orch_merge", "Merge strategies for conflicting branches.")
+
+        corpus = ChunkCorpus(tmp_path)
+        corpus.sync(corpus_docs)
+
+        assert len(analyzed) == 1
+        assert "conflicting" in analyzed[0]
+
+    def test_incremental_statistics_match_rebuild(self, tmp_path, corpus_docs):
+        corpus = ChunkCorpus(tmp_path)
+        corpus.sync(corpus_docs)
+        write_goal(tmp_path, "orch_merge", "Merge strategies for conflicting branches.")
+        corpus.sync(corpus_docs[1:])
+
+        corpus.path.unlink()
+        rebuilt = ChunkCorpus(tmp_path)
+        rebuilt.sync(corpus_docs[1:])
+
+        assert corpus.doc_freq == rebuilt.doc_freq
+        assert corpus.term_totals == rebuilt.term_totals
+        assert "orch_scheduler" not in [doc.name for doc in corpus.documents.values()]
+
+    def test_corrupt_store_is_rebuilt(self, tmp_path, corpus_docs):
+        corpus = ChunkCorpus(tmp_path)
+        corpus.sync(corpus_docs)
+        corpus.path.write_text("{not json")
+
+        rebuilt = ChunkCorpus(tmp_path)
+        assert rebuilt.documents == {}
+        rebuilt.sync(corpus_docs)
+        assert rebuilt.doc_freq == corpus.doc_freq
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 
 from entity_episodic import tokenize, EpisodicChunk, build_chunks, BM25Index, SearchResult, EpisodicStore
-from entity_transcript import Turn, SessionTranscript
+from entity_transcript import Turn, SessionTranscript, parse_session_jsonl
 
 
 def _make_turn(role, text, timestamp="2026-01-01T00:00:00Z", uuid="abc"):
@@ -160,8 +160,7 @@ class TestEpisodicStoreIndexing:
         store.build_or_update()
 
         assert store.index_path.exists()
-        data = json.loads(store.index_path.read_text())
-        assert len(data["chunks"]) > 0
+        assert len(store.list_chunks()) > 0
 
     def test_build_or_update_skips_already_indexed_sessions(self, tmp_path):
         entity_dir = tmp_path / "entity"
@@ -177,14 +176,12 @@ class TestEpisodicStoreIndexing:
         store = EpisodicStore(entity_dir)
         store.build_or_update()
 
-        data1 = json.loads(store.index_path.read_text())
-        indexed_count1 = len(data1["indexed_sessions"])
+        indexed_count1 = len(store.indexed_sessions())
 
         # Second call should not re-index
         store.build_or_update()
 
-        data2 = json.loads(store.index_path.read_text())
-        indexed_count2 = len(data2["indexed_sessions"])
+        indexed_count2 = len(store.indexed_sessions())
 
         assert indexed_count1 == indexed_count2
 
@@ -203,8 +200,7 @@ class TestEpisodicStoreIndexing:
 
         store = EpisodicStore(entity_dir)
         store.build_or_update()
-        data1 = json.loads(store.index_path.read_text())
-        chunks_count1 = len(data1["chunks"])
+        chunks_count1 = len(store.list_chunks())
 
         # Add session B
         _make_session_jsonl(
@@ -216,14 +212,13 @@ class TestEpisodicStoreIndexing:
         )
 
         store.build_or_update()
-        data2 = json.loads(store.index_path.read_text())
-        chunks_count2 = len(data2["chunks"])
+        chunks_count2 = len(store.list_chunks())
 
         # More chunks after adding session B
         assert chunks_count2 > chunks_count1
         # Both sessions indexed
-        assert "session_a" in data2["indexed_sessions"]
-        assert "session_b" in data2["indexed_sessions"]
+        assert "session_a" in store.indexed_sessions()
+        assert "session_b" in store.indexed_sessions()
 
     def test_build_or_update_handles_no_sessions_directory(self, tmp_path):
         entity_dir = tmp_path / "entity"
@@ -301,13 +296,12 @@ class TestEpisodicStoreExpand:
         store = EpisodicStore(entity_dir)
         store.build_or_update()
 
-        data = json.loads(store.index_path.read_text())
         # Find a chunk near the middle
-        chunks = data["chunks"]
+        chunks = store.list_chunks()
         # pick one with anchor_start around turn 8-12
         mid_chunk = None
         for c in chunks:
-            if 5 <= c["anchor_start"] <= 12:
+            if 5 <= c.anchor_start <= 12:
                 mid_chunk = c
                 break
 
@@ -315,7 +309,7 @@ class TestEpisodicStoreExpand:
             # Just use first chunk
             mid_chunk = chunks[0]
 
-        expanded = store.expand(mid_chunk["session_id"], mid_chunk["chunk_id"], radius=5)
+        expanded = store.expand(mid_chunk.session_id, mid_chunk.chunk_id, radius=5)
         assert expanded is not None
         assert len(expanded) > 0
 
@@ -324,10 +318,9 @@ class TestEpisodicStoreExpand:
         store = EpisodicStore(entity_dir)
         store.build_or_update()
 
-        data = json.loads(store.index_path.read_text())
-        chunk = data["chunks"][0]
+        chunk = store.list_chunks()[0]
 
-        expanded = store.expand(chunk["session_id"], chunk["chunk_id"], radius=3)
+        expanded = store.expand(chunk.session_id, chunk.chunk_id, radius=3)
         assert expanded is not None
         assert ">>>" in expanded
 
@@ -336,11 +329,81 @@ class TestEpisodicStoreExpand:
         store = EpisodicStore(entity_dir)
         store.build_or_update()
 
-        data = json.loads(store.index_path.read_text())
         # Find chunk with anchor_start == 0 (or the earliest chunk)
-        chunks = sorted(data["chunks"], key=lambda c: c["anchor_start"])
+        chunks = sorted(store.list_chunks(), key=lambda c: c.anchor_start)
         first_chunk = chunks[0]
 
         # Should not raise IndexError
-        expanded = store.expand(first_chunk["session_id"], first_chunk["chunk_id"], radius=100)
+        expanded = store.expand(first_chunk.session_id, first_chunk.chunk_id, radius=100)
         assert expanded is not None
+
+
+# Chunk: docs/chunks/episodic_inverted_index - Persisted inverted index tests
+class TestEpisodicInvertedIndex:
+    def _write_sessions(self, sessions_dir, topics):
+        for name, topic in topics.items():
+            _make_session_jsonl(
+                sessions_dir / f"{name}.jsonl",
+                turns=[
+                    {"type": "user", "text": f"Substantive question about {topic} and how it behaves."},
+                    {"type": "assistant", "text": f"Detailed answer about {topic} covering edge cases."},
+                ] * 5,
+            )
+
+    def test_persisted_scores_match_in_memory_index(self, tmp_path):
+        entity_dir = tmp_path / "entity"
+        self._write_sessions(entity_dir / "sessions", {
+            "s1": "websocket reconnect logic",
+            "s2": "database migration scripts",
+            "s3": "websocket heartbeat timeouts",
+        })
+        store = EpisodicStore(entity_dir)
+        store.build_or_update()
+
+        expected = BM25Index.build(store.list_chunks()).search("websocket reconnect", top_k=5)
+        results = store.search("websocket reconnect", top_k=5)
+
+        assert [(r.chunk_id, r.score) for r in results] == [
+            (c.chunk_id, s) for c, s in expected
+        ]
+
+    def test_incremental_update_matches_full_rebuild(self, tmp_path):
+        incremental_dir = tmp_path / "incremental"
+        self._write_sessions(incremental_dir / "sessions", {"s1": "caching strategy"})
+        incremental = EpisodicStore(incremental_dir)
+        incremental.build_or_update()
+        self._write_sessions(incremental_dir / "sessions", {"s2": "caching eviction"})
+        incremental.build_or_update()
+
+        expected = BM25Index.build(incremental.list_chunks()).search("caching eviction", top_k=10)
+        results = incremental.search("caching eviction", top_k=10)
+
+        assert [(r.chunk_id, r.score) for r in results] == [
+            (c.chunk_id, s) for c, s in expected
+        ]
+
+    def test_legacy_json_index_is_imported(self, tmp_path):
+        entity_dir = tmp_path / "entity"
+        self._write_sessions(entity_dir / "sessions", {"s1": "websocket reconnect logic"})
+        store = EpisodicStore(entity_dir)
+        chunks = build_chunks(parse_session_jsonl(entity_dir / "sessions" / "s1.jsonl"))
+        store.legacy_index_path.parent.mkdir(parents=True)
+        store.legacy_index_path.write_text(json.dumps({
+            "indexed_sessions": ["s1"],
+            "chunks": [c.__dict__ for c in chunks],
+            "doc_freqs": {},
+            "doc_lengths": [],
+            "tokenized_docs": [],
+        }))
+
+        store.build_or_update()
+
+        assert not store.legacy_index_path.exists()
+        assert store.indexed_sessions() == ["s1"]
+        assert len(store.list_chunks()) == len(chunks)
+        assert store.search("websocket")[0].session_id == "s1"
+
+    def test_search_without_index_returns_empty(self, tmp_path):
+        store = EpisodicStore(tmp_path / "entity")
+        assert store.search("anything") == []
+        assert store.expand("missing", 0) is None
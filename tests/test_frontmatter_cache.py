@@ -0,0 +1,284 @@
+"""Tests for the persistent frontmatter cache.
+
+# Chunk: docs/chunks/frontmatter_parse_cache - Persistent parsed-frontmatter cache
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+import frontmatter as frontmatter_module
+from chunks import Chunks
+from frontmatter import parse_frontmatter_from_content_with_errors
+from frontmatter_cache import (
+    FRONTMATTER_CACHE_DIR,
+    clear_memo,
+    model_version,
+    parse_frontmatter_cached,
+)
+from narratives import Narratives
+
+
+class StubFrontmatter(BaseModel):
+    """Simple model for cache tests."""
+
+    status: str
+    count: int = 0
+
+
+class StubFrontmatterV2(BaseModel):
+    """Same shape as StubFrontmatter plus a field, to vary the schema."""
+
+    status: str
+    count: int = 0
+    extra: str | None = None
+
+
+@pytest.fixture(autouse=True)
+def fresh_memo():
+    """Isolate tests from memo entries created by other tests."""
+    clear_memo()
+    yield
+    clear_memo()
+
+
+class CountingParser:
+    """Content parser that records how often it is invoked."""
+
+    def __init__(self, model_class):
+        self.model_class = model_class
+        self.calls = 0
+
+    def __call__(self, content):
+        self.calls += 1
+        return parse_frontmatter_from_content_with_errors(content, self.model_class)
+
+
+def _write(path: Path, status: str, count: int = 0) -> None:
+    path.write_text(f"---\nstatus: {status}\ncount: {count}\n---\n\n# Body\n")
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate a file so its stat signature is outside the racy window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestParseFrontmatterCached:
+    """Tests for parse_frontmatter_cached."""
+
+    def test_memo_parses_file_once(self, tmp_path):
+        """Repeated parses of an unchanged file only invoke the parser once."""
+        md = tmp_path / "GOAL.md"
+        _write(md, "ACTIVE", 3)
+        parser = CountingParser(StubFrontmatter)
+
+        for _ in range(3):
+            model, errors = parse_frontmatter_cached(md, StubFrontmatter, parser)
+            assert model.status == "ACTIVE"
+            assert model.count == 3
+            assert errors == []
+
+        assert parser.calls == 1
+
+    def test_disk_cache_survives_new_process(self, tmp_path):
+        """A cleared memo (new process) is served from the on-disk store."""
+        md = tmp_path / "GOAL.md"
+        _write(md, "ACTIVE")
+        cache_dir = tmp_path / "cache"
+        parser = CountingParser(StubFrontmatter)
+
+        parse_frontmatter_cached(md, StubFrontmatter, parser, cache_dir=cache_dir)
+        clear_memo()
+        model, _ = parse_frontmatter_cached(md, StubFrontmatter, parser, cache_dir=cache_dir)
+
+        assert model.status == "ACTIVE"
+        assert parser.calls == 1
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_content_change_with_same_size_and_mtime_is_detected(self, tmp_path):
+        """Rewrites hidden by coarse timestamps are caught by the content digest."""
+        md = tmp_path / "GOAL.md"
+        _write(md, "FUTURE")
+        st = md.stat()
+        parser = CountingParser(StubFrontmatter)
+        parse_frontmatter_cached(md, StubFrontmatter, parser, cache_dir=tmp_path / "c")
+
+        # Same length status, restored mtime: stat signature is unchanged
+        _write(md, "ACTIVE")
+        os.utime(md, ns=(st.st_atime_ns, st.st_mtime_ns))
+        model, _ = parse_frontmatter_cached(md, StubFrontmatter, parser, cache_dir=tmp_path / "c")
+
+        assert model.status == "ACTIVE"
+        assert parser.calls == 2
+
+    def test_stale_disk_entry_is_replaced(self, tmp_path):
+        """Edits after a previous run re-parse and overwrite the disk entry."""
+        md = tmp_path / "GOAL.md"
+        cache_dir = tmp_path / "cache"
+        parser = CountingParser(StubFrontmatter)
+        _write(md, "FUTURE")
+        parse_frontmatter_cached(md, StubFrontmatter, parser, cache_dir=cache_dir)
+
+        clear_memo()
+        _write(md, "IMPLEMENTING")
+        model, _ = parse_frontmatter_cached(md, StubFrontmatter, parser, cache_dir=cache_dir)
+
+        assert model.status == "IMPLEMENTING"
+        assert parser.calls == 2
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_stat_fast_path_skips_read_for_old_files(self, tmp_path, monkeypatch):
+        """Files older than the racy window are served from the memo by stat alone."""
+        md = tmp_path / "GOAL.md"
+        _write(md, "ACTIVE")
+        _age(md)
+        parser = CountingParser(StubFrontmatter)
+        parse_frontmatter_cached(md, StubFrontmatter, parser)
+
+        def fail_read(self):
+            raise AssertionError("file should not be re-read")
+
+        monkeypatch.setattr(Path, "read_bytes", fail_read)
+        model, _ = parse_frontmatter_cached(md, StubFrontmatter, parser)
+        assert model.status == "ACTIVE"
+
+    def test_validation_errors_are_cached(self, tmp_path):
+        """Invalid frontmatter is not re-parsed and its errors are preserved."""
+        md = tmp_path / "GOAL.md"
+        md.write_text("---\ncount: not-a-number\n---\n")
+        cache_dir = tmp_path / "cache"
+        parser = CountingParser(StubFrontmatter)
+
+        first = parse_frontmatter_cached(md, StubFrontmatter, parser, cache_dir=cache_dir)
+        clear_memo()
+        second = parse_frontmatter_cached(md, StubFrontmatter, parser, cache_dir=cache_dir)
+
+        assert first[0] is None and second[0] is None
+        assert first[1] == second[1]
+        assert any("status" in e for e in second[1])
+        assert parser.calls == 1
+
+    def test_model_version_separates_entries(self, tmp_path):
+        """Different models never share a cache entry for the same file."""
+        assert model_version(StubFrontmatter) != model_version(StubFrontmatterV2)
+
+        md = tmp_path / "GOAL.md"
+        _write(md, "ACTIVE")
+        cache_dir = tmp_path / "cache"
+        v1 = CountingParser(StubFrontmatter)
+        v2 = CountingParser(StubFrontmatterV2)
+
+        parse_frontmatter_cached(md, StubFrontmatter, v1, cache_dir=cache_dir)
+        model, _ = parse_frontmatter_cached(md, StubFrontmatterV2, v2, cache_dir=cache_dir)
+
+        assert isinstance(model, StubFrontmatterV2)
+        assert v1.calls == 1 and v2.calls == 1
+
+    def test_corrupt_disk_entry_is_a_miss(self, tmp_path):
+        """Garbage in the cache directory falls back to parsing."""
+        md = tmp_path / "GOAL.md"
+        _write(md, "ACTIVE")
+        cache_dir = tmp_path / "cache"
+        parser = CountingParser(StubFrontmatter)
+        parse_frontmatter_cached(md, StubFrontmatter, parser, cache_dir=cache_dir)
+        for entry in cache_dir.glob("*.json"):
+            entry.write_text("{not json")
+
+        clear_memo()
+        model, _ = parse_frontmatter_cached(md, StubFrontmatter, parser, cache_dir=cache_dir)
+
+        assert model.status == "ACTIVE"
+        assert parser.calls == 2
+
+    def test_returned_models_are_independent(self, tmp_path):
+        """Mutating a returned model does not leak into later parses."""
+        md = tmp_path / "GOAL.md"
+        _write(md, "ACTIVE")
+        parser = CountingParser(StubFrontmatter)
+
+        model, _ = parse_frontmatter_cached(md, StubFrontmatter, parser)
+        model.status = "MUTATED"
+        again, _ = parse_frontmatter_cached(md, StubFrontmatter, parser)
+
+        assert again.status == "ACTIVE"
+
+    def test_missing_file(self, tmp_path):
+        """Missing files report the standard not-found error."""
+        parser = CountingParser(StubFrontmatter)
+        model, errors = parse_frontmatter_cached(
+            tmp_path / "missing.md", StubFrontmatter, parser
+        )
+        assert model is None
+        assert errors and "File not found" in errors[0]
+        assert parser.calls == 0
+
+
+class TestArtifactManagerIntegration:
+    """The cache sits underneath every ArtifactManager subclass."""
+
+    def _make_chunk(self, project: Path, name: str, status: str = "ACTIVE") -> None:
+        chunk_dir = project / "docs" / "chunks" / name
+        chunk_dir.mkdir(parents=True)
+        (chunk_dir / "GOAL.md").write_text(
+            f"---\nstatus: {status}\ncode_references: []\n---\n\n# Goal\n"
+        )
+
+    def test_managers_share_parsed_frontmatter(self, temp_project, monkeypatch):
+        """Separate Chunks instances in one process parse each file once."""
+        self._make_chunk(temp_project, "alpha")
+        calls = []
+        real_parse = frontmatter_module.parse_frontmatter_from_content_with_errors
+
+        def counting_parse(content, model_class):
+            calls.append(model_class)
+            return real_parse(content, model_class)
+
+        monkeypatch.setattr(
+            frontmatter_module, "parse_frontmatter_from_content_with_errors", counting_parse
+        )
+
+        first = Chunks(temp_project).parse_chunk_frontmatter("alpha")
+        second = Chunks(temp_project).parse_chunk_frontmatter("alpha")
+
+        assert first.status.value == "ACTIVE"
+        assert second.status.value == "ACTIVE"
+        assert len(calls) == 1
+
+    def test_cache_written_under_project_ve_dir(self, temp_project):
+        """Parsed frontmatter is persisted under .ve/cache/frontmatter/."""
+        self._make_chunk(temp_project, "alpha")
+
+        Chunks(temp_project).parse_chunk_frontmatter("alpha")
+
+        assert list((temp_project / FRONTMATTER_CACHE_DIR).glob("*.json"))
+
+    def test_status_update_is_visible_immediately(self, temp_project):
+        """update_status followed by a parse sees the new status."""
+        self._make_chunk(temp_project, "alpha", status="FUTURE")
+        chunks = Chunks(temp_project)
+        assert chunks.get_status("alpha").value == "FUTURE"
+
+        from models import ChunkStatus
+
+        chunks.update_status("alpha", ChunkStatus.IMPLEMENTING)
+
+        assert Chunks(temp_project).get_status("alpha") == ChunkStatus.IMPLEMENTING
+
+    def test_narrative_legacy_chunks_field_through_cache(self, temp_project):
+        """Legacy narrative 'chunks' mapping still applies on cached parses."""
+        narrative_dir = temp_project / "docs" / "narratives" / "legacy"
+        narrative_dir.mkdir(parents=True)
+        (narrative_dir / "OVERVIEW.md").write_text(
+            "---\nstatus: ACTIVE\nchunks:\n  - prompt: Do a thing\n    chunk_directory: null\n---\n"
+        )
+
+        narratives = Narratives(temp_project)
+        first = narratives.parse_narrative_frontmatter("legacy")
+        clear_memo()
+        second = narratives.parse_narrative_frontmatter("legacy")
+
+        assert first.proposed_chunks[0].prompt == "Do a thing"
+        assert second.proposed_chunks[0].prompt == "Do a thing"
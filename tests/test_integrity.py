@@ -2,9 +2,13 @@
 
 # Chunk: docs/chunks/integrity_validate - Tests for integrity validation module
 # Chunk: docs/chunks/validate_external_chunks - Tests for external chunk validation behavior
+# Chunk: docs/chunks/integrity_parallel_scan - Tests for parallel validation
+# Chunk: docs/chunks/validate_since_ref - Tests for incremental validation
 """
 
 import pathlib
+import shutil
+import subprocess
 
 import pytest
 
@@ -211,6 +215,20 @@ def write_friction_log(
     friction_path.write_text("\n".join(frontmatter_lines))
 
 
+def _mkdir(path: pathlib.Path) -> pathlib.Path:
+    """Create a directory (and parents) and return it."""
+    path.mkdir(parents=True)
+    return path
+
+
+def _commit_all(project_path: pathlib.Path, message: str = "snapshot") -> None:
+    """Stage and commit everything in the test repository."""
+    subprocess.run(["git", "add", "-A"], cwd=project_path, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-q", "-m", message], cwd=project_path, check=True, capture_output=True
+    )
+
+
 class TestIntegrityValidatorBasic:
     """Basic tests for IntegrityValidator."""
 
@@ -1591,3 +1609,258 @@ class TestIntegrityValidatorMultiLanguage:
         assert result.success
         assert result.files_scanned >= 3
         assert result.chunk_backrefs_found == 3
+
+
+# Chunk: docs/chunks/integrity_parallel_scan - Parallel and serial validation agree
+class TestIntegrityValidatorParallel:
+    """Tests for IntegrityValidator with a process pool (jobs > 1)."""
+
+    def _make_mixed_project(self, project_path: pathlib.Path) -> None:
+        """Create a project with valid references, errors and warnings."""
+        make_ve_initialized_git_repo(project_path)
+
+        write_subsystem_overview(
+            _mkdir(project_path / "docs" / "subsystems" / "core"),
+            chunks=[{"chunk_id": "chunk_00"}, {"chunk_id": "missing_chunk"}],
+        )
+        write_narrative_overview(
+            _mkdir(project_path / "docs" / "narratives" / "story"),
+            proposed_chunks=[{"chunk_directory": "chunk_01"}, {"chunk_directory": "ghost"}],
+        )
+        write_investigation_overview(
+            _mkdir(project_path / "docs" / "investigations" / "probe"),
+            proposed_chunks=[{"chunk_directory": "docs/chunks/chunk_02"}],
+        )
+        for i in range(40):
+            write_chunk_goal(
+                _mkdir(project_path / "docs" / "chunks" / f"chunk_{i:02d}"),
+                narrative="story" if i % 3 == 0 else None,
+                subsystems=[{"subsystem_id": "core" if i % 2 else "nowhere"}],
+                code_references=[{"ref": f"src/mod_{i % 7}.py#f"}],
+            )
+
+        src_dir = _mkdir(project_path / "src")
+        for i in range(150):
+            (src_dir / f"mod_{i}.py").write_text(
+                f'"""Module {i}."""\n'
+                f"# Chunk: docs/chunks/chunk_{i % 45:02d} - ref\n"
+                "\n"
+                f"# Subsystem: docs/subsystems/{'core' if i % 4 else 'gone'}\n"
+            )
+
+    def test_parallel_result_matches_serial(self, temp_project):
+        """jobs > 1 produces exactly the serial result, in the same order."""
+        self._make_mixed_project(temp_project)
+
+        serial = IntegrityValidator(temp_project, jobs=1).validate()
+        parallel = IntegrityValidator(temp_project, jobs=3).validate()
+
+        assert not serial.success
+        assert serial.errors and serial.warnings
+        assert parallel == serial
+
+    def test_parallel_reports_code_backref_line_numbers(self, temp_project):
+        """Errors found by pool workers carry the correct file and line."""
+        make_ve_initialized_git_repo(temp_project)
+        src_dir = _mkdir(temp_project / "src")
+        (src_dir / "broken.py").write_text(
+            '"""Broken."""\n\n\n# Subsystem: docs/subsystems/nope - gone\n'
+        )
+
+        result = IntegrityValidator(temp_project, jobs=2).validate()
+
+        assert [e.source for e in result.errors] == ["src/broken.py:4"]
+        assert result.subsystem_backrefs_found == 1
+
+    def test_jobs_zero_uses_cpu_count(self, temp_project, monkeypatch):
+        """jobs=0 resolves to one worker per CPU."""
+        monkeypatch.setattr("integrity.os.cpu_count", lambda: 6)
+        assert IntegrityValidator(temp_project, jobs=0).jobs == 6
+
+    def test_negative_jobs_rejected(self, temp_project):
+        """Negative job counts are a programming error."""
+        with pytest.raises(ValueError):
+            IntegrityValidator(temp_project, jobs=-1)
+
+    def test_cli_jobs_option(self, runner, temp_project):
+        """ve validate --jobs runs validation in a pool with the same outcome."""
+        from ve import cli
+
+        self._make_mixed_project(temp_project)
+
+        serial = runner.invoke(cli, ["validate", "--project-dir", str(temp_project)])
+        parallel = runner.invoke(
+            cli, ["validate", "--jobs", "2", "--project-dir", str(temp_project)]
+        )
+
+        assert parallel.exit_code == serial.exit_code == 1
+        assert parallel.output == serial.output
+
+
+# Chunk: docs/chunks/validate_since_ref - Incremental validation driven by git diff
+class TestIntegrityValidatorSince:
+    """Tests for validate(since=...) incremental validation."""
+
+    def _make_valid_project(self, project_path: pathlib.Path) -> None:
+        """Create and commit a project with consistent cross-references."""
+        make_ve_initialized_git_repo(project_path)
+        write_subsystem_overview(
+            _mkdir(project_path / "docs" / "subsystems" / "core"),
+            chunks=[{"chunk_id": "alpha"}],
+        )
+        write_narrative_overview(
+            _mkdir(project_path / "docs" / "narratives" / "story"),
+            proposed_chunks=[{"chunk_directory": "beta"}],
+        )
+        write_chunk_goal(
+            _mkdir(project_path / "docs" / "chunks" / "alpha"),
+            subsystems=[{"subsystem_id": "core", "relationship": "implements"}],
+            code_references=[{"ref": "src/alpha.py#run"}],
+        )
+        write_chunk_goal(
+            _mkdir(project_path / "docs" / "chunks" / "beta"),
+            narrative="story",
+            depends_on=["alpha"],
+            code_references=[{"ref": "src/beta.py#run"}],
+        )
+        src_dir = _mkdir(project_path / "src")
+        (src_dir / "alpha.py").write_text(
+            "# Chunk: docs/chunks/alpha - Alpha\n# Subsystem: docs/subsystems/core - Core\n"
+        )
+        (src_dir / "beta.py").write_text("# Chunk: docs/chunks/beta - Beta\n")
+        for i in range(5):
+            (src_dir / f"plain_{i}.py").write_text("x = 1\n")
+        _commit_all(project_path)
+
+    def test_no_changes_checks_nothing(self, temp_project):
+        """A clean working tree has nothing to validate."""
+        self._make_valid_project(temp_project)
+
+        result = IntegrityValidator(temp_project).validate(since="HEAD")
+
+        assert result.success
+        assert result.chunks_scanned == 0
+        assert result.files_scanned == 0
+
+    def test_changed_source_file_only_scans_that_file(self, temp_project):
+        """Only changed source files are scanned for backreferences."""
+        self._make_valid_project(temp_project)
+        (temp_project / "src" / "plain_0.py").write_text(
+            "# Chunk: docs/chunks/nonexistent - Broken\n"
+        )
+
+        result = IntegrityValidator(temp_project).validate(since="HEAD")
+
+        assert result.files_scanned == 1
+        assert result.chunks_scanned == 0
+        assert [e.source for e in result.errors] == ["src/plain_0.py:1"]
+
+    def test_deleted_chunk_breaks_unchanged_referrers(self, temp_project):
+        """Deleting a chunk reports broken links from unchanged files and artifacts."""
+        self._make_valid_project(temp_project)
+        shutil.rmtree(temp_project / "docs" / "chunks" / "alpha")
+
+        result = IntegrityValidator(temp_project).validate(since="HEAD")
+        full = IntegrityValidator(temp_project).validate()
+
+        link_types = {e.link_type for e in result.errors}
+        # src/alpha.py backref, beta depends_on, core subsystem's chunks list
+        assert link_types == {"code→chunk", "chunk→chunk", "subsystem→chunk"}
+        assert sorted(map(repr, result.errors)) == sorted(map(repr, full.errors))
+
+    def test_renamed_subsystem_is_caught(self, temp_project):
+        """Renaming a subsystem flags chunks and code still using the old name."""
+        self._make_valid_project(temp_project)
+        subprocess.run(
+            ["git", "mv", "docs/subsystems/core", "docs/subsystems/kernel"],
+            cwd=temp_project,
+            check=True,
+            capture_output=True,
+        )
+
+        result = IntegrityValidator(temp_project).validate(since="HEAD")
+
+        targets = {(e.link_type, e.target) for e in result.errors}
+        assert ("chunk→subsystem", "docs/subsystems/core") in targets
+        assert ("code→subsystem", "docs/subsystems/core") in targets
+
+    def test_changed_narrative_rechecks_its_chunks(self, temp_project):
+        """Dropping a chunk from a narrative warns from the unchanged chunk."""
+        self._make_valid_project(temp_project)
+        write_narrative_overview(temp_project / "docs" / "narratives" / "story")
+
+        result = IntegrityValidator(temp_project).validate(since="HEAD")
+
+        assert result.narratives_scanned == 1
+        assert result.chunks_scanned == 1
+        assert [w.link_type for w in result.warnings] == ["chunk↔narrative"]
+
+    def test_committed_changes_since_older_ref(self, temp_project):
+        """Changes already committed after the ref are included."""
+        self._make_valid_project(temp_project)
+        write_chunk_goal(
+            temp_project / "docs" / "chunks" / "beta", investigation="missing"
+        )
+        _commit_all(temp_project, "break beta")
+
+        assert IntegrityValidator(temp_project).validate(since="HEAD").chunks_scanned == 0
+        result = IntegrityValidator(temp_project).validate(since="HEAD~1")
+        assert [e.link_type for e in result.errors] == ["chunk→investigation"]
+
+    def test_untracked_files_are_included(self, temp_project):
+        """New, not-yet-added source files are scanned."""
+        self._make_valid_project(temp_project)
+        (temp_project / "src" / "new.py").write_text(
+            "# Subsystem: docs/subsystems/missing - New\n"
+        )
+
+        result = IntegrityValidator(temp_project).validate(since="HEAD")
+
+        assert [e.source for e in result.errors] == ["src/new.py:1"]
+
+    def test_invalid_ref_raises(self, temp_project):
+        """An unknown revision is reported as a GitRefError."""
+        from source_files import GitRefError
+
+        self._make_valid_project(temp_project)
+
+        with pytest.raises(GitRefError, match="no-such-ref"):
+            IntegrityValidator(temp_project).validate(since="no-such-ref")
+
+    def test_cli_since_option(self, runner, temp_project):
+        """ve validate --since reports errors from changed files and bad refs."""
+        from ve import cli
+
+        self._make_valid_project(temp_project)
+        (temp_project / "src" / "plain_1.py").write_text(
+            "# Chunk: docs/chunks/ghost - Broken\n"
+        )
+
+        result = runner.invoke(
+            cli, ["validate", "--since", "HEAD", "--verbose", "--project-dir", str(temp_project)]
+        )
+        assert result.exit_code == 1
+        assert "Files scanned: 1" in result.output
+        assert "ghost" in result.output
+
+        result = runner.invoke(
+            cli, ["validate", "--since", "nope", "--project-dir", str(temp_project)]
+        )
+        assert result.exit_code == 1
+        assert "Cannot diff against 'nope'" in result.output
+
+    def test_cli_since_does_not_swallow_other_errors(self, runner, temp_project, monkeypatch):
+        """Only bad refs become a one-line error; other ValueErrors propagate."""
+        from ve import cli
+
+        self._make_valid_project(temp_project)
+
+        def broken_validate(self, since=None):
+            raise ValueError("parser bug")
+
+        monkeypatch.setattr(IntegrityValidator, "validate", broken_validate)
+        result = runner.invoke(
+            cli, ["validate", "--since", "HEAD", "--project-dir", str(temp_project)]
+        )
+        assert isinstance(result.exception, ValueError)
+        assert "Error: parser bug" not in result.output
@@ -59,6 +59,20 @@ class AdapterContractTests:
         msg = await storage.read_after(swarm.swarm_id, "ch", 1)
         assert msg is None
 
+    # Chunk: docs/chunks/leader_board_stream_watch - Batched read contract
+    async def test_read_batch_after_returns_consecutive_messages(
+        self, storage, swarm: SwarmInfo
+    ) -> None:
+        for body in (b"a", b"b", b"c", b"d"):
+            await storage.append_message(swarm.swarm_id, "ch", body)
+
+        batch = await storage.read_batch_after(swarm.swarm_id, "ch", 1, 2)
+        assert [msg.body for msg in batch] == [b"b", b"c"]
+        batch = await storage.read_batch_after(swarm.swarm_id, "ch", 2, 10)
+        assert [msg.position for msg in batch] == [3, 4]
+        assert await storage.read_batch_after(swarm.swarm_id, "ch", 4, 10) == []
+        assert await storage.read_batch_after(swarm.swarm_id, "none", 0, 10) == []
+
     async def test_compact_removes_old_retains_most_recent(
         self, storage, swarm: SwarmInfo
     ) -> None:
@@ -74,16 +88,21 @@ class AdapterContractTests:
             storage._channels[key][0] = m1.model_copy(
                 update={"sent_at": old_time}
             )
-        elif hasattr(storage, "_messages_path"):
+        elif hasattr(storage, "_segment_path"):
             # FileSystemStorage
             import json as _json
 
-            mp = storage._messages_path(swarm.swarm_id, "ch")
-            lines = mp.read_text().strip().split("\n")
-            data = _json.loads(lines[0])
-            data["sent_at"] = old_time.isoformat()
-            lines[0] = _json.dumps(data)
-            mp.write_text("\n".join(lines) + "\n")
+            from leader_board.fs_storage import encode_record, iter_records
+
+            mp = storage._segment_path(swarm.swarm_id, "ch", 1)
+            records = list(iter_records(mp))
+            records[0] = (records[0][0], old_time, records[0][2])
+            mp.write_bytes(b"".join(encode_record(*r) for r in records))
+            # meta.json records the oldest message's timestamp too
+            meta_path = storage._meta_path(swarm.swarm_id, "ch")
+            meta = _json.loads(meta_path.read_text())
+            meta["oldest_sent_at"] = old_time.isoformat()
+            meta_path.write_text(_json.dumps(meta))
 
         removed = await storage.compact(swarm.swarm_id, "ch", 30)
         assert removed >= 1
@@ -241,6 +241,78 @@ async def test_multiple_concurrent_watchers(core: LeaderBoardCore) -> None:
         assert msg.position == 2
 
 
+
+# Chunk: docs/chunks/leader_board_stream_watch - Batched blocking read
+async def test_read_batch_after_returns_available_messages(core: LeaderBoardCore) -> None:
+    await _register_swarm(core)
+    for body in (b"a", b"b", b"c"):
+        await core.append("s1", "ch", body)
+
+    batch = await core.read_batch_after("s1", "ch", 0, 2)
+    assert [msg.body for msg in batch] == [b"a", b"b"]
+    batch = await core.read_batch_after("s1", "ch", 1, 10)
+    assert [msg.position for msg in batch] == [2, 3]
+
+
+async def test_read_batch_after_blocks_until_append(core: LeaderBoardCore) -> None:
+    await _register_swarm(core)
+    await core.append("s1", "ch", b"seed")
+
+    task = asyncio.create_task(core.read_batch_after("s1", "ch", 1, 10))
+    await asyncio.sleep(0.05)
+    assert not task.done()
+
+    await core.append("s1", "ch", b"next")
+    batch = await asyncio.wait_for(task, timeout=2.0)
+    assert [msg.body for msg in batch] == [b"next"]
+
+
+
+# Chunk: docs/chunks/leader_board_tail_cache - Watchers served from memory
+async def test_caught_up_reader_is_served_from_tail_cache(
+    core: LeaderBoardCore, storage: InMemoryStorage
+) -> None:
+    await _register_swarm(core)
+    await core.append("s1", "ch", b"a")
+
+    reads = 0
+    real_get_channel_info = storage.get_channel_info
+
+    async def counting_get_channel_info(swarm_id, channel):
+        nonlocal reads
+        reads += 1
+        return await real_get_channel_info(swarm_id, channel)
+
+    storage.get_channel_info = counting_get_channel_info
+    storage.read_after = None  # any storage read would fail
+
+    reader = asyncio.create_task(core.read_after("s1", "ch", 1))
+    await asyncio.sleep(0.01)
+    await core.append("s1", "ch", b"b")
+    msg = await asyncio.wait_for(reader, timeout=2.0)
+
+    assert msg.body == b"b"
+    assert reads == 0
+    assert core.tail_cache.hits == 2
+
+
+async def test_compaction_invalidates_tail_cache(
+    core: LeaderBoardCore, storage: InMemoryStorage
+) -> None:
+    await _register_swarm(core)
+    await core.append("s1", "ch", b"old")
+    await core.append("s1", "ch", b"keep")
+
+    key = ("s1", "ch")
+    storage._channels[key][0] = storage._channels[key][0].model_copy(
+        update={"sent_at": datetime.now(UTC) - timedelta(days=60)}
+    )
+    await core.compact("s1", "ch", 30)
+
+    with pytest.raises(CursorExpiredError):
+        await core.read_after("s1", "ch", 0)
+
+
 # ------------------------------------------------------------------
 # Compaction (Step 6)
 # ------------------------------------------------------------------
@@ -16,7 +16,7 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from starlette.testclient import TestClient
 
 from leader_board.core import LeaderBoardCore
-from leader_board.fs_storage import FileSystemStorage
+from leader_board.fs_storage import FileSystemStorage, encode_record, iter_records
 from leader_board.server import create_app
 
 
@@ -202,13 +202,15 @@ class TestCompaction:
                 assert ack["type"] == "ack"
 
         # Age the first message directly in the filesystem
-        messages_path = storage._messages_path(swarm_id, "compact-ch")
-        lines = messages_path.read_text().strip().split("\n")
-        old_data = json.loads(lines[0])
+        messages_path = storage._segment_path(swarm_id, "compact-ch", 1)
+        records = list(iter_records(messages_path))
         old_time = datetime.now(UTC) - timedelta(days=60)
-        old_data["sent_at"] = old_time.isoformat()
-        lines[0] = json.dumps(old_data)
-        messages_path.write_text("\n".join(lines) + "\n")
+        records[0] = (records[0][0], old_time, records[0][2])
+        messages_path.write_bytes(b"".join(encode_record(*r) for r in records))
+        meta_path = storage._meta_path(swarm_id, "compact-ch")
+        meta = json.loads(meta_path.read_text())
+        meta["oldest_sent_at"] = old_time.isoformat()
+        meta_path.write_text(json.dumps(meta))
 
         # Run compaction directly via the storage (sync-friendly in test)
         import asyncio
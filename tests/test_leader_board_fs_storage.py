@@ -1,18 +1,45 @@
 # Chunk: docs/chunks/leader_board_local_server - Local WebSocket server adapter
+# Chunk: docs/chunks/leader_board_fs_writer - Group-commit writer and durability modes
 """Tests for the filesystem storage adapter."""
 
 from __future__ import annotations
 
 import asyncio
+import os
 from datetime import UTC, datetime, timedelta
 
 import pytest
 
-from leader_board.fs_storage import FileSystemStorage
+from leader_board.fs_storage import (
+    RECORD_HEADER,
+    FileSystemStorage,
+    encode_record,
+    iter_records,
+)
 from leader_board.models import SwarmInfo
 from test_leader_board_adapter_contract import AdapterContractTests
 
 
+def _backdate(
+    storage: FileSystemStorage, swarm_id: str, channel: str, positions
+) -> None:
+    """Backdate the given positions by 60 days, in place."""
+    import json
+
+    old_time = datetime.now(UTC) - timedelta(days=60)
+    for segment in storage._segment_files(swarm_id, channel):
+        records = [
+            (position, old_time if position in positions else sent_at, body)
+            for position, sent_at, body in iter_records(segment)
+        ]
+        segment.write_bytes(b"".join(encode_record(*r) for r in records))
+    # meta.json records the oldest message's timestamp too
+    meta = storage._read_meta(swarm_id, channel)
+    if meta["oldest_position"] in positions:
+        meta["oldest_sent_at"] = old_time.isoformat()
+        storage._meta_path(swarm_id, channel).write_text(json.dumps(meta))
+
+
 # ---------------------------------------------------------------------------
 # Contract tests — validates all generic StorageAdapter behavior
 # ---------------------------------------------------------------------------
@@ -72,16 +99,8 @@ class TestFileSystemStorageSpecific:
         m1 = await storage.append_message(swarm.swarm_id, "ch", b"old")
         await storage.append_message(swarm.swarm_id, "ch", b"new")
 
-        # Age the first message by rewriting the JSONL
-        import json
-
-        messages_path = storage._messages_path(swarm.swarm_id, "ch")
-        lines = messages_path.read_text().strip().split("\n")
-        old_data = json.loads(lines[0])
-        old_time = datetime.now(UTC) - timedelta(days=60)
-        old_data["sent_at"] = old_time.isoformat()
-        lines[0] = json.dumps(old_data)
-        messages_path.write_text("\n".join(lines) + "\n")
+        # Age the first message by rewriting its record
+        _backdate(storage, swarm.swarm_id, "ch", {1})
 
         removed = await storage.compact(swarm.swarm_id, "ch", 30)
         assert removed == 1
@@ -114,21 +133,12 @@ class TestFileSystemStorageSpecific:
         self, storage: FileSystemStorage, swarm: SwarmInfo
     ) -> None:
         """After compaction, get_channel_info reflects updated oldest_position."""
-        import json
-
         await storage.append_message(swarm.swarm_id, "ch", b"a")
         await storage.append_message(swarm.swarm_id, "ch", b"b")
         await storage.append_message(swarm.swarm_id, "ch", b"c")
 
         # Age the first two messages
-        messages_path = storage._messages_path(swarm.swarm_id, "ch")
-        lines = messages_path.read_text().strip().split("\n")
-        old_time = (datetime.now(UTC) - timedelta(days=60)).isoformat()
-        for i in range(2):
-            data = json.loads(lines[i])
-            data["sent_at"] = old_time
-            lines[i] = json.dumps(data)
-        messages_path.write_text("\n".join(lines) + "\n")
+        _backdate(storage, swarm.swarm_id, "ch", {1, 2})
 
         await storage.compact(swarm.swarm_id, "ch", 30)
 
@@ -136,3 +146,359 @@ class TestFileSystemStorageSpecific:
         assert info is not None
         assert info.oldest_position == 3
         assert info.head_position == 3
+
+
+# ---------------------------------------------------------------------------
+# Segmented log
+# ---------------------------------------------------------------------------
+
+
+# Chunk: docs/chunks/leader_board_segmented_log - Segment, index and compaction tests
+class TestSegmentedLog:
+    @pytest.fixture
+    def storage(self, tmp_path) -> FileSystemStorage:
+        return FileSystemStorage(tmp_path, segment_size=4, index_interval=2)
+
+    async def test_appends_roll_over_into_segments(
+        self, storage: FileSystemStorage
+    ) -> None:
+        for i in range(10):
+            await storage.append_message("s", "ch", f"m{i + 1}".encode())
+
+        names = [p.name for p in storage._segment_files("s", "ch")]
+        assert names == [
+            f"{1:020d}.log",
+            f"{5:020d}.log",
+            f"{9:020d}.log",
+        ]
+        for cursor in range(10):
+            msg = await storage.read_after("s", "ch", cursor)
+            assert msg is not None
+            assert msg.position == cursor + 1
+            assert msg.body == f"m{cursor + 1}".encode()
+        assert await storage.read_after("s", "ch", 10) is None
+
+    async def test_sparse_index_records_offsets(
+        self, storage: FileSystemStorage
+    ) -> None:
+        for i in range(4):
+            await storage.append_message("s", "ch", b"x")
+
+        segment = storage._segment_path("s", "ch", 1)
+        positions, offsets = storage._load_index(segment)
+        assert positions == [1, 3]
+        record_size = RECORD_HEADER.size + 1
+        assert offsets == [0, 2 * record_size]
+
+    async def test_stale_index_falls_back_to_scan(
+        self, storage: FileSystemStorage
+    ) -> None:
+        for i in range(4):
+            await storage.append_message("s", "ch", f"m{i + 1}".encode())
+
+        segment = storage._segment_path("s", "ch", 1)
+        storage._index_path(segment).write_text("1 0\n3 5\n")
+
+        msg = await storage.read_after("s", "ch", 3)
+        assert msg is not None
+        assert msg.body == b"m4"
+
+    # Chunk: docs/chunks/leader_board_stream_watch - Batched reads across segments
+    async def test_read_batch_after_spans_segments(
+        self, storage: FileSystemStorage
+    ) -> None:
+        for i in range(10):
+            await storage.append_message("s", "ch", f"m{i + 1}".encode())
+
+        batch = await storage.read_batch_after("s", "ch", 2, 5)
+        assert [msg.position for msg in batch] == [3, 4, 5, 6, 7]
+        batch = await storage.read_batch_after("s", "ch", 7, 100)
+        assert [msg.body for msg in batch] == [b"m8", b"m9", b"m10"]
+
+        _backdate(storage, "s", "ch", set(range(1, 7)))
+        await storage.compact("s", "ch", 30)
+        batch = await storage.read_batch_after("s", "ch", 0, 2)
+        assert [msg.position for msg in batch] == [7, 8]
+
+    async def test_compact_drops_whole_segments(
+        self, storage: FileSystemStorage
+    ) -> None:
+        for i in range(10):
+            await storage.append_message("s", "ch", f"m{i + 1}".encode())
+        _backdate(storage, "s", "ch", set(range(1, 7)))
+
+        removed = await storage.compact("s", "ch", 30)
+
+        assert removed == 6
+        names = [p.name for p in storage._segment_files("s", "ch")]
+        assert names == [f"{5:020d}.log", f"{9:020d}.log"]
+        info = await storage.get_channel_info("s", "ch")
+        assert info is not None
+        assert info.oldest_position == 7
+        msg = await storage.read_after("s", "ch", 0)
+        assert msg is not None
+        assert msg.position == 7
+        assert (await storage.read_after("s", "ch", 8)).position == 9
+
+    async def test_compact_retains_most_recent_in_active_segment(
+        self, storage: FileSystemStorage
+    ) -> None:
+        for i in range(6):
+            await storage.append_message("s", "ch", b"x")
+        _backdate(storage, "s", "ch", set(range(1, 7)))
+
+        removed = await storage.compact("s", "ch", 30)
+
+        assert removed == 5
+        info = await storage.get_channel_info("s", "ch")
+        assert info.oldest_position == 6
+        assert info.head_position == 6
+        # Appending after compaction continues in the rewritten segment
+        msg = await storage.append_message("s", "ch", b"y")
+        assert msg.position == 7
+        assert (await storage.read_after("s", "ch", 6)).body == b"y"
+
+    async def test_legacy_log_is_converted(self, tmp_path) -> None:
+        import json
+
+        ch_dir = tmp_path / "swarms" / "s" / "channels" / "ch"
+        ch_dir.mkdir(parents=True)
+        sent_at = datetime.now(UTC).isoformat()
+        with open(ch_dir / "messages.jsonl", "w") as f:
+            for position in range(1, 7):
+                f.write(json.dumps({
+                    "channel": "ch",
+                    "position": position,
+                    "body": f"m{position}".encode().hex(),
+                    "sent_at": sent_at,
+                }) + "\n")
+        (ch_dir / "meta.json").write_text(
+            json.dumps({"head_position": 6, "oldest_position": 1})
+        )
+
+        storage = FileSystemStorage(tmp_path, segment_size=4, index_interval=2)
+        msg = await storage.read_after("s", "ch", 4)
+        assert msg is not None
+        assert msg.body == b"m5"
+        assert not (ch_dir / "messages.jsonl").exists()
+        assert len(storage._segment_files("s", "ch")) == 2
+
+        appended = await storage.append_message("s", "ch", b"m7")
+        assert appended.position == 7
+        assert (await storage.read_after("s", "ch", 6)).body == b"m7"
+
+    # Chunk: docs/chunks/leader_board_binary_records - JSON segment conversion
+    @staticmethod
+    def _write_json_segments(tmp_path, count: int) -> None:
+        """Lay out a channel as the previous format's JSON-line segments."""
+        import json
+
+        ch_dir = tmp_path / "swarms" / "s" / "channels" / "ch"
+        (ch_dir / "segments").mkdir(parents=True)
+        sent_at = datetime.now(UTC).isoformat()
+        for start in range(1, count + 1, 4):
+            with open(ch_dir / "segments" / f"{start:020d}.jsonl", "w") as f:
+                for position in range(start, min(start + 4, count + 1)):
+                    f.write(json.dumps({
+                        "channel": "ch",
+                        "position": position,
+                        "body": (b"\x00" * 64).hex(),
+                        "sent_at": sent_at,
+                    }) + "\n")
+        (ch_dir / "meta.json").write_text(json.dumps({
+            "head_position": count,
+            "oldest_position": 1,
+            "segment_size": 4,
+            "index_interval": 2,
+        }))
+
+    async def test_json_segments_are_converted(self, tmp_path) -> None:
+        self._write_json_segments(tmp_path, 6)
+        storage = FileSystemStorage(tmp_path)
+
+        batch = await storage.read_batch_after("s", "ch", 0, 10)
+
+        assert [msg.position for msg in batch] == [1, 2, 3, 4, 5, 6]
+        assert all(msg.body == b"\x00" * 64 for msg in batch)
+        segments_dir = storage._segments_dir("s", "ch")
+        assert sorted(p.name for p in segments_dir.glob("*.jsonl")) == []
+        assert len(storage._segment_files("s", "ch")) == 2
+        assert (await storage.append_message("s", "ch", b"x")).position == 7
+
+    async def test_partial_tail_record_is_not_read(
+        self, storage: FileSystemStorage
+    ) -> None:
+        for i in range(2):
+            await storage.append_message("s", "ch", b"done")
+        segment = storage._segment_path("s", "ch", 1)
+        with open(segment, "ab") as f:
+            # Header of a third record whose body was never written
+            f.write(encode_record(3, datetime.now(UTC), b"lost")[:-2])
+
+        batch = await storage.read_batch_after("s", "ch", 0, 10)
+
+        assert [msg.position for msg in batch] == [1, 2]
+        assert storage._last_record(segment)[0] == 2
+
+    def test_migrate_reports_space_saved(self, tmp_path) -> None:
+        self._write_json_segments(tmp_path, 6)
+        storage = FileSystemStorage(tmp_path)
+
+        (stats,) = storage.migrate()
+
+        assert stats.converted
+        assert stats.bytes_after < stats.bytes_before / 2
+        records = list(iter_records(storage._segment_path("s", "ch", 5)))
+        assert [position for position, _, _ in records] == [5, 6]
+        (again,) = storage.migrate()
+        assert not again.converted
+
+    async def test_existing_channel_keeps_its_geometry(self, tmp_path) -> None:
+        small = FileSystemStorage(tmp_path, segment_size=2)
+        for i in range(3):
+            await small.append_message("s", "ch", b"x")
+
+        large = FileSystemStorage(tmp_path, segment_size=100)
+        await large.append_message("s", "ch", b"x")
+
+        assert len(large._segment_files("s", "ch")) == 2
+        assert (await large.read_after("s", "ch", 3)).position == 4
+
+    # Chunk: docs/chunks/leader_board_stream_compaction - Metadata skip and stats
+    async def test_compact_skips_young_channel_without_reading_segments(
+        self, storage: FileSystemStorage, monkeypatch
+    ) -> None:
+        for i in range(6):
+            await storage.append_message("s", "ch", b"x")
+
+        def no_segments(*args):
+            raise AssertionError("segments listed")
+
+        monkeypatch.setattr(storage, "_segment_files", no_segments)
+        stats = await storage.compact_channel("s", "ch", 30)
+
+        assert stats.skipped
+        assert stats.removed == 0
+
+    async def test_compact_channel_reports_bytes_reclaimed(
+        self, storage: FileSystemStorage
+    ) -> None:
+        for i in range(10):
+            await storage.append_message("s", "ch", f"m{i + 1}".encode())
+        _backdate(storage, "s", "ch", set(range(1, 7)))
+        segments_dir = storage._segments_dir("s", "ch")
+        before = sum(p.stat().st_size for p in segments_dir.iterdir())
+
+        stats = await storage.compact_channel("s", "ch", 30)
+
+        after = sum(p.stat().st_size for p in segments_dir.iterdir())
+        assert stats.removed == 6
+        assert not stats.skipped
+        assert stats.bytes_reclaimed == before - after > 0
+        assert stats.duration_seconds >= 0
+        # The rewritten segment's index still points at message starts
+        assert (await storage.read_after("s", "ch", 7)).body == b"m8"
+        # The new oldest timestamp lets the next sweep skip the channel
+        assert (await storage.compact_channel("s", "ch", 30)).skipped
+
+    async def test_compact_without_recorded_timestamp_reads_segments(
+        self, storage: FileSystemStorage
+    ) -> None:
+        import json
+
+        for i in range(6):
+            await storage.append_message("s", "ch", b"x")
+        _backdate(storage, "s", "ch", {1, 2})
+        meta = storage._read_meta("s", "ch")
+        del meta["oldest_sent_at"]
+        storage._meta_path("s", "ch").write_text(json.dumps(meta))
+
+        assert await storage.compact("s", "ch", 30) == 2
+        assert storage._read_meta("s", "ch")["oldest_sent_at"] is not None
+
+
+# ---------------------------------------------------------------------------
+# Group-commit writer
+# ---------------------------------------------------------------------------
+
+
+class TestGroupCommit:
+    @pytest.fixture
+    def fsyncs(self, monkeypatch) -> list[int]:
+        calls: list[int] = []
+        real_fsync = os.fsync
+
+        def counting_fsync(fd: int) -> None:
+            calls.append(fd)
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", counting_fsync)
+        return calls
+
+    async def test_concurrent_appends_share_commits(self, tmp_path) -> None:
+        storage = FileSystemStorage(tmp_path, segment_size=8, index_interval=4)
+
+        msgs = await asyncio.gather(
+            *(storage.append_message("s", "ch", f"m{i}".encode()) for i in range(50))
+        )
+
+        assert sorted(m.position for m in msgs) == list(range(1, 51))
+        assert storage._writer.items_committed == 50
+        assert storage._writer.groups_committed < 50
+        batch = await storage.read_batch_after("s", "ch", 0, 100)
+        assert [m.position for m in batch] == list(range(1, 51))
+        assert {m.body for m in batch} == {f"m{i}".encode() for i in range(50)}
+
+    async def test_channels_commit_independently(self, tmp_path) -> None:
+        storage = FileSystemStorage(tmp_path)
+
+        msgs = await asyncio.gather(
+            *(storage.append_message("s", f"ch{i % 3}", b"x") for i in range(9))
+        )
+
+        assert sorted(m.position for m in msgs) == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+        for i in range(3):
+            assert (await storage.get_channel_info("s", f"ch{i}")).head_position == 3
+
+    async def test_per_message_syncs_before_acknowledging(self, tmp_path, fsyncs) -> None:
+        storage = FileSystemStorage(tmp_path, durability="per-message")
+
+        await storage.append_message("s", "ch", b"x")
+
+        assert fsyncs
+
+    async def test_batched_syncs_after_interval(self, tmp_path, fsyncs) -> None:
+        storage = FileSystemStorage(tmp_path, sync_interval=0.05)
+
+        await storage.append_message("s", "ch", b"x")
+        await asyncio.sleep(0.2)
+
+        assert fsyncs
+        assert await asyncio.to_thread(storage.flush, 5)
+
+    async def test_none_never_syncs(self, tmp_path, fsyncs) -> None:
+        storage = FileSystemStorage(tmp_path, durability="none")
+
+        await storage.append_message("s", "ch", b"x")
+        assert await asyncio.to_thread(storage.flush, 5)
+
+        assert fsyncs == []
+
+    async def test_write_error_reaches_every_waiter(self, tmp_path) -> None:
+        storage = FileSystemStorage(tmp_path)
+
+        def fail(key, bodies, sync):
+            raise OSError("disk full")
+
+        storage._writer._write_group = fail
+        results = await asyncio.gather(
+            storage.append_message("s", "ch", b"a"),
+            storage.append_message("s", "ch", b"b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, OSError) for r in results)
+
+    def test_unknown_durability_is_rejected(self, tmp_path) -> None:
+        with pytest.raises(ValueError, match="durability"):
+            FileSystemStorage(tmp_path, durability="sometimes")
@@ -14,9 +14,11 @@ from leader_board.protocol import (
     ChallengeFrame,
     ChannelsFrame,
     ChannelsListFrame,
+    CreditFrame,
     ErrorFrame,
     InvalidFrameError,
     MessageFrame,
+    MessagesFrame,
     RegisterSwarmFrame,
     SendFrame,
     SwarmInfoFrame,
@@ -58,6 +60,41 @@ class TestParseClientFrame:
         assert frame.channel == "ch1"
         assert frame.swarm == "s1"
         assert frame.cursor == 42
+        assert frame.max_batch is None
+        assert frame.stream is False
+
+    # Chunk: docs/chunks/leader_board_stream_watch - Streaming watch frames
+    def test_parse_streaming_watch_frame(self) -> None:
+        data = json.dumps(
+            {
+                "type": "watch",
+                "channel": "ch1",
+                "swarm": "s1",
+                "cursor": 0,
+                "max_batch": 50,
+                "stream": True,
+                "credits": 100,
+            }
+        )
+        frame = parse_client_frame(data)
+        assert frame == WatchFrame(
+            channel="ch1", swarm="s1", cursor=0, max_batch=50, stream=True, credits=100
+        )
+
+    def test_parse_credit_frame(self) -> None:
+        data = json.dumps({"type": "credit", "channel": "ch1", "swarm": "s1", "credits": 8})
+        assert parse_client_frame(data) == CreditFrame(channel="ch1", swarm="s1", credits=8)
+
+    @pytest.mark.parametrize(
+        "extra",
+        [{"max_batch": 0}, {"max_batch": "many"}, {"credits": -1}],
+    )
+    def test_parse_watch_rejects_invalid_batch_fields(self, extra) -> None:
+        data = json.dumps(
+            {"type": "watch", "channel": "ch1", "swarm": "s1", "cursor": 0, **extra}
+        )
+        with pytest.raises(InvalidFrameError):
+            parse_client_frame(data)
 
     def test_parse_send_frame(self) -> None:
         data = json.dumps(
@@ -133,6 +170,13 @@ class TestSerializeServerFrame:
         assert result["body"] == "dGVzdA=="
         assert result["sent_at"] == "2026-03-15T14:30:00Z"
 
+    def test_serialize_messages_frame(self) -> None:
+        messages = [{"position": 4, "body": "YQ==", "sent_at": "2026-03-15T14:30:00Z"}]
+        result = json.loads(
+            serialize_server_frame(MessagesFrame(channel="ch1", messages=messages))
+        )
+        assert result == {"type": "messages", "channel": "ch1", "messages": messages}
+
     def test_serialize_ack_frame(self) -> None:
         frame = AckFrame(channel="ch1", position=3)
         result = json.loads(serialize_server_frame(frame))
@@ -207,6 +251,10 @@ class TestRoundTrip:
                 '{"type":"send","channel":"c","swarm":"s","body":"dGVzdA=="}',
                 SendFrame,
             ),
+            (
+                '{"type":"credit","channel":"c","swarm":"s","credits":4}',
+                CreditFrame,
+            ),
             ('{"type":"channels","swarm":"s"}', ChannelsFrame),
             ('{"type":"swarm_info","swarm":"s"}', SwarmInfoFrame),
         ],
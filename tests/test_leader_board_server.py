@@ -1,4 +1,6 @@
 # Chunk: docs/chunks/leader_board_local_server - Local WebSocket server adapter
+# Chunk: docs/chunks/leader_board_stream_compaction - Compaction sweep tests
+# Chunk: docs/chunks/leader_board_watch_registry - Watch registry tests
 """Tests for the WebSocket connection handler and server."""
 
 from __future__ import annotations
@@ -6,6 +8,7 @@ from __future__ import annotations
 import asyncio
 import base64
 import json
+import time
 
 import pytest
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
@@ -14,7 +17,13 @@ from starlette.testclient import TestClient
 
 from leader_board.core import LeaderBoardCore
 from leader_board.memory_storage import InMemoryStorage
-from leader_board.server import create_app
+from leader_board.fs_storage import CompactionStats, FileSystemStorage
+from leader_board.server import (
+    WatcherCounts,
+    _compact_all,
+    _ConnectionWatches,
+    create_app,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -320,6 +329,107 @@ class TestWebSocketHandler:
             assert "created_at" in result
 
 
+# Chunk: docs/chunks/leader_board_stream_watch - Batched and streaming watch tests
+class TestBatchedWatch:
+    @staticmethod
+    def _send(ws, swarm_id: str, body: bytes, channel: str = "ch") -> None:
+        ws.send_text(
+            json.dumps(
+                {
+                    "type": "send",
+                    "channel": channel,
+                    "swarm": swarm_id,
+                    "body": base64.b64encode(body).decode(),
+                }
+            )
+        )
+
+    def _seed(self, ws, swarm_id: str, count: int) -> None:
+        for i in range(count):
+            self._send(ws, swarm_id, f"m{i + 1}".encode())
+            assert json.loads(ws.receive_text())["type"] == "ack"
+
+    def test_max_batch_watch_returns_one_batch(self, client: TestClient, keypair) -> None:
+        private_key, pub_bytes = keypair
+        with client.websocket_connect("/ws") as ws:
+            _register_handshake(ws, pub_bytes, "batch")
+            self._seed(ws, "batch", 5)
+
+            ws.send_text(
+                json.dumps(
+                    {"type": "watch", "channel": "ch", "swarm": "batch", "cursor": 1, "max_batch": 3}
+                )
+            )
+
+            frame = json.loads(ws.receive_text())
+            assert frame["type"] == "messages"
+            assert frame["channel"] == "ch"
+            assert [m["position"] for m in frame["messages"]] == [2, 3, 4]
+            assert base64.b64decode(frame["messages"][0]["body"]) == b"m2"
+
+    def test_stream_honours_credits_and_follows_new_messages(
+        self, client: TestClient, keypair
+    ) -> None:
+        private_key, pub_bytes = keypair
+        with client.websocket_connect("/ws") as ws:
+            _register_handshake(ws, pub_bytes, "stream")
+            self._seed(ws, "stream", 5)
+
+            ws.send_text(
+                json.dumps(
+                    {
+                        "type": "watch",
+                        "channel": "ch",
+                        "swarm": "stream",
+                        "cursor": 0,
+                        "max_batch": 2,
+                        "stream": True,
+                        "credits": 3,
+                    }
+                )
+            )
+            first = json.loads(ws.receive_text())
+            second = json.loads(ws.receive_text())
+            assert [m["position"] for m in first["messages"]] == [1, 2]
+            assert [m["position"] for m in second["messages"]] == [3]
+
+            # Out of credits: the next frame is the answer to this request
+            ws.send_text(json.dumps({"type": "channels", "swarm": "stream"}))
+            assert json.loads(ws.receive_text())["type"] == "channels_list"
+
+            ws.send_text(
+                json.dumps({"type": "credit", "channel": "ch", "swarm": "stream", "credits": 10})
+            )
+            rest = json.loads(ws.receive_text())
+            assert [m["position"] for m in rest["messages"]] == [4, 5]
+
+            # The stream stays open and pushes new messages as they arrive
+            self._send(ws, "stream", b"m6")
+            frames = [json.loads(ws.receive_text()) for _ in range(2)]
+            pushed = next(f for f in frames if f["type"] == "messages")
+            assert [m["position"] for m in pushed["messages"]] == [6]
+            assert any(f["type"] == "ack" for f in frames)
+
+    def test_stream_reports_channel_not_found(self, client: TestClient, keypair) -> None:
+        private_key, pub_bytes = keypair
+        with client.websocket_connect("/ws") as ws:
+            _register_handshake(ws, pub_bytes, "stream-missing")
+            ws.send_text(
+                json.dumps(
+                    {
+                        "type": "watch",
+                        "channel": "nope",
+                        "swarm": "stream-missing",
+                        "cursor": 0,
+                        "stream": True,
+                    }
+                )
+            )
+
+            error = json.loads(ws.receive_text())
+            assert error["code"] == "channel_not_found"
+
+
 class TestCreateApp:
     def test_create_app_returns_runnable_starlette_app(
         self, tmp_path
@@ -331,3 +441,139 @@ class TestCreateApp:
         # Verify the /ws route exists
         route_paths = [r.path for r in app.routes]
         assert "/ws" in route_paths
+
+
+class TestCompactionSweep:
+    async def test_sweep_bounds_concurrency(self, tmp_path, monkeypatch) -> None:
+        storage = FileSystemStorage(tmp_path)
+        core = LeaderBoardCore(storage)
+        for i in range(6):
+            await storage.append_message("s", f"ch{i}", b"x")
+
+        running = 0
+        peak = 0
+
+        async def compact_channel(swarm_id, channel, min_age_days):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return CompactionStats(swarm_id, channel, 1, 10, 0.01)
+
+        monkeypatch.setattr(storage, "compact_channel", compact_channel)
+        stats = await _compact_all(core, storage, concurrency=2)
+
+        assert len(stats) == 6
+        assert peak == 2
+
+    async def test_sweep_invalidates_compacted_tails(self, tmp_path, monkeypatch) -> None:
+        storage = FileSystemStorage(tmp_path)
+        core = LeaderBoardCore(storage)
+        await core.register_swarm("s", b"\x00" * 32)
+        await core.append("s", "kept", b"x")
+        await core.append("s", "compacted", b"x")
+
+        async def compact_channel(swarm_id, channel, min_age_days):
+            removed = 1 if channel == "compacted" else 0
+            return CompactionStats(swarm_id, channel, removed, 0, 0.0)
+
+        monkeypatch.setattr(storage, "compact_channel", compact_channel)
+        await _compact_all(core, storage)
+
+        assert core.tail_cache.read_after("s", "kept", 0, 1) is not None
+        assert core.tail_cache.read_after("s", "compacted", 0, 1) is None
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    """Poll until the server thread has caught up."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+class TestWatchRegistry:
+    async def test_finished_watches_are_pruned(self) -> None:
+        counts = WatcherCounts()
+        watches = _ConnectionWatches("s", counts, limit=10)
+
+        for channel in ("a", "b"):
+            watches.register(channel, asyncio.create_task(asyncio.sleep(0)))
+        assert counts.snapshot() == {"s": {"a": 1, "b": 1}}
+        await asyncio.sleep(0.01)
+
+        assert len(watches) == 0
+        assert counts.total == 0
+
+    async def test_reregistering_replaces_the_watch(self) -> None:
+        counts = WatcherCounts()
+        watches = _ConnectionWatches("s", counts, limit=1)
+        first = asyncio.create_task(asyncio.sleep(10))
+        second = asyncio.create_task(asyncio.sleep(10))
+
+        watches.register("a", first)
+        assert watches.has_room_for("a")
+        assert not watches.has_room_for("b")
+        watches.register("a", second)
+        await asyncio.gather(first, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert first.cancelled()
+        assert len(watches) == 1
+        assert counts.count("s", "a") == 1
+        await watches.cancel_all()
+        await asyncio.sleep(0)
+        assert counts.total == 0
+
+    def test_rewatch_on_connection_does_not_duplicate_readers(
+        self, client: TestClient, app: Starlette, keypair
+    ) -> None:
+        private_key, pub_bytes = keypair
+        watchers = app.state.watchers
+        with client.websocket_connect("/ws") as ws:
+            _register_handshake(ws, pub_bytes, "rewatch")
+            ws.send_text(json.dumps({
+                "type": "send", "channel": "ch", "swarm": "rewatch",
+                "body": base64.b64encode(b"first").decode(),
+            }))
+            assert json.loads(ws.receive_text())["type"] == "ack"
+
+            watch = {"type": "watch", "channel": "ch", "swarm": "rewatch", "cursor": 1}
+            for _ in range(3):
+                ws.send_text(json.dumps(watch))
+            _wait_for(lambda: watchers.count("rewatch", "ch") == 1)
+
+            ws.send_text(json.dumps({
+                "type": "send", "channel": "ch", "swarm": "rewatch",
+                "body": base64.b64encode(b"second").decode(),
+            }))
+            types = sorted(json.loads(ws.receive_text())["type"] for _ in range(2))
+            assert types == ["ack", "message"]
+            _wait_for(lambda: watchers.total == 0)
+
+    def test_watch_limit_per_connection(
+        self, core: LeaderBoardCore, memory_storage: InMemoryStorage, keypair
+    ) -> None:
+        private_key, pub_bytes = keypair
+        app = create_app(core=core, storage=memory_storage, max_watches_per_connection=2)
+        with TestClient(app).websocket_connect("/ws") as ws:
+            _register_handshake(ws, pub_bytes, "capped")
+            for channel in ("a", "b", "c"):
+                ws.send_text(json.dumps({
+                    "type": "send", "channel": channel, "swarm": "capped",
+                    "body": base64.b64encode(b"x").decode(),
+                }))
+                assert json.loads(ws.receive_text())["type"] == "ack"
+
+            for channel in ("a", "b", "a", "c"):
+                ws.send_text(json.dumps(
+                    {"type": "watch", "channel": channel, "swarm": "capped", "cursor": 1}
+                ))
+
+            error = json.loads(ws.receive_text())
+            assert error["code"] == "too_many_watches"
+            assert "'c'" in error["message"]
+            assert app.state.watchers.snapshot() == {"capped": {"a": 1, "b": 1}}
+
+        _wait_for(lambda: app.state.watchers.total == 0)
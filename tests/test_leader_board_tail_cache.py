@@ -0,0 +1,77 @@
+# Chunk: docs/chunks/leader_board_tail_cache - In-memory channel tail cache
+"""Tests for the core's per-channel tail cache."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from leader_board.models import ChannelInfo, ChannelMessage
+from leader_board.tail_cache import MESSAGE_OVERHEAD_BYTES, ChannelTailCache
+
+
+def _msg(position: int, body: bytes = b"x", channel: str = "ch") -> ChannelMessage:
+    return ChannelMessage(
+        channel=channel, position=position, body=body, sent_at=datetime.now(UTC)
+    )
+
+
+class TestChannelTailCache:
+    def test_reads_within_tail_hit(self) -> None:
+        cache = ChannelTailCache(max_messages_per_channel=3)
+        for position in range(1, 6):
+            cache.record_append("s", "ch", _msg(position))
+
+        assert [m.position for m in cache.read_after("s", "ch", 2, 10)] == [3, 4, 5]
+        assert [m.position for m in cache.read_after("s", "ch", 3, 1)] == [4]
+        assert cache.read_after("s", "ch", 5, 10) == []
+        assert cache.hits == 3
+
+    def test_reads_before_tail_or_unknown_channel_miss(self) -> None:
+        cache = ChannelTailCache(max_messages_per_channel=3)
+        for position in range(1, 6):
+            cache.record_append("s", "ch", _msg(position))
+
+        assert cache.read_after("s", "ch", 1, 10) is None
+        assert cache.read_after("s", "other", 0, 10) is None
+        assert cache.misses == 2
+
+    def test_gap_restarts_the_run(self) -> None:
+        cache = ChannelTailCache()
+        cache.record_append("s", "ch", _msg(1))
+        cache.record_append("s", "ch", _msg(3))
+        cache.record_append("s", "ch", _msg(2))  # arrived late, ignored
+
+        assert cache.read_after("s", "ch", 0, 10) is None
+        assert [m.position for m in cache.read_after("s", "ch", 2, 10)] == [3]
+
+    def test_least_recently_used_channel_is_evicted(self) -> None:
+        cost = 10 + MESSAGE_OVERHEAD_BYTES
+        cache = ChannelTailCache(max_bytes=2 * cost)
+        cache.record_append("s", "a", _msg(1, b"0" * 10, "a"))
+        cache.record_append("s", "b", _msg(1, b"0" * 10, "b"))
+        cache.read_after("s", "a", 0, 1)  # touch a
+        cache.record_append("s", "c", _msg(1, b"0" * 10, "c"))
+
+        assert cache.read_after("s", "b", 0, 1) is None
+        assert cache.read_after("s", "a", 0, 1) is not None
+        assert cache.size == 2 * cost
+        assert cache.stats()["evictions"] == 1
+
+    def test_channel_info_needs_oldest_from_storage(self) -> None:
+        cache = ChannelTailCache()
+        cache.record_append("s", "ch", _msg(1))
+        assert cache.channel_info("s", "ch") is None
+
+        cache.record_channel_info("s", ChannelInfo(name="ch", head_position=1, oldest_position=1))
+        cache.record_append("s", "ch", _msg(2))
+
+        assert cache.channel_info("s", "ch") == ChannelInfo(
+            name="ch", head_position=2, oldest_position=1
+        )
+
+    def test_zero_ceiling_disables_cache(self) -> None:
+        cache = ChannelTailCache(max_bytes=0)
+        cache.record_append("s", "ch", _msg(1))
+
+        assert len(cache) == 0
+        assert cache.read_after("s", "ch", 0, 1) is None
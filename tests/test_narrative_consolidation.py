@@ -306,6 +306,66 @@ Content for chunk {name} about topic.
         assert "only_one" in result.unclustered
 
 
+# Chunk: docs/chunks/cluster_knn_graph - Sparse kNN graph clustering
+class TestChunkClusteringKnn:
+    """Tests for the sparse kNN graph clustering mode."""
+
+    TOPICS = {
+        "auth": "authentication login session tokens oauth cookies",
+        "db": "database schema migration postgres tables indexes",
+        "ui": "dashboard widgets rendering layout css components",
+    }
+
+    def write_chunks(self, project_dir):
+        names = []
+        for topic, words in self.TOPICS.items():
+            for i, extra in enumerate(["alpha", "beta", "gamma"]):
+                name = f"{topic}_{extra}"
+                goal = project_dir / "docs" / "chunks" / name / "GOAL.md"
+                goal.parent.mkdir(parents=True)
+                goal.write_text(f"---\nstatus: ACTIVE\n---\n\n{words} {extra} step{i}\n")
+                names.append(name)
+        return names
+
+    def test_knn_with_complete_graph_matches_dense(self, temp_project):
+        from cluster_analysis import cluster_chunks
+
+        names = self.write_chunks(temp_project)
+
+        dense = cluster_chunks(temp_project, chunk_ids=names, method="dense")
+        knn = cluster_chunks(temp_project, chunk_ids=names, method="knn", neighbors=len(names))
+
+        assert len(dense.clusters) == 3
+        assert knn == dense
+
+    def test_auto_uses_knn_above_dense_limit(self, temp_project, monkeypatch):
+        import cluster_analysis
+
+        names = self.write_chunks(temp_project)
+        monkeypatch.setattr(cluster_analysis, "DENSE_CLUSTER_MAX_CHUNKS", 4)
+
+        def no_dense(*args, **kwargs):
+            raise AssertionError("dense path used above the limit")
+
+        monkeypatch.setattr(cluster_analysis, "_dense_cluster_labels", no_dense)
+
+        result = cluster_analysis.cluster_chunks(temp_project, chunk_ids=names)
+
+        assert sorted(result.clusters) == [
+            ["auth_alpha", "auth_beta", "auth_gamma"],
+            ["db_alpha", "db_beta", "db_gamma"],
+            ["ui_alpha", "ui_beta", "ui_gamma"],
+        ]
+
+    def test_unknown_method_raises(self, temp_project):
+        from cluster_analysis import cluster_chunks
+
+        names = self.write_chunks(temp_project)
+
+        with pytest.raises(ValueError, match="Unknown clustering method"):
+            cluster_chunks(temp_project, chunk_ids=names, method="spectral")
+
+
 class TestConsolidateChunks:
     """Tests for consolidate_chunks function."""
 
@@ -576,6 +636,20 @@ Handle HTTP requests and responses.
         # Should show clustering results (either clusters found or unclustered)
         assert "cluster" in result.output.lower() or "Unclustered" in result.output
 
+    def test_cluster_knn_method(self, temp_project, runner):
+        """--method knn clusters through the sparse neighbour graph."""
+        from ve import cli
+
+        names = TestChunkClusteringKnn().write_chunks(temp_project)
+
+        result = runner.invoke(
+            cli,
+            ["chunk", "cluster", *names, "--method", "knn", "--project-dir", str(temp_project)],
+        )
+
+        assert result.exit_code == 0
+        assert "Found 3 cluster(s)" in result.output
+
     def test_cluster_requires_chunks_or_all(self, temp_project, runner):
         """Errors when neither chunk IDs nor --all provided."""
         from ve import cli
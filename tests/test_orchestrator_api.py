@@ -58,6 +58,21 @@ class TestStatusEndpoint:
         assert data["work_unit_counts"]["READY"] == 2
         assert data["work_unit_counts"]["RUNNING"] == 1
 
+    # Chunk: docs/chunks/orch_async_state_store - Store latency in status
+    def test_reports_store_latency(self, client):
+        """Status includes per-query latency histograms for store calls."""
+        client.post("/work-units", json={"chunk": "chunk_1", "status": "READY"})
+        client.get("/work-units/chunk_1")
+
+        data = client.get("/status").json()
+
+        latency = data["store_latency"]
+        assert latency["create_work_unit"]["count"] == 1
+        assert latency["get_work_unit"]["count"] >= 1
+        assert set(latency["get_work_unit"]) == {
+            "count", "mean_ms", "p50_ms", "p99_ms", "max_ms", "buckets",
+        }
+
 
 class TestListWorkUnitsEndpoint:
     """Tests for GET /work-units endpoint."""
@@ -473,6 +488,74 @@ class TestDeleteWorkUnitSafeBranch:
         assert "3 unmerged commit(s)" in response.json()["error"]
 
 
+# Chunk: docs/chunks/orch_paged_log_view - Paged log reads
+class TestLogPageEndpoint:
+    """Tests for GET /work-units/{chunk}/log endpoint."""
+
+    @pytest.fixture
+    def log_dir(self, client, tmp_path):
+        import json
+
+        client.post("/work-units", json={"chunk": "log_chunk"})
+        log_dir = tmp_path / ".ve" / "chunks" / "log_chunk" / "log"
+        log_dir.mkdir(parents=True)
+        (log_dir / "plan.txt").write_text(
+            json.dumps({"timestamp": "2026-01-31T14:00:00+00:00", "type": "text", "text": "plan"}) + "\n"
+        )
+        (log_dir / "implement.txt").write_text("".join(
+            json.dumps({
+                "timestamp": f"2026-01-31T14:1{i}:00+00:00",
+                "type": "text",
+                "text": f"step {i}",
+            }) + "\n"
+            for i in range(5)
+        ))
+        return log_dir
+
+    def test_defaults_to_latest_phase(self, client, log_dir):
+        """Without a phase the latest phase log is read."""
+        response = client.get("/work-units/log_chunk/log")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["phase"] == "IMPLEMENT"
+        assert data["total"] == 5
+        assert [e["record"]["text"] for e in data["entries"]] == [f"step {i}" for i in range(5)]
+
+    def test_last_entries(self, client, log_dir):
+        """last returns the newest entries with their entry numbers."""
+        data = client.get("/work-units/log_chunk/log?last=2").json()
+
+        assert data["first"] == 3
+        assert [e["index"] for e in data["entries"]] == [3, 4]
+
+    def test_entry_and_time_ranges(self, client, log_dir):
+        """start/count and since/until select ranges."""
+        data = client.get("/work-units/log_chunk/log?start=1&count=2").json()
+        assert [e["record"]["text"] for e in data["entries"]] == ["step 1", "step 2"]
+
+        data = client.get(
+            "/work-units/log_chunk/log",
+            params={"since": "2026-01-31T14:13:00+00:00"},
+        ).json()
+        assert [e["record"]["text"] for e in data["entries"]] == ["step 3", "step 4"]
+
+        data = client.get("/work-units/log_chunk/log?phase=plan").json()
+        assert [e["record"]["text"] for e in data["entries"]] == ["plan"]
+
+    def test_invalid_parameters(self, client, log_dir):
+        """Bad ranges and phases are rejected."""
+        assert client.get("/work-units/log_chunk/log?count=-1").status_code == 400
+        assert client.get("/work-units/log_chunk/log?since=soon").status_code == 400
+        assert client.get("/work-units/log_chunk/log?phase=lunch").status_code == 400
+
+    def test_not_found(self, client):
+        """Returns 404 for non-existent work unit."""
+        response = client.get("/work-units/nonexistent/log")
+
+        assert response.status_code == 404
+
+
 class TestStatusHistoryEndpoint:
     """Tests for GET /work-units/{chunk}/history endpoint."""
 
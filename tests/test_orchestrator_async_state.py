@@ -0,0 +1,212 @@
+# Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
+# Chunk: docs/chunks/orch_async_state_store - AsyncStateStore tests
+"""Tests for the awaitable StateStore facade."""
+
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from orchestrator.async_state import AsyncStateStore, LATENCY_BUCKETS_MS, QueryLatency
+from orchestrator.models import WorkUnit, WorkUnitPhase, WorkUnitStatus
+from orchestrator.state import StateStore, StaleWriteError
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create and initialize a state store."""
+    store = StateStore(tmp_path / ".ve" / "orchestrator.db")
+    store.initialize()
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def async_store(store):
+    """Wrap the state store in an AsyncStateStore."""
+    async_store = AsyncStateStore(store)
+    yield async_store
+    async_store.close()
+
+
+def make_unit(chunk: str, status: WorkUnitStatus = WorkUnitStatus.READY) -> WorkUnit:
+    now = datetime.now(timezone.utc)
+    return WorkUnit(
+        chunk=chunk,
+        phase=WorkUnitPhase.PLAN,
+        status=status,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestAsyncStateStoreRoundTrip:
+    """Reads and writes through the facade hit the same database."""
+
+    @pytest.mark.asyncio
+    async def test_create_then_read(self, async_store):
+        await async_store.create_work_unit(make_unit("alpha"))
+
+        unit = await async_store.get_work_unit("alpha")
+        assert unit is not None
+        assert unit.chunk == "alpha"
+        assert [u.chunk for u in await async_store.list_work_units()] == ["alpha"]
+        assert await async_store.count_by_status() == {"READY": 1}
+
+    @pytest.mark.asyncio
+    async def test_writes_visible_to_sync_store(self, store, async_store):
+        await async_store.create_work_unit(make_unit("alpha"))
+        await async_store.set_config("max_agents", "4")
+
+        assert store.get_work_unit("alpha") is not None
+        assert store.get_config("max_agents") == "4"
+
+    @pytest.mark.asyncio
+    async def test_update_propagates_stale_write_error(self, async_store):
+        created = await async_store.create_work_unit(make_unit("alpha"))
+        stale = created.updated_at
+        created.status = WorkUnitStatus.RUNNING
+        created.updated_at = datetime.now(timezone.utc)
+        await async_store.update_work_unit(created)
+
+        created.status = WorkUnitStatus.DONE
+        with pytest.raises(StaleWriteError):
+            await async_store.update_work_unit(created, expected_updated_at=stale)
+
+    @pytest.mark.asyncio
+    async def test_reads_run_on_read_only_connections(self, async_store):
+        def on_reader(store):
+            return store.connection.execute("PRAGMA query_only").fetchone()[0]
+
+        # Reader stores are private; a read proves the pragma was applied
+        await async_store.get_work_unit("missing")
+        readers = list(async_store._reader_stores)
+        assert readers
+        assert all(on_reader(r) == 1 for r in readers)
+
+    @pytest.mark.asyncio
+    async def test_zero_readers_routes_reads_through_writer(self, store):
+        async_store = AsyncStateStore(store, reader_count=0)
+        try:
+            await async_store.create_work_unit(make_unit("alpha"))
+            assert (await async_store.get_work_unit("alpha")).chunk == "alpha"
+            assert async_store._reader_stores == []
+        finally:
+            async_store.close()
+
+    @pytest.mark.asyncio
+    async def test_usable_after_close(self, async_store):
+        await async_store.create_work_unit(make_unit("alpha"))
+        async_store.close()
+
+        assert (await async_store.get_work_unit("alpha")).chunk == "alpha"
+
+
+class TestAsyncStateStoreConcurrency:
+    """The event loop and readers are not held up by writes."""
+
+    @pytest.mark.asyncio
+    async def test_event_loop_runs_during_write(self, async_store):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_write(store):
+            started.set()
+            release.wait(5)
+            return "done"
+
+        write = asyncio.create_task(async_store.run_write(slow_write))
+        await asyncio.to_thread(started.wait, 5)
+
+        # The loop is free and reads complete while the writer is busy
+        assert await async_store.get_work_unit("missing") is None
+        assert not write.done()
+
+        release.set()
+        assert await write == "done"
+
+    @pytest.mark.asyncio
+    async def test_writes_are_serialized(self, async_store):
+        active = 0
+        overlap = False
+        lock = threading.Lock()
+
+        def write(store, n):
+            nonlocal active, overlap
+            with lock:
+                active += 1
+                overlap = overlap or active > 1
+            threading.Event().wait(0.01)
+            with lock:
+                active -= 1
+            return n
+
+        results = await asyncio.gather(
+            *(async_store.run_write(write, n) for n in range(5))
+        )
+
+        assert results == list(range(5))
+        assert not overlap
+
+    @pytest.mark.asyncio
+    async def test_patched_store_methods_are_honored(self, store, async_store):
+        calls = []
+        original = store.update_work_unit
+
+        def spy(work_unit, expected_updated_at=None):
+            calls.append(work_unit.chunk)
+            return original(work_unit, expected_updated_at=expected_updated_at)
+
+        created = await async_store.create_work_unit(make_unit("alpha"))
+        store.update_work_unit = spy
+        await async_store.update_work_unit(created)
+
+        assert calls == ["alpha"]
+
+
+class TestQueryLatency:
+    """Latency histograms per query type."""
+
+    def test_buckets_and_summary(self):
+        stats = QueryLatency()
+        for ms in (0.05, 0.3, 0.3, 7.0, 5000.0):
+            stats.record(ms)
+
+        summary = stats.to_dict()
+        assert summary["count"] == 5
+        assert summary["max_ms"] == 5000.0
+        assert summary["buckets"]["le_0.1"] == 1
+        assert summary["buckets"]["le_0.5"] == 2
+        assert summary["buckets"]["le_10"] == 1
+        assert summary["buckets"]["overflow"] == 1
+        assert len(summary["buckets"]) == len(LATENCY_BUCKETS_MS) + 1
+
+    def test_percentiles_use_bucket_upper_bounds(self):
+        """Percentiles report bucket bounds, capped at the observed maximum."""
+        stats = QueryLatency()
+        for _ in range(99):
+            stats.record(0.2)
+        stats.record(40.0)
+
+        assert stats.percentile(0.5) == 0.25
+        assert stats.percentile(0.99) == 0.25
+        assert stats.percentile(1.0) == 40.0
+
+    def test_empty_histogram(self):
+        assert QueryLatency().percentile(0.5) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_snapshot_keyed_by_query(self, async_store):
+        await async_store.create_work_unit(make_unit("alpha"))
+        await async_store.get_work_unit("alpha")
+        await async_store.get_work_unit("alpha")
+        await async_store.run_write(lambda store: None, query="custom")
+
+        snapshot = async_store.latency_snapshot()
+        assert snapshot["get_work_unit"]["count"] == 2
+        assert snapshot["create_work_unit"]["count"] == 1
+        assert snapshot["custom"]["count"] == 1
+
+        async_store.reset_latency()
+        assert async_store.latency_snapshot() == {}
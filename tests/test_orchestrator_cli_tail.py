@@ -184,6 +184,78 @@ class TestOrchTail:
         impl_pos = result.output.index("IMPLEMENT")
         assert plan_pos < impl_pos
 
+    # Chunk: docs/chunks/orch_paged_log_view - Range options
+    def test_tail_last_shows_only_newest_entries(self, runner, tmp_path):
+        """--last limits output to the newest entries across phases."""
+        chunk_dir = tmp_path / "docs" / "chunks" / "my_chunk"
+        chunk_dir.mkdir(parents=True)
+        (chunk_dir / "GOAL.md").write_text("# Goal")
+
+        log_dir = tmp_path / ".ve" / "chunks" / "my_chunk" / "log"
+        log_dir.mkdir(parents=True)
+        (log_dir / "plan.txt").write_text(
+            _json_line("text", "2026-01-31T14:00:00.000000+00:00", text="Planning") + "\n"
+        )
+        (log_dir / "implement.txt").write_text(
+            "".join(
+                _json_line("text", f"2026-01-31T14:1{i}:00.000000+00:00", text=f"Step {i}") + "\n"
+                for i in range(5)
+            )
+        )
+
+        result = runner.invoke(
+            cli,
+            ["orch", "tail", "my_chunk", "--last", "2", "--project-dir", str(tmp_path)],
+        )
+
+        assert result.exit_code == 0
+        assert "PLAN" not in result.output
+        assert "=== IMPLEMENT phase ===" in result.output
+        assert "Step 2" not in result.output
+        assert "Step 3" in result.output
+        assert "Step 4" in result.output
+
+    def test_tail_time_range(self, runner, tmp_path):
+        """--since and --until select entries by timestamp."""
+        chunk_dir = tmp_path / "docs" / "chunks" / "my_chunk"
+        chunk_dir.mkdir(parents=True)
+        (chunk_dir / "GOAL.md").write_text("# Goal")
+
+        log_dir = tmp_path / ".ve" / "chunks" / "my_chunk" / "log"
+        log_dir.mkdir(parents=True)
+        (log_dir / "implement.txt").write_text(
+            "".join(
+                _json_line("text", f"2026-01-31T14:1{i}:00.000000+00:00", text=f"Step {i}") + "\n"
+                for i in range(5)
+            )
+        )
+
+        result = runner.invoke(
+            cli,
+            [
+                "orch", "tail", "my_chunk",
+                "--since", "2026-01-31T14:11:00+00:00",
+                "--until", "2026-01-31T14:12:00+00:00",
+                "--project-dir", str(tmp_path),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Step 0" not in result.output
+        assert "Step 1" in result.output
+        assert "Step 2" in result.output
+        assert "Step 3" not in result.output
+
+    def test_tail_rejects_invalid_time(self, runner, tmp_path):
+        """An unparseable --since is a usage error."""
+        result = runner.invoke(
+            cli,
+            ["orch", "tail", "my_chunk", "--since", "yesterday", "--project-dir", str(tmp_path)],
+        )
+
+        assert result.exit_code == 2
+        assert "Invalid time" in result.output
+
     def test_tail_help(self, runner):
         """Shows help text."""
         result = runner.invoke(cli, ["orch", "tail", "--help"])
@@ -284,8 +284,8 @@ class TestLogStreamWebSocket:
             # Connection should succeed - should receive an info message
             # about waiting for logs or existing log data
             data = websocket.receive_json()
-            # Should be either 'info' (no logs yet) or 'log_line' (has logs)
-            assert data["type"] in ("info", "log_line")
+            # Should be either 'info' (no logs yet) or 'log_lines' (has logs)
+            assert data["type"] in ("info", "log_lines")
 
     def test_log_stream_chunk_not_found(self, client):
         """Log stream returns error for non-existent chunk."""
@@ -320,16 +320,17 @@ class TestLogStreamWebSocket:
         )
 
         with client.websocket_connect("/ws/log/logs_test") as websocket:
-            # Should receive phase header
+            # Existing logs arrive as one batched frame
             data = websocket.receive_json()
-            assert data["type"] == "log_line"
-            assert data.get("is_header") is True
-            assert "IMPLEMENT" in data["content"]
+            assert data["type"] == "log_lines"
+            header, entry = data["lines"][0], data["lines"][1]
 
-            # Should receive the log entry
-            data = websocket.receive_json()
-            assert data["type"] == "log_line"
-            assert "Read" in data["content"]
+            # Phase header first
+            assert header.get("is_header") is True
+            assert "IMPLEMENT" in header["content"]
+
+            # Then the log entry
+            assert "Read" in entry["content"]
 
     def test_log_stream_no_logs_yet(self, client):
         """Log stream sends info message when no logs exist."""
@@ -345,6 +346,88 @@ class TestLogStreamWebSocket:
             assert data["type"] == "info"
             assert "Waiting" in data["content"]
 
+    # Chunk: docs/chunks/orch_log_bus - Pushed records and completion
+    def test_log_stream_pushes_new_records(self, client, tmp_path):
+        """Records written by the log callback are pushed as they happen."""
+        from orchestrator.agent import create_log_callback
+        from orchestrator.backend import TextEvent, ToolCallEvent
+        from orchestrator.models import WorkUnitPhase
+
+        client.post("/work-units", json={
+            "chunk": "push_chunk",
+            "status": "RUNNING",
+            "phase": "IMPLEMENT",
+        })
+        log_dir = tmp_path / ".ve" / "chunks" / "push_chunk" / "log"
+
+        with client.websocket_connect("/ws/log/push_chunk") as websocket:
+            assert websocket.receive_json()["type"] == "info"
+
+            callback = create_log_callback(
+                "push_chunk", WorkUnitPhase.IMPLEMENT, log_dir
+            )
+            callback(ToolCallEvent(tool_id="t1", name="Bash", input={"command": "ls"}))
+            callback(TextEvent(text="listing done"))
+
+            received = []
+            while len(received) < 3:
+                data = websocket.receive_json()
+                assert data["type"] == "log_lines"
+                received.extend(data["lines"])
+
+        # Header, then each record exactly once, in order
+        assert received[0].get("is_header") is True
+        assert "Bash" in received[1]["content"]
+        assert "listing done" in received[2]["content"]
+        assert len(received) == 3
+
+    # Chunk: docs/chunks/orch_paged_log_view - Replay only the latest entries
+    def test_log_stream_replays_only_recent_entries(self, client, tmp_path, monkeypatch):
+        """Connecting replays the newest entries and summarizes the rest."""
+        import json as _json
+        monkeypatch.setattr("orchestrator.api.streaming.LOG_REPLAY_ENTRIES", 2)
+
+        client.post("/work-units", json={
+            "chunk": "long_log",
+            "status": "RUNNING",
+            "phase": "IMPLEMENT",
+        })
+        log_dir = tmp_path / ".ve" / "chunks" / "long_log" / "log"
+        log_dir.mkdir(parents=True)
+        (log_dir / "implement.txt").write_text("".join(
+            _json.dumps({
+                "timestamp": f"2026-01-31T19:30:0{i}+00:00",
+                "type": "text",
+                "text": f"message {i}",
+            }) + "\n"
+            for i in range(5)
+        ))
+
+        with client.websocket_connect("/ws/log/long_log") as websocket:
+            lines = websocket.receive_json()["lines"]
+
+        assert "3 earlier log entries" in lines[0]["content"]
+        assert "IMPLEMENT" in lines[1]["content"]
+        assert "message 3" in lines[2]["content"]
+        assert "message 4" in lines[3]["content"]
+        assert len(lines) == 4
+
+    def test_log_stream_reports_completion(self, client):
+        """Marking the work unit DONE ends the stream without polling."""
+        client.post("/work-units", json={
+            "chunk": "finishing_chunk",
+            "status": "RUNNING",
+            "phase": "IMPLEMENT",
+        })
+
+        with client.websocket_connect("/ws/log/finishing_chunk") as websocket:
+            assert websocket.receive_json()["type"] == "info"
+
+            client.patch("/work-units/finishing_chunk", json={"status": "DONE"})
+
+            data = websocket.receive_json()
+            assert data["type"] == "completed"
+
 
 class TestDashboardLogTiling:
     """Tests for dashboard tile expansion UI."""
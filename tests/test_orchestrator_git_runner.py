@@ -0,0 +1,179 @@
+# Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
+# Chunk: docs/chunks/orch_async_git_runner - GitRunner tests
+"""Tests for running git operations off the event loop."""
+
+import asyncio
+import subprocess
+import threading
+
+import pytest
+
+from orchestrator.git_runner import GitRunner
+from orchestrator.worktree import WorktreeManager
+
+
+@pytest.fixture
+def runner():
+    runner = GitRunner(max_concurrency=4)
+    yield runner
+    runner.close()
+
+
+class OverlapTracker:
+    """Records the peak number of concurrently running operations."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def op(self, result=None, hold=0.02):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        threading.Event().wait(hold)
+        with self._lock:
+            self.active -= 1
+        return result
+
+
+class TestGitRunnerCall:
+    """Results, errors and the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result_and_passes_arguments(self, runner):
+        def op(a, b, *, c):
+            return (a, b, c)
+
+        assert await runner.call("/repo", op, 1, 2, c=3) == (1, 2, 3)
+        assert await runner.query(op, 4, 5, c=6) == (4, 5, 6)
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate(self, runner):
+        def op():
+            raise RuntimeError("merge conflict")
+
+        with pytest.raises(RuntimeError, match="merge conflict"):
+            await runner.call("/repo", op)
+
+        # The repository lock was released
+        assert await runner.call("/repo", lambda: "ok") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_event_loop_runs_during_operation(self, runner):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_merge():
+            started.set()
+            release.wait(5)
+            return "merged"
+
+        task = asyncio.create_task(runner.call("/repo", slow_merge))
+        await asyncio.to_thread(started.wait, 5)
+
+        # Other coroutines keep running while git is busy
+        await asyncio.sleep(0)
+        assert not task.done()
+        assert runner.stats()["in_flight"] == 1
+
+        release.set()
+        assert await task == "merged"
+        assert runner.stats()["in_flight"] == 0
+
+
+class TestGitRunnerConcurrency:
+    """Per-repository serialization and the global bound."""
+
+    @pytest.mark.asyncio
+    async def test_same_repo_is_serialized_in_order(self, runner):
+        tracker = OverlapTracker()
+        results = await asyncio.gather(
+            *(runner.call("/repo", tracker.op, n) for n in range(5))
+        )
+
+        assert results == list(range(5))
+        assert tracker.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_different_repos_run_in_parallel(self, runner):
+        tracker = OverlapTracker()
+        await asyncio.gather(
+            *(runner.call(f"/repo{n}", tracker.op, hold=0.1) for n in range(3))
+        )
+
+        assert tracker.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        runner = GitRunner(max_concurrency=2)
+        try:
+            tracker = OverlapTracker()
+            await asyncio.gather(
+                *(runner.query(tracker.op, hold=0.05) for _ in range(6)),
+                *(runner.call(f"/repo{n}", tracker.op, hold=0.05) for n in range(3)),
+            )
+            assert tracker.peak == 2
+        finally:
+            runner.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_lock_until_git_finishes(self, runner):
+        release = threading.Event()
+        started = threading.Event()
+        finished = threading.Event()
+
+        def slow_merge():
+            started.set()
+            release.wait(5)
+            finished.set()
+
+        task = asyncio.create_task(runner.call("/repo", slow_merge))
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # The next operation on the repo waits for the abandoned thread
+        second = asyncio.create_task(runner.call("/repo", finished.is_set))
+        await asyncio.sleep(0.05)
+        assert not second.done()
+
+        release.set()
+        assert await second is True
+
+    def test_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError):
+            GitRunner(max_concurrency=0)
+
+
+class TestGitRunnerWithWorktreeManager:
+    """End to end against a real repository."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_finalizes_merge_cleanly(self, tmp_path, runner):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        git = lambda *args: subprocess.run(
+            ["git", *args], cwd=repo, check=True, capture_output=True
+        )
+        git("init", "-b", "main")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test")
+        (repo / "README.md").write_text("# Test\n")
+        git("add", ".")
+        git("commit", "-m", "Initial commit")
+
+        manager = WorktreeManager(repo)
+        chunks = ["alpha", "beta", "gamma"]
+        for chunk in chunks:
+            path = await runner.call(repo, manager.create_worktree, chunk)
+            (path / f"{chunk}.txt").write_text(chunk)
+
+        await asyncio.gather(
+            *(runner.call(repo, manager.finalize_work_unit, chunk) for chunk in chunks)
+        )
+
+        for chunk in chunks:
+            assert (repo / f"{chunk}.txt").read_text() == chunk
+            assert not manager.worktree_exists(chunk)
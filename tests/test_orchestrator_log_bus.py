@@ -0,0 +1,146 @@
+# Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
+# Chunk: docs/chunks/orch_log_bus - Log bus tests
+"""Tests for the in-daemon log bus."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from orchestrator.agent import create_log_callback
+from orchestrator.backend import TextEvent
+from orchestrator.api.streaming import _LogFollower
+from orchestrator.log_bus import LogBus, LogFrame, get_log_bus, reset_log_bus
+from orchestrator.models import WorkUnitPhase
+
+
+def record(text: str) -> str:
+    return json.dumps({
+        "timestamp": "2026-01-31T19:30:56.669473+00:00",
+        "type": "text",
+        "text": text,
+    }) + "\n"
+
+
+class TestLogBus:
+    """Delivery, batching and overflow."""
+
+    @pytest.mark.asyncio
+    async def test_subscriber_receives_frames_for_its_chunk(self):
+        bus = LogBus()
+        subscription = bus.subscribe("chunk_a")
+
+        bus.publish("chunk_a", "plan", 0, 10, record("one"))
+        bus.publish("chunk_b", "plan", 0, 10, record("other"))
+        bus.publish("chunk_a", "plan", 10, 20, record("two"))
+
+        await asyncio.wait_for(subscription.wait(), 1)
+        frames, overflowed = subscription.drain()
+
+        # Both records arrive in one batch
+        assert [(f.start, f.end) for f in frames] == [(0, 10), (10, 20)]
+        assert not overflowed
+        subscription.close()
+        assert "chunk_a" not in bus._subscribers
+
+    @pytest.mark.asyncio
+    async def test_publish_from_another_thread(self):
+        bus = LogBus()
+        subscription = bus.subscribe("chunk_a")
+
+        thread = threading.Thread(
+            target=bus.publish, args=("chunk_a", "plan", 0, 10, record("one"))
+        )
+        thread.start()
+        thread.join()
+
+        await asyncio.wait_for(subscription.wait(), 1)
+        frames, _ = subscription.drain()
+        assert len(frames) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_overflows_instead_of_growing(self):
+        bus = LogBus(max_pending=2)
+        subscription = bus.subscribe("chunk_a")
+
+        for n in range(5):
+            bus.publish("chunk_a", "plan", n * 10, n * 10 + 10, record(str(n)))
+
+        frames, overflowed = subscription.drain()
+        assert overflowed
+        assert len(frames) <= 2
+
+    @pytest.mark.asyncio
+    async def test_html_is_formatted_once_for_all_subscribers(self):
+        bus = LogBus()
+        first = bus.subscribe("chunk_a")
+        second = bus.subscribe("chunk_a")
+
+        bus.publish("chunk_a", "plan", 0, 10, record("shared text"))
+        (frame_a,), _ = first.drain()
+        (frame_b,), _ = second.drain()
+
+        assert frame_a is frame_b
+        lines = frame_a.html_lines()
+        assert lines[0]["is_header"] is True
+        assert "shared text" in lines[1]["content"]
+        assert frame_b.html_lines() is lines
+
+
+class TestLogCallbackPublishing:
+    """create_log_callback publishes what it writes."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_bus(self):
+        reset_log_bus()
+        yield
+        reset_log_bus()
+
+    @pytest.mark.asyncio
+    async def test_frames_match_file_offsets(self, tmp_path):
+        subscription = get_log_bus().subscribe("test_chunk")
+        callback = create_log_callback("test_chunk", WorkUnitPhase.PLAN, tmp_path)
+
+        callback(TextEvent(text="first"))
+        callback(TextEvent(text="second"))
+        callback.close()
+
+        frames, _ = subscription.drain()
+        content = (tmp_path / "plan.txt").read_bytes()
+        assert [f.phase for f in frames] == ["plan", "plan"]
+        assert frames[0].start == 0
+        assert frames[1].start == frames[0].end
+        assert frames[1].end == len(content)
+        for frame in frames:
+            assert content[frame.start:frame.end].decode() == frame.line
+
+
+# Chunk: docs/chunks/orch_phase_log_writer - Gaps while records sit in the writer's buffer
+class TestLogFollowerGaps:
+    """A frame after a gap is sent once the file has caught up to it."""
+
+    @staticmethod
+    def frame(start, line):
+        return LogFrame(chunk="c", phase="plan", start=start, end=start + len(line), line=line)
+
+    def test_frame_after_flushed_gap_is_sent(self, tmp_path):
+        first, second = record("one"), record("two")
+        (tmp_path / "plan.txt").write_text(first)
+        follower = _LogFollower(tmp_path)
+
+        lines = follower.apply([self.frame(len(first), second)], False)
+
+        assert len([line for line in lines if not line.get("is_header")]) == 2
+        assert follower.positions["plan"] == len(first) + len(second)
+
+    def test_frame_after_unflushed_gap_waits_for_the_file(self, tmp_path):
+        first, second = record("one"), record("two")
+        follower = _LogFollower(tmp_path)
+
+        # The first record is still buffered, so the file has nothing yet
+        assert follower.apply([self.frame(len(first), second)], False) == []
+
+        (tmp_path / "plan.txt").write_text(first + second)
+        lines = follower.catch_up()
+        assert len([line for line in lines if not line.get("is_header")]) == 2
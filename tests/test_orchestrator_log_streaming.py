@@ -10,6 +10,8 @@ from orchestrator.log_streaming import (
     get_phase_log_files,
     stream_phase_log,
     display_phase_log,
+    parse_log_time,
+    read_log_pages,
 )
 from orchestrator.models import WorkUnitPhase
 
@@ -171,3 +173,41 @@ class TestDisplayPhaseLog:
 
         # Should not raise
         display_phase_log(WorkUnitPhase.GOAL, log_file, show_header=False)
+
+
+# Chunk: docs/chunks/orch_paged_log_view - Selected entries across phases
+class TestReadLogPages:
+    """Tests for read_log_pages function."""
+
+    def test_last_counts_across_phases_newest_first(self, tmp_path):
+        """--last style selection takes the newest phase first."""
+        (tmp_path / "plan.txt").write_text("p1\np2\np3\n")
+        (tmp_path / "implement.txt").write_text("i1\ni2\n")
+
+        pages = read_log_pages(tmp_path, last=3)
+
+        assert [phase for phase, _ in pages] == [WorkUnitPhase.PLAN, WorkUnitPhase.IMPLEMENT]
+        assert [line for _, line in pages[0][1].records] == ["p3\n"]
+        assert [line for _, line in pages[1][1].records] == ["i1\n", "i2\n"]
+        assert pages[0][1].first == 2
+
+    def test_filters_phases(self, tmp_path):
+        """Only the requested phases are read."""
+        (tmp_path / "plan.txt").write_text("p1\n")
+        (tmp_path / "implement.txt").write_text("i1\n")
+
+        pages = read_log_pages(tmp_path, phases=[WorkUnitPhase.PLAN])
+
+        assert [phase for phase, _ in pages] == [WorkUnitPhase.PLAN]
+
+
+class TestParseLogTime:
+    """Tests for parse_log_time function."""
+
+    def test_accepts_unix_seconds_and_iso_times(self):
+        assert parse_log_time("1767225600") == 1767225600.0
+        assert parse_log_time("2026-01-01T00:00:00+00:00") == 1767225600.0
+
+    def test_rejects_other_values(self):
+        with pytest.raises(ValueError):
+            parse_log_time("yesterday")
@@ -583,3 +583,139 @@ class TestConflictPersistence:
         conflicts = store.list_all_conflicts(verdict=ConflictVerdict.ASK_OPERATOR)
         assert len(conflicts) == 1
         assert conflicts[0].verdict == ConflictVerdict.ASK_OPERATOR
+
+
+# Chunk: docs/chunks/orch_oracle_footprint_index - Footprint cache and index tests
+def write_chunk(project_dir, name, goal="## Minor Goal\nTest", plan=None):
+    chunk_dir = project_dir / "docs" / "chunks" / name
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    (chunk_dir / "GOAL.md").write_text(goal)
+    if plan is not None:
+        (chunk_dir / "PLAN.md").write_text(plan)
+
+
+def completed_goal(*refs):
+    lines = "".join(
+        f"  - ref: {ref}\n    implements: x\n" for ref in refs
+    )
+    return f"---\nstatus: ACTIVE\ncode_references:\n{lines}---\n## Minor Goal\nDone\n"
+
+
+class TestChunkFootprints:
+    """Tests for the per-chunk footprint cache."""
+
+    def test_footprint_captures_analysis_inputs(self, oracle, project_dir):
+        """Footprints hold stage, locations, reference files and goal terms."""
+        write_chunk(
+            project_dir,
+            "chunk_a",
+            goal="## Minor Goal\nRefactor the dispatch_loop scheduling",
+            plan="Location: src/foo.py\nLocation: src/bar.py",
+        )
+        write_chunk(
+            project_dir, "chunk_b", goal=completed_goal("src/foo.py#Foo::run")
+        )
+
+        footprint_a = oracle.footprint("chunk_a")
+        footprint_b = oracle.footprint("chunk_b")
+
+        assert footprint_a.stage == AnalysisStage.PLAN
+        assert footprint_a.locations == {"src/foo.py", "src/bar.py"}
+        assert {"dispatch_loop", "scheduling"} <= footprint_a.goal_terms
+        assert footprint_b.stage == AnalysisStage.COMPLETED
+        assert footprint_b.reference_files == {(".", "src/foo.py")}
+
+    def test_unchanged_chunk_is_not_rebuilt(self, oracle, project_dir):
+        """A footprint whose files hash the same is reused."""
+        write_chunk(project_dir, "chunk_a", plan="Location: src/foo.py")
+        first = oracle.footprint("chunk_a")
+
+        with patch.object(oracle, "_build_footprint") as build:
+            assert oracle.footprint("chunk_a") is first
+            build.assert_not_called()
+
+    def test_edited_chunk_is_rebuilt_and_reindexed(self, oracle, project_dir):
+        """Editing PLAN.md changes the digest and the index entries."""
+        write_chunk(project_dir, "chunk_a", plan="Location: src/foo.py")
+        write_chunk(project_dir, "chunk_b", plan="Location: src/bar.py")
+        first = oracle.footprint("chunk_a")
+        assert oracle._index.related(oracle.footprint("chunk_b")) == set()
+
+        write_chunk(project_dir, "chunk_a", plan="Location: src/bar.py")
+        second = oracle.footprint("chunk_a")
+
+        assert second.digest != first.digest
+        assert second.locations == {"src/bar.py"}
+        assert oracle._index.related(oracle.footprint("chunk_b")) == {"chunk_a"}
+
+
+class TestBatchedConflictAnalysis:
+    """Tests for analyze_conflicts and the verdict cache."""
+
+    def test_overlap_checked_only_for_shared_files(self, oracle, project_dir):
+        """Only chunks sharing a location or referenced file get overlap checks."""
+        write_chunk(project_dir, "chunk_a", goal=completed_goal("src/foo.py#Foo"))
+        write_chunk(project_dir, "chunk_b", goal=completed_goal("src/foo.py#Foo::run"))
+        write_chunk(project_dir, "chunk_c", goal=completed_goal("src/bar.py#Bar"))
+
+        with patch.object(
+            oracle, "_analyze_footprints", wraps=oracle._analyze_footprints
+        ) as analyze:
+            oracle.analyze_conflicts("chunk_a", ["chunk_b", "chunk_c"])
+
+        assert {
+            c.args[1].chunk: c.kwargs["may_overlap"] for c in analyze.call_args_list
+        } == {"chunk_b": True, "chunk_c": False}
+
+    def test_batch_matches_pairwise_verdicts(self, oracle, project_dir, store):
+        """Batched analysis gives the same verdicts as a fresh pairwise oracle."""
+        write_chunk(project_dir, "chunk_a", goal=completed_goal("src/foo.py#Foo"))
+        write_chunk(project_dir, "chunk_b", goal=completed_goal("src/foo.py#Foo::run"))
+        write_chunk(project_dir, "chunk_c", goal=completed_goal("src/bar.py#Bar"))
+        write_chunk(project_dir, "chunk_d", plan="Location: src/foo.py")
+
+        analyses = oracle.analyze_conflicts("chunk_a", ["chunk_b", "chunk_c", "chunk_d"])
+
+        fresh = create_oracle(project_dir, store)
+        for other, analysis in analyses.items():
+            expected = fresh.analyze_conflict("chunk_a", other)
+            assert analysis.verdict == expected.verdict
+            assert analysis.analysis_stage == expected.analysis_stage
+        assert analyses["chunk_b"].verdict == ConflictVerdict.SERIALIZE
+        assert analyses["chunk_c"].verdict == ConflictVerdict.INDEPENDENT
+
+    def test_verdicts_recomputed_only_when_footprint_changes(
+        self, oracle, project_dir, store
+    ):
+        """Unchanged pairs reuse their verdict; edited chunks are re-analyzed."""
+        write_chunk(project_dir, "chunk_a", plan="Location: src/foo.py")
+        write_chunk(project_dir, "chunk_b", plan="Location: src/bar.py")
+        write_chunk(project_dir, "chunk_c", plan="Location: src/baz.py")
+        oracle.analyze_conflicts("chunk_a", ["chunk_b", "chunk_c"])
+
+        write_chunk(project_dir, "chunk_b", plan="Location: src/foo.py")
+        with patch.object(
+            oracle, "_analyze_footprints", wraps=oracle._analyze_footprints
+        ) as analyze, patch.object(
+            store, "save_conflict_analysis", wraps=store.save_conflict_analysis
+        ) as save:
+            analyses = oracle.analyze_conflicts("chunk_a", ["chunk_b", "chunk_c"])
+
+        assert [c.args[1].chunk for c in analyze.call_args_list] == ["chunk_b"]
+        assert analyses["chunk_b"].verdict == ConflictVerdict.ASK_OPERATOR
+        # Only the recomputed analysis is written again
+        assert [c.args[0].chunk_b for c in save.call_args_list] == ["chunk_b"]
+
+    def test_forget_recomputes_and_persists(self, oracle, project_dir, store):
+        """After forget, cleared analyses are recomputed and saved again."""
+        write_chunk(project_dir, "chunk_a", plan="Location: src/foo.py")
+        write_chunk(project_dir, "chunk_b", plan="Location: src/bar.py")
+        oracle.analyze_conflicts("chunk_a", ["chunk_b"])
+        store.clear_conflicts_for_chunk("chunk_a")
+
+        oracle.analyze_conflicts("chunk_a", ["chunk_b"])
+        assert store.get_conflict_analysis("chunk_a", "chunk_b") is None
+
+        oracle.forget("chunk_a")
+        oracle.analyze_conflicts("chunk_a", ["chunk_b"])
+        assert store.get_conflict_analysis("chunk_a", "chunk_b") is not None
@@ -0,0 +1,207 @@
+"""Tests for the buffered, rotating phase log writer and its offset index."""
+# Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
+# Chunk: docs/chunks/orch_phase_log_writer - Buffered rotating phase log writer
+
+import asyncio
+import gzip
+import json
+import time
+
+import pytest
+
+from orchestrator.phase_log import (
+    INDEX_ENTRY_SIZE,
+    INDEX_HEADER_SIZE,
+    PhaseLogWriter,
+    index_path,
+    iter_records,
+    log_end,
+    read_index,
+    read_page,
+    read_records,
+    rotated_segments,
+)
+
+
+def make_line(i: int, size: int = 0) -> str:
+    record = {"timestamp": f"2026-01-01T00:00:{i % 60:02d}+00:00", "type": "text", "text": "x" * size}
+    return json.dumps(record) + "\n"
+
+
+def wait_for_compression(log_dir, phase):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if all(path.suffix == ".gz" for _, path in rotated_segments(log_dir, phase)):
+            return
+        time.sleep(0.01)
+    raise AssertionError("rotated segments were not compressed")
+
+
+class TestBuffering:
+    def test_writes_without_loop_reach_disk_immediately(self, tmp_path):
+        writer = PhaseLogWriter(tmp_path, "plan")
+        writer.write(make_line(0), 0.0)
+
+        assert (tmp_path / "plan.txt").read_text() == make_line(0)
+        writer.close()
+
+    @pytest.mark.asyncio
+    async def test_writes_on_loop_are_flushed_by_timer(self, tmp_path):
+        writer = PhaseLogWriter(tmp_path, "plan", flush_interval=0.05)
+        writer.write(make_line(0), 0.0)
+        writer.write(make_line(1), 1.0)
+
+        assert (tmp_path / "plan.txt").read_bytes() == b""
+        await asyncio.sleep(0.2)
+        assert (tmp_path / "plan.txt").read_text() == make_line(0) + make_line(1)
+        writer.close()
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_flushes_without_waiting(self, tmp_path):
+        line = make_line(0, size=100)
+        writer = PhaseLogWriter(tmp_path, "plan", buffer_bytes=2 * len(line), flush_interval=60)
+        writer.write(line, 0.0)
+        writer.write(line, 0.0)
+
+        assert (tmp_path / "plan.txt").read_text() == line * 2
+        writer.close()
+
+
+class TestIndex:
+    def test_entries_point_at_record_starts(self, tmp_path):
+        writer = PhaseLogWriter(tmp_path, "implement")
+        offsets = [writer.write(make_line(i), float(i))[0] for i in range(5)]
+        writer.close()
+
+        index = read_index(tmp_path, "implement")
+        content = (tmp_path / "implement.txt").read_bytes()
+        assert len(index) == 5
+        assert [index.offset(i) for i in range(5)] == offsets
+        assert [index.timestamp(i) for i in range(5)] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert all(content[offset:offset + 1] == b"{" for offset in offsets)
+
+    def test_legacy_log_is_indexed_on_open(self, tmp_path):
+        (tmp_path / "goal.txt").write_text(make_line(1) + make_line(2))
+
+        writer = PhaseLogWriter(tmp_path, "goal")
+        start, _ = writer.write(make_line(3), 3.0)
+        writer.close()
+
+        index = read_index(tmp_path, "goal")
+        assert len(index) == 3
+        assert index.offset(1) == len(make_line(1))
+        assert index.offset(2) == start
+        assert index.timestamp(0) == 1767225601.0
+
+    def test_entries_past_the_data_are_dropped(self, tmp_path):
+        writer = PhaseLogWriter(tmp_path, "goal")
+        for i in range(3):
+            writer.write(make_line(i), float(i))
+        writer.close()
+
+        # Lose the last record but keep its index entry, as after a crash
+        content = (tmp_path / "goal.txt").read_bytes()
+        (tmp_path / "goal.txt").write_bytes(content[: 2 * len(make_line(0))])
+
+        PhaseLogWriter(tmp_path, "goal").close()
+
+        assert len(read_index(tmp_path, "goal")) == 2
+        size = index_path(tmp_path, "goal").stat().st_size
+        assert size == INDEX_HEADER_SIZE + 2 * INDEX_ENTRY_SIZE
+
+
+class TestRotation:
+    def test_rotates_and_compresses_with_monotonic_offsets(self, tmp_path):
+        line = make_line(0, size=200)
+        writer = PhaseLogWriter(tmp_path, "implement", max_segment_bytes=3 * len(line))
+        spans = [writer.write(make_line(i, size=200), float(i)) for i in range(10)]
+        writer.close()
+        wait_for_compression(tmp_path, "implement")
+
+        segments = rotated_segments(tmp_path, "implement")
+        assert [base for base, _ in segments] == [0, 3 * len(line), 6 * len(line)]
+        assert all(path.suffix == ".gz" for _, path in segments)
+        with gzip.open(segments[0][1], "rt") as f:
+            assert f.read() == "".join(make_line(i, size=200) for i in range(3))
+
+        assert [start for start, _ in spans] == [i * len(line) for i in range(10)]
+        assert log_end(tmp_path, "implement") == spans[-1][1]
+        index = read_index(tmp_path, "implement")
+        assert [index.offset(i) for i in range(len(index))] == [s for s, _ in spans]
+
+    def test_read_records_spans_segments(self, tmp_path):
+        line = make_line(0, size=200)
+        writer = PhaseLogWriter(tmp_path, "review", max_segment_bytes=2 * len(line))
+        lines = [make_line(i, size=200) for i in range(5)]
+        for i, text in enumerate(lines):
+            writer.write(text, float(i))
+        writer.close()
+        wait_for_compression(tmp_path, "review")
+
+        records, position = read_records(tmp_path, "review")
+        assert [text for _, text in records] == lines
+        assert position == 5 * len(line)
+
+        records, _ = read_records(tmp_path, "review", 3 * len(line))
+        assert [text for _, text in records] == lines[3:]
+
+    def test_reopen_after_rotation_continues_offsets(self, tmp_path):
+        line = make_line(0, size=200)
+        writer = PhaseLogWriter(tmp_path, "plan", max_segment_bytes=2 * len(line))
+        for i in range(3):
+            writer.write(line, float(i))
+        writer.close()
+
+        writer = PhaseLogWriter(tmp_path, "plan", max_segment_bytes=2 * len(line))
+        start, _ = writer.write(line, 3.0)
+        writer.close()
+
+        assert start == 3 * len(line)
+        assert len(read_index(tmp_path, "plan")) == 4
+
+
+# Chunk: docs/chunks/orch_paged_log_view - Index-backed range reads
+class TestReadPage:
+    @pytest.fixture
+    def log_dir(self, tmp_path):
+        line = make_line(0, size=100)
+        writer = PhaseLogWriter(tmp_path, "implement", max_segment_bytes=4 * len(line))
+        for i in range(10):
+            writer.write(make_line(i, size=100), 100.0 + i)
+        writer.close()
+        return tmp_path
+
+    def test_last_entries_span_segments(self, log_dir):
+        page = read_page(log_dir, "implement", last=6)
+
+        assert page.total == 10
+        assert page.first == 4
+        assert [line for _, line in page.records] == [make_line(i, size=100) for i in range(4, 10)]
+        assert page.end == log_end(log_dir, "implement")
+
+    def test_entry_range(self, log_dir):
+        page = read_page(log_dir, "implement", start=3, count=2)
+
+        assert page.first == 3
+        assert [line for _, line in page.records] == [make_line(3, size=100), make_line(4, size=100)]
+
+    def test_time_window(self, log_dir):
+        page = read_page(log_dir, "implement", since=102.0, until=104.5)
+
+        assert page.first == 2
+        assert len(page.records) == 3
+
+    def test_unindexed_records_are_scanned(self, tmp_path):
+        (tmp_path / "goal.txt").write_text("".join(make_line(i) for i in range(5)))
+
+        page = read_page(tmp_path, "goal", last=2)
+
+        assert page.total == 5
+        assert page.first == 3
+        assert [line for _, line in page.records] == [make_line(3), make_line(4)]
+
+    def test_iter_records_matches_read_records(self, log_dir):
+        records, _ = read_records(log_dir, "implement")
+
+        assert list(iter_records(log_dir, "implement")) == records
+        assert list(iter_records(log_dir, "implement", records[2][0], records[5][0])) == records[2:5]
@@ -467,6 +467,31 @@ class TestUnaddressedFeedbackReroute:
         assert "REVIEW_FEEDBACK.md" in updated.reentry_context
         assert "not deleted" in updated.reentry_context
 
+    # Chunk: docs/chunks/orch_phase_log_writer - No phase log for a phase that never ran
+    @pytest.mark.asyncio
+    async def test_reroute_opens_no_phase_log(
+        self, scheduler, state_store, mock_worktree_manager, tmp_path
+    ):
+        """Rerouting before the agent runs leaves no REVIEW log behind."""
+        now = datetime.now(timezone.utc)
+        work_unit = WorkUnit(
+            chunk="test_chunk",
+            phase=WorkUnitPhase.REVIEW,
+            status=WorkUnitStatus.READY,
+            created_at=now,
+            updated_at=now,
+        )
+        state_store.create_work_unit(work_unit)
+        log_dir = tmp_path / "logs"
+        mock_worktree_manager.get_log_path.return_value = log_dir
+
+        with patch("orchestrator.scheduler.validate_feedback_addressed", return_value=False), \
+             patch("orchestrator.scheduler.activate_chunk_in_worktree"), \
+             patch("orchestrator.scheduler.broadcast_work_unit_update", new_callable=AsyncMock):
+            await scheduler._run_work_unit(work_unit)
+
+        assert not log_dir.exists() or list(log_dir.iterdir()) == []
+
     @pytest.mark.asyncio
     async def test_reentry_context_consumed_on_next_dispatch(
         self, scheduler, state_store, mock_worktree_manager, mock_agent_runner
@@ -527,7 +552,7 @@ class TestApproveResetsIterations:
 
         callbacks = MagicMock(spec=ReviewRoutingCallbacks)
         callbacks.advance_phase = AsyncMock()
-        callbacks.update_work_unit = MagicMock()
+        callbacks.update_work_unit = AsyncMock()
 
         config = ReviewRoutingConfig(max_iterations=3)
 
@@ -578,7 +603,7 @@ class TestFullCycleIntegration:
         callbacks = MagicMock(spec=ReviewRoutingCallbacks)
         callbacks.advance_phase = AsyncMock()
         callbacks.mark_needs_attention = AsyncMock()
-        callbacks.update_work_unit = MagicMock()
+        callbacks.update_work_unit = AsyncMock()
         callbacks.broadcast_work_unit_update = AsyncMock()
 
         config = ReviewRoutingConfig(max_iterations=3)
@@ -50,7 +50,7 @@ class MockReviewRoutingCallbacks:
     async def mark_needs_attention(self, work_unit: WorkUnit, reason: str) -> None:
         self.mark_needs_attention_calls.append((work_unit, reason))
 
-    def update_work_unit(self, work_unit: WorkUnit) -> None:
+    async def update_work_unit(self, work_unit: WorkUnit) -> None:
         self.update_work_unit_calls.append(work_unit)
 
     async def broadcast_work_unit_update(
@@ -14,7 +14,7 @@ Fixtures used in this file come from conftest.py:
 
 import asyncio
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -146,6 +146,39 @@ class TestSchedulerDispatch:
         assert "high_chunk" in scheduler._running_agents
         assert "low_chunk" not in scheduler._running_agents
 
+    # Chunk: docs/chunks/orch_dispatch_candidates - Backed-off units don't starve free slots
+    @pytest.mark.asyncio
+    async def test_backed_off_units_do_not_starve_slots(self, scheduler, state_store):
+        """Slots go to dispatchable units even when backed-off ones rank higher."""
+        now = datetime.now(timezone.utc)
+        later = now + timedelta(minutes=5)
+        for i in range(2):
+            state_store.create_work_unit(
+                WorkUnit(
+                    chunk=f"backoff_{i}",
+                    phase=WorkUnitPhase.PLAN,
+                    status=WorkUnitStatus.READY,
+                    priority=10,
+                    next_retry_at=later,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        state_store.create_work_unit(
+            WorkUnit(
+                chunk="ready_chunk",
+                phase=WorkUnitPhase.PLAN,
+                status=WorkUnitStatus.READY,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+        await scheduler._dispatch_tick()
+
+        assert list(scheduler._running_agents) == ["ready_chunk"]
+        assert scheduler._retry_deadlines == [later]
+
 
 class TestPhaseAdvancement:
     """Tests for phase advancement logic."""
@@ -278,7 +311,7 @@ class TestCreateScheduler:
         scheduler = create_scheduler(state_store, tmp_path, base_branch="main")
 
         assert scheduler.config.max_agents == 4
-        assert scheduler.config.dispatch_interval_seconds == 1.0
+        assert scheduler.config.dispatch_interval_seconds == 10.0
 
     def test_create_scheduler_custom_config(self, state_store, tmp_path):
         """Creates scheduler with custom config."""
@@ -306,6 +339,118 @@ class TestSchedulerLifecycle:
         await stop_task
 
 
+# Chunk: docs/chunks/orch_event_dispatch - Wakeup signal and retry deadline tests
+class TestEventDrivenDispatch:
+    """Tests for dispatch on state changes instead of fixed polling."""
+
+    @staticmethod
+    def _make_unit(chunk, next_retry_at=None):
+        now = datetime.now(timezone.utc)
+        return WorkUnit(
+            chunk=chunk,
+            phase=WorkUnitPhase.PLAN,
+            status=WorkUnitStatus.READY,
+            next_retry_at=next_retry_at,
+            created_at=now,
+            updated_at=now,
+        )
+
+    async def _run_loop(self, scheduler):
+        """Start the loop with crash recovery stubbed and a counting tick."""
+        ticks = []
+
+        async def tick():
+            ticks.append(datetime.now(timezone.utc))
+
+        scheduler._recover_from_crash = AsyncMock()
+        scheduler._dispatch_tick = tick
+        task = asyncio.create_task(scheduler.start())
+        while not ticks:
+            await asyncio.sleep(0.01)
+        return task, ticks
+
+    @staticmethod
+    async def _wait_for_ticks(ticks, count):
+        while len(ticks) < count:
+            await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_store_write_wakes_scheduler(self, scheduler):
+        """A write through the async store sets the wakeup signal."""
+        assert not scheduler._wakeup.is_set()
+
+        await scheduler.async_store.create_work_unit(self._make_unit("alpha"))
+
+        assert scheduler._wakeup.is_set()
+
+    @pytest.mark.asyncio
+    async def test_write_dispatches_before_fallback_tick(self, scheduler):
+        """A state change triggers a tick long before the fallback interval."""
+        scheduler.config.dispatch_interval_seconds = 60
+        task, ticks = await self._run_loop(scheduler)
+
+        await scheduler.async_store.create_work_unit(self._make_unit("alpha"))
+        await asyncio.wait_for(self._wait_for_ticks(ticks, 2), timeout=2)
+
+        await scheduler.stop(timeout=0.1)
+        await asyncio.wait_for(task, timeout=2)
+
+    @pytest.mark.asyncio
+    async def test_stop_interrupts_wait(self, scheduler):
+        """stop() ends the loop without waiting for the fallback tick."""
+        scheduler.config.dispatch_interval_seconds = 60
+        task, _ticks = await self._run_loop(scheduler)
+
+        await scheduler.stop(timeout=0.1)
+        await asyncio.wait_for(task, timeout=2)
+
+    @pytest.mark.asyncio
+    async def test_retry_deadline_wakes_loop(self, scheduler):
+        """A unit in retry backoff is ticked for when its backoff expires."""
+        scheduler.config.dispatch_interval_seconds = 60
+        task, ticks = await self._run_loop(scheduler)
+
+        retry_at = datetime.now(timezone.utc) + timedelta(milliseconds=200)
+        await scheduler.async_store.create_work_unit(
+            self._make_unit("alpha", next_retry_at=retry_at)
+        )
+        await asyncio.wait_for(self._wait_for_ticks(ticks, 3), timeout=2)
+
+        assert ticks[2] >= retry_at
+        assert scheduler._retry_deadlines == []
+
+        await scheduler.stop(timeout=0.1)
+        await asyncio.wait_for(task, timeout=2)
+
+    def test_next_wakeup_timeout(self, scheduler):
+        """Timeout is the earliest deadline, capped by the fallback interval."""
+        scheduler.config.dispatch_interval_seconds = 5
+        assert scheduler._next_wakeup_timeout() == 5
+
+        now = datetime.now(timezone.utc)
+        scheduler._schedule_retry_deadline(now + timedelta(seconds=2))
+        scheduler._schedule_retry_deadline(now + timedelta(seconds=2))
+        scheduler._schedule_retry_deadline(now + timedelta(seconds=30))
+        assert len(scheduler._retry_deadlines) == 2
+        assert 1 < scheduler._next_wakeup_timeout() <= 2
+
+        scheduler._schedule_retry_deadline(now - timedelta(seconds=1))
+        assert scheduler._next_wakeup_timeout() == 0.0
+        scheduler._pop_due_retry_deadlines()
+        assert len(scheduler._retry_deadlines) == 2
+
+    @pytest.mark.asyncio
+    async def test_dispatch_tick_schedules_backoff_deadline(self, scheduler, state_store):
+        """Units already in backoff at start-up get a retry timer."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        state_store.create_work_unit(self._make_unit("alpha", next_retry_at=retry_at))
+
+        await scheduler._dispatch_tick()
+
+        assert scheduler._retry_deadlines == [retry_at]
+        assert "alpha" not in scheduler._running_agents
+
+
 # Chunk: docs/chunks/dispatch_toctou_guard - TOCTOU guard tests for status verification
 class TestTOCTOUGuard:
     """Tests for the TOCTOU guard in _run_work_unit().
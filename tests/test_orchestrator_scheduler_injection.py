@@ -3,12 +3,15 @@
 # Chunk: docs/chunks/explicit_deps_skip_oracle - Oracle bypass for explicit dependencies
 """Tests for pending answer injection and conflict checking in orchestrator scheduler."""
 
+import threading
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from orchestrator.models import (
+    ConflictAnalysis,
+    ConflictVerdict,
     WorkUnit,
     WorkUnitPhase,
     WorkUnitStatus,
@@ -426,6 +429,17 @@ class TestConflictChecking:
         updated = state_store.get_work_unit("chunk_a")
         assert updated.conflict_verdicts == {}
 
+    @pytest.mark.asyncio
+    async def test_reanalyze_conflicts_forgets_oracle_verdicts(
+        self, scheduler, state_store
+    ):
+        """_reanalyze_conflicts drops the oracle's cached verdicts for the chunk."""
+        scheduler._oracle = MagicMock()
+
+        await scheduler._reanalyze_conflicts("chunk_a")
+
+        scheduler._oracle.forget.assert_called_once_with("chunk_a")
+
 
 # Chunk: docs/chunks/explicit_deps_skip_oracle - Oracle bypass for explicit dependencies
 class TestExplicitDepsOracleBypass:
@@ -639,21 +653,72 @@ class TestExplicitDepsOracleBypass:
         # Mock the oracle
         mock_analysis = MagicMock()
         mock_analysis.verdict.value = "INDEPENDENT"
+        mock_analysis.analysis_stage = "GOAL"
 
         with patch("orchestrator.oracle.create_oracle") as mock_create_oracle:
             mock_oracle = MagicMock()
-            mock_oracle.analyze_conflict.return_value = mock_analysis
+            mock_oracle.evaluate_conflicts.return_value = (
+                {"other_chunk": mock_analysis},
+                [],
+            )
             mock_create_oracle.return_value = mock_oracle
 
             blocking = await scheduler._check_conflicts(work_unit)
 
             # Oracle SHOULD be created and called for non-explicit work units
             mock_create_oracle.assert_called_once()
-            mock_oracle.analyze_conflict.assert_called_once_with("normal_chunk", "other_chunk")
+            mock_oracle.evaluate_conflicts.assert_called_once_with(
+                "normal_chunk", ["other_chunk"]
+            )
 
         # Independent verdict means no blocking
         assert blocking == []
 
+    @pytest.mark.asyncio
+    async def test_oracle_runs_off_the_writer_thread(self, scheduler, state_store):
+        """Analysis runs on the oracle thread; recomputed analyses are saved."""
+        now = datetime.now(timezone.utc)
+        for chunk, status in (
+            ("normal_chunk", WorkUnitStatus.READY),
+            ("other_chunk", WorkUnitStatus.RUNNING),
+        ):
+            state_store.create_work_unit(
+                WorkUnit(
+                    chunk=chunk,
+                    phase=WorkUnitPhase.PLAN,
+                    status=status,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        work_unit = state_store.get_work_unit("normal_chunk")
+        analysis = ConflictAnalysis(
+            chunk_a="normal_chunk",
+            chunk_b="other_chunk",
+            verdict=ConflictVerdict.INDEPENDENT,
+            confidence=0.9,
+            reason="No overlap",
+            analysis_stage="PLAN",
+            created_at=now,
+        )
+        threads = []
+
+        def evaluate(chunk, others):
+            threads.append(threading.current_thread().name)
+            return {"other_chunk": analysis}, [analysis]
+
+        with patch("orchestrator.oracle.create_oracle") as mock_create_oracle:
+            mock_create_oracle.return_value.evaluate_conflicts.side_effect = evaluate
+            await scheduler._check_conflicts(work_unit)
+
+        assert len(threads) == 1
+        assert threads[0].startswith("conflict-oracle")
+        saved = state_store.get_conflict_analysis("normal_chunk", "other_chunk")
+        assert saved.verdict == ConflictVerdict.INDEPENDENT
+        assert state_store.get_work_unit("normal_chunk").conflict_verdicts == {
+            "other_chunk": "INDEPENDENT"
+        }
+
     @pytest.mark.asyncio
     async def test_explicit_deps_ignores_other_active_chunks(self, scheduler, state_store):
         """Explicit-dep work units ignore chunks not in blocked_by even if RUNNING."""
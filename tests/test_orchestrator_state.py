@@ -1155,6 +1155,216 @@ class TestReadyQueueCriticalPath:
         assert ready_chunks[1] == "chunk_med", f"Expected chunk_med second, got {ready_chunks}"
 
 
+# Chunk: docs/chunks/orch_dispatch_candidates - Materialized blocks_count tests
+class TestBlocksCountMaintenance:
+    """The blocks_count column stays equal to the json_each() count it replaces."""
+
+    @staticmethod
+    def _unit(chunk, status=WorkUnitStatus.READY, blocked_by=None):
+        now = datetime.now(timezone.utc)
+        return WorkUnit(
+            chunk=chunk,
+            phase=WorkUnitPhase.IMPLEMENT,
+            status=status,
+            blocked_by=blocked_by or [],
+            created_at=now,
+            updated_at=now,
+        )
+
+    @staticmethod
+    def _counts(store):
+        rows = store.connection.execute(
+            "SELECT chunk, blocks_count FROM work_units"
+        ).fetchall()
+        return {row["chunk"]: row["blocks_count"] for row in rows}
+
+    @staticmethod
+    def _recomputed(store):
+        rows = store.connection.execute(
+            """
+            SELECT w.chunk, (
+                SELECT COUNT(*) FROM work_units b
+                WHERE b.status IN ('BLOCKED', 'READY')
+                AND EXISTS (SELECT 1 FROM json_each(b.blocked_by) WHERE value = w.chunk)
+            ) AS expected
+            FROM work_units w
+            """
+        ).fetchall()
+        return {row["chunk"]: row["expected"] for row in rows}
+
+    def test_insert_counts_existing_and_new_references(self, store):
+        """Counts are right whether the blocker or the dependent is created first."""
+        store.create_work_unit(self._unit("a"))
+        store.create_work_unit(self._unit("dep", WorkUnitStatus.BLOCKED, ["a", "b"]))
+        store.create_work_unit(self._unit("b"))
+
+        assert self._counts(store) == {"a": 1, "b": 1, "dep": 0}
+
+    def test_status_and_blocked_by_changes(self, store):
+        """Leaving BLOCKED/READY or editing blocked_by adjusts the counts."""
+        store.create_work_unit(self._unit("a"))
+        store.create_work_unit(self._unit("b"))
+        dep = store.create_work_unit(self._unit("dep", WorkUnitStatus.BLOCKED, ["a"]))
+
+        dep.blocked_by = ["b"]
+        store.update_work_unit(dep)
+        assert self._counts(store) == {"a": 0, "b": 1, "dep": 0}
+
+        dep.status = WorkUnitStatus.RUNNING
+        store.update_work_unit(dep)
+        assert self._counts(store)["b"] == 0
+
+        dep.status = WorkUnitStatus.READY
+        store.update_work_unit(dep)
+        assert self._counts(store) == self._recomputed(store)
+
+    def test_delete_and_rename(self, store):
+        """Deleting a dependent and renaming a blocker keep counts consistent."""
+        store.create_work_unit(self._unit("a"))
+        store.create_work_unit(self._unit("dep1", WorkUnitStatus.BLOCKED, ["a"]))
+        store.create_work_unit(self._unit("dep2", WorkUnitStatus.READY, ["a"]))
+
+        store.delete_work_unit("dep1")
+        assert self._counts(store)["a"] == 1
+
+        store.rename_work_unit("a", "a2")
+        store.update_blocked_by_references("a", "a2")
+        assert self._counts(store) == {"a2": 1, "dep2": 0}
+        assert self._counts(store) == self._recomputed(store)
+
+    def test_migration_backfills_existing_rows(self, db_path):
+        """Upgrading a v16 database computes blocks_count for existing rows."""
+        store = StateStore(db_path)
+        for version in range(1, 17):
+            getattr(store, f"_migrate_v{version}")()
+        store.connection.execute(
+            """
+            INSERT INTO work_units (chunk, phase, status, blocked_by, created_at, updated_at)
+            VALUES ('a', 'IMPLEMENT', 'READY', '[]', '2026-01-01T00:00:00+00:00',
+                    '2026-01-01T00:00:00+00:00'),
+                   ('dep', 'IMPLEMENT', 'BLOCKED', '["a"]', '2026-01-01T00:00:00+00:00',
+                    '2026-01-01T00:00:00+00:00')
+            """
+        )
+
+        store._migrate_v17()
+
+        assert self._counts(store) == {"a": 1, "dep": 0}
+        store.close()
+
+
+# Chunk: docs/chunks/orch_dispatch_candidates - Dispatch candidate query tests
+class TestDispatchCandidates:
+    """get_dispatch_candidates filters before LIMIT so skipped units can't starve slots."""
+
+    @staticmethod
+    def _unit(chunk, priority=0, status=WorkUnitStatus.READY, **fields):
+        now = datetime.now(timezone.utc)
+        return WorkUnit(
+            chunk=chunk,
+            phase=WorkUnitPhase.IMPLEMENT,
+            status=status,
+            priority=priority,
+            created_at=now,
+            updated_at=now,
+            **fields,
+        )
+
+    def test_backed_off_units_do_not_fill_the_limit(self, store):
+        """High-priority units in retry backoff are skipped before LIMIT."""
+        later = datetime.now(timezone.utc) + timedelta(minutes=5)
+        store.create_work_unit(self._unit("backoff_1", priority=10, next_retry_at=later))
+        store.create_work_unit(self._unit("backoff_2", priority=10, next_retry_at=later))
+        store.create_work_unit(self._unit("ready", priority=0))
+
+        assert [u.chunk for u in store.get_ready_queue(limit=2)] == ["backoff_1", "backoff_2"]
+        assert [u.chunk for u in store.get_dispatch_candidates(limit=2)] == ["ready"]
+
+    def test_elapsed_backoff_is_included(self, store):
+        """A unit whose next_retry_at has passed is a candidate."""
+        earlier = datetime.now(timezone.utc) - timedelta(seconds=1)
+        store.create_work_unit(self._unit("due", next_retry_at=earlier))
+
+        assert [u.chunk for u in store.get_dispatch_candidates(limit=5)] == ["due"]
+
+    def test_known_blocked_units_are_excluded(self, store):
+        """Units blocked by a RUNNING chunk they must serialize with are excluded."""
+        store.create_work_unit(self._unit("runner", status=WorkUnitStatus.RUNNING))
+        store.create_work_unit(
+            self._unit("explicit", blocked_by=["runner"], explicit_deps=True)
+        )
+        store.create_work_unit(
+            self._unit(
+                "serialized",
+                blocked_by=["runner"],
+                conflict_verdicts={"runner": "SERIALIZE"},
+            )
+        )
+        store.create_work_unit(
+            self._unit(
+                "overridden",
+                blocked_by=["runner"],
+                conflict_verdicts={"runner": "ASK_OPERATOR"},
+                conflict_override="SERIALIZE",
+            )
+        )
+        # Parallelized by the operator: stays a candidate
+        store.create_work_unit(
+            self._unit(
+                "independent",
+                blocked_by=["runner"],
+                conflict_verdicts={"runner": "INDEPENDENT"},
+            )
+        )
+        # Not yet analysed: the scheduler's conflict check decides
+        store.create_work_unit(self._unit("unknown"))
+
+        chunks = {u.chunk for u in store.get_dispatch_candidates(limit=10)}
+        assert chunks == {"independent", "unknown"}
+
+    def test_blocker_no_longer_running(self, store):
+        """Once the blocker stops running, the unit is a candidate again."""
+        runner = store.create_work_unit(self._unit("runner", status=WorkUnitStatus.RUNNING))
+        store.create_work_unit(
+            self._unit("explicit", blocked_by=["runner"], explicit_deps=True)
+        )
+        assert store.get_dispatch_candidates(limit=10) == []
+
+        runner.status = WorkUnitStatus.DONE
+        store.update_work_unit(runner)
+
+        assert [u.chunk for u in store.get_dispatch_candidates(limit=10)] == ["explicit"]
+
+    def test_iterates_lazily_in_batches(self, store):
+        """iter_dispatch_candidates yields every candidate once, in order."""
+        now = datetime.now(timezone.utc)
+        for i in range(5):
+            store.create_work_unit(
+                WorkUnit(
+                    chunk=f"chunk_{i}",
+                    phase=WorkUnitPhase.IMPLEMENT,
+                    status=WorkUnitStatus.READY,
+                    created_at=now + timedelta(seconds=i),
+                    updated_at=now + timedelta(seconds=i),
+                )
+            )
+
+        chunks = [u.chunk for u in store.iter_dispatch_candidates(batch_size=2)]
+
+        assert chunks == [f"chunk_{i}" for i in range(5)]
+
+    def test_get_next_retry_at(self, store):
+        """Returns the earliest future backoff among READY units."""
+        now = datetime.now(timezone.utc)
+        assert store.get_next_retry_at() is None
+
+        store.create_work_unit(self._unit("past", next_retry_at=now - timedelta(seconds=5)))
+        store.create_work_unit(self._unit("soon", next_retry_at=now + timedelta(seconds=5)))
+        store.create_work_unit(self._unit("later", next_retry_at=now + timedelta(seconds=50)))
+
+        assert store.get_next_retry_at(now=now) == now + timedelta(seconds=5)
+
+
 # Chunk: docs/chunks/optimistic_locking - Optimistic locking for stale write detection
 class TestOptimisticLocking:
     """Tests for optimistic locking in work unit updates."""
@@ -1322,3 +1532,246 @@ class TestSchedulerApiRace:
         final = store.get_work_unit("sequential_test")
         assert final.phase == WorkUnitPhase.IMPLEMENT
         assert final.status == WorkUnitStatus.RUNNING
+
+
+# Chunk: docs/chunks/orch_conflict_verdict_table - Normalized conflict verdict storage tests
+class TestConflictVerdictTable:
+    """Conflict verdicts live in their own table, one row per (holder, other) pair."""
+
+    @staticmethod
+    def _unit(chunk, **fields):
+        now = datetime.now(timezone.utc)
+        return WorkUnit(
+            chunk=chunk,
+            phase=WorkUnitPhase.IMPLEMENT,
+            status=WorkUnitStatus.READY,
+            created_at=now,
+            updated_at=now,
+            **fields,
+        )
+
+    @staticmethod
+    def _rows(store):
+        rows = store.connection.execute(
+            "SELECT chunk_a, chunk_b, verdict, stage FROM conflict_verdicts ORDER BY chunk_a, chunk_b"
+        ).fetchall()
+        return [tuple(row) for row in rows]
+
+    def test_verdicts_round_trip_through_update(self, store):
+        """Added, changed and removed verdicts are reflected row by row."""
+        unit = store.create_work_unit(
+            self._unit("a", conflict_verdicts={"b": "SERIALIZE", "c": "INDEPENDENT"})
+        )
+        unit.conflict_verdicts = {"b": "INDEPENDENT", "d": "ASK_OPERATOR"}
+        store.update_work_unit(unit)
+
+        assert store.get_work_unit("a").conflict_verdicts == {
+            "b": "INDEPENDENT",
+            "d": "ASK_OPERATOR",
+        }
+        assert [u.conflict_verdicts for u in store.list_work_units()] == [
+            {"b": "INDEPENDENT", "d": "ASK_OPERATOR"}
+        ]
+        row = store.connection.execute("SELECT conflict_verdicts FROM work_units").fetchone()
+        assert row[0] is None
+
+    def test_update_sets_only_changed_columns(self, store):
+        """An update writes the columns that moved and leaves verdicts alone."""
+        unit = store.create_work_unit(self._unit("a", conflict_verdicts={"b": "SERIALIZE"}))
+        statements = []
+        store.connection.set_trace_callback(statements.append)
+
+        unit.priority = 5
+        unit.updated_at = datetime.now(timezone.utc)
+        store.update_work_unit(unit)
+        store.connection.set_trace_callback(None)
+
+        updates = [s for s in statements if s.lstrip().startswith(("UPDATE", "INSERT", "DELETE"))]
+        assert len(updates) == 1
+        assert "SET priority = 5, updated_at = " in updates[0]
+        assert store.get_work_unit("a").priority == 5
+
+    def test_save_conflict_verdicts_batches_and_skips_missing_units(self, store):
+        """Batched saves upsert rows without touching the work_units rows."""
+        a = store.create_work_unit(self._unit("a"))
+        store.create_work_unit(self._unit("b"))
+
+        recorded = store.save_conflict_verdicts(
+            [
+                ("a", "b", "SERIALIZE", "GOAL"),
+                ("b", "a", "SERIALIZE", "GOAL"),
+                ("gone", "a", "SERIALIZE", "GOAL"),
+            ]
+        )
+        store.save_conflict_verdicts([("a", "b", "INDEPENDENT", "PLAN")])
+
+        assert recorded == 2
+        assert self._rows(store) == [
+            ("a", "b", "INDEPENDENT", "PLAN"),
+            ("b", "a", "SERIALIZE", "GOAL"),
+        ]
+        assert store.get_work_unit("a").updated_at == a.updated_at
+
+    def test_update_keeps_verdicts_saved_since_load(self, store):
+        """Verdicts batch-saved after a unit was loaded survive its next update."""
+        store.create_work_unit(self._unit("r", conflict_verdicts={"y": "INDEPENDENT"}))
+        store.create_work_unit(self._unit("x"))
+        r = store.get_work_unit("r")
+
+        store.save_conflict_verdicts(
+            [("r", "x", "SERIALIZE", "PLAN"), ("x", "r", "SERIALIZE", "PLAN")]
+        )
+        r.status = WorkUnitStatus.RUNNING
+        r.updated_at = datetime.now(timezone.utc)
+        store.update_work_unit(r)
+
+        assert store.get_work_unit("r").conflict_verdicts == {
+            "x": "SERIALIZE",
+            "y": "INDEPENDENT",
+        }
+        assert store.get_work_unit("x").conflict_verdicts == {"r": "SERIALIZE"}
+
+        # Verdicts the caller did remove are still deleted
+        r.conflict_verdicts = {}
+        store.update_work_unit(r)
+        assert store.get_work_unit("r").conflict_verdicts == {"x": "SERIALIZE"}
+
+    def test_rows_follow_rename_and_delete(self, store):
+        """Renaming re-keys a unit's verdicts; deleting it drops them."""
+        store.create_work_unit(self._unit("a", conflict_verdicts={"b": "SERIALIZE"}))
+        store.create_work_unit(self._unit("b", conflict_verdicts={"a": "SERIALIZE"}))
+
+        store.rename_work_unit("a", "a2")
+        assert store.update_conflict_verdicts_references("a", "a2") == 1
+        assert self._rows(store) == [
+            ("a2", "b", "SERIALIZE", None),
+            ("b", "a2", "SERIALIZE", None),
+        ]
+
+        store.delete_work_unit("a2")
+        assert self._rows(store) == [("b", "a2", "SERIALIZE", None)]
+
+    def test_migration_moves_json_verdicts(self, db_path):
+        """Upgrading a v17 database copies the JSON verdicts into rows."""
+        store = StateStore(db_path)
+        for version in range(1, 18):
+            getattr(store, f"_migrate_v{version}")()
+        store.connection.execute(
+            """
+            INSERT INTO work_units
+                (chunk, phase, status, blocked_by, conflict_verdicts, created_at, updated_at)
+            VALUES ('a', 'IMPLEMENT', 'READY', '[]', '{"b": "SERIALIZE", "c": "INDEPENDENT"}',
+                    '2026-01-01T00:00:00+00:00', '2026-01-01T00:00:00+00:00')
+            """
+        )
+
+        store._migrate_v18()
+
+        assert self._rows(store) == [
+            ("a", "b", "SERIALIZE", None),
+            ("a", "c", "INDEPENDENT", None),
+        ]
+        assert store.get_work_unit("a").conflict_verdicts == {
+            "b": "SERIALIZE",
+            "c": "INDEPENDENT",
+        }
+        store.close()
+
+
+# Chunk: docs/chunks/orch_work_unit_dirty_fields - Dirty field tracking and compare-and-swap tests
+class TestDirtyFieldUpdates:
+    """Units remember their stored state; compare-and-swap writes only what changed."""
+
+    @staticmethod
+    def _writes(store, action):
+        statements = []
+        store.connection.set_trace_callback(statements.append)
+        try:
+            action()
+        finally:
+            store.connection.set_trace_callback(None)
+        return [
+            s.strip() for s in statements
+            if s.lstrip().startswith(("SELECT", "UPDATE", "INSERT", "DELETE"))
+        ]
+
+    def test_dirty_fields_track_assignments_and_in_place_edits(self, store, sample_work_unit):
+        """Loaded units start clean; both assignment and mutation mark fields dirty."""
+        assert sample_work_unit.dirty_fields() == list(WorkUnit.model_fields)
+
+        unit = store.create_work_unit(sample_work_unit)
+        loaded = store.get_work_unit("test_chunk")
+        assert unit.dirty_fields() == [] and loaded.dirty_fields() == []
+
+        loaded.priority = 3
+        loaded.blocked_by.append("other")
+        assert loaded.dirty_fields() == ["blocked_by", "priority"]
+        assert loaded.persisted_value("blocked_by") == []
+        # The snapshot is bookkeeping, not part of equality
+        assert store.get_work_unit("test_chunk") == unit
+
+    def test_compare_and_swap_skips_the_read(self, store, sample_work_unit):
+        """One UPDATE naming the dirty columns and checking updated_at, no SELECT."""
+        store.create_work_unit(sample_work_unit)
+        unit = store.get_work_unit("test_chunk")
+        unit.next_retry_at = None
+        unit.status = WorkUnitStatus.RUNNING
+        unit.updated_at = datetime.now(timezone.utc)
+
+        writes = self._writes(store, lambda: store.compare_and_swap_work_unit(unit))
+
+        assert writes[0].startswith(
+            "UPDATE work_units SET status = 'RUNNING', updated_at = "
+        )
+        assert "AND updated_at = " in writes[0]
+        assert not any(s.startswith("SELECT") for s in writes)
+        assert unit.dirty_fields() == []
+        assert store.get_work_unit("test_chunk").status == WorkUnitStatus.RUNNING
+        assert [h["new_status"] for h in store.get_status_history("test_chunk")] == [
+            "READY",
+            "RUNNING",
+        ]
+
+    def test_compare_and_swap_detects_stale_writes(self, store, sample_work_unit):
+        """A write between read and swap raises StaleWriteError and changes nothing."""
+        store.create_work_unit(sample_work_unit)
+        first = store.get_work_unit("test_chunk")
+        second = store.get_work_unit("test_chunk")
+
+        first.priority = 1
+        first.updated_at = datetime.now(timezone.utc) + timedelta(seconds=1)
+        store.compare_and_swap_work_unit(first)
+
+        second.priority = 2
+        second.updated_at = datetime.now(timezone.utc) + timedelta(seconds=2)
+        with pytest.raises(StaleWriteError) as exc_info:
+            store.compare_and_swap_work_unit(second)
+
+        assert exc_info.value.actual_updated_at == first.updated_at
+        assert store.get_work_unit("test_chunk").priority == 1
+
+    def test_update_with_expected_timestamp_uses_compare_and_swap(self, store, sample_work_unit):
+        """The usual read/modify/update(expected_updated_at) pattern needs no pre-read."""
+        store.create_work_unit(sample_work_unit)
+        unit = store.get_work_unit("test_chunk")
+        expected = unit.updated_at
+        unit.conflict_verdicts["other"] = "SERIALIZE"
+        unit.updated_at = datetime.now(timezone.utc)
+
+        writes = self._writes(
+            store, lambda: store.update_work_unit(unit, expected_updated_at=expected)
+        )
+
+        assert not any(s.startswith("SELECT") for s in writes)
+        assert store.get_work_unit("test_chunk").conflict_verdicts == {"other": "SERIALIZE"}
+
+    def test_compare_and_swap_requires_a_snapshot_or_timestamp(self, store, sample_work_unit):
+        """A unit never read from the store has nothing to compare against."""
+        store.create_work_unit(sample_work_unit.model_copy())
+        fresh = sample_work_unit.model_copy(update={"priority": 4})
+
+        with pytest.raises(ValueError):
+            store.compare_and_swap_work_unit(fresh)
+
+        store.compare_and_swap_work_unit(fresh, expected_updated_at=fresh.updated_at)
+        assert store.get_work_unit("test_chunk").priority == 4
@@ -0,0 +1,143 @@
+# Subsystem: docs/subsystems/orchestrator - Parallel agent orchestration
+# Chunk: docs/chunks/orch_ws_send_queues - Per-connection send queues
+"""Tests for the dashboard WebSocket ConnectionManager."""
+
+import asyncio
+import json
+
+import pytest
+
+from orchestrator.websocket import SLOW_CLIENT_CLOSE_CODE, ConnectionManager
+
+
+class FakeWebSocket:
+    """Records sent payloads; sends block while ``stalled`` is set."""
+
+    def __init__(self):
+        self.sent: list[dict] = []
+        self.closed_with = None
+        self.stalled = False
+        self._resume = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        if self.stalled:
+            await self._resume.wait()
+        self.sent.append(json.loads(payload))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+    def resume(self):
+        self.stalled = False
+        self._resume.set()
+
+
+def update(chunk, status):
+    return {"type": "work_unit_update", "data": {"chunk": chunk, "status": status}}
+
+
+async def settle(manager):
+    # Long enough for senders to pass their coalescing window and drain
+    await asyncio.sleep(manager.coalesce_window + 0.05)
+
+
+class TestConnectionManager:
+    async def test_slow_client_does_not_delay_others(self):
+        manager = ConnectionManager(coalesce_window=0)
+        fast, slow = FakeWebSocket(), FakeWebSocket()
+        slow.stalled = True
+        await manager.connect(fast)
+        await manager.connect(slow)
+
+        await asyncio.wait_for(manager.broadcast(update("a", "RUNNING")), 0.1)
+        await settle(manager)
+
+        assert [m["data"]["status"] for m in fast.sent] == ["RUNNING"]
+        assert slow.sent == []
+
+        slow.resume()
+        await settle(manager)
+        assert [m["data"]["status"] for m in slow.sent] == ["RUNNING"]
+
+    async def test_queued_updates_for_a_chunk_coalesce(self):
+        manager = ConnectionManager(coalesce_window=0.05)
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+
+        await manager.broadcast(update("a", "READY"))
+        await manager.broadcast({"type": "attention_update", "data": {"chunk": "a"}})
+        await manager.broadcast(update("a", "RUNNING"))
+        await manager.broadcast(update("b", "READY"))
+        await settle(manager)
+
+        assert [(m["type"], m["data"].get("status")) for m in websocket.sent] == [
+            ("work_unit_update", "RUNNING"),
+            ("attention_update", None),
+            ("work_unit_update", "READY"),
+        ]
+        assert manager.metrics()["messages_coalesced"] == 1
+
+    async def test_client_that_falls_behind_is_disconnected(self):
+        manager = ConnectionManager(max_queue=3, coalesce_window=0)
+        websocket = FakeWebSocket()
+        websocket.stalled = True
+        await manager.connect(websocket)
+
+        for i in range(6):
+            await manager.broadcast({"type": "attention_update", "data": {"chunk": str(i)}})
+        websocket.resume()
+        await settle(manager)
+
+        assert websocket.closed_with == SLOW_CLIENT_CLOSE_CODE
+        assert manager.connection_count == 0
+        assert manager.metrics()["clients_dropped"] == 1
+
+    async def test_stalled_send_times_out(self):
+        manager = ConnectionManager(coalesce_window=0, send_timeout=0.05)
+        websocket = FakeWebSocket()
+        websocket.stalled = True
+        await manager.connect(websocket)
+
+        await manager.broadcast(update("a", "READY"))
+        await asyncio.sleep(0.2)
+
+        assert manager.connection_count == 0
+        assert websocket.closed_with == SLOW_CLIENT_CLOSE_CODE
+
+    async def test_initial_message_precedes_queued_updates(self):
+        manager = ConnectionManager(coalesce_window=0)
+        websocket = FakeWebSocket()
+
+        async def snapshot():
+            # A broadcast while the snapshot is being built is queued behind it
+            await manager.broadcast(update("a", "RUNNING"))
+            return {"type": "initial_state", "data": {}}
+
+        await manager.connect(websocket, initial_message=snapshot)
+        await settle(manager)
+
+        assert [m["type"] for m in websocket.sent] == ["initial_state", "work_unit_update"]
+
+    async def test_metrics_report_queue_depth(self):
+        manager = ConnectionManager(coalesce_window=0)
+        websocket = FakeWebSocket()
+        websocket.stalled = True
+        await manager.connect(websocket)
+
+        for chunk in "abc":
+            await manager.broadcast(update(chunk, "READY"))
+        await asyncio.sleep(0)
+
+        metrics = manager.metrics()
+        assert metrics["connections"] == 1
+        # One message is in flight, blocked in send_text
+        assert metrics["queued_messages"] == 2
+        assert metrics["peak_queue_depth"] == 3
+
+        websocket.resume()
+        await settle(manager)
+        assert manager.metrics()["messages_sent"] == 3
+        await manager.disconnect(websocket)
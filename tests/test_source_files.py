@@ -1,6 +1,7 @@
 """Tests for language-agnostic source file enumeration.
 
 # Chunk: docs/chunks/backref_language_agnostic - Tests for source file enumeration utility
+# Chunk: docs/chunks/validate_since_ref - Tests for git diff based changed-file discovery
 """
 
 import pathlib
@@ -9,7 +10,14 @@ import subprocess
 import pytest
 
 from conftest import make_ve_initialized_git_repo
-from source_files import enumerate_source_files, SOURCE_EXTENSIONS, FALLBACK_EXCLUDE_DIRS
+from source_files import (
+    FALLBACK_EXCLUDE_DIRS,
+    SOURCE_EXTENSIONS,
+    GitRefError,
+    enumerate_changed_files,
+    enumerate_source_files,
+    find_files_containing,
+)
 
 
 class TestEnumerateSourceFilesGit:
@@ -328,3 +336,75 @@ class TestFallbackExcludeDirsConstant:
         assert "node_modules" in FALLBACK_EXCLUDE_DIRS
         assert ".venv" in FALLBACK_EXCLUDE_DIRS
         assert "venv" in FALLBACK_EXCLUDE_DIRS
+
+
+class TestEnumerateChangedFiles:
+    """Tests for git-diff based changed-file discovery."""
+
+    def _commit(self, path: pathlib.Path) -> None:
+        subprocess.run(["git", "add", "-A"], cwd=path, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-q", "-m", "c"], cwd=path, check=True, capture_output=True)
+
+    def test_reports_modified_deleted_renamed_and_untracked(self, temp_project):
+        """Both sides of a rename, deletions and untracked files are included."""
+        make_ve_initialized_git_repo(temp_project)
+        for name in ["keep.py", "edit.py", "gone.py", "old.py"]:
+            (temp_project / name).write_text(f"# {name}\n")
+        self._commit(temp_project)
+
+        (temp_project / "edit.py").write_text("# edited\n")
+        (temp_project / "gone.py").unlink()
+        subprocess.run(["git", "mv", "old.py", "new.py"], cwd=temp_project, check=True)
+        (temp_project / "fresh.py").write_text("# new\n")
+
+        changed = enumerate_changed_files(temp_project, "HEAD")
+
+        assert changed == {"edit.py", "gone.py", "old.py", "new.py", "fresh.py"}
+
+    def test_paths_are_relative_to_subdirectory(self, temp_project):
+        """A project nested in a repository sees paths relative to itself."""
+        make_ve_initialized_git_repo(temp_project)
+        sub = temp_project / "sub"
+        sub.mkdir()
+        (sub / "a.py").write_text("# a\n")
+        (temp_project / "outside.py").write_text("# b\n")
+        self._commit(temp_project)
+        (sub / "a.py").write_text("# changed\n")
+        (temp_project / "outside.py").write_text("# changed\n")
+
+        assert enumerate_changed_files(sub, "HEAD") == {"a.py"}
+
+    def test_invalid_ref_raises(self, temp_project):
+        """An unknown revision raises GitRefError."""
+        make_ve_initialized_git_repo(temp_project)
+        with pytest.raises(GitRefError, match="Cannot diff against"):
+            enumerate_changed_files(temp_project, "does-not-exist")
+
+    def test_non_git_directory_raises(self, tmp_path):
+        """Outside a git repository there is nothing to diff against."""
+        with pytest.raises(GitRefError, match="not a git repository"):
+            enumerate_changed_files(tmp_path, "HEAD")
+
+
+class TestFindFilesContaining:
+    """Tests for git grep based file lookup."""
+
+    def test_finds_tracked_and_untracked_matches(self, temp_project):
+        """Matches in committed and new files are returned."""
+        make_ve_initialized_git_repo(temp_project)
+        (temp_project / "tracked.py").write_text("# Chunk: docs/chunks/alpha\n")
+        (temp_project / "other.py").write_text("x = 1\n")
+        subprocess.run(["git", "add", "-A"], cwd=temp_project, check=True)
+        (temp_project / "untracked.py").write_text("# Subsystem: docs/subsystems/core\n")
+
+        found = find_files_containing(
+            temp_project, ["docs/chunks/alpha", "docs/subsystems/core"]
+        )
+
+        assert found == {"tracked.py", "untracked.py"}
+
+    def test_no_needles_or_matches(self, temp_project):
+        """No needles and no matches both yield an empty set."""
+        make_ve_initialized_git_repo(temp_project)
+        assert find_files_containing(temp_project, []) == set()
+        assert find_files_containing(temp_project, ["docs/chunks/nothing"]) == set()